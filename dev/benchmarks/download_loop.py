@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Measure the per-chunk overhead of the default downloader's transfer loop.
+
+A response body is streamed from memory through an httpx MockTransport, so the
+result reflects only the cost of viu's read/write/progress loop, not the
+network. Reports throughput and how many times the progress hook was called.
+
+Usage:
+    python dev/benchmarks/download_loop.py
+    python dev/benchmarks/download_loop.py --size 512 --chunk 16 --downloads 4
+"""
+
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from viu_media.core.config.model import DownloadsConfig
+from viu_media.core.downloader.default import DefaultDownloader
+
+
+def make_client(size: int, chunk_size: int) -> httpx.Client:
+    block = b"\0" * chunk_size
+
+    def body():
+        remaining = size
+        while remaining > 0:
+            yield block[: min(chunk_size, remaining)]
+            remaining -= chunk_size
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-length": str(size)}, stream=_IteratorStream(body())
+        )
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class _IteratorStream(httpx.SyncByteStream):
+    def __init__(self, iterator):
+        self._iterator = iterator
+
+    def __iter__(self):
+        yield from self._iterator
+
+
+def run_once(work_dir: Path, size: int, chunk_size: int, downloads: int):
+    hook_calls = 0
+    lock = threading.Lock()
+
+    def hook(info):
+        nonlocal hook_calls
+        with lock:
+            hook_calls += 1
+
+    def download(index: int):
+        downloader = DefaultDownloader(DownloadsConfig(downloads_dir=work_dir))
+        downloader.client = make_client(size, chunk_size)
+        downloader._download_with_progress(
+            "http://bench/video.mp4",
+            work_dir / f"video-{index}.mp4",
+            {},
+            True,
+            [hook],
+            show_progress=False,
+        )
+
+    threads = [threading.Thread(target=download, args=(i,)) for i in range(downloads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, hook_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=256, help="MiB per download")
+    parser.add_argument("--chunk", type=int, default=64, help="KiB per network read")
+    parser.add_argument("--downloads", type=int, default=1, help="concurrent downloads")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    size = args.size * 1024 * 1024
+    with tempfile.TemporaryDirectory(prefix="viu-bench-") as tmp:
+        timings = []
+        for _ in range(args.rounds):
+            elapsed, hook_calls = run_once(
+                Path(tmp), size, args.chunk * 1024, args.downloads
+            )
+            timings.append(elapsed)
+        median = statistics.median(timings)
+        total_mib = args.size * args.downloads
+        print(
+            f"{args.downloads} x {args.size} MiB in {args.chunk} KiB reads: "
+            f"{median:.2f}s median, {total_mib / median:.0f} MiB/s, "
+            f"{hook_calls} hook calls per round"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fuzzy matching backends on synthetic title sets.
+
+Every query is scored against every choice (1k x 1k by default) and the best
+choice per query is picked, mirroring what find_best_match_title does.
+
+Usage:
+    python dev/benchmarks/fuzzy_benchmark.py
+    python dev/benchmarks/fuzzy_benchmark.py --size 500 --dp-sample 10
+"""
+
+import argparse
+import random
+import time
+
+from viu_media.core.utils.fuzzy import RAPIDFUZZ_AVAILABLE, FuzzyMatcher
+
+WORDS = (
+    "shingeki kyojin one piece naruto shippuden boku hero academia kimetsu yaiba "
+    "jujutsu kaisen sousou frieren spy family chainsaw man oshi ko re zero kara "
+    "hajimeru isekai seikatsu season 2nd 3rd part movie film tensei shitara slime "
+    "datta ken mahou shoujo madoka magica dungeon meshi kusuriya hitorigoto"
+).split()
+
+
+def make_titles(count: int, rng: random.Random) -> list[str]:
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6)))
+        for _ in range(count)
+    ]
+
+
+def dp_ratio(s1: str, s2: str) -> int:
+    """The original full-table Levenshtein ratio, kept as a baseline."""
+    if not s1 and not s2:
+        return 100
+    if not s1 or not s2:
+        return 0
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            current_row.append(
+                min(
+                    previous_row[j + 1] + 1,
+                    current_row[j] + 1,
+                    previous_row[j] + (c1 != c2),
+                )
+            )
+        previous_row = current_row
+    max_len = max(len(s1), len(s2))
+    return int((max_len - previous_row[-1]) / max_len * 100)
+
+
+def bench_dp(queries, choices, sample):
+    start = time.perf_counter()
+    for query in queries[:sample]:
+        max(range(len(choices)), key=lambda i: dp_ratio(query, choices[i]))
+    elapsed = time.perf_counter() - start
+    # extrapolate to the full query set
+    return elapsed * len(queries) / sample
+
+
+def bench_myers(queries, choices):
+    start = time.perf_counter()
+    for query in queries:
+        scores = FuzzyMatcher._batch_ratio([query], choices)
+        max(range(len(scores)), key=scores.__getitem__)
+    return time.perf_counter() - start
+
+
+def bench_rapidfuzz_extract_one(queries, choices):
+    from rapidfuzz import fuzz, process
+
+    start = time.perf_counter()
+    for query in queries:
+        process.extractOne(query, choices, scorer=fuzz.ratio)
+    return time.perf_counter() - start
+
+
+def bench_rapidfuzz_cdist(queries, choices):
+    from rapidfuzz import fuzz, process
+
+    start = time.perf_counter()
+    matrix = process.cdist(queries, choices, scorer=fuzz.ratio)
+    matrix.argmax(axis=1)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1000, help="titles per set")
+    parser.add_argument(
+        "--dp-sample",
+        type=int,
+        default=20,
+        help="queries to time for the slow DP baseline before extrapolating",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    queries = make_titles(args.size, rng)
+    choices = make_titles(args.size, rng)
+
+    # sanity check: the bit-parallel distance must agree with the DP baseline
+    for query, choice in zip(queries[:200], choices[:200]):
+        assert FuzzyMatcher._batch_ratio([query], [choice])[0] == dp_ratio(
+            query, choice
+        ), (query, choice)
+
+    results = [
+        (
+            f"pure python DP (extrapolated from {args.dp_sample})",
+            bench_dp(queries, choices, min(args.dp_sample, args.size)),
+        ),
+        ("pure python Myers bit-parallel", bench_myers(queries, choices)),
+    ]
+    if RAPIDFUZZ_AVAILABLE:
+        results.append(
+            (
+                "rapidfuzz process.extractOne",
+                bench_rapidfuzz_extract_one(queries, choices),
+            )
+        )
+        try:
+            results.append(
+                ("rapidfuzz process.cdist", bench_rapidfuzz_cdist(queries, choices))
+            )
+        except ImportError:
+            print("numpy not installed, skipping rapidfuzz cdist")
+    else:
+        print("rapidfuzz not installed, skipping C backends")
+
+    pairs = args.size * args.size
+    baseline = results[0][1]
+    print(f"\n{args.size} x {args.size} titles ({pairs:,} pairs)\n")
+    print(f"{'backend':<45} {'seconds':>10} {'pairs/s':>14} {'speedup':>9}")
+    for name, seconds in results:
+        print(
+            f"{name:<45} {seconds:>10.3f} {pairs / seconds:>14,.0f} {baseline / seconds:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
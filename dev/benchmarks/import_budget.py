@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Check the cold start import time of common viu invocations against a budget.
+
+Each command is run a few times under `python -X importtime` and the median of
+the total import time is compared with its budget. Exits non-zero when any
+command goes over. tests/test_import_budget.py runs the same invocations in
+CI and checks which modules they import, which does not depend on the machine.
+
+The budgets leave headroom over the medians measured on a developer
+laptop with a warm option cache, so they catch a heavy import sneaking
+onto the startup path rather than run to run noise.
+
+Usage:
+    python dev/benchmarks/import_budget.py
+    python dev/benchmarks/import_budget.py --runs 9 --scale 1.5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# runs the entry point as `viu` so click picks up the _VIU_COMPLETE variable
+ENTRY_POINT = "import sys; sys.argv[0] = 'viu'; from viu_media import Cli; Cli()"
+
+# argv after `viu`, and the budget for its imports in ms
+# (--help and completion list every lazy subcommand, so they import all of them)
+BUDGETS = {
+    ("--version",): 200,
+    ("--help",): 650,
+    ("--no-config", "--no-check-for-updates", "search", "--help"): 550,
+    ("--no-config", "--no-check-for-updates", "download", "--help"): 550,
+    ("--no-config", "--no-check-for-updates", "registry", "--help"): 550,
+}
+
+# shell completion of the top level command
+COMPLETION_ENV = {
+    "_VIU_COMPLETE": "bash_complete",
+    "COMP_WORDS": "viu ",
+    "COMP_CWORD": "1",
+}
+COMPLETION_BUDGET = 550
+
+# (label, argv, extra env, budget ms) of every checked invocation
+CASES = [(" ".join(argv), argv, None, budget) for argv, budget in BUDGETS.items()]
+CASES.append(("<completion>", (), COMPLETION_ENV, COMPLETION_BUDGET))
+
+
+def import_time_ms(args: tuple[str, ...], env: dict[str, str] | None = None) -> float:
+    """Total import time of one run, summed over the top level imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", ENTRY_POINT, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+        stdin=subprocess.DEVNULL,
+        timeout=60,
+    )
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # nested imports are indented; their time is already in the parent
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def median_import_time_ms(
+    args: tuple[str, ...], env: dict[str, str] | None = None, runs: int = 5
+) -> float:
+    return statistics.median(import_time_ms(args, env) for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="runs per command")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget, e.g. on slow CI machines",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'command':<60} {'median ms':>10} {'budget ms':>10}")
+    for label, argv, env, budget in CASES:
+        median = median_import_time_ms(argv, env, args.runs)
+        limit = budget * args.scale
+        status = "ok" if median <= limit else "OVER"
+        failed |= median > limit
+        print(f"{label:<60} {median:>10.1f} {limit:>10.1f}  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Compare the stdlib JSON persistence path with viu's JSON codec.
+
+Benchmarks saving and loading a registry index with 3000 entries, and
+decoding a 50-item AniList search page. The "stdlib" rows reproduce the old
+code path (``json.dump(model.model_dump(mode="json"), indent=2)`` and
+``json.load`` plus ``model_validate``); the "codec" rows use
+``viu_media.core.utils.json_codec`` with whichever backend is installed.
+
+Usage:
+    python dev/benchmarks/json_codec.py
+    python dev/benchmarks/json_codec.py --entries 10000 --rounds 20
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+from viu_media.cli.service.registry.models import (
+    MediaRegistryIndex,
+    MediaRegistryIndexEntry,
+)
+from viu_media.core.utils import json_codec
+from viu_media.core.utils.file import AtomicWriter
+from viu_media.libs.media_api.types import UserMediaListStatus
+
+WORDS = "sword magic school love demon slayer kingdom ghost idol robot sky sea".split()
+
+
+def bench(name: str, rounds: int, func: Callable[[], object]) -> List[float]:
+    func()  # warm up
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    print(
+        f"{name:<28} {min(timings) * 1000:>9.2f} {statistics.median(timings) * 1000:>9.2f}"
+    )
+    return timings
+
+
+def make_index(entries: int, rng: random.Random) -> MediaRegistryIndex:
+    now = datetime.now()
+    index = MediaRegistryIndex()
+    for media_id in range(1, entries + 1):
+        index.media_index[f"anilist_{media_id}"] = MediaRegistryIndexEntry(
+            media_id=media_id,
+            media_api="anilist",
+            status=rng.choice(list(UserMediaListStatus)),
+            progress=str(rng.randint(0, 24)),
+            last_watch_position="00:12:34",
+            total_duration="00:23:40",
+            total_episodes=24,
+            score=rng.randint(0, 100) / 10,
+            notes=" ".join(rng.choices(WORDS, k=5)),
+            last_watched=now - timedelta(days=rng.randint(0, 900)),
+        )
+    return index
+
+
+def make_anilist_page(items: int, rng: random.Random) -> bytes:
+    def media(media_id: int):
+        title = " ".join(rng.choices(WORDS, k=3)).title()
+        return {
+            "id": media_id,
+            "idMal": media_id + 1000,
+            "title": {"romaji": title, "english": title, "native": "ソードマジック"},
+            "coverImage": {
+                "medium": f"https://s4.anilist.co/file/anilistcdn/media/anime/cover/small/bx{media_id}.jpg",
+                "large": f"https://s4.anilist.co/file/anilistcdn/media/anime/cover/medium/bx{media_id}.jpg",
+            },
+            "bannerImage": f"https://s4.anilist.co/file/anilistcdn/media/anime/banner/{media_id}.jpg",
+            "description": " ".join(rng.choices(WORDS, k=150)),
+            "episodes": 24,
+            "duration": 24,
+            "genres": rng.sample(
+                ["Action", "Comedy", "Drama", "Fantasy", "Romance"], 3
+            ),
+            "synonyms": [title.upper(), title.lower()],
+            "tags": [
+                {"name": word, "rank": rng.randint(50, 100)}
+                for word in rng.sample(WORDS, 6)
+            ],
+            "studios": {"nodes": [{"name": "Studio", "isAnimationStudio": True}]},
+            "averageScore": rng.randint(50, 90),
+            "popularity": rng.randint(1000, 500000),
+            "favourites": rng.randint(10, 50000),
+            "status": "FINISHED",
+            "startDate": {"year": 2020, "month": 4, "day": 3},
+            "endDate": {"year": 2020, "month": 9, "day": 25},
+            "nextAiringEpisode": None,
+            "streamingEpisodes": [
+                {"title": f"Episode {i} - {title}", "thumbnail": "https://img/x.jpg"}
+                for i in range(1, 13)
+            ],
+            "mediaListEntry": None,
+        }
+
+    page = {
+        "data": {
+            "Page": {
+                "pageInfo": {
+                    "total": 5000,
+                    "currentPage": 1,
+                    "hasNextPage": True,
+                    "perPage": items,
+                },
+                "media": [media(i) for i in range(1, items + 1)],
+            }
+        }
+    }
+    return json.dumps(page).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entries", type=int, default=3000)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    index = make_index(args.entries, rng)
+    page = make_anilist_page(args.items, rng)
+    work_dir = Path(tempfile.mkdtemp(prefix="viu-json-bench-"))
+    stdlib_file = work_dir / "registry-stdlib.json"
+    codec_file = work_dir / "registry-codec.json"
+
+    def stdlib_save():
+        with AtomicWriter(stdlib_file) as f:
+            json.dump(index.model_dump(mode="json"), f, indent=2)
+
+    def stdlib_load():
+        with stdlib_file.open("r", encoding="utf-8") as f:
+            return MediaRegistryIndex.model_validate(json.load(f))
+
+    print(f"backend: {json_codec.BACKEND}")
+    print(f"{'benchmark':<28} {'min ms':>9} {'median ms':>9}")
+    bench(f"registry save ({args.entries}) stdlib", args.rounds, stdlib_save)
+    bench(
+        f"registry save ({args.entries}) codec",
+        args.rounds,
+        lambda: json_codec.write_model(codec_file, index),
+    )
+    bench(f"registry load ({args.entries}) stdlib", args.rounds, stdlib_load)
+    bench(
+        f"registry load ({args.entries}) codec",
+        args.rounds,
+        lambda: json_codec.read_model(codec_file, MediaRegistryIndex),
+    )
+    bench(f"anilist page ({args.items}) stdlib", args.rounds, lambda: json.loads(page))
+    bench(
+        f"anilist page ({args.items}) codec",
+        args.rounds,
+        lambda: json_codec.loads(page),
+    )
+
+    assert json_codec.read_model(codec_file, MediaRegistryIndex) == stdlib_load()
+    print(
+        f"index size: stdlib {stdlib_file.stat().st_size / 1024:.0f} KiB, "
+        f"codec {codec_file.stat().st_size / 1024:.0f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Benchmark the network heavy paths offline by replaying recorded HTTP exchanges.
+
+Record a cassette once against the live sites, then replay it as often as
+needed. Replays never touch the network, so results only depend on viu's own
+code and the injected latency.
+
+Scenarios:
+    provider   search -> get -> episode_streams on an anime provider
+    media-api  media api search
+    registry   saving and searching the media registry with the replayed results
+    sync       downloading the user's media lists into the registry, as
+               `viu registry sync --download` does (recording needs a login)
+    preview    caching anime previews (info text and cover images)
+
+Usage:
+    # record (needs network access)
+    python dev/benchmarks/network_benchmark.py --record
+    # replay with 50ms of latency per request
+    python dev/benchmarks/network_benchmark.py --latency 50 --rounds 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from viu_media.core.utils.cassette import (
+    RECORD_ENV,
+    REPLAY_ENV,
+    REPLAY_LATENCY_ENV,
+)
+
+DEFAULT_CASSETTE = Path(__file__).parent / "cassettes" / "network.json"
+
+
+def bench(name: str, rounds: int, func: Callable[[], object]) -> List[float]:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    print(
+        f"{name:<32} {min(timings) * 1000:>10.1f} {statistics.median(timings) * 1000:>10.1f} {max(timings) * 1000:>10.1f}"
+    )
+    return timings
+
+
+def provider_flow(provider_name: str, query: str, episode: str):
+    from viu_media.libs.provider.anime.params import (
+        AnimeParams,
+        EpisodeStreamsParams,
+        SearchParams,
+    )
+    from viu_media.libs.provider.anime.provider import create_provider
+    from viu_media.libs.provider.anime.types import ProviderName
+
+    provider = create_provider(ProviderName(provider_name))
+
+    def run():
+        results = provider.search(SearchParams(query=query))
+        if not results or not results.results:
+            raise RuntimeError(f"{provider_name} returned no results for {query!r}")
+        anime = provider.get(AnimeParams(id=results.results[0].id, query=query))
+        if not anime:
+            raise RuntimeError(f"{provider_name} could not get {results.results[0].id}")
+        streams = provider.episode_streams(
+            EpisodeStreamsParams(query=query, anime_id=anime.id, episode=episode)
+        )
+        return list(streams or [])
+
+    return run
+
+
+def media_api_search(config, query: str):
+    from viu_media.libs.media_api.api import create_api_client
+    from viu_media.libs.media_api.params import MediaSearchParams
+
+    api = create_api_client(config.general.media_api, config)
+
+    def run():
+        result = api.search_media(MediaSearchParams(query=query, per_page=25))
+        if not result:
+            raise RuntimeError(f"media api returned no results for {query!r}")
+        return result.media
+
+    return run
+
+
+def registry_benchmarks(config, media_items, work_dir: Path, rounds: int):
+    from viu_media.cli.service.registry.service import MediaRegistryService
+    from viu_media.libs.media_api.params import MediaSearchParams
+
+    registry_config = config.media_registry.model_copy(
+        update={
+            "media_dir": work_dir / "registry" / "media",
+            "index_dir": work_dir / "registry" / "index",
+        }
+    )
+    registry = MediaRegistryService(config.general.media_api, registry_config)
+
+    def save_all():
+        for media_item in media_items:
+            registry.save_media_record(registry.get_or_create_record(media_item))
+
+    bench("registry save", rounds, save_all)
+    query = media_items[0].title.romaji or media_items[0].title.english or ""
+    bench(
+        "registry search",
+        rounds,
+        lambda: registry.search_for_media(MediaSearchParams(query=query)),
+    )
+    bench("registry load all", rounds, lambda: list(registry.get_all_media_records()))
+
+
+def registry_sync(config, work_dir: Path, record: bool):
+    from viu_media.cli.service.auth import AuthService
+    from viu_media.cli.service.registry.service import MediaRegistryService
+    from viu_media.libs.media_api.api import create_api_client
+    from viu_media.libs.media_api.params import UserMediaListSearchParams
+    from viu_media.libs.media_api.types import UserMediaListStatus
+
+    api = create_api_client(config.general.media_api, config)
+    profile = AuthService(config.general.media_api).get_auth()
+    if record and not profile:
+        print(f"sync: skipped, run `viu {config.general.media_api} auth` to record it")
+        return None
+    # replayed requests are matched without their headers, so any token will do
+    if not api.authenticate(profile.token if profile else "replay"):
+        raise RuntimeError("media api did not return the viewer profile")
+
+    registry_config = config.media_registry.model_copy(
+        update={
+            "media_dir": work_dir / "sync" / "media",
+            "index_dir": work_dir / "sync" / "index",
+        }
+    )
+    registry = MediaRegistryService(config.general.media_api, registry_config)
+
+    def run():
+        synced = 0
+        for status in UserMediaListStatus:
+            page = 1
+            while True:
+                result = api.search_media_list(
+                    UserMediaListSearchParams(status=status, page=page, per_page=50)
+                )
+                if not result or not result.media:
+                    break
+                for media_item in result.media:
+                    record = registry.get_or_create_record(media_item)
+                    if media_item.user_status:
+                        registry.update_media_index_entry(
+                            media_item.id,
+                            media_item=media_item,
+                            status=media_item.user_status.status,
+                            progress=str(media_item.user_status.progress or 0),
+                            score=media_item.user_status.score,
+                            repeat=media_item.user_status.repeat,
+                            notes=media_item.user_status.notes,
+                        )
+                    registry.save_media_record(record)
+                    synced += 1
+                if not result.page_info.has_next_page:
+                    break
+                page += 1
+        return synced
+
+    return run
+
+
+def preview_caching(config, media_items, work_dir: Path):
+    from viu_media.cli.utils.preview_workers import PreviewCacheWorker
+
+    preview_config = config.model_copy(
+        update={"general": config.general.model_copy(update={"preview": "full"})}
+    )
+    titles = [item.title.english or item.title.romaji or "" for item in media_items]
+    round_number = 0
+
+    def run():
+        nonlocal round_number
+        round_number += 1
+        # a fresh cache dir per round so every image is fetched again
+        cache_dir = work_dir / "preview" / str(round_number)
+        (cache_dir / "images").mkdir(parents=True)
+        (cache_dir / "info").mkdir(parents=True)
+        worker = PreviewCacheWorker(cache_dir / "images", cache_dir / "info")
+        worker.start()
+        worker.cache_anime_previews(media_items, titles, preview_config)
+        worker.shutdown(wait=True)
+
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cassette", type=Path, default=DEFAULT_CASSETTE)
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="hit the live sites and record every exchange to the cassette",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0, help="ms of latency per replayed request"
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--provider", default="allanime")
+    parser.add_argument("--query", default="one piece")
+    parser.add_argument("--episode", default="1")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=["provider", "media-api", "registry", "sync", "preview"],
+        help="scenarios to run (default: all)",
+    )
+    args = parser.parse_args()
+    scenarios = args.scenario or [
+        "provider",
+        "media-api",
+        "registry",
+        "sync",
+        "preview",
+    ]
+
+    # must be set before any http client is created
+    if args.record:
+        os.environ[RECORD_ENV] = str(args.cassette)
+        # recording only needs one pass over every request
+        args.rounds = 1
+    else:
+        if not args.cassette.exists():
+            sys.exit(f"{args.cassette} does not exist; run with --record first")
+        os.environ[REPLAY_ENV] = str(args.cassette)
+        os.environ[REPLAY_LATENCY_ENV] = str(args.latency)
+
+    from viu_media.core.config import AppConfig
+
+    config = AppConfig()
+    mode = "recording" if args.record else f"replaying with {args.latency:g}ms latency"
+    print(f"{mode} ({args.cassette})\n")
+    print(f"{'scenario':<32} {'min ms':>10} {'median ms':>10} {'max ms':>10}")
+
+    with tempfile.TemporaryDirectory(prefix="viu-bench-") as tmp:
+        work_dir = Path(tmp)
+        if "provider" in scenarios:
+            bench(
+                f"{args.provider} search/get/streams",
+                args.rounds,
+                provider_flow(args.provider, args.query, args.episode),
+            )
+
+        search = media_api_search(config, args.query)
+        if "media-api" in scenarios:
+            bench("media api search", args.rounds, search)
+
+        if "sync" in scenarios:
+            sync = registry_sync(config, work_dir, args.record)
+            if sync:
+                bench("registry sync", args.rounds, sync)
+
+        if "registry" in scenarios or "preview" in scenarios:
+            media_items = search()
+            if "registry" in scenarios:
+                registry_benchmarks(config, media_items, work_dir, args.rounds)
+            if "preview" in scenarios:
+                bench(
+                    "preview caching",
+                    args.rounds,
+                    preview_caching(config, media_items, work_dir),
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from viu_media.core.config import AppConfig
+
+
+def test_torrent_resume_dir_follows_the_media_registry_dir(tmp_path):
+    config = AppConfig.model_validate({"media_registry": {"media_dir": tmp_path}})
+
+    assert config.downloads.torrent_resume_dir is None
+    assert config.downloads.torrent_resume_path == tmp_path / "torrents"
+
+
+def test_configured_torrent_resume_dir_wins(tmp_path):
+    config = AppConfig.model_validate(
+        {
+            "media_registry": {"media_dir": tmp_path},
+            "downloads": {"torrent_resume_dir": "/srv/torrents"},
+        }
+    )
+
+    assert config.downloads.torrent_resume_path == Path("/srv/torrents")
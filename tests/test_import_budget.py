@@ -0,0 +1,110 @@
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARK = Path(__file__).parent.parent / "dev" / "benchmarks" / "import_budget.py"
+
+spec = importlib.util.spec_from_file_location("import_budget", BENCHMARK)
+assert spec and spec.loader
+import_budget = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(import_budget)
+
+# runs the entry point with the app cache dir redirected, then writes the
+# names of every imported module, even when click exits
+PROBE = """
+import sys
+from pathlib import Path
+
+from viu_media.core import constants
+
+constants.APP_CACHE_DIR = Path(sys.argv.pop(1))
+modules_file = Path(sys.argv.pop(1))
+sys.argv[0] = "viu"
+try:
+    from viu_media import Cli
+
+    Cli()
+finally:
+    modules_file.write_text("\\n".join(sorted(sys.modules)))
+"""
+
+# never needed to print help, the version or completions
+ALWAYS_LAZY = (
+    "viu_media.cli.interactive",
+    "viu_media.core.downloader",
+    "viu_media.libs.aniskip",
+    "viu_media.libs.discord",
+    "viu_media.libs.player",
+    "viu_media.libs.selectors",
+    "viu_media.libs.provider.anime.allanime",
+    "viu_media.libs.provider.anime.animepahe",
+    "viu_media.libs.provider.anime.animeunity",
+    "InquirerPy",
+    "libtorrent",
+    "yt_dlp",
+)
+
+# `viu --version` is answered from the option spec cache alone
+VERSION_LAZY = (
+    "httpx",
+    "pydantic",
+    "rich",
+    "viu_media.cli.commands",
+    "viu_media.core.config",
+)
+
+
+def imported_modules(
+    cache_dir: Path,
+    output: Path,
+    args: tuple[str, ...],
+    env: dict[str, str] | None = None,
+) -> set[str]:
+    subprocess.run(
+        [sys.executable, "-c", PROBE, str(cache_dir), str(output), *args],
+        capture_output=True,
+        env={**os.environ, **(env or {})},
+        stdin=subprocess.DEVNULL,
+        timeout=60,
+        check=False,
+    )
+    return set(output.read_text().split())
+
+
+def loaded(modules: set[str], packages: tuple[str, ...]) -> list[str]:
+    return sorted(
+        module
+        for module in modules
+        if any(module == pkg or module.startswith(f"{pkg}.") for pkg in packages)
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    # the first run after an install or upgrade renders the option spec cache
+    imported_modules(cache_dir, tmp_path / "warmup.txt", ("--version",))
+    assert (cache_dir / "cli_options.json").exists()
+    return cache_dir
+
+
+@pytest.mark.parametrize(
+    "argv, env",
+    [case[1:3] for case in import_budget.CASES],
+    ids=[case[0] for case in import_budget.CASES],
+)
+def test_startup_skips_heavy_imports(cache_dir, tmp_path, argv, env):
+    modules = imported_modules(cache_dir, tmp_path / "modules.txt", argv, env)
+    assert "viu_media.cli.cli" in modules
+    assert not loaded(modules, ALWAYS_LAZY)
+
+
+def test_version_is_served_from_option_cache(cache_dir, tmp_path):
+    modules = imported_modules(cache_dir, tmp_path / "modules.txt", ("--version",))
+    assert "viu_media.cli.cli" in modules
+    assert not loaded(modules, VERSION_LAZY)
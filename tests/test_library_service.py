@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+from viu_media.cli.service.library.service import DownloadsLibraryService
+from viu_media.cli.service.registry.models import DownloadStatus
+from viu_media.cli.service.registry.service import MediaRegistryService
+from viu_media.core.config.model import MediaRegistryConfig
+from viu_media.libs.media_api.types import MediaItem, MediaTitle
+
+MEDIA_ID = 1
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> MediaRegistryService:
+    config = MediaRegistryConfig(
+        media_dir=tmp_path / "registry", index_dir=tmp_path / "index"
+    )
+    registry = MediaRegistryService("anilist", config)
+    registry.get_or_create_record(
+        MediaItem(id=MEDIA_ID, title=MediaTitle(english="Show"))
+    )
+    return registry
+
+
+@pytest.fixture
+def library(tmp_path: Path, registry: MediaRegistryService):
+    downloads_dir = tmp_path / "downloads"
+    downloads_dir.mkdir()
+    library = DownloadsLibraryService(downloads_dir, registry)
+    yield library
+    library.close()
+
+
+def _complete(registry: MediaRegistryService, episode: str, path: Path):
+    registry.update_episode_download_status(
+        MEDIA_ID,
+        episode,
+        DownloadStatus.COMPLETED,
+        file_path=path,
+        file_size=path.stat().st_size,
+    )
+
+
+def _status(registry: MediaRegistryService, episode: str) -> DownloadStatus:
+    record = registry.get_media_record(MEDIA_ID)
+    assert record
+    return next(
+        e.download_status for e in record.media_episodes if e.episode_number == episode
+    )
+
+
+def test_file_missing_from_stale_index_is_kept(library, registry):
+    # index the (empty) tree; the next refresh is throttled
+    library.refresh(force=True)
+    episode_file = library.downloads_dir / "Show" / "Episode 1.mkv"
+    episode_file.parent.mkdir()
+    episode_file.write_bytes(b"video")
+    _complete(registry, "1", episode_file)
+
+    assert library.get_downloaded_episodes(MEDIA_ID) == {"1": episode_file}
+    assert _status(registry, "1") == DownloadStatus.COMPLETED
+
+
+def test_file_spelled_differently_is_kept(library, registry, tmp_path):
+    episode_file = library.downloads_dir / "Show" / "Episode 1.mkv"
+    episode_file.parent.mkdir()
+    episode_file.write_bytes(b"video")
+    spelled = library.downloads_dir / "Show" / ".." / "Show" / "Episode 1.mkv"
+    _complete(registry, "1", spelled)
+
+    assert library.get_downloaded_episodes(MEDIA_ID) == {"1": spelled}
+    assert _status(registry, "1") == DownloadStatus.COMPLETED
+
+
+def test_deleted_file_is_demoted(library, registry):
+    episode_file = library.downloads_dir / "Episode 1.mkv"
+    episode_file.write_bytes(b"video")
+    _complete(registry, "1", episode_file)
+    library.refresh(force=True)
+    episode_file.unlink()
+    library.refresh(force=True)
+
+    assert library.get_downloaded_episodes(MEDIA_ID) == {}
+    assert _status(registry, "1") == DownloadStatus.NOT_DOWNLOADED
@@ -0,0 +1,19 @@
+from viu_media.core.utils.normalizer import TitleNormalizer
+
+
+def test_remapping_drops_the_old_reverse_entry():
+    normalizer = TitleNormalizer()
+    normalizer.add("allanime", "Foo", "Old Title")
+    normalizer.add("allanime", "Foo", "New Title")
+
+    assert normalizer.to_provider_title("New Title", "allanime") == "Foo"
+    assert not normalizer.has_mapping("Old Title", "allanime", reverse=True)
+
+
+def test_remapping_keeps_a_reverse_entry_claimed_by_another_title():
+    normalizer = TitleNormalizer()
+    normalizer.add("allanime", "Foo", "Shared Title")
+    normalizer.add("allanime", "Bar", "Shared Title")
+    normalizer.add("allanime", "Foo", "New Title")
+
+    assert normalizer.to_provider_title("Shared Title", "allanime") == "Bar"
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from viu_media.cli.commands.registry.commands.search import _build_search_params
+from viu_media.cli.service.registry import title_index
+from viu_media.cli.service.registry.service import MediaRegistryService
+from viu_media.cli.service.registry.title_index import TitleIndex
+from viu_media.core.config.model import MediaRegistryConfig
+from viu_media.libs.media_api.types import MediaItem, MediaTitle
+
+TITLES = {
+    1: "Attack on Titan Junior High",
+    2: "Attack on Titan",
+    3: "A Titan Story",
+}
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> MediaRegistryService:
+    config = MediaRegistryConfig(
+        media_dir=tmp_path / "registry", index_dir=tmp_path / "index"
+    )
+    registry = MediaRegistryService("anilist", config)
+    for media_id, title in TITLES.items():
+        registry.get_or_create_record(
+            MediaItem(id=media_id, title=MediaTitle(english=title))
+        )
+    return registry
+
+
+def _search_ids(registry: MediaRegistryService, query: str, limit: int) -> list[int]:
+    params = _build_search_params(query, None, (), None, None, None, None, None, limit)
+    return [media.id for media in registry.search_for_media(params).media]
+
+
+def test_query_results_keep_the_relevance_order(registry):
+    # the exact title would sort after "A Titan Story" and be cut by a title sort
+    assert _search_ids(registry, "attack on titan", limit=1) == [2]
+
+
+def test_title_sort_is_still_the_default_without_a_query(registry):
+    assert _search_ids(registry, None, limit=3) == [3, 2, 1]
+
+
+def test_index_changes_are_journaled_and_replayed(registry):
+    index_file = registry._title_index.index_file
+    registry.search_titles("titan")
+    index_written_at = index_file.stat().st_mtime_ns
+
+    registry.get_or_create_record(
+        MediaItem(id=4, title=MediaTitle(english="Titan Hunters"))
+    )
+    registry.remove_media_record(3)
+
+    assert index_file.stat().st_mtime_ns == index_written_at
+    reloaded = TitleIndex(index_file)
+    assert [media_id for media_id, _ in reloaded.search("titan hunters")][0] == 4
+    assert 3 not in {media_id for media_id, _ in reloaded.search("titan story")}
+
+
+def test_journal_is_compacted_into_the_index(registry, monkeypatch):
+    monkeypatch.setattr(title_index, "JOURNAL_COMPACT_MIN", 2)
+    registry.search_titles("titan")
+
+    for media_id in (5, 6, 7, 8):
+        registry.get_or_create_record(
+            MediaItem(id=media_id, title=MediaTitle(english=f"Titan {media_id}"))
+        )
+
+    index = registry._title_index
+    assert index._journal_entries < max(2, len(index))
+    assert len(TitleIndex(index.index_file)) == 7
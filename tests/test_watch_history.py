@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from viu_media.cli.service.registry.service import MediaRegistryService
+from viu_media.cli.service.watch_history.service import WatchHistoryService
+from viu_media.core.config import AppConfig
+from viu_media.core.config.model import MediaRegistryConfig
+from viu_media.libs.media_api.types import MediaItem, MediaTitle
+from viu_media.libs.player.types import PlayerResult
+
+MEDIA_ITEM = MediaItem(id=1, title=MediaTitle(english="Show"))
+
+
+def _watch_history(tmp_path: Path) -> WatchHistoryService:
+    config = MediaRegistryConfig(
+        media_dir=tmp_path / "registry", index_dir=tmp_path / "index"
+    )
+    return WatchHistoryService(AppConfig(), MediaRegistryService("anilist", config))
+
+
+def test_progress_hook_saves_the_position_and_resumes_from_it(tmp_path):
+    watch_history = _watch_history(tmp_path)
+    hook = watch_history.progress_hook(MEDIA_ITEM)
+
+    hook(PlayerResult(episode="3", stop_time="00:05:00", total_time="00:24:00"))
+
+    assert watch_history.get_episode(MEDIA_ITEM) == ("3", "00:05:00")
+
+
+def test_progress_hook_throttles_saves(tmp_path):
+    watch_history = _watch_history(tmp_path)
+    hook = watch_history.progress_hook(MEDIA_ITEM)
+
+    hook(PlayerResult(episode="3", stop_time="00:05:00", total_time="00:24:00"))
+    hook(PlayerResult(episode="3", stop_time="00:05:01", total_time="00:24:00"))
+
+    entry = watch_history.media_registry.get_media_index_entry(MEDIA_ITEM.id)
+    assert entry and entry.last_watch_position == "00:05:00"
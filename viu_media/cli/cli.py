@@ -5,11 +5,8 @@ from typing import TYPE_CHECKING
 import click
 from click.core import ParameterSource
 
-from ..core.config import AppConfig
 from ..core.constants import CLI_NAME, USER_CONFIG, __version__
-from .config import ConfigLoader
-from .options import options_from_model
-from .utils.exception import setup_exceptions_handler
+from .options import cached_config_options
 from .utils.lazyloader import LazyGroup
 from .utils.logging import setup_logging
 
@@ -25,6 +22,7 @@ if TYPE_CHECKING:
         log: bool | None
         rich_traceback: bool | None
         rich_traceback_theme: str
+        profile: bool | None
 
 
 logger = logging.getLogger(__name__)
@@ -66,12 +64,22 @@ commands = {
     default="github-dark",
     help="Controls Whether to display a rich traceback",
 )
-@options_from_model(AppConfig)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Time the hot paths, print a summary and export a Chrome trace on exit",
+)
+@cached_config_options()
 @click.pass_context
 def cli(ctx: click.Context, **options: "Unpack[Options]"):
     """
     The main entry point for the Viu CLI.
     """
+    # imported here so --version, --help and completions never pay for them
+    from ..core.config import AppConfig
+    from .config import ConfigLoader
+    from .utils.exception import setup_exceptions_handler
+
     setup_logging(options["log"])
     setup_exceptions_handler(
         options["trace"],
@@ -81,6 +89,9 @@ def cli(ctx: click.Context, **options: "Unpack[Options]"):
     )
 
     logger.info(f"Current Command: {' '.join(sys.argv)}")
+    if options["profile"]:
+        _setup_profiling(ctx)
+
     cli_overrides = {}
     param_lookup = {p.name: p for p in ctx.command.params}
 
@@ -155,3 +166,22 @@ def cli(ctx: click.Context, **options: "Unpack[Options]"):
         from .commands.anilist import cmd
 
         ctx.invoke(cmd.anilist)
+
+
+def _setup_profiling(ctx: click.Context):
+    """Record spans for this invocation and report them when it finishes."""
+    import time
+
+    from ..core.constants import APP_CACHE_DIR
+    from ..core.utils import profiling
+
+    profiling.enable()
+    command = " ".join(sys.argv[1:]) or CLI_NAME.lower()
+
+    def report():
+        profiling.print_summary(title=f"Profile: {command}")
+        trace_file = APP_CACHE_DIR / "traces" / f"trace-{int(time.time())}.json"
+        profiling.export_chrome_trace(trace_file)
+        click.echo(f"Chrome trace written to {trace_file}", err=True)
+
+    ctx.call_on_close(report)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 import click
 from viu_media.cli.utils.completion import anime_titles_shell_complete
@@ -112,6 +112,7 @@ if TYPE_CHECKING:
 )
 @click.pass_obj
 def download(config: AppConfig, **options: "Unpack[DownloadOptions]"):
+    from viu_media.cli.service.download.scheduler import JobState
     from viu_media.cli.service.download.service import DownloadService
     from viu_media.cli.service.feedback import FeedbackService
     from viu_media.cli.service.registry import MediaRegistryService
@@ -216,11 +217,11 @@ def download(config: AppConfig, **options: "Unpack[DownloadOptions]"):
                 return
             anime_to_download = [choice_map[title] for title in selected_titles]
 
-        total_downloaded = 0
         episode_range_str = options.get("episode_range")
         if not episode_range_str:
             raise ViuError("--episode-range is required.")
 
+        batches: List[Tuple[MediaItem, List[str]]] = []
         for media_item in anime_to_download:
             watch_history.add_media_to_list_if_not_present(media_item)
 
@@ -244,10 +245,7 @@ def download(config: AppConfig, **options: "Unpack[DownloadOptions]"):
                 feedback.info(
                     f"Preparing to download {len(episodes_to_download)} episodes for '{media_item.title.english}'."
                 )
-                download_service.download_episodes_sync(
-                    media_item, episodes_to_download
-                )
-                total_downloaded += len(episodes_to_download)
+                batches.append((media_item, episodes_to_download))
 
             except (ValueError, IndexError) as e:
                 feedback.error(
@@ -255,6 +253,10 @@ def download(config: AppConfig, **options: "Unpack[DownloadOptions]"):
                 )
                 continue
 
+        # all episodes of all selected anime run concurrently on one scheduler
+        jobs = download_service.download_batch_sync(batches)
+        total_downloaded = sum(1 for job in jobs if job.state == JobState.COMPLETED)
+
         feedback.success(
             f"Finished. Successfully downloaded a total of {total_downloaded} episodes."
         )
@@ -1,3 +1,4 @@
+import functools
 from typing import TYPE_CHECKING
 
 import click
@@ -11,12 +12,13 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import TypedDict
 
-    from viu_media.cli.service.feedback.service import FeedbackService
     from typing_extensions import Unpack
 
+    from ...core.downloader.base import BaseDownloader
     from ...libs.provider.anime.base import BaseAnimeProvider
     from ...libs.provider.anime.types import Anime
     from ...libs.selectors.base import BaseSelector
+    from ..service.download.scheduler import DownloadJob
 
     class Options(TypedDict):
         anime_title: tuple
@@ -105,6 +107,7 @@ if TYPE_CHECKING:
 def download(config: AppConfig, **options: "Unpack[Options]"):
     from viu_media.cli.service.feedback.service import FeedbackService
 
+    from ...core.downloader import create_downloader
     from ...core.exceptions import ViuError
     from ...libs.provider.anime.params import (
         AnimeParams,
@@ -112,10 +115,14 @@ def download(config: AppConfig, **options: "Unpack[Options]"):
     )
     from ...libs.provider.anime.provider import create_provider
     from ...libs.selectors.selector import create_selector
+    from ..service.download.scheduler import DownloadScheduler
 
     feedback = FeedbackService(config)
     provider = create_provider(config.general.provider)
     selector = create_selector(config)
+    # one downloader for every episode, so its connections are reused
+    downloader = create_downloader(config.downloads)
+    scheduler = DownloadScheduler.from_config(config.downloads)
 
     anime_titles = options["anime_title"]
     feedback.info(f"[green bold]Streaming:[/] {anime_titles}")
@@ -158,21 +165,9 @@ def download(config: AppConfig, **options: "Unpack[Options]"):
             from ..utils.parser import parse_episode_range
 
             try:
-                episodes_range = parse_episode_range(
-                    options["episode_range"], available_episodes
+                episodes = list(
+                    parse_episode_range(options["episode_range"], available_episodes)
                 )
-
-                for episode in episodes_range:
-                    download_anime(
-                        config,
-                        options,
-                        provider,
-                        selector,
-                        feedback,
-                        anime,
-                        anime_title,
-                        episode,
-                    )
             except (ValueError, IndexError) as e:
                 raise ViuError(f"Invalid episode range: {e}") from e
         else:
@@ -182,34 +177,48 @@ def download(config: AppConfig, **options: "Unpack[Options]"):
             )
             if not episode:
                 raise ViuError("No episode selected")
-            download_anime(
-                config,
-                options,
-                provider,
-                selector,
-                feedback,
-                anime,
-                anime_title,
-                episode,
+            episodes = [episode]
+
+        for episode in episodes:
+            scheduler.add(
+                f"{anime.title} Episode {episode}",
+                functools.partial(
+                    download_anime,
+                    config,
+                    options,
+                    provider,
+                    downloader,
+                    selector,
+                    anime,
+                    anime_title,
+                    episode,
+                ),
+                provider=config.general.provider.value,
             )
 
+    # the episodes of every title download concurrently
+    scheduler.run()
+    scheduler.print_report()
+    if scheduler.cancel_event.is_set():
+        raise click.Abort()
+
 
 def download_anime(
     config: AppConfig,
     download_options: "Options",
     provider: "BaseAnimeProvider",
+    downloader: "BaseDownloader",
     selector: "BaseSelector",
-    feedback: "FeedbackService",
     anime: "Anime",
     anime_title: str,
     episode: str,
+    job: "DownloadJob",
 ):
-    from ...core.downloader import DownloadParams, create_downloader
+    from ...core.downloader import DownloadParams
+    from ...core.downloader.postprocess import merge_subtitles
     from ...libs.provider.anime.params import EpisodeStreamsParams
 
-    downloader = create_downloader(config.downloads)
-
-    with feedback.progress("Fetching episode streams"):
+    with job.provider_slot():
         streams = provider.episode_streams(
             EpisodeStreamsParams(
                 anime_id=anime.id,
@@ -223,43 +232,62 @@ def download_anime(
                 f"Failed to get streams for anime: {anime.title}, episode: {episode}"
             )
 
-    if config.stream.server.value == "TOP":
-        with feedback.progress("Fetching top server"):
+        if config.stream.server.value == "TOP":
             server = next(streams, None)
             if not server:
                 raise ViuError(
                     f"Failed to get server for anime: {anime.title}, episode: {episode}"
                 )
-    else:
-        with feedback.progress("Fetching servers"):
-            servers = {server.name: server for server in streams}
-        servers_names = list(servers.keys())
-        if config.stream.server in servers_names:
-            server = servers[config.stream.server.value]
         else:
-            server_name = selector.choose("Select Server", servers_names)
-            if not server_name:
-                raise ViuError("Server not selected")
-            server = servers[server_name]
+            servers = {server.name: server for server in streams}
+            servers_names = list(servers.keys())
+            if config.stream.server in servers_names:
+                server = servers[config.stream.server.value]
+            else:
+                with job.interactive():
+                    server_name = selector.choose(
+                        f"Select Server for Episode {episode}", servers_names
+                    )
+                if not server_name:
+                    raise ViuError("Server not selected")
+                server = servers[server_name]
     stream_link = server.links[0].link
     if not stream_link:
         raise ViuError(
             f"Failed to get stream link for anime: {anime.title}, episode: {episode}"
         )
-    feedback.info(f"[green bold]Now Downloading:[/] {anime.title} Episode: {episode}")
-    downloader.download(
-        DownloadParams(
-            url=stream_link,
-            anime_title=anime.title,
-            episode_title=f"{anime.title}; Episode {episode}",
-            subtitles=[sub.url for sub in server.subtitles],
-            headers=server.headers,
-            vid_format=config.downloads.ytdlp_format,
-            force_unknown_ext=download_options["force_unknown_ext"],
-            verbose=download_options["verbose"],
-            hls_use_mpegts=download_options["hls_use_mpegts"],
-            hls_use_h264=download_options["hls_use_h264"],
-            silent=download_options["silent"],
-            no_check_certificate=config.downloads.no_check_certificate,
+    with job.host_slot(stream_link):
+        result = downloader.download(
+            DownloadParams(
+                url=stream_link,
+                anime_title=anime.title,
+                episode_title=f"{anime.title}; Episode {episode}",
+                subtitles=[sub.url for sub in server.subtitles],
+                headers=server.headers,
+                vid_format=config.downloads.ytdlp_format,
+                force_unknown_ext=download_options["force_unknown_ext"],
+                verbose=download_options["verbose"],
+                hls_use_mpegts=download_options["hls_use_mpegts"],
+                hls_use_h264=download_options["hls_use_h264"],
+                silent=download_options["silent"],
+                no_check_certificate=config.downloads.no_check_certificate,
+                # progress is rendered by the scheduler, which cannot prompt
+                show_progress=False,
+                progress_hooks=[job.progress_hook],
+                prompt=False,
+            )
+        )
+    job.check_cancelled()
+    if not result.success:
+        raise ViuError(result.error_message or "Unknown download error")
+    if download_options["merge"] and result.video_path and result.subtitle_paths:
+        # muxing runs on the scheduler's post-processing pool, freeing this slot
+        job.defer(
+            functools.partial(
+                merge_subtitles,
+                result.video_path,
+                result.subtitle_paths,
+                silent=download_options["silent"],
+                clean=download_options["clean"],
+            )
         )
-    )
@@ -7,6 +7,8 @@ commands = {
     "list": "list.list_cmd",
     "resume": "resume.resume",
     "clear": "clear.clear_cmd",
+    "pause": "pause.pause",
+    "cancel": "cancel.cancel",
 }
 
 
@@ -15,7 +17,7 @@ commands = {
     name="queue",
     root="viu_media.cli.commands.queue.commands",
     invoke_without_command=False,
-    help="Manage the download queue (add, list, resume, clear).",
+    help="Manage the download queue (add, list, pause, resume, cancel, clear).",
     short_help="Manage the download queue.",
     lazy_subcommands=commands,
 )
@@ -73,6 +73,7 @@ def add(config: AppConfig, **options):
     from viu_media.cli.service.download import DownloadService
     from viu_media.cli.service.feedback import FeedbackService
     from viu_media.cli.service.registry import MediaRegistryService
+    from viu_media.cli.service.worker.control import WorkerClient, WorkerUnavailable
     from viu_media.cli.utils.parser import parse_episode_range
     from viu_media.libs.media_api.api import create_api_client
     from viu_media.libs.media_api.params import MediaSearchParams
@@ -83,9 +84,13 @@ def add(config: AppConfig, **options):
     feedback = FeedbackService(config)
     selector = create_selector(config)
     media_api = create_api_client(config.general.media_api, config)
-    provider = create_provider(config.general.provider)
-    registry = MediaRegistryService(config.general.media_api, config.media_registry)
-    download_service = DownloadService(config, registry, media_api, provider)
+    # a running worker queues and starts the downloads itself
+    worker = WorkerClient.connect()
+    download_service = None
+    if not worker:
+        provider = create_provider(config.general.provider)
+        registry = MediaRegistryService(config.general.media_api, config.media_registry)
+        download_service = DownloadService(config, registry, media_api, provider)
 
     try:
         # Build search params mirroring anilist download
@@ -194,9 +199,13 @@ def add(config: AppConfig, **options):
                     continue
 
                 queued_count = 0
-                for ep in episodes_to_queue:
-                    if download_service.add_to_queue(media_item, ep):
-                        queued_count += 1
+                if worker:
+                    queued_count = worker.enqueue(media_item, episodes_to_queue)
+                else:
+                    assert download_service is not None
+                    for ep in episodes_to_queue:
+                        if download_service.add_to_queue(media_item, ep):
+                            queued_count += 1
 
                 total_queued += queued_count
                 feedback.success(
@@ -210,7 +219,14 @@ def add(config: AppConfig, **options):
         feedback.success(
             f"Done. Total of {total_queued} episode(s) queued across all selections."
         )
+        if worker:
+            feedback.info("The running worker has started downloading them.")
 
+    except WorkerUnavailable:
+        feedback.error(
+            "No background worker is running.",
+            "It exited while queueing; run the command again to queue the rest.",
+        )
     except ViuError as e:
         feedback.error("Queue add failed", str(e))
     except Exception as e:
@@ -0,0 +1,46 @@
+import click
+from viu_media.core.config import AppConfig
+
+
+@click.command(name="cancel", help="Cancel queued or running downloads of an anime.")
+@click.argument("media_id", type=int)
+@click.option(
+    "--episode",
+    "-e",
+    "episodes",
+    multiple=True,
+    help="Episode to cancel; all episodes of the anime when omitted.",
+)
+@click.pass_obj
+def cancel(config: AppConfig, media_id: int, episodes: tuple[str, ...]):
+    from viu_media.cli.service.feedback import FeedbackService
+    from viu_media.cli.service.registry import MediaRegistryService
+    from viu_media.cli.service.registry.models import DownloadStatus
+    from viu_media.cli.service.worker.control import WorkerClient, WorkerUnavailable
+
+    feedback = FeedbackService(config)
+    if worker := WorkerClient.connect():
+        try:
+            cancelled = worker.cancel(media_id, list(episodes) or None)
+        except WorkerUnavailable:
+            # the worker exited since connecting; only the registry is left
+            pass
+        else:
+            feedback.success(f"Cancelled {cancelled} episode(s).")
+            return
+
+    # without a worker only the queue entries in the registry exist
+    registry = MediaRegistryService(config.general.media_api, config.media_registry)
+    cancelled = 0
+    for queued_id, ep in registry.get_episodes_by_download_status(
+        DownloadStatus.QUEUED
+    ):
+        if queued_id != media_id or (episodes and ep not in episodes):
+            continue
+        if registry.update_episode_download_status(
+            media_id=queued_id,
+            episode_number=ep,
+            status=DownloadStatus.NOT_DOWNLOADED,
+        ):
+            cancelled += 1
+    feedback.success(f"Cancelled {cancelled} queued episode(s).")
@@ -12,14 +12,27 @@ def clear_cmd(config: AppConfig, force: bool):
     from viu_media.cli.service.feedback import FeedbackService
     from viu_media.cli.service.registry import MediaRegistryService
     from viu_media.cli.service.registry.models import DownloadStatus
+    from viu_media.cli.service.worker.control import WorkerClient, WorkerUnavailable
 
     feedback = FeedbackService(config)
-    registry = MediaRegistryService(config.general.media_api, config.media_registry)
 
     if not force and not click.confirm("This will clear all queued items. Continue?"):
         feedback.info("Aborted.")
         return
 
+    # the worker also drops the queued jobs it is holding
+    if worker := WorkerClient.connect():
+        try:
+            cleared = worker.cancel(include_running=False)
+        except WorkerUnavailable:
+            # the worker exited since connecting; only the registry is left
+            pass
+        else:
+            feedback.success(f"Cleared {cleared} queued episode(s).")
+            return
+
+    registry = MediaRegistryService(config.general.media_api, config.media_registry)
+
     cleared = 0
     queued = registry.get_episodes_by_download_status(DownloadStatus.QUEUED)
     for media_id, ep in queued:
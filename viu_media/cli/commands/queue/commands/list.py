@@ -13,9 +13,11 @@ def list_cmd(config: AppConfig, status: str | None, detailed: bool | None):
     from viu_media.cli.service.feedback import FeedbackService
     from viu_media.cli.service.registry import MediaRegistryService
     from viu_media.cli.service.registry.models import DownloadStatus
+    from viu_media.cli.service.worker.control import WorkerClient, WorkerUnavailable
 
     feedback = FeedbackService(config)
     registry = MediaRegistryService(config.general.media_api, config.media_registry)
+    worker = WorkerClient.connect()
 
     status_map = {
         "queued": DownloadStatus.QUEUED,
@@ -46,7 +48,16 @@ def list_cmd(config: AppConfig, status: str | None, detailed: bool | None):
         from rich.console import Console
         from rich.table import Table
 
-        stats = registry.get_download_statistics()
+        worker_status = stats = None
+        if worker:
+            try:
+                worker_status = worker.status()
+                stats = worker.stats()
+            except WorkerUnavailable:
+                # the worker exited since connecting
+                worker_status = stats = None
+        if stats is None:
+            stats = registry.get_download_statistics()
         table = Table(title="Queue Status")
         table.add_column("Metric")
         table.add_column("Value")
@@ -58,3 +69,26 @@ def list_cmd(config: AppConfig, status: str | None, detailed: bool | None):
 
         console = Console()
         console.print(table)
+
+        if not worker_status:
+            feedback.info("No background worker is running.")
+            return
+        state = "paused" if worker_status["paused"] else "running"
+        feedback.info(f"Worker {state} (pid {worker_status['pid']}).")
+        if worker_status["jobs"]:
+            jobs = Table(title="Worker Jobs")
+            jobs.add_column("Anime")
+            jobs.add_column("Episode")
+            jobs.add_column("State")
+            jobs.add_column("Progress")
+            for job in worker_status["jobs"]:
+                progress = ""
+                if job["total_bytes"]:
+                    progress = f"{job['downloaded_bytes'] / job['total_bytes']:.0%}"
+                jobs.add_row(
+                    job["title"] or str(job["media_id"]),
+                    job["episode"],
+                    job["state"],
+                    progress,
+                )
+            console.print(jobs)
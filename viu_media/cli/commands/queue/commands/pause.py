@@ -0,0 +1,27 @@
+import click
+from viu_media.core.config import AppConfig
+
+
+@click.command(
+    name="pause", help="Hold the running worker's queued downloads until resumed."
+)
+@click.pass_obj
+def pause(config: AppConfig):
+    from viu_media.cli.service.feedback import FeedbackService
+    from viu_media.cli.service.worker.control import WorkerClient, WorkerUnavailable
+
+    feedback = FeedbackService(config)
+    worker = WorkerClient.connect()
+    if not worker:
+        feedback.warning("No background worker is running.")
+        return
+
+    try:
+        worker.pause()
+    except WorkerUnavailable:
+        feedback.warning("No background worker is running.")
+        return
+    feedback.success(
+        "Paused the background worker.",
+        "Running downloads finish; run 'viu queue resume' to continue.",
+    )
@@ -10,10 +10,21 @@ def resume(config: AppConfig):
     from viu_media.cli.service.download.service import DownloadService
     from viu_media.cli.service.feedback import FeedbackService
     from viu_media.cli.service.registry import MediaRegistryService
+    from viu_media.cli.service.worker.control import WorkerClient, WorkerUnavailable
     from viu_media.libs.media_api.api import create_api_client
     from viu_media.libs.provider.anime.provider import create_provider
 
     feedback = FeedbackService(config)
+    if worker := WorkerClient.connect():
+        try:
+            worker.resume()
+        except WorkerUnavailable:
+            # the worker exited since connecting; submit the downloads here
+            pass
+        else:
+            feedback.success("Resumed the background worker's downloads.")
+            return
+
     media_api = create_api_client(config.general.media_api, config)
     provider = create_provider(config.general.provider)
     registry = MediaRegistryService(config.general.media_api, config.media_registry)
@@ -55,11 +55,10 @@ if TYPE_CHECKING:
 @click.option(
     "--sort",
     type=click.Choice(
-        ["title", "score", "popularity", "year", "episodes", "updated"],
+        ["relevance", "title", "score", "popularity", "year", "episodes", "updated"],
         case_sensitive=False,
     ),
-    default="title",
-    help="Sort results by field",
+    help="Sort results by field [default: relevance with a query, else title]",
 )
 @click.option("--limit", type=int, default=20, help="Maximum number of results to show")
 @click.option(
@@ -81,7 +80,7 @@ def search(
     year: int | None,
     min_score: float | None,
     max_score: float | None,
-    sort: str,
+    sort: str | None,
     limit: int,
     output_json: bool,
     api: str,
@@ -128,11 +127,12 @@ def _build_search_params(
     year: int | None,
     min_score: float | None,
     max_score: float | None,
-    sort: str,
+    sort: str | None,
     limit: int,
 ) -> MediaSearchParams:
     """Build MediaSearchParams from command options for local filtering."""
     sort_map = {
+        "relevance": MediaSort.SEARCH_MATCH,
         "title": MediaSort.TITLE_ROMAJI,
         "score": MediaSort.SCORE_DESC,
         "popularity": MediaSort.POPULARITY_DESC,
@@ -151,6 +151,9 @@ def _build_search_params(
 
     # Note: Local search handles status separately as it's part of the index, not MediaItem
 
+    # title index matches come best first unless another order is asked for
+    sort = sort or ("relevance" if query else "title")
+
     return MediaSearchParams(
         query=query,
         per_page=limit,
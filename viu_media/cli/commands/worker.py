@@ -1,5 +1,6 @@
 import click
 from viu_media.core.config import AppConfig
+from viu_media.core.exceptions import ViuError
 
 
 @click.command(help="Run the background worker for notifications and downloads.")
@@ -44,4 +45,7 @@ def worker(config: AppConfig):
     )
 
     feedback.info("Starting background worker...", "Press Ctrl+C to stop.")
-    worker_service.run()
+    try:
+        worker_service.run()
+    except ViuError as e:
+        feedback.error("Could not start the background worker", str(e))
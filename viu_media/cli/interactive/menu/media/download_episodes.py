@@ -9,6 +9,7 @@ def download_episodes(ctx: Context, state: State) -> State | InternalDirective:
     from viu_media.cli.utils.search import find_best_match_title
     from .....core.utils.normalizer import normalize_title
     from ....service.download.service import DownloadService
+    from ....service.provider_mapping import PinnedMappingUnavailable
 
     feedback = ctx.feedback
     selector = ctx.selector
@@ -26,33 +27,65 @@ def download_episodes(ctx: Context, state: State) -> State | InternalDirective:
         return InternalDirective.BACK
 
     # Step 1: Find the anime on the provider to get a full episode list
-    with feedback.progress(
-        f"Searching for '{media_title}' on {provider.__class__.__name__}..."
-    ):
-        provider_search_results = provider.search(
-            SearchParams(
-                query=normalize_title(media_title, config.general.provider.value, True)
+    full_provider_anime = None
+    pinned_error = None
+    with feedback.progress(f"Fetching episode list for '{media_title}'..."):
+        try:
+            full_provider_anime = ctx.provider_mappings.get_mapped_anime(
+                provider,
+                config.general.provider,
+                media_item.id,
+                config.stream.translation_type,
+                media_title,
             )
+        except PinnedMappingUnavailable as e:
+            pinned_error = e
+    if pinned_error:
+        feedback.warning(
+            str(pinned_error),
+            "Searching instead; use 'Rematch Provider Anime' to pick another",
         )
 
-    if not provider_search_results or not provider_search_results.results:
-        feedback.warning(f"Could not find '{media_title}' on provider.")
-        return InternalDirective.BACK
+    if not full_provider_anime:
+        with feedback.progress(
+            f"Searching for '{media_title}' on {provider.__class__.__name__}..."
+        ):
+            provider_search_results = provider.search(
+                SearchParams(
+                    query=normalize_title(
+                        media_title, config.general.provider.value, True
+                    )
+                )
+            )
 
-    provider_results_map = {res.title: res for res in provider_search_results.results}
-    best_match_title = find_best_match_title(
-        provider_results_map, config.general.provider, media_item
-    )
-    selected_provider_anime_ref = provider_results_map[best_match_title]
+        if not provider_search_results or not provider_search_results.results:
+            feedback.warning(f"Could not find '{media_title}' on provider.")
+            return InternalDirective.BACK
 
-    with feedback.progress(f"Fetching episode list for '{best_match_title}'..."):
-        full_provider_anime = provider.get(
-            AnimeParams(id=selected_provider_anime_ref.id, query=media_title)
+        provider_results_map = {
+            res.title: res for res in provider_search_results.results
+        }
+        best_match_title = find_best_match_title(
+            provider_results_map, config.general.provider, media_item
         )
+        selected_provider_anime_ref = provider_results_map[best_match_title]
 
-    if not full_provider_anime:
-        feedback.warning(f"Failed to fetch details for '{best_match_title}'.")
-        return InternalDirective.BACK
+        with feedback.progress(f"Fetching episode list for '{best_match_title}'..."):
+            full_provider_anime = provider.get(
+                AnimeParams(id=selected_provider_anime_ref.id, query=media_title)
+            )
+
+        if not full_provider_anime:
+            feedback.warning(f"Failed to fetch details for '{best_match_title}'.")
+            return InternalDirective.BACK
+
+        ctx.provider_mappings.save(
+            media_item.id,
+            config.general.provider,
+            config.stream.translation_type,
+            selected_provider_anime_ref.id,
+            selected_provider_anime_ref.title,
+        )
 
     available_episodes = getattr(
         full_provider_anime.episodes, config.stream.translation_type, []
@@ -124,16 +124,15 @@ def _create_local_random_media_list(ctx: Context, state: State) -> MenuAction:
 
         loading_message = "Getting random local media"
         with feedback.progress(loading_message):
-            # Get all records and pick random ones
-            all_records = list(ctx.media_registry.get_all_media_records())
+            # Pick from the index so only the sampled records are read
+            media_ids = ctx.media_registry.get_media_ids()
 
-        if not all_records:
+        if not media_ids:
             feedback.info("No media found in local registry")
             return InternalDirective.BACK
 
         # Get up to 50 random records
-        random_records = random.sample(all_records, min(50, len(all_records)))
-        random_ids = [record.media_item.id for record in random_records]
+        random_ids = random.sample(media_ids, min(50, len(media_ids)))
 
         search_params = MediaSearchParams(id_in=random_ids)
         result = ctx.media_registry.search_for_media(search_params)
@@ -1,8 +1,10 @@
 import json
 import logging
 
-from .....core.constants import APP_CACHE_DIR, SCRIPTS_DIR
+from .....core.constants import APP_CACHE_DIR
+from .....core.utils import json_codec
 from .....libs.media_api.params import MediaSearchParams
+from ....utils.template import load_template
 from ...session import Context, session
 from ...state import InternalDirective, MediaApiState, MenuName, State
 
@@ -10,10 +12,7 @@ logger = logging.getLogger(__name__)
 
 SEARCH_CACHE_DIR = APP_CACHE_DIR / "search"
 SEARCH_RESULTS_FILE = SEARCH_CACHE_DIR / "current_search_results.json"
-FZF_SCRIPTS_DIR = SCRIPTS_DIR / "fzf"
-SEARCH_TEMPLATE_SCRIPT = (FZF_SCRIPTS_DIR / "search.template.sh").read_text(
-    encoding="utf-8"
-)
+SEARCH_TEMPLATE_SCRIPT = "fzf/search.template.sh"
 
 
 @session.menu
@@ -38,8 +37,6 @@ def dynamic_search(ctx: Context, state: State) -> State | InternalDirective:
     if ctx.media_api.is_authenticated() and profile:
         auth_header = f"Bearer {profile.token}"
 
-    search_command = SEARCH_TEMPLATE_SCRIPT
-
     replacements = {
         "GRAPHQL_ENDPOINT": "https://graphql.anilist.co",
         "GRAPHQL_QUERY": search_query_escaped,
@@ -48,8 +45,7 @@ def dynamic_search(ctx: Context, state: State) -> State | InternalDirective:
         "AUTH_HEADER": auth_header,
     }
 
-    for key, value in replacements.items():
-        search_command = search_command.replace(f"{{{key}}}", str(value))
+    search_command = load_template(SEARCH_TEMPLATE_SCRIPT).render(replacements)
 
     try:
         # Prepare preview functionality
@@ -83,8 +79,7 @@ def dynamic_search(ctx: Context, state: State) -> State | InternalDirective:
         logger.error("Search results file not found")
         return InternalDirective.MAIN
 
-    with open(SEARCH_RESULTS_FILE, "r", encoding="utf-8") as f:
-        raw_data = json.load(f)
+    raw_data = json_codec.read(SEARCH_RESULTS_FILE)
 
     # Transform the raw data into MediaSearchResult
     search_result = ctx.media_api.transform_raw_search_data(raw_data)
@@ -1,9 +1,12 @@
 import logging
 import random
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
+
+import httpx
 
 from .....libs.media_api.params import MediaSearchParams, UserMediaListSearchParams
 from .....libs.media_api.types import (
+    MediaSearchResult,
     MediaSort,
     MediaStatus,
     UserMediaListStatus,
@@ -151,7 +154,7 @@ def _create_search_media_list(ctx: Context, state: State) -> MenuAction:
         loading_message = "Fetching media list"
         result = None
         with feedback.progress(loading_message):
-            result = ctx.media_api.search_media(search_params)
+            result = search_media_with_fallback(ctx, search_params)
 
         if result:
             return State(
@@ -170,6 +173,27 @@ def _create_search_media_list(ctx: Context, state: State) -> MenuAction:
     return action
 
 
+def search_media_with_fallback(
+    ctx: Context, search_params: MediaSearchParams
+) -> Optional[MediaSearchResult]:
+    """Search the media api, falling back to the local registry when it is unreachable."""
+    try:
+        result = ctx.media_api.search_media(search_params)
+    except httpx.HTTPError as e:
+        logger.warning(f"Media api search failed: {e}")
+        result = None
+    if result:
+        return result
+
+    local_result = ctx.media_registry.search_for_media(search_params)
+    if local_result.media:
+        ctx.feedback.warning(
+            "Media api unavailable, showing matches from your local registry"
+        )
+        return local_result
+    return None
+
+
 def _create_user_list_action(
     ctx: Context, state: State, status: UserMediaListStatus
 ) -> MenuAction:
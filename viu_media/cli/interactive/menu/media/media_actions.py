@@ -19,8 +19,6 @@ MenuAction = Callable[[], State | InternalDirective]
 
 @session.menu
 def media_actions(ctx: Context, state: State) -> State | InternalDirective:
-    from ....service.registry.service import DownloadStatus
-
     feedback = ctx.feedback
 
     icons = ctx.config.general.icons
@@ -33,15 +31,7 @@ def media_actions(ctx: Context, state: State) -> State | InternalDirective:
     progress = _get_progress_string(ctx, state.media_api.media_item)
 
     # Check for downloaded episodes to conditionally show options
-    record = ctx.media_registry.get_media_record(media_item.id)
-    has_downloads = False
-    if record:
-        has_downloads = any(
-            ep.download_status == DownloadStatus.COMPLETED
-            and ep.file_path
-            and ep.file_path.exists()
-            for ep in record.media_episodes
-        )
+    has_downloads = ctx.downloads_library.has_downloads(media_item.id)
 
     options: Dict[str, MenuAction] = {
         f"{'▶️ ' if icons else ''}Stream {progress}": _stream(ctx, state),
@@ -82,6 +72,9 @@ def media_actions(ctx: Context, state: State) -> State | InternalDirective:
             f"{'📀 ' if icons else ''}Change Provider (Current: {ctx.config.general.provider.value.upper()})": _change_provider(
                 ctx, state
             ),
+            f"{'🧷 ' if icons else ''}Rematch Provider Anime": _rematch_provider(
+                ctx, state
+            ),
             f"{'🔘 ' if icons else ''}Toggle Auto Select Anime (Current: {ctx.config.general.auto_select_anime_result})": _toggle_config_state(
                 ctx, state, "AUTO_ANIME"
             ),
@@ -313,6 +306,21 @@ def _change_provider(ctx: Context, state: State) -> MenuAction:
     return action
 
 
+def _rematch_provider(ctx: Context, state: State) -> MenuAction:
+    def action():
+        media_item = state.media_api.media_item
+        ctx.provider_mappings.invalidate(
+            media_item.id,
+            ctx.config.general.provider,
+            ctx.config.stream.translation_type,
+            force=True,
+        )
+        ctx.switch.force_provider_results_menu()
+        return State(menu_name=MenuName.PROVIDER_SEARCH, media_api=state.media_api)
+
+    return action
+
+
 def _toggle_config_state(
     ctx: Context,
     state: State,
@@ -10,27 +10,13 @@ MenuAction = Callable[[], Union[State, InternalDirective]]
 @session.menu
 def play_downloads(ctx: Context, state: State) -> State | InternalDirective:
     """Menu to select and play locally downloaded episodes."""
-    from ....service.registry.models import DownloadStatus
-
     feedback = ctx.feedback
     media_item = state.media_api.media_item
     current_episode_num = state.provider.episode
 
-    record = ctx.media_registry.get_media_record(media_item.id)
-    if not record or not record.media_episodes:
-        feedback.warning("No downloaded episodes found for this anime.")
-        return InternalDirective.BACK
-
-    downloaded_episodes = {
-        ep.episode_number: ep.file_path
-        for ep in record.media_episodes
-        if ep.download_status == DownloadStatus.COMPLETED
-        and ep.file_path
-        and ep.file_path.exists()
-    }
-
+    downloaded_episodes = ctx.downloads_library.get_downloaded_episodes(media_item.id)
     if not downloaded_episodes:
-        feedback.warning("No complete downloaded episodes found.")
+        feedback.warning("No downloaded episodes found for this anime.")
         return InternalDirective.BACK
 
     chosen_episode: str | None = current_episode_num
@@ -89,7 +75,6 @@ def play_downloads(ctx: Context, state: State) -> State | InternalDirective:
 def downloads_player_controls(
     ctx: Context, state: State
 ) -> Union[State, InternalDirective]:
-    from ....service.registry.models import DownloadStatus
 
     feedback = ctx.feedback
     feedback.clear_console()
@@ -104,18 +89,10 @@ def downloads_player_controls(
     if not media_item or not current_episode_num:
         feedback.error("Player state is incomplete. Returning.")
         return InternalDirective.BACK
-    record = ctx.media_registry.get_media_record(media_item.id)
-    if not record or not record.media_episodes:
+    downloaded_episodes = ctx.downloads_library.get_downloaded_episodes(media_item.id)
+    if not downloaded_episodes:
         feedback.warning("No downloaded episodes found for this anime.")
         return InternalDirective.BACK
-
-    downloaded_episodes = {
-        ep.episode_number: ep.file_path
-        for ep in record.media_episodes
-        if ep.download_status == DownloadStatus.COMPLETED
-        and ep.file_path
-        and ep.file_path.exists()
-    }
     available_episodes = list(sorted(downloaded_episodes.keys(), key=float))
     current_index = available_episodes.index(current_episode_num)
 
@@ -134,6 +111,7 @@ def downloads_player_controls(
                 query=media_item.title.english or media_item.title.romaji or "",
                 episode=current_episode_num,
                 start_time=current_start_time,
+                progress_hook=ctx.watch_history.progress_hook(media_item),
             ),
             media_item=media_item,
             local=True,
@@ -188,7 +166,6 @@ def downloads_player_controls(
 
 def _next_episode(ctx: Context, state: State) -> MenuAction:
     def action():
-        from ....service.registry.models import DownloadStatus
 
         feedback = ctx.feedback
 
@@ -202,19 +179,13 @@ def _next_episode(ctx: Context, state: State) -> MenuAction:
             ctx.switch.force_dont_play()
             return InternalDirective.RELOAD
 
-        record = ctx.media_registry.get_media_record(media_item.id)
-        if not record or not record.media_episodes:
+        downloaded_episodes = ctx.downloads_library.get_downloaded_episodes(
+            media_item.id
+        )
+        if not downloaded_episodes:
             feedback.warning("No downloaded episodes found for this anime.")
             ctx.switch.force_dont_play()
             return InternalDirective.RELOAD
-
-        downloaded_episodes = {
-            ep.episode_number: ep.file_path
-            for ep in record.media_episodes
-            if ep.download_status == DownloadStatus.COMPLETED
-            and ep.file_path
-            and ep.file_path.exists()
-        }
         available_episodes = list(sorted(downloaded_episodes.keys(), key=float))
         current_index = available_episodes.index(current_episode_num)
 
@@ -237,7 +208,6 @@ def _next_episode(ctx: Context, state: State) -> MenuAction:
 
 def _previous_episode(ctx: Context, state: State) -> MenuAction:
     def action():
-        from ....service.registry.models import DownloadStatus
 
         feedback = ctx.feedback
 
@@ -251,19 +221,13 @@ def _previous_episode(ctx: Context, state: State) -> MenuAction:
             ctx.switch.force_dont_play()
             return InternalDirective.RELOAD
 
-        record = ctx.media_registry.get_media_record(media_item.id)
-        if not record or not record.media_episodes:
+        downloaded_episodes = ctx.downloads_library.get_downloaded_episodes(
+            media_item.id
+        )
+        if not downloaded_episodes:
             feedback.warning("No downloaded episodes found for this anime.")
             ctx.switch.force_dont_play()
             return InternalDirective.RELOAD
-
-        downloaded_episodes = {
-            ep.episode_number: ep.file_path
-            for ep in record.media_episodes
-            if ep.download_status == DownloadStatus.COMPLETED
-            and ep.file_path
-            and ep.file_path.exists()
-        }
         available_episodes = list(sorted(downloaded_episodes.keys(), key=float))
         current_index = available_episodes.index(current_episode_num)
 
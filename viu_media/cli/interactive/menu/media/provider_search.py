@@ -9,6 +9,7 @@ def provider_search(ctx: Context, state: State) -> State | InternalDirective:
     from viu_media.cli.utils.search import find_best_match_title
 
     from .....core.utils.normalizer import normalize_title, update_user_normalizer_json
+    from ....service.provider_mapping import PinnedMappingUnavailable
 
     feedback = ctx.feedback
     media_item = state.media_api.media_item
@@ -26,10 +27,40 @@ def provider_search(ctx: Context, state: State) -> State | InternalDirective:
         )
         return InternalDirective.BACK
 
+    translation_type = config.stream.translation_type
+    # a forced results menu means the user wants to re-pick the match
+    force_results_menu = ctx.switch.show_provider_results_menu
+
+    if not force_results_menu:
+        mapped_provider_anime = None
+        pinned_error = None
+        with feedback.progress(f"[cyan]Fetching full details for '{media_title}'"):
+            try:
+                mapped_provider_anime = ctx.provider_mappings.get_mapped_anime(
+                    provider,
+                    config.general.provider,
+                    media_item.id,
+                    translation_type,
+                    media_title.lower(),
+                )
+            except PinnedMappingUnavailable as e:
+                pinned_error = e
+        if pinned_error:
+            feedback.warning(
+                str(pinned_error),
+                "Searching instead; use 'Rematch Provider Anime' to pick another",
+            )
+        if mapped_provider_anime:
+            return State(
+                menu_name=MenuName.EPISODES,
+                media_api=state.media_api,
+                provider=ProviderState(anime=mapped_provider_anime),
+            )
+
     provider_search_results = provider.search(
         SearchParams(
             query=normalize_title(media_title, config.general.provider.value, True),
-            translation_type=config.stream.translation_type,
+            translation_type=translation_type,
         )
     )
 
@@ -45,9 +76,10 @@ def provider_search(ctx: Context, state: State) -> State | InternalDirective:
     }
 
     selected_provider_anime: SearchResult | None = None
+    pin_mapping = False
 
     # --- Auto-Select or Prompt ---
-    if config.general.auto_select_anime_result:
+    if config.general.auto_select_anime_result and not force_results_menu:
         # Use fuzzy matching to find the best title
         best_match_title = find_best_match_title(
             provider_results_map, config.general.provider, media_item
@@ -72,6 +104,7 @@ def provider_search(ctx: Context, state: State) -> State | InternalDirective:
                 chosen_title, media_title, config.general.provider.value
             )
         selected_provider_anime = provider_results_map[chosen_title]
+        pin_mapping = True
 
     with feedback.progress(
         f"[cyan]Fetching full details for '{selected_provider_anime.title}'"
@@ -86,6 +119,15 @@ def provider_search(ctx: Context, state: State) -> State | InternalDirective:
         )
         return InternalDirective.BACK
 
+    ctx.provider_mappings.save(
+        media_item.id,
+        config.general.provider,
+        translation_type,
+        selected_provider_anime.id,
+        selected_provider_anime.title,
+        pinned=pin_mapping,
+    )
+
     return State(
         menu_name=MenuName.EPISODES,
         media_api=state.media_api,
@@ -184,8 +184,11 @@ def _handle_pagination(
         loading_message = "Fetching media list"
         result = None
         new_search_params = MediaSearchParams(**search_params_dict, page=new_page)
+        # later pages fall back to the local registry just like the first one
+        from .main import search_media_with_fallback
+
         with feedback.progress(loading_message):
-            result = ctx.media_api.search_media(new_search_params)
+            result = search_media_with_fallback(ctx, new_search_params)
 
         if result:
             return State(
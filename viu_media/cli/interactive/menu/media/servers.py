@@ -92,6 +92,7 @@ def servers(ctx: Context, state: State) -> State | InternalDirective:
             subtitles=[sub.url for sub in selected_server.subtitles],
             headers=selected_server.headers,
             start_time=state.provider.start_time,
+            progress_hook=ctx.watch_history.progress_hook(media_item),
         ),
         state.provider.anime,
         state.media_api.media_item,
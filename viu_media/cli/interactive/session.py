@@ -1,8 +1,10 @@
+import importlib
 import importlib.util
 import logging
 import os
+import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 import click
 
@@ -16,9 +18,12 @@ if TYPE_CHECKING:
     from ...libs.selectors.base import BaseSelector
     from ..service.auth import AuthService
     from ..service.feedback import FeedbackService
+    from ..service.library import DownloadsLibraryService
     from ..service.player import PlayerService
+    from ..service.provider_mapping import ProviderMappingService
     from ..service.registry import MediaRegistryService
     from ..service.session import SessionsService
+    from ..service.session.service import SessionHistory
     from ..service.watch_history import WatchHistoryService
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,28 @@ logger = logging.getLogger(__name__)
 
 MENUS_DIR = APP_DIR / "cli" / "interactive" / "menu"
 
+# Static manifest of menu package -> menu name -> module defining it.
+# Modules are only imported on first navigation to one of their menus.
+MENU_MANIFEST: dict[str, dict[MenuName, str]] = {
+    "media": {
+        MenuName.MAIN: "main",
+        MenuName.RESULTS: "results",
+        MenuName.MEDIA_ACTIONS: "media_actions",
+        MenuName.PROVIDER_SEARCH: "provider_search",
+        MenuName.EPISODES: "episodes",
+        MenuName.SERVERS: "servers",
+        MenuName.PLAYER_CONTROLS: "player_controls",
+        MenuName.DOWNLOADS: "downloads",
+        MenuName.DYNAMIC_SEARCH: "dynamic_search",
+        MenuName.DOWNLOAD_EPISODES: "download_episodes",
+        MenuName.PLAY_DOWNLOADS: "play_downloads",
+        MenuName.DOWNLOADS_PLAYER_CONTROLS: "play_downloads",
+        MenuName.MEDIA_REVIEW: "media_review",
+        MenuName.MEDIA_CHARACTERS: "media_characters",
+        MenuName.MEDIA_AIRING_SCHEDULE: "media_airing_schedule",
+    }
+}
+
 
 @dataclass
 class Switch:
@@ -91,6 +118,8 @@ class Context:
     _session: Optional["SessionsService"] = None
     _auth: Optional["AuthService"] = None
     _player: Optional["PlayerService"] = None
+    _provider_mappings: Optional["ProviderMappingService"] = None
+    _downloads_library: Optional["DownloadsLibraryService"] = None
 
     @property
     def provider(self) -> "BaseAnimeProvider":
@@ -164,6 +193,26 @@ class Context:
             )
         return self._media_registry
 
+    @property
+    def provider_mappings(self) -> "ProviderMappingService":
+        if not self._provider_mappings:
+            from ..service.provider_mapping.service import ProviderMappingService
+
+            self._provider_mappings = ProviderMappingService(
+                self.config.general.media_api, self.config.media_registry
+            )
+        return self._provider_mappings
+
+    @property
+    def downloads_library(self) -> "DownloadsLibraryService":
+        if not self._downloads_library:
+            from ..service.library.service import DownloadsLibraryService
+
+            self._downloads_library = DownloadsLibraryService(
+                self.config.downloads.downloads_dir, self.media_registry
+            )
+        return self._downloads_library
+
     @property
     def watch_history(self) -> "WatchHistoryService":
         if not self._watch_history:
@@ -202,8 +251,10 @@ class Menu:
 
 class Session:
     _context: Context
-    _history: List[State] = []
+    _history: "SessionHistory" = []
     _menus: dict[MenuName, Menu] = {}
+    _lazy_menus: dict[MenuName, str] = {}
+    _run_started_at: Optional[float] = None
 
     def _load_context(self, config: AppConfig):
         self._context = Context(config)
@@ -222,8 +273,9 @@ class Session:
         self,
         config: AppConfig,
         resume: bool = False,
-        history: Optional[List[State]] = None,
+        history: Optional["SessionHistory"] = None,
     ):
+        self._run_started_at = time.perf_counter()
         self._load_context(config)
         if resume:
             if history := self._context.session.get_default_session_history():
@@ -260,10 +312,23 @@ class Session:
         """Run the main session loop."""
         while self._history:
             current_state = self._history[-1]
+            if not isinstance(current_state, State):
+                # a resumed entry stored as a snapshot
+                current_state = self._context.session.rehydrate(
+                    current_state,
+                    self._context.media_registry,
+                    self._context.media_api,
+                )
+                self._history[-1] = current_state
 
-            next_step = self._menus[current_state.menu_name].execute(
-                self._context, current_state
-            )
+            menu = self._get_menu(current_state.menu_name)
+            if self._run_started_at is not None:
+                logger.info(
+                    f"Time to first menu ({menu.name.value}): {(time.perf_counter() - self._run_started_at) * 1000:.1f}ms"
+                )
+                self._run_started_at = None
+
+            next_step = menu.execute(self._context, current_state)
 
             if isinstance(next_step, InternalDirective):
                 if next_step == InternalDirective.MAIN:
@@ -308,7 +373,38 @@ class Session:
 
         return decorator
 
+    def _get_menu(self, menu_name: MenuName) -> Menu:
+        """Return a registered menu, importing its module on first use."""
+        if menu_name in self._menus:
+            return self._menus[menu_name]
+
+        module_name = self._lazy_menus.get(menu_name)
+        if module_name:
+            started_at = time.perf_counter()
+            # Importing the module runs its @session.menu decorators
+            importlib.import_module(module_name)
+            logger.debug(
+                f"Loaded menu module '{module_name}' in {(time.perf_counter() - started_at) * 1000:.1f}ms"
+            )
+        if menu_name not in self._menus:
+            raise KeyError(f"Menu '{menu_name.value}' is not registered")
+        return self._menus[menu_name]
+
     def load_menus_from_folder(self, package: str):
+        """
+        Register the menus of a package.
+
+        Packages listed in MENU_MANIFEST are registered lazily; any other
+        package is imported eagerly by scanning its folder.
+        """
+        if manifest := MENU_MANIFEST.get(package):
+            for menu_name, module in manifest.items():
+                self._lazy_menus[menu_name] = (
+                    f"viu_media.cli.interactive.menu.{package}.{module}"
+                )
+            logger.debug(f"Registered {len(manifest)} lazy menus from '{package}'")
+            return
+
         package_path = MENUS_DIR / package
         package_name = package_path.name
         logger.debug(f"Loading menus from '{package_path}'...")
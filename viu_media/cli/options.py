@@ -1,14 +1,32 @@
+import json
+import logging
+import sys
 from collections.abc import Callable
 from enum import Enum
 from pathlib import Path
-from typing import Any, Literal, Optional, get_args, get_origin
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    get_args,
+    get_origin,
+)
 
 import click
-from pydantic import BaseModel
-from pydantic.fields import FieldInfo
-from pydantic_core import PydanticUndefined
 
-from ..core.config.model import OtherConfig
+from ..core.constants import APP_CACHE_DIR, __version__
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from pydantic.fields import FieldInfo
+
+logger = logging.getLogger(__name__)
+
+OPTION_SPEC_CACHE = APP_CACHE_DIR / "cli_options.json"
+CONFIG_MODEL_DIR = Path(__file__).resolve().parent.parent / "core" / "config"
 
 TYPE_MAP = {
     str: click.STRING,
@@ -34,7 +52,7 @@ class ConfigOption(click.Option):
         super().__init__(*args, **kwargs)
 
 
-def options_from_model(model: type[BaseModel], parent_name: str = "") -> Callable:
+def options_from_model(model: "type[BaseModel]", parent_name: str = "") -> Callable:
     """
     A decorator factory that generates click.option decorators from a Pydantic model.
 
@@ -47,7 +65,121 @@ def options_from_model(model: type[BaseModel], parent_name: str = "") -> Callabl
     Returns:
         A decorator that applies the generated options to a function.
     """
-    decorators = []
+    return options_from_specs(option_specs_from_model(model, parent_name))
+
+
+def cached_config_options() -> Callable:
+    """
+    Like ``options_from_model(AppConfig)`` but served from a versioned cache.
+
+    The option spec only changes with the modules it is built from: this one,
+    the config model sources and the modules defining enums used as choices,
+    such as ``ProviderServer``. It is stored in the cache dir together with that list
+    of sources, keyed on the package version and their mtimes. A cache hit
+    avoids importing pydantic and the whole config model, which dominates the
+    startup time of ``--version``, ``--help`` and shell completion.
+    """
+    try:
+        with OPTION_SPEC_CACHE.open("r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == _option_spec_cache_key(cached["sources"]):
+            return options_from_specs(cached["options"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    from ..core.config.model import AppConfig
+
+    specs = option_specs_from_model(AppConfig)
+    sources = sorted(
+        {str(path) for path in CONFIG_MODEL_DIR.glob("*.py")}
+        | _option_spec_sources(AppConfig)
+    )
+    try:
+        from ..core.utils.file import AtomicWriter
+
+        with AtomicWriter(OPTION_SPEC_CACHE) as f:
+            json.dump(
+                {
+                    "key": _option_spec_cache_key(sources),
+                    "sources": sources,
+                    "options": specs,
+                },
+                f,
+            )
+    except OSError as e:
+        logger.debug(f"Could not cache cli option spec: {e}")
+    return options_from_specs(specs)
+
+
+def _option_spec_cache_key(sources: List[str]) -> str:
+    mtimes = []
+    # this module renders the spec and picks the sources, so it is always one
+    for source in [str(Path(__file__).resolve()), *sources]:
+        try:
+            mtimes.append(f"{source}:{Path(source).stat().st_mtime_ns}")
+        except OSError:
+            mtimes.append(f"{source}:missing")
+    return f"{__version__}|{'|'.join(mtimes)}"
+
+
+def _option_spec_sources(model: "type[BaseModel]") -> set[str]:
+    """Source files of the model, its nested models and the enums of its fields."""
+    from pydantic import BaseModel
+
+    sources = set()
+    module_file = getattr(sys.modules.get(model.__module__), "__file__", None)
+    if module_file:
+        sources.add(str(Path(module_file).resolve()))
+    for field_info in model.model_fields.values():
+        annotation = field_info.annotation
+        if not isinstance(annotation, type):
+            continue
+        if issubclass(annotation, BaseModel):
+            sources |= _option_spec_sources(annotation)
+        elif issubclass(annotation, Enum):
+            enum_file = getattr(
+                sys.modules.get(annotation.__module__), "__file__", None
+            )
+            if enum_file:
+                sources.add(str(Path(enum_file).resolve()))
+    return sources
+
+
+def options_from_specs(specs: List[Dict[str, Any]]) -> Callable:
+    """Build the click.option decorator stack from serialized option specs."""
+    decorators = [
+        click.option(
+            *spec["decls"],
+            cls=ConfigOption,
+            model_name=spec["model_name"],
+            field_name=spec["field_name"],
+            type=_click_type_from_spec(spec["type"]),
+            **spec["kwargs"],
+        )
+        for spec in specs
+    ]
+
+    def decorator(f: Callable) -> Callable:
+        # Apply the decorators in reverse order to the function
+        for deco in reversed(decorators):
+            f = deco(f)
+        return f
+
+    # Store the list of decorators as an attribute for nested calls
+    setattr(decorator, "decorators", decorators)
+    return decorator
+
+
+def option_specs_from_model(
+    model: "type[BaseModel]", parent_name: str = ""
+) -> List[Dict[str, Any]]:
+    """Introspect a Pydantic model into JSON serializable click option specs."""
+    from pydantic import BaseModel
+    from pydantic_core import PydanticUndefined
+
+    from ..core.config.model import OtherConfig
+
+    specs = []
 
     is_external_tool = issubclass(model, OtherConfig)
     model_name = model.__name__.lower().replace("config", "")
@@ -57,19 +189,15 @@ def options_from_model(model: type[BaseModel], parent_name: str = "") -> Callabl
         if isinstance(field_info.annotation, type) and issubclass(
             field_info.annotation, BaseModel
         ):
-            nested_decorators = options_from_model(field_info.annotation, field_name)
-            nested_decorator_list = getattr(nested_decorators, "decorators", [])
-            decorators.extend(nested_decorator_list)
+            specs.extend(option_specs_from_model(field_info.annotation, field_name))
             continue
 
         if is_external_tool:
             cli_name = f"--{model_name}-{field_name.replace('_', '-')}"
         else:
             cli_name = f"--{field_name.replace('_', '-')}"
-        kwargs = {
-            "type": _get_click_type(field_info),
-            "help": field_info.description or "",
-        }
+        click_type = _get_click_type(field_info)
+        kwargs: Dict[str, Any] = {"help": field_info.description or ""}
 
         if (
             field_info.annotation is not None
@@ -88,17 +216,17 @@ def options_from_model(model: type[BaseModel], parent_name: str = "") -> Callabl
             else:
                 cli_name = f"{cli_name}/--no-{field_name.replace('_', '-')}"
         elif field_info.default is not PydanticUndefined:
-            kwargs["default"] = field_info.default
+            kwargs["default"] = _serializable_default(field_info.default)
             kwargs["show_default"] = True
 
-        decorators.append(
-            click.option(
-                cli_name,
-                cls=ConfigOption,
-                model_name=model_name,
-                field_name=field_name,
-                **kwargs,
-            )
+        specs.append(
+            {
+                "decls": [cli_name],
+                "model_name": model_name,
+                "field_name": field_name,
+                "type": _click_type_to_spec(click_type),
+                "kwargs": kwargs,
+            }
         )
 
     for field_name, computed_field_info in model.model_computed_fields.items():
@@ -107,33 +235,62 @@ def options_from_model(model: type[BaseModel], parent_name: str = "") -> Callabl
         else:
             cli_name = f"--{field_name.replace('_', '-')}"
 
-        kwargs = {
-            "type": TYPE_MAP[computed_field_info.return_type],
-            "help": computed_field_info.description or "",
-        }
-
-        decorators.append(
-            click.option(
-                cli_name,
-                cls=ConfigOption,
-                model_name=model_name,
-                field_name=field_name,
-                **kwargs,
-            )
+        specs.append(
+            {
+                "decls": [cli_name],
+                "model_name": model_name,
+                "field_name": field_name,
+                "type": _click_type_to_spec(TYPE_MAP[computed_field_info.return_type]),
+                "kwargs": {"help": computed_field_info.description or ""},
+            }
         )
 
-    def decorator(f: Callable) -> Callable:
-        # Apply the decorators in reverse order to the function
-        for deco in reversed(decorators):
-            f = deco(f)
-        return f
+    return specs
 
-    # Store the list of decorators as an attribute for nested calls
-    setattr(decorator, "decorators", decorators)
-    return decorator
+
+def _serializable_default(default: Any) -> Any:
+    try:
+        json.dumps(default)
+        return default
+    except TypeError:
+        return str(default)
 
 
-def _get_click_type(field_info: FieldInfo) -> Any:
+def _click_type_to_spec(click_type: Any) -> Dict[str, Any]:
+    if isinstance(click_type, click.Choice):
+        return {"name": "choice", "choices": list(click_type.choices)}
+    if isinstance(click_type, (click.IntRange, click.FloatRange)):
+        return {
+            "name": "int_range"
+            if isinstance(click_type, click.IntRange)
+            else "float_range",
+            "min": click_type.min,
+            "max": click_type.max,
+        }
+    if isinstance(click_type, click.Path):
+        return {"name": "path"}
+    return {"name": click_type.name}
+
+
+def _click_type_from_spec(spec: Dict[str, Any]) -> Any:
+    name = spec["name"]
+    if name == "choice":
+        return click.Choice(spec["choices"])
+    if name == "int_range":
+        return click.IntRange(min=spec["min"], max=spec["max"])
+    if name == "float_range":
+        return click.FloatRange(min=spec["min"], max=spec["max"])
+    if name == "path":
+        return click.Path()
+    return {
+        "text": click.STRING,
+        "integer": click.INT,
+        "boolean": click.BOOL,
+        "float": click.FLOAT,
+    }.get(name, click.STRING)
+
+
+def _get_click_type(field_info: "FieldInfo") -> Any:
     """Maps a Pydantic field's type to a corresponding click type."""
     field_type = field_info.annotation
 
@@ -203,6 +360,11 @@ def _get_click_type(field_info: FieldInfo) -> Any:
                 else:
                     return click.FloatRange(**range_kwargs)
 
+    # Optional[X] takes the type of X; None only means unset
+    non_none_args = [arg for arg in get_args(field_type) if arg is not type(None)]
+    if len(non_none_args) == 1 and non_none_args[0] in TYPE_MAP:
+        return TYPE_MAP[non_none_args[0]]
+
     return TYPE_MAP.get(
         field_type, click.STRING
     )  # Default to STRING if type is not found
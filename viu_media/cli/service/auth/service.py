@@ -1,9 +1,9 @@
-import json
 import logging
 from typing import Optional
 
 from ....core.constants import APP_DATA_DIR
-from ....core.utils.file import AtomicWriter, FileLock
+from ....core.utils import json_codec
+from ....core.utils.file import FileLock
 from ....libs.media_api.types import UserProfile
 from .model import AuthModel, AuthProfile
 
@@ -41,13 +41,10 @@ class AuthService:
             self._save_auth(self._auth)
             return self._auth
 
-        with self.path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            self._auth = AuthModel.model_validate(data)
-            return self._auth
+        self._auth = json_codec.read_model(self.path, AuthModel)
+        return self._auth
 
     def _save_auth(self, auth: AuthModel):
         with self._lock:
-            with AtomicWriter(self.path) as f:
-                json.dump(auth.model_dump(), f, indent=2)
+            json_codec.write_model(self.path, auth)
             logger.info(f"Successfully saved user credentials to {self.path}")
@@ -0,0 +1,388 @@
+"""
+Bounded scheduling of foreground downloads.
+
+Jobs run on a thread pool capped at ``downloads.max_concurrent_downloads``.
+On top of that a job holds a per-provider slot while it resolves streams and a
+per-host slot while it transfers, so a single site is never hit by every
+worker at once. Post-processing (merging, cleanup, registry updates) runs on
+a separate bounded pool, so the download slot is freed as soon as the bytes are
+on disk. Every job gets a row in a live progress display, Ctrl-C cancels queued
+jobs and stops running transfers at their next progress update, and a
+throughput report can be printed once the run is over.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from rich import get_console
+from rich.console import Console
+from rich.filesize import decimal
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TaskID,
+    TextColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
+from rich.table import Table
+
+from ....core.config.model import DownloadsConfig
+from ....core.exceptions import DownloadCancelled
+from ....core.utils.concurrency import ManagedBackgroundWorker
+
+logger = logging.getLogger(__name__)
+
+# how often waiting threads wake up to check for cancellation
+_POLL_INTERVAL = 0.2
+
+
+class JobState(Enum):
+    QUEUED = "queued"
+    RESOLVING = "resolving"
+    WAITING = "waiting for host"
+    DOWNLOADING = "downloading"
+    POSTPROCESSING = "post-processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+_FINISHED_STATES = (JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED)
+
+
+@dataclass
+class JobStats:
+    label: str
+    provider: str
+    state: JobState = JobState.QUEUED
+    downloaded_bytes: int = 0
+    total_bytes: Optional[int] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Average bytes per second over the whole job."""
+        return self.downloaded_bytes / self.elapsed if self.elapsed else 0.0
+
+
+class _KeyedSlots:
+    """One bounded semaphore per key, created on first use."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[key]
+
+
+class DownloadJob:
+    """The handle a job function uses to take slots and report progress."""
+
+    def __init__(
+        self, scheduler: "DownloadScheduler", stats: JobStats, func: "JobFunction"
+    ):
+        self.stats = stats
+        self._scheduler = scheduler
+        self._func = func
+        self._deferred: Optional[Callable[[], Any]] = None
+        self._task_id: Optional[TaskID] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._scheduler.cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise DownloadCancelled(f"{self.stats.label} was cancelled")
+
+    @contextmanager
+    def provider_slot(self) -> Iterator[None]:
+        """Hold one of the provider's slots, e.g. while resolving streams."""
+        self._set_state(JobState.RESOLVING)
+        with self._hold(self._scheduler._provider_slots.get(self.stats.provider)):
+            yield
+
+    @contextmanager
+    def host_slot(self, url: str) -> Iterator[None]:
+        """Hold one of the slots of the host serving ``url`` while transferring."""
+        host = urlparse(url).hostname or url
+        self._set_state(JobState.WAITING)
+        with self._hold(self._scheduler._host_slots.get(host)):
+            self._set_state(JobState.DOWNLOADING)
+            yield
+
+    def defer(self, func: Callable[[], Any]) -> None:
+        """
+        Finish the job with ``func`` on the post-processing pool.
+
+        Call it once the transfer is done; the job's download slot is released
+        when the job function returns and ``func`` decides the final state.
+        Deferred work is not interrupted by cancellation, since the bytes are
+        already on disk.
+        """
+        self._deferred = func
+
+    @contextmanager
+    def interactive(self) -> Iterator[None]:
+        """Pause the progress display so the job can prompt the user."""
+        with self._scheduler._interactive_lock:
+            self._scheduler._progress.stop()
+            try:
+                yield
+            finally:
+                self._scheduler._progress.start()
+
+    def progress_hook(self, info: Dict[str, Any]) -> None:
+        """Progress hook for downloaders; raises once the run is cancelled."""
+        self.check_cancelled()
+        downloaded = info.get("downloaded_bytes")
+        total = info.get("total_bytes") or info.get("total_bytes_estimate")
+        if downloaded is not None:
+            self.stats.downloaded_bytes = int(downloaded)
+        if total:
+            self.stats.total_bytes = int(total)
+        if self._task_id is not None:
+            self._scheduler._progress.update(
+                self._task_id,
+                completed=self.stats.downloaded_bytes,
+                total=self.stats.total_bytes,
+            )
+
+    @contextmanager
+    def _hold(self, semaphore: threading.BoundedSemaphore) -> Iterator[None]:
+        while not semaphore.acquire(timeout=_POLL_INTERVAL):
+            self.check_cancelled()
+        try:
+            self.check_cancelled()
+            yield
+        finally:
+            semaphore.release()
+
+    def _set_state(self, state: JobState, error: Optional[str] = None) -> None:
+        self.stats.state = state
+        if error:
+            self.stats.error = error
+        if self._task_id is not None:
+            self._scheduler._progress.update(self._task_id, state=state.value)
+
+    def _run(self) -> None:
+        if self.cancelled:
+            self._set_state(JobState.CANCELLED)
+            return
+        self.stats.started_at = time.monotonic()
+        if self._attempt(self._func, self) and self._deferred is not None:
+            self._set_state(JobState.POSTPROCESSING)
+            self._scheduler._postprocess(self)
+            return
+        self._finish()
+
+    def _run_deferred(self) -> None:
+        assert self._deferred is not None
+        self._attempt(self._deferred)
+        self._finish()
+
+    def _attempt(self, func: Callable[..., Any], *args: Any) -> bool:
+        """Run one stage of the job, recording why it failed if it did."""
+        try:
+            func(*args)
+            return True
+        except DownloadCancelled:
+            self._set_state(JobState.CANCELLED)
+        except Exception as e:
+            logger.error(f"Download job '{self.stats.label}' failed: {e}")
+            self._set_state(JobState.FAILED, str(e))
+        return False
+
+    def _finish(self) -> None:
+        if self.stats.state not in _FINISHED_STATES:
+            self._set_state(JobState.COMPLETED)
+        self.stats.finished_at = time.monotonic()
+
+
+JobFunction = Callable[[DownloadJob], Any]
+
+
+class DownloadScheduler:
+    """
+    Runs download jobs concurrently within global, per-provider and per-host caps.
+
+    A job is a function taking its ``DownloadJob``; it completes by returning
+    and fails by raising. It should resolve streams inside
+    ``job.provider_slot()``, transfer inside ``job.host_slot(url)`` and pass
+    ``job.progress_hook`` to the downloader.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_per_provider: int,
+        max_per_host: int,
+        max_postprocessing: int = 2,
+        console: Optional[Console] = None,
+    ):
+        self.max_concurrent = max_concurrent
+        self.console = console or get_console()
+        self.cancel_event = threading.Event()
+        self._provider_slots = _KeyedSlots(max_per_provider)
+        self._host_slots = _KeyedSlots(max_per_host)
+        self._interactive_lock = threading.Lock()
+        self._postprocessor = ManagedBackgroundWorker(
+            max_workers=max_postprocessing, name="PostProcessor"
+        )
+        self._postprocess_futures: List[Future] = []
+        self._postprocess_lock = threading.Lock()
+        self._jobs: List[DownloadJob] = []
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._progress = Progress(
+            TextColumn("[bold blue]{task.description}"),
+            TextColumn("[dim]{task.fields[state]}"),
+            BarColumn(bar_width=None),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+            console=self.console,
+        )
+
+    @classmethod
+    def from_config(
+        cls, config: DownloadsConfig, console: Optional[Console] = None
+    ) -> "DownloadScheduler":
+        return cls(
+            config.max_concurrent_downloads,
+            config.max_concurrent_per_provider,
+            config.max_concurrent_per_host,
+            config.max_concurrent_postprocessing,
+            console,
+        )
+
+    @property
+    def jobs(self) -> List[JobStats]:
+        return [job.stats for job in self._jobs]
+
+    def add(self, label: str, func: JobFunction, provider: str = "") -> JobStats:
+        job = DownloadJob(self, JobStats(label, provider), func)
+        self._jobs.append(job)
+        return job.stats
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    def run(self) -> List[JobStats]:
+        """Run every added job and block until all of them have finished."""
+        self._started_at = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent, thread_name_prefix="DownloadScheduler"
+        )
+        self._postprocessor.start()
+        try:
+            with self._progress:
+                for job in self._jobs:
+                    job._task_id = self._progress.add_task(
+                        job.stats.label, total=None, state=job.stats.state.value
+                    )
+                futures = [executor.submit(job._run) for job in self._jobs]
+                try:
+                    self._wait(futures)
+                except KeyboardInterrupt:
+                    self._cancel_running(futures)
+                # jobs only defer work before they return, so the list is final
+                try:
+                    self._wait(self._postprocess_futures)
+                except KeyboardInterrupt:
+                    logger.warning("Stopped waiting for post-processing")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._postprocessor.shutdown(wait=False)
+            for job in self._jobs:
+                if job.stats.state not in _FINISHED_STATES:
+                    job.stats.state = JobState.CANCELLED
+            self._finished_at = time.monotonic()
+        return self.jobs
+
+    def print_report(self) -> None:
+        """Print per-job results and the aggregate throughput of the run."""
+        table = Table(title="Downloads")
+        table.add_column("Episode")
+        table.add_column("Status")
+        table.add_column("Size", justify="right")
+        table.add_column("Time", justify="right")
+        table.add_column("Speed", justify="right")
+        for stats in self.jobs:
+            status = stats.state.value
+            if stats.error:
+                status = f"{status}: {stats.error}"
+            table.add_row(
+                stats.label,
+                status,
+                decimal(stats.downloaded_bytes),
+                f"{stats.elapsed:.1f}s",
+                f"{decimal(int(stats.throughput))}/s",
+            )
+        self.console.print(table)
+
+        wall_time = (self._finished_at or time.monotonic()) - (
+            self._started_at or time.monotonic()
+        )
+        total_bytes = sum(stats.downloaded_bytes for stats in self.jobs)
+        counts = {
+            state: sum(1 for stats in self.jobs if stats.state == state)
+            for state in _FINISHED_STATES
+        }
+        rate = total_bytes / wall_time if wall_time > 0 else 0
+        self.console.print(
+            f"{counts[JobState.COMPLETED]} completed, {counts[JobState.FAILED]} failed, "
+            f"{counts[JobState.CANCELLED]} cancelled: {decimal(total_bytes)} in "
+            f"{wall_time:.1f}s ({decimal(int(rate))}/s)"
+        )
+
+    def _postprocess(self, job: DownloadJob) -> None:
+        with self._postprocess_lock:
+            self._postprocess_futures.append(
+                self._postprocessor.submit_function(job._run_deferred)
+            )
+
+    def _wait(self, futures: List[Future]) -> None:
+        # short timeouts keep the main thread responsive to Ctrl-C
+        pending = set(futures)
+        while pending:
+            _, pending = wait_futures(pending, timeout=_POLL_INTERVAL)
+
+    def _cancel_running(self, futures: List[Future]) -> None:
+        self.cancel()
+        for future in futures:
+            future.cancel()
+        self.console.print(
+            "[yellow]Cancelling downloads (press Ctrl-C again to stop waiting)...[/]"
+        )
+        try:
+            self._wait(futures)
+        except KeyboardInterrupt:
+            logger.warning("Stopped waiting for cancelled downloads")
+        for job in self._jobs:
+            # deferred post-processing still runs to completion
+            if job.stats.state not in (*_FINISHED_STATES, JobState.POSTPROCESSING):
+                job._set_state(JobState.CANCELLED)
@@ -1,12 +1,18 @@
+import functools
 import logging
+import threading
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from viu_media.cli.utils.search import find_best_match_title
 
 from ....core.config.model import AppConfig
 from ....core.constants import APP_CACHE_DIR
-from ....core.downloader import DownloadParams, create_downloader
+from ....core.downloader import DownloadParams, DownloadResult, create_downloader
+from ....core.downloader.postprocess import merge_subtitles
+from ....core.exceptions import DownloadCancelled, ViuError
 from ....core.utils.concurrency import ManagedBackgroundWorker, thread_manager
 from ....core.utils.normalizer import normalize_title
 from ....libs.media_api.types import MediaItem
@@ -15,7 +21,9 @@ from ....libs.provider.anime.params import (
     EpisodeStreamsParams,
     SearchParams,
 )
+from ..provider_mapping import PinnedMappingUnavailable, ProviderMappingService
 from ..registry.models import DownloadStatus
+from .scheduler import DownloadJob, DownloadScheduler, JobStats
 
 if TYPE_CHECKING:
     from ....libs.media_api.api import BaseApiClient
@@ -25,6 +33,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 NOTIFICATION_ICONS_CACHE_DIR = APP_CACHE_DIR / "notification_icons"
+# how often a paused job waiting for its turn checks whether it was cancelled
+_PAUSE_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class BackgroundJobStatus:
+    """A download submitted to the background worker."""
+
+    media_id: int
+    episode: str
+    title: str
+    state: str = "queued"
+    downloaded_bytes: int = 0
+    total_bytes: Optional[int] = None
 
 
 class DownloadService:
@@ -40,25 +62,45 @@ class DownloadService:
         self.media_api = media_api_service
         self.provider = provider_service
         self.downloader = create_downloader(config.downloads)
+        self.provider_mappings = ProviderMappingService(
+            config.general.media_api, config.media_registry
+        )
         # Track in-flight downloads to avoid duplicate queueing
         self._inflight: set[tuple[int, str]] = set()
+        self._jobs: Dict[Tuple[int, str], BackgroundJobStatus] = {}
+        self._cancelled: set[tuple[int, str]] = set()
+        # cleared while paused; queued background jobs wait for it to start
+        self._unpaused = threading.Event()
+        self._unpaused.set()
+        # concurrent episodes of one anime share a single provider search
+        self._resolve_locks: Dict[int, threading.Lock] = {}
+        self._resolve_locks_guard = threading.Lock()
 
         self._worker = ManagedBackgroundWorker(
             max_workers=config.downloads.max_concurrent_downloads,
             name="DownloadWorker",
         )
         thread_manager.register_worker("download_worker", self._worker)
+        # merging and registry updates run here so download slots free up early
+        self._postprocess_worker = ManagedBackgroundWorker(
+            max_workers=config.downloads.max_concurrent_postprocessing,
+            name="PostProcessWorker",
+        )
+        thread_manager.register_worker("postprocess_worker", self._postprocess_worker)
 
     def start(self):
-        """Starts the download worker for background tasks."""
+        """Starts the download and post-processing workers for background tasks."""
         if not self._worker.is_running():
             self._worker.start()
+        if not self._postprocess_worker.is_running():
+            self._postprocess_worker.start()
         # We can still resume background tasks on startup if any exist
         self.resume_unfinished_downloads()
 
     def stop(self):
-        """Stops the download worker."""
+        """Stops the download and post-processing workers."""
         self._worker.shutdown(wait=False)
+        self._postprocess_worker.shutdown(wait=False)
 
     def add_to_queue(self, media_item: MediaItem, episode_number: str) -> bool:
         """Mark an episode as queued in the registry (no immediate download)."""
@@ -72,6 +114,70 @@ class DownloadService:
             status=DownloadStatus.QUEUED,
         )
 
+    def submit(self, media_item: MediaItem, episode_number: str) -> bool:
+        """Queue an episode in the registry and start downloading it right away."""
+        if not self.add_to_queue(media_item, episode_number):
+            return False
+        return self._submit_download(media_item, episode_number)
+
+    def pause(self):
+        """Hold queued background downloads; running ones carry on."""
+        self._unpaused.clear()
+        logger.info("Background downloads paused")
+
+    def resume(self):
+        self._unpaused.set()
+        logger.info("Background downloads resumed")
+
+    @property
+    def paused(self) -> bool:
+        return not self._unpaused.is_set()
+
+    def cancel(
+        self,
+        media_id: Optional[int] = None,
+        episodes: Optional[List[str]] = None,
+        include_running: bool = True,
+    ) -> int:
+        """
+        Cancel background downloads, all of them if no media id is given.
+
+        Jobs that have not started yet and queued episodes not submitted
+        to the worker go back to NOT_DOWNLOADED. Running transfers stop at
+        their next progress update and are recorded as PAUSED.
+
+        Returns:
+            The number of episodes cancelled.
+        """
+
+        def matches(key: Tuple[int, str]) -> bool:
+            return (media_id is None or key[0] == media_id) and (
+                episodes is None or key[1] in episodes
+            )
+
+        cancelled = 0
+        for key, job in list(self._jobs.items()):
+            if matches(key) and (include_running or job.state == "queued"):
+                self._cancelled.add(key)
+                cancelled += 1
+
+        for queued_id, episode_number in self.registry.get_episodes_by_download_status(
+            DownloadStatus.QUEUED
+        ):
+            key = (queued_id, str(episode_number))
+            if matches(key) and key not in self._inflight:
+                if self.registry.update_episode_download_status(
+                    media_id=queued_id,
+                    episode_number=episode_number,
+                    status=DownloadStatus.NOT_DOWNLOADED,
+                ):
+                    cancelled += 1
+        return cancelled
+
+    def status(self) -> List[Dict[str, Any]]:
+        """The background downloads that are queued or running."""
+        return [asdict(job) for job in list(self._jobs.values())]
+
     def _submit_download(self, media_item: MediaItem, episode_number: str) -> bool:
         """Submit a download task to the worker if not already in-flight."""
         key = (media_item.id, str(episode_number))
@@ -80,26 +186,160 @@ class DownloadService:
         if not self._worker.is_running():
             self._worker.start()
         self._inflight.add(key)
+        self._jobs[key] = BackgroundJobStatus(
+            media_id=media_item.id,
+            episode=str(episode_number),
+            title=media_item.title.english or media_item.title.romaji or "",
+        )
         self._worker.submit_function(
-            self._execute_download_job, media_item, episode_number
+            self._run_background_download, media_item, episode_number
         )
         return True
 
-    def download_episodes_sync(self, media_item: MediaItem, episodes: List[str]):
+    def _run_background_download(self, media_item: MediaItem, episode_number: str):
+        key = (media_item.id, str(episode_number))
+        deferred = False
+        try:
+            while not self._unpaused.wait(_PAUSE_POLL_INTERVAL):
+                if key in self._cancelled:
+                    break
+            if key in self._cancelled:
+                logger.info(
+                    f"Cancelled queued download of '{media_item.title.english}' Ep {episode_number}"
+                )
+                self.registry.update_episode_download_status(
+                    media_id=media_item.id,
+                    episode_number=episode_number,
+                    status=DownloadStatus.NOT_DOWNLOADED,
+                )
+                return
+            self._jobs[key].state = "downloading"
+            deferred = self._execute_download_job(media_item, episode_number)
+        except DownloadCancelled:
+            pass  # recorded as PAUSED by _execute_download_job
+        finally:
+            # a deferred download stays in flight until it has been finalized
+            if not deferred:
+                self._inflight.discard(key)
+            self._jobs.pop(key, None)
+            self._cancelled.discard(key)
+
+    def _background_progress_hook(self, key: Tuple[int, str], info: Dict[str, Any]):
+        """Progress hook of background downloads; raises once they are cancelled."""
+        if key in self._cancelled:
+            raise DownloadCancelled(f"Download of {key} was cancelled")
+        job = self._jobs.get(key)
+        if job is None:
+            return
+        if (downloaded := info.get("downloaded_bytes")) is not None:
+            job.downloaded_bytes = int(downloaded)
+        if total := info.get("total_bytes") or info.get("total_bytes_estimate"):
+            job.total_bytes = int(total)
+
+    def download_episodes_sync(
+        self, media_item: MediaItem, episodes: List[str]
+    ) -> List[JobStats]:
         """
         Performs downloads SYNCHRONOUSLY and blocks until complete.
         This is for the direct `download` command.
         """
-        for episode_number in episodes:
+        return self.download_batch_sync([(media_item, episodes)])
+
+    def download_batch_sync(
+        self, batches: List[Tuple[MediaItem, List[str]]]
+    ) -> List[JobStats]:
+        """
+        Downloads the episodes of several anime concurrently, blocking until done.
+
+        Jobs run on a DownloadScheduler within the configured global,
+        per-provider and per-host caps; a throughput report is printed at the end.
+        """
+        scheduler = DownloadScheduler.from_config(self.app_config.downloads)
+        provider_name = self.app_config.general.provider.value
+        for media_item, episodes in batches:
             title = (
                 media_item.title.english
                 or media_item.title.romaji
                 or f"ID: {media_item.id}"
             )
-            logger.info(
-                f"Starting synchronous download for '{title}' Episode {episode_number}"
+            for episode_number in episodes:
+                scheduler.add(
+                    f"{title} Episode {episode_number}",
+                    functools.partial(
+                        self._execute_download_job, media_item, episode_number
+                    ),
+                    provider=provider_name,
+                )
+        logger.info(f"Starting {len(scheduler.jobs)} foreground downloads")
+        scheduler.run()
+        scheduler.print_report()
+        return scheduler.jobs
+
+    def _resolve_provider_anime(self, media_item: MediaItem, media_title: str):
+        """Find the provider anime for a media item, searching only if not mapped."""
+        with self._resolve_locks_guard:
+            lock = self._resolve_locks.setdefault(media_item.id, threading.Lock())
+        # the first episode saves the mapping, the others then reuse it
+        with lock:
+            return self._resolve_provider_anime_unlocked(media_item, media_title)
+
+    def _resolve_provider_anime_unlocked(self, media_item: MediaItem, media_title: str):
+        provider_name = self.app_config.general.provider
+        translation_type = self.app_config.stream.translation_type
+
+        try:
+            provider_anime = self.provider_mappings.get_mapped_anime(
+                self.provider,
+                provider_name,
+                media_item.id,
+                translation_type,
+                media_title,
+            )
+        except PinnedMappingUnavailable as e:
+            logger.warning(f"{e}; searching '{media_title}' instead")
+            provider_anime = None
+        if provider_anime:
+            return provider_anime
+
+        # Search the provider to get the provider-specific ID
+        provider_search_results = self.provider.search(
+            SearchParams(
+                query=normalize_title(media_title, provider_name.value, True),
+                translation_type=translation_type,
             )
-            self._execute_download_job(media_item, episode_number)
+        )
+
+        if not provider_search_results or not provider_search_results.results:
+            raise ValueError(
+                f"Could not find '{media_title}' on provider '{provider_name.value}'"
+            )
+
+        # Find the best match using fuzzy logic (like auto-select)
+        provider_results_map = {
+            result.title: result for result in provider_search_results.results
+        }
+        best_match_title = find_best_match_title(
+            provider_results_map, provider_name, media_item
+        )
+        provider_anime_ref = provider_results_map[best_match_title]
+
+        # Get full provider anime details (contains the correct episode list)
+        provider_anime = self.provider.get(
+            AnimeParams(id=provider_anime_ref.id, query=media_title)
+        )
+        if not provider_anime:
+            raise ValueError(
+                f"Failed to get full details for '{best_match_title}' from provider."
+            )
+
+        self.provider_mappings.save(
+            media_item.id,
+            provider_name,
+            translation_type,
+            provider_anime_ref.id,
+            provider_anime_ref.title,
+        )
+        return provider_anime
 
     def resume_unfinished_downloads(self):
         """Finds and re-queues any downloads that were left in an unfinished state."""
@@ -174,8 +414,25 @@ class DownloadService:
                     f"Could not find metadata for media ID {media_id}. Cannot resume. Please run 'viu registry sync'."
                 )
 
-    def _execute_download_job(self, media_item: MediaItem, episode_number: str):
-        """The core download logic, can be called by worker or synchronously."""
+    def _execute_download_job(
+        self,
+        media_item: MediaItem,
+        episode_number: str,
+        job: Optional[DownloadJob] = None,
+    ) -> bool:
+        """
+        The core download logic, can be called by worker or synchronously.
+
+        When run as a scheduler ``job`` it takes the job's provider and host
+        slots, reports progress through it and raises on failure.
+
+        Returns:
+            True if the download was handed to the post-processing worker. The
+            episode then stays in flight until `_finalize_download` is done, so
+            resume scans don't queue it again while it is being merged.
+        """
+        key = (media_item.id, str(episode_number))
+        deferred = False
         self.registry.get_or_create_record(media_item)
         try:
             self.registry.update_episode_download_status(
@@ -186,64 +443,37 @@ class DownloadService:
 
             media_title = media_item.title.romaji or media_item.title.english
 
-            # 1. Search the provider to get the provider-specific ID
-            provider_search_results = self.provider.search(
-                SearchParams(
-                    query=normalize_title(
-                        media_title, self.app_config.general.provider.value, True
-                    ),
-                    translation_type=self.app_config.stream.translation_type,
-                )
-            )
-
-            if not provider_search_results or not provider_search_results.results:
-                raise ValueError(
-                    f"Could not find '{media_title}' on provider '{self.app_config.general.provider.value}'"
+            with job.provider_slot() if job else nullcontext():
+                # 1-3. Resolve the provider anime, preferring a remembered mapping
+                provider_anime = self._resolve_provider_anime(media_item, media_title)
+
+                # 4. Get stream links using the now-validated provider_anime ID
+                streams_iterator = self.provider.episode_streams(
+                    EpisodeStreamsParams(
+                        anime_id=provider_anime.id,
+                        query=media_title,
+                        episode=episode_number,
+                        translation_type=self.app_config.stream.translation_type,
+                    )
                 )
+                if not streams_iterator:
+                    raise ValueError("Provider returned no stream iterator.")
 
-            # 2. Find the best match using fuzzy logic (like auto-select)
-            provider_results_map = {
-                result.title: result for result in provider_search_results.results
-            }
-            best_match_title = find_best_match_title(
-                provider_results_map, self.app_config.general.provider, media_item
-            )
-            provider_anime_ref = provider_results_map[best_match_title]
-
-            # 3. Get full provider anime details (contains the correct episode list)
-            provider_anime = self.provider.get(
-                AnimeParams(id=provider_anime_ref.id, query=media_title)
-            )
-            if not provider_anime:
-                raise ValueError(
-                    f"Failed to get full details for '{best_match_title}' from provider."
-                )
+                server = next(streams_iterator, None)
+                if not server or not server.links:
+                    raise ValueError(
+                        f"No stream links found for Episode {episode_number}"
+                    )
 
-            # 4. Get stream links using the now-validated provider_anime ID
-            streams_iterator = self.provider.episode_streams(
-                EpisodeStreamsParams(
-                    anime_id=provider_anime.id,
-                    query=media_title,
-                    episode=episode_number,
-                    translation_type=self.app_config.stream.translation_type,
-                )
-            )
-            if not streams_iterator:
-                raise ValueError("Provider returned no stream iterator.")
-
-            server = next(streams_iterator, None)
-            if not server or not server.links:
-                raise ValueError(f"No stream links found for Episode {episode_number}")
-
-            if server.name != self.app_config.downloads.server.value:
-                while True:
-                    try:
-                        _server = next(streams_iterator)
-                        if _server.name == self.app_config.downloads.server.value:
-                            server = _server
+                if server.name != self.app_config.downloads.server.value:
+                    while True:
+                        try:
+                            _server = next(streams_iterator)
+                            if _server.name == self.app_config.downloads.server.value:
+                                server = _server
+                                break
+                        except StopIteration:
                             break
-                    except StopIteration:
-                        break
 
             stream_link = server.links[0]
             episode_title = f"{media_item.title.english}; Episode {episode_number}"
@@ -251,7 +481,7 @@ class DownloadService:
                 episode_number
             ):
                 episode_title = media_item.streaming_episodes[episode_number].title
-            # 5. Perform the download
+            # 5. Perform the download; merging happens during post-processing
             download_params = DownloadParams(
                 url=stream_link.link,
                 anime_title=media_item.title.english,
@@ -259,85 +489,162 @@ class DownloadService:
                 silent=False,
                 headers=server.headers,
                 subtitles=[sub.url for sub in server.subtitles],
-                merge=self.app_config.downloads.merge_subtitles,
-                clean=self.app_config.downloads.cleanup_after_merge,
+                merge=False,
                 no_check_certificate=self.app_config.downloads.no_check_certificate,
+                # the scheduler renders progress and must not block on prompts
+                show_progress=job is None,
+                progress_hooks=[job.progress_hook]
+                if job
+                else [
+                    functools.partial(
+                        self._background_progress_hook,
+                        (media_item.id, str(episode_number)),
+                    )
+                ],
+                prompt=job is None,
             )
 
-            result = self.downloader.download(download_params)
-
-            # 6. Update registry based on result
-            if result.success and result.video_path:
-                file_size = (
-                    result.video_path.stat().st_size
-                    if result.video_path.exists()
-                    else None
+            with job.host_slot(stream_link.link) if job else nullcontext():
+                result = self.downloader.download(download_params)
+            # downloaders report a cancelled transfer as a failed result
+            if job:
+                job.check_cancelled()
+            elif (media_item.id, str(episode_number)) in self._cancelled:
+                raise DownloadCancelled(
+                    f"Download of Episode {episode_number} was cancelled"
                 )
-                self.registry.update_episode_download_status(
-                    media_id=media_item.id,
-                    episode_number=episode_number,
-                    status=DownloadStatus.COMPLETED,
-                    file_path=result.merged_path or result.video_path,
-                    file_size=file_size,
-                    quality=stream_link.quality,
-                    provider_name=self.app_config.general.provider.value,
-                    server_name=server.name,
-                    subtitle_paths=result.subtitle_paths,
-                )
-                message = f"Successfully downloaded Episode {episode_number} of '{media_title}'"
-                try:
-                    from plyer import notification
-
-                    icon_path = self._get_or_fetch_icon(media_item)
-                    app_icon = str(icon_path) if icon_path else None
-
-                    notification.notify(  # type: ignore
-                        title="Viu: New Episode",
-                        message=message,
-                        app_name="Viu",
-                        app_icon=app_icon,
-                        timeout=self.app_config.general.desktop_notification_duration
-                        * 60,
-                    )
-                except:  # noqa: E722
-                    pass
-                logger.info(message)
-            else:
+            if not result.success or not result.video_path:
                 raise ValueError(result.error_message or "Unknown download error")
 
-        except Exception as e:
-            message = f"Download failed for '{media_item.title.english}' Ep {episode_number}: {e}"
-            try:
-                from plyer import notification
-
-                icon_path = self._get_or_fetch_icon(media_item)
-                app_icon = str(icon_path) if icon_path else None
-
-                notification.notify(  # type: ignore
-                    title="Viu: New Episode",
-                    message=message,
-                    app_name="Viu",
-                    app_icon=app_icon,
-                    timeout=self.app_config.general.desktop_notification_duration * 60,
-                )
-            except:  # noqa: E722
-                pass
-            logger.error(
-                message,
-                exc_info=True,
+            # 6. Hand the finished file to post-processing, freeing this slot
+            finalize = functools.partial(
+                self._finalize_download,
+                media_item,
+                episode_number,
+                result,
+                stream_link.quality,
+                server.name,
+                job is not None,
+                None if job else key,
+            )
+            if job:
+                job.defer(finalize)
+            else:
+                self._postprocess_worker.submit_function(finalize)
+                deferred = True
+
+        except DownloadCancelled:
+            logger.info(
+                f"Download of '{media_item.title.english}' Ep {episode_number} was cancelled"
+            )
+            self.registry.update_episode_download_status(
+                media_id=media_item.id,
+                episode_number=episode_number,
+                status=DownloadStatus.PAUSED,
             )
+            raise
+        except Exception as e:
+            self._record_failure(media_item, episode_number, e)
+            if job:
+                raise
+        finally:
+            # Remove from in-flight tracking unless post-processing still runs
+            if not deferred:
+                self._inflight.discard(key)
+        return deferred
+
+    def _finalize_download(
+        self,
+        media_item: MediaItem,
+        episode_number: str,
+        result: DownloadResult,
+        quality: str,
+        server_name: str,
+        raise_errors: bool = False,
+        inflight_key: Optional[Tuple[int, str]] = None,
+    ):
+        """
+        Post-processing of a finished download: merge, clean up and record it.
+
+        ``inflight_key`` is released from the in-flight set once the episode
+        has been recorded.
+        """
+        try:
+            assert result.video_path is not None
+            final_path = result.video_path
+            subtitle_paths = result.subtitle_paths
+            clean = self.app_config.downloads.cleanup_after_merge
+            if subtitle_paths and self.app_config.downloads.merge_subtitles:
+                try:
+                    merged_path = merge_subtitles(
+                        final_path, subtitle_paths, clean=clean
+                    )
+                except ViuError as e:
+                    # the download itself is fine; keep it unmerged
+                    logger.warning(f"Could not merge subtitles into {final_path}: {e}")
+                else:
+                    if merged_path:
+                        final_path = merged_path
+                        if clean:
+                            subtitle_paths = []
+
             self.registry.update_episode_download_status(
                 media_id=media_item.id,
                 episode_number=episode_number,
-                status=DownloadStatus.FAILED,
-                error_message=str(e),
+                status=DownloadStatus.COMPLETED,
+                file_path=final_path,
+                file_size=final_path.stat().st_size if final_path.exists() else None,
+                quality=quality,
+                provider_name=self.app_config.general.provider.value,
+                server_name=server_name,
+                subtitle_paths=subtitle_paths,
             )
+            media_title = media_item.title.romaji or media_item.title.english
+            message = (
+                f"Successfully downloaded Episode {episode_number} of '{media_title}'"
+            )
+            self._notify(media_item, message)
+            logger.info(message)
+        except Exception as e:
+            self._record_failure(media_item, episode_number, e)
+            if raise_errors:
+                raise
         finally:
-            # Remove from in-flight tracking regardless of outcome
-            try:
-                self._inflight.discard((media_item.id, str(episode_number)))
-            except Exception:
-                pass
+            if inflight_key is not None:
+                self._inflight.discard(inflight_key)
+
+    def _record_failure(
+        self, media_item: MediaItem, episode_number: str, error: Exception
+    ):
+        message = f"Download failed for '{media_item.title.english}' Ep {episode_number}: {error}"
+        self._notify(media_item, message)
+        logger.error(
+            message,
+            exc_info=True,
+        )
+        self.registry.update_episode_download_status(
+            media_id=media_item.id,
+            episode_number=episode_number,
+            status=DownloadStatus.FAILED,
+            error_message=str(error),
+        )
+
+    def _notify(self, media_item: MediaItem, message: str):
+        try:
+            from plyer import notification
+
+            icon_path = self._get_or_fetch_icon(media_item)
+            app_icon = str(icon_path) if icon_path else None
+
+            notification.notify(  # type: ignore
+                title="Viu: New Episode",
+                message=message,
+                app_name="Viu",
+                app_icon=app_icon,
+                timeout=self.app_config.general.desktop_notification_duration * 60,
+            )
+        except:  # noqa: E722
+            pass
 
     def _get_or_fetch_icon(self, media_item: MediaItem) -> Path | None:
         """Fetch and cache a small cover image for system notifications."""
@@ -0,0 +1,3 @@
+from .service import DownloadsLibraryService, LibraryFile
+
+__all__ = ["DownloadsLibraryService", "LibraryFile"]
@@ -0,0 +1,133 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class DirectoryWatcher:
+    """
+    Minimal non-blocking inotify wrapper that reports which directories changed.
+
+    Only available on Linux; ``available`` is False elsewhere or when the
+    kernel refuses a watch (e.g. the per-user watch limit is reached), in which
+    case callers fall back to comparing directory mtimes.
+    """
+
+    def __init__(self):
+        self._fd = -1
+        self._libc = None
+        self._watches: Dict[int, str] = {}
+        self._paths: Dict[str, int] = {}
+
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            logger.debug(f"inotify is not available: {e}")
+            return
+        if fd < 0:
+            logger.debug(f"inotify_init1 failed: {os.strerror(ctypes.get_errno())}")
+            return
+        self._libc = libc
+        self._fd = fd
+
+    @property
+    def available(self) -> bool:
+        return self._fd >= 0
+
+    def add(self, path: str) -> bool:
+        if not self.available:
+            return False
+        if path in self._paths:
+            return True
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)  # type: ignore[union-attr]
+        if wd < 0:
+            logger.warning(
+                f"Could not watch {path} ({os.strerror(ctypes.get_errno())}); falling back to rescans"
+            )
+            self.close()
+            return False
+        self._watches[wd] = path
+        self._paths[path] = wd
+        return True
+
+    def discard(self, path: str) -> None:
+        wd = self._paths.pop(path, None)
+        if wd is None:
+            return
+        self._watches.pop(wd, None)
+        if self.available:
+            self._libc.inotify_rm_watch(self._fd, wd)  # type: ignore[union-attr]
+
+    def poll(self) -> Optional[Set[str]]:
+        """
+        Drain pending events and return the directories that changed.
+
+        Returns None when events were lost, meaning everything must be rescanned.
+        """
+        changed: Set[str] = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            except OSError as e:
+                logger.warning(f"Reading inotify events failed: {e}")
+                self.close()
+                return None
+
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, name_len = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size + name_len
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                path = self._watches.get(wd)
+                if path is None:
+                    continue
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    self._paths.pop(path, None)
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    # the parent sees the same change, rescanning it drops this dir
+                    changed.add(os.path.dirname(path))
+                else:
+                    changed.add(path)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = -1
+        self._watches.clear()
+        self._paths.clear()
@@ -0,0 +1,259 @@
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from ....core.utils.file import check_file_modified
+from ..registry.models import DownloadStatus, MediaRecord
+from ..registry.service import MediaRegistryService
+from .inotify import DirectoryWatcher
+
+logger = logging.getLogger(__name__)
+
+# menus re-render often; directory mtimes are only re-checked this often
+RESCAN_INTERVAL = 1.0
+
+
+@dataclass(frozen=True)
+class LibraryFile:
+    path: Path
+    size: int
+    mtime: float
+
+
+class DownloadsLibraryService:
+    """
+    In-memory index of the files under the downloads directory.
+
+    The tree is walked once with ``os.scandir``; afterwards only directories
+    reported by inotify (or whose mtime changed, where inotify is unavailable)
+    are rescanned. Completed registry episodes are checked against the index
+    instead of stat-ing every file, and episodes whose files were moved or
+    deleted outside viu are reconciled back into the registry.
+    """
+
+    def __init__(self, downloads_dir: Path, media_registry: MediaRegistryService):
+        self.downloads_dir = downloads_dir
+        self.media_registry = media_registry
+        self._files: Dict[str, LibraryFile] = {}
+        self._dir_files: Dict[str, Set[str]] = {}
+        self._dir_children: Dict[str, Set[str]] = {}
+        self._dir_mtimes: Dict[str, float] = {}
+        self._by_name: Dict[Tuple[str, int], Set[str]] = {}
+
+        self._watcher = DirectoryWatcher()
+        self._scanned = False
+        self._last_refresh = 0.0
+        # bumped on every change so cached availability can be invalidated
+        self._generation = 0
+        self._availability: Dict[int, Tuple[int, float, Dict[str, Path]]] = {}
+
+    def refresh(self, force: bool = False) -> None:
+        """Bring the index up to date, rescanning only directories that changed."""
+        now = time.monotonic()
+        if self._scanned and not force and now - self._last_refresh < RESCAN_INTERVAL:
+            return
+        self._last_refresh = now
+
+        if not self._scanned or force:
+            self._full_scan()
+            return
+
+        if self._watcher.available:
+            changed = self._watcher.poll()
+            if changed is None:
+                self._full_scan()
+                return
+        else:
+            changed = {
+                directory
+                for directory, mtime in self._dir_mtimes.items()
+                if self._dir_mtime(directory) != mtime
+            }
+        # a rescan may drop nested directories that are also in the set
+        for directory in sorted(changed, key=len):
+            if directory in self._dir_mtimes:
+                self._scan_dir(directory)
+
+    def get_downloaded_episodes(self, media_id: int) -> Dict[str, Path]:
+        """Map episode numbers to the local files of completed downloads."""
+        self.refresh()
+        record_file = self.media_registry._get_media_file_path(media_id)
+        cached = self._availability.get(media_id)
+        record_mtime, record_modified = check_file_modified(
+            record_file, cached[1] if cached else 0
+        )
+        if cached and not record_modified and cached[0] == self._generation:
+            return cached[2]
+
+        record = self.media_registry.get_media_record(media_id)
+        episodes = self._reconcile(record) if record else {}
+        # reconciling may have rewritten the record
+        record_mtime, _ = check_file_modified(record_file, 0)
+        self._availability[media_id] = (self._generation, record_mtime, episodes)
+        return episodes
+
+    def has_downloads(self, media_id: int) -> bool:
+        return bool(self.get_downloaded_episodes(media_id))
+
+    def get_file(self, path: Path) -> Optional[LibraryFile]:
+        self.refresh()
+        return self._files.get(str(path))
+
+    def close(self) -> None:
+        self._watcher.close()
+
+    def _reconcile(self, record: MediaRecord) -> Dict[str, Path]:
+        media_id = record.media_item.id
+        episodes: Dict[str, Path] = {}
+        for episode in record.media_episodes:
+            if (
+                episode.download_status != DownloadStatus.COMPLETED
+                or not episode.file_path
+            ):
+                continue
+            if self._contains(episode.file_path):
+                episodes[episode.episode_number] = episode.file_path
+                continue
+            if episode.file_path.exists():
+                # the index is stale (throttled refresh, coarse directory
+                # mtimes) or spells the path differently (symlinks, case)
+                self._rescan_parent(episode.file_path)
+                episodes[episode.episode_number] = episode.file_path
+                continue
+
+            moved_to = self._find_moved(episode.file_path, episode.file_size)
+            if moved_to:
+                logger.info(
+                    f"Episode {episode.episode_number} of {media_id} moved to {moved_to}"
+                )
+                self.media_registry.update_episode_download_status(
+                    media_id,
+                    episode.episode_number,
+                    DownloadStatus.COMPLETED,
+                    file_path=moved_to,
+                )
+                episodes[episode.episode_number] = moved_to
+            else:
+                logger.info(
+                    f"Episode {episode.episode_number} of {media_id} is missing from {episode.file_path}"
+                )
+                self.media_registry.update_episode_download_status(
+                    media_id,
+                    episode.episode_number,
+                    DownloadStatus.NOT_DOWNLOADED,
+                    error_message="File was removed outside viu",
+                )
+        return episodes
+
+    def _contains(self, path: Path) -> bool:
+        if self._is_inside_library(path):
+            return str(path) in self._files
+        # downloads from before a downloads_dir change are not indexed
+        return path.exists()
+
+    def _rescan_parent(self, path: Path) -> None:
+        parent = str(path.parent)
+        if parent in self._dir_mtimes:
+            self._scan_dir(parent)
+
+    def _is_inside_library(self, path: Path) -> bool:
+        return path.is_relative_to(self.downloads_dir)
+
+    def _find_moved(self, path: Path, size: Optional[int]) -> Optional[Path]:
+        if size is None:
+            return None
+        candidates = self._by_name.get((path.name, size), set())
+        if len(candidates) == 1:
+            return Path(next(iter(candidates)))
+        return None
+
+    def _full_scan(self) -> None:
+        for directory in list(self._dir_mtimes):
+            self._forget_dir(directory)
+        self._scanned = True
+        if self.downloads_dir.is_dir():
+            self._scan_dir(str(self.downloads_dir))
+        self._generation += 1
+        logger.debug(
+            f"Indexed {len(self._files)} files in {len(self._dir_mtimes)} directories under {self.downloads_dir}"
+        )
+
+    def _scan_dir(self, directory: str) -> None:
+        """Re-read the entries of one directory, recursing into new subdirectories."""
+        self._generation += 1
+        mtime = self._dir_mtime(directory)
+        if mtime is None:
+            self._forget_dir(directory)
+            return
+
+        # watch before listing so nothing created in between is missed
+        self._watcher.add(directory)
+        self._dir_mtimes[directory] = mtime
+
+        for path in self._dir_files.pop(directory, set()):
+            self._drop_file(path)
+        files: Set[str] = set()
+        children: Set[str] = set()
+        new_children: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            children.add(entry.path)
+                            if entry.path not in self._dir_mtimes:
+                                new_children.append(entry.path)
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            self._add_file(
+                                LibraryFile(
+                                    Path(entry.path), stat.st_size, stat.st_mtime
+                                )
+                            )
+                            files.add(entry.path)
+                    except OSError as e:
+                        logger.debug(f"Skipping {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to scan {directory}: {e}")
+
+        for child in self._dir_children.get(directory, set()) - children:
+            self._forget_dir(child)
+        self._dir_files[directory] = files
+        self._dir_children[directory] = children
+        for child in new_children:
+            self._scan_dir(child)
+
+    def _forget_dir(self, directory: str) -> None:
+        for child in self._dir_children.pop(directory, set()):
+            self._forget_dir(child)
+        for path in self._dir_files.pop(directory, set()):
+            self._drop_file(path)
+        self._dir_mtimes.pop(directory, None)
+        self._watcher.discard(directory)
+
+    def _add_file(self, library_file: LibraryFile) -> None:
+        key = str(library_file.path)
+        self._files[key] = library_file
+        self._by_name.setdefault(
+            (library_file.path.name, library_file.size), set()
+        ).add(key)
+
+    def _drop_file(self, path: str) -> None:
+        library_file = self._files.pop(path, None)
+        if not library_file:
+            return
+        name_key = (library_file.path.name, library_file.size)
+        paths = self._by_name.get(name_key)
+        if paths is not None:
+            paths.discard(path)
+            if not paths:
+                del self._by_name[name_key]
+
+    def _dir_mtime(self, directory: str) -> Optional[float]:
+        try:
+            return os.stat(directory).st_mtime
+        except OSError:
+            return None
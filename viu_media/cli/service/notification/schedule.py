@@ -0,0 +1,146 @@
+"""
+Notification checks timed by the airing schedule of tracked shows.
+
+Polling AniList for notifications every few minutes costs an authenticated
+request each time, even though episodes air at known times. The registry
+already records ``next_airing`` for every tracked show. The worker therefore
+checks a few minutes after each of those airings, and checks again a little
+later if AniList has not sent the notification yet. A slow fallback poll
+catches anything the schedule does not know about.
+
+Once an airing has been handled its show is refetched with one batched
+search, so the registry learns about the following episode.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from ....libs.media_api.base import BaseApiClient
+from ....libs.media_api.params import MediaSearchParams
+from ....libs.media_api.types import UserMediaListStatus
+from ..registry import MediaRegistryService
+
+logger = logging.getLogger(__name__)
+
+TRACKED_STATUSES = (
+    UserMediaListStatus.WATCHING,
+    UserMediaListStatus.REPEATING,
+    UserMediaListStatus.PLANNING,
+)
+# checks after an airing, in multiples of the delay; later ones only run if
+# the notification has not arrived yet
+RETRY_FACTORS = (1, 3, 6)
+# AniList returns at most 50 media per page
+REFETCH_BATCH_SIZE = 50
+
+
+class AiringScheduler:
+    """Works out when the worker should next check for notifications."""
+
+    def __init__(
+        self,
+        registry: MediaRegistryService,
+        media_api: BaseApiClient,
+        delay: float,
+        fallback_interval: float,
+    ):
+        """
+        Args:
+            registry: Registry holding the tracked shows.
+            media_api: Client used to refetch shows whose airing has passed.
+            delay: Seconds after an airing to check for its notification.
+            fallback_interval: Longest time between two checks, in seconds.
+        """
+        self.registry = registry
+        self.media_api = media_api
+        self.delay = delay
+        self.fallback_interval = fallback_interval
+        # media id -> timestamp of its next (or most recent unhandled) airing
+        self._airings: Dict[int, float] = {}
+        # media id -> time its latest notification was received
+        self._notified: Dict[int, float] = {}
+        self._last_check: Optional[float] = None
+
+    def record_check(self, checked_at: float, notified_media_ids: Iterable[int]):
+        """Note a finished notification check and refresh the schedule."""
+        self._last_check = checked_at
+        for media_id in notified_media_ids:
+            self._notified[media_id] = checked_at
+        try:
+            self.refresh(checked_at)
+        except Exception:
+            logger.exception("Failed to refresh the airing schedule")
+
+    def next_check(self) -> float:
+        """The timestamp of the next notification check."""
+        last_check = self._last_check or 0.0
+        next_ts = last_check + self.fallback_interval
+        for media_id, airing_at in self._airings.items():
+            if self._notified.get(media_id, 0.0) >= airing_at:
+                continue
+            for factor in RETRY_FACTORS:
+                check_at = airing_at + factor * self.delay
+                if check_at > last_check:
+                    next_ts = min(next_ts, check_at)
+                    break
+        return next_ts
+
+    def refresh(self, now: float) -> None:
+        """
+        Reload upcoming airings from the registry.
+
+        Shows whose airing has been handled, either because its notification
+        arrived or its last retry passed, are refetched first.
+        """
+        airings = self._load_airings()
+        handled = [
+            media_id
+            for media_id, airing_at in airings.items()
+            if self._notified.get(media_id, 0.0) >= airing_at
+            or airing_at + RETRY_FACTORS[-1] * self.delay <= now
+        ]
+        if handled:
+            self._refetch(handled)
+            airings = self._load_airings()
+        self._airings = airings
+        self._notified = {
+            media_id: notified_at
+            for media_id, notified_at in self._notified.items()
+            if media_id in airings
+        }
+        if airings:
+            upcoming = min(airings.values())
+            logger.info(
+                f"Tracking airings of {len(airings)} shows; next at "
+                f"{datetime.fromtimestamp(upcoming):%Y-%m-%d %H:%M}"
+            )
+
+    def _load_airings(self) -> Dict[int, float]:
+        airings: Dict[int, float] = {}
+        for media_id in self.registry.get_media_ids():
+            entry = self.registry.get_media_index_entry(media_id)
+            if not entry or entry.status not in TRACKED_STATUSES:
+                continue
+            record = self.registry.get_media_record(entry.media_id)
+            if not record:
+                continue
+            next_airing = record.media_item.next_airing
+            if next_airing and next_airing.airing_at:
+                airings[entry.media_id] = next_airing.airing_at.timestamp()
+        return airings
+
+    def _refetch(self, media_ids: list[int]) -> None:
+        """Update the registry records of the given shows, one search per page."""
+        refetched = 0
+        for start in range(0, len(media_ids), REFETCH_BATCH_SIZE):
+            batch = media_ids[start : start + REFETCH_BATCH_SIZE]
+            result = self.media_api.search_media(
+                MediaSearchParams(id_in=batch, per_page=len(batch))
+            )
+            if not result:
+                continue
+            for media_item in result.media:
+                self.registry.get_or_create_record(media_item)
+            refetched += len(result.media)
+        logger.debug(f"Refetched airing schedule of {refetched} shows")
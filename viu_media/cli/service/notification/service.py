@@ -43,21 +43,22 @@ class NotificationService:
             except Exception:
                 logger.debug("Failed to update last_notified_episode in registry")
 
-    def check_and_display_notifications(self):
+    def check_and_display_notifications(self) -> list[Notification]:
+        """Display unseen airing notifications and return them."""
         if not PLYER_AVAILABLE:
             logger.warning("plyer not installed. Cannot display desktop notifications.")
-            return
+            return []
 
         if not self.media_api.is_authenticated():
             logger.info("Not authenticated, skipping notification check.")
-            return
+            return []
 
         logger.info("Checking for new notifications...")
         notifications = self.media_api.get_notifications()
 
         if not notifications:
             logger.info("No new notifications found.")
-            return
+            return []
 
         # Filter out notifications already seen in this session or older than registry marker
         filtered: list[Notification] = []
@@ -68,7 +69,7 @@ class NotificationService:
 
         if not filtered:
             logger.info("No unseen notifications found.")
-            return
+            return []
 
         for notif in filtered:
             if self.app_config.worker.auto_download_new_episode:
@@ -112,6 +113,8 @@ class NotificationService:
             except Exception as e:
                 logger.error(f"Failed to display notification: {e}")
 
+        return filtered
+
     def _is_seen_in_registry(self, media_id: int, episode: Optional[int]) -> bool:
         if episode is None:
             return False
@@ -18,6 +18,7 @@ from typing import Any, Callable, Dict, List, Literal, Optional
 from .....core.config.model import StreamConfig
 from .....core.exceptions import ViuError
 from .....core.utils import formatter
+from .....libs.aniskip import SkipInterval
 from .....libs.media_api.types import MediaItem
 from .....libs.player.base import BasePlayer
 from .....libs.player.params import PlayerParams
@@ -27,10 +28,18 @@ from .....libs.provider.anime.params import EpisodeStreamsParams
 from .....libs.provider.anime.types import Anime, ProviderServer, Server
 from ....service.registry.models import DownloadStatus
 from ...registry import MediaRegistryService
+from ...skip import SkipTimesService
 from .base import BaseIPCPlayer
+from .pool import MpvPool
 
 logger = logging.getLogger(__name__)
 
+# how many upcoming episodes to fetch skip times for while one is playing
+SKIP_TIMES_PREFETCH_AHEAD = 3
+# backoff bounds while waiting for mpv's IPC socket to accept connections
+IPC_PROBE_MIN_DELAY = 0.01
+IPC_PROBE_MAX_DELAY = 0.1
+
 
 class MPVIPCError(ViuError):
     """Exception raised for MPV IPC communication errors."""
@@ -55,18 +64,35 @@ class MPVIPCClient:
         self._response_dict: Dict[int, Any] = {}
         self._response_events: Dict[int, threading.Event] = {}
 
-    def connect(self, timeout: float = 5.0) -> None:
-        """Connect to MPV IPC socket and start the reader thread."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+    def connect(
+        self, timeout: float = 5.0, process: Optional[subprocess.Popen] = None
+    ) -> None:
+        """
+        Connect to MPV IPC socket and start the reader thread.
+
+        The socket is probed with a short, growing backoff until MPV is ready
+        to accept connections. If ``process`` exits meanwhile, fails right
+        away instead of waiting for the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delay = IPC_PROBE_MIN_DELAY
+        while time.monotonic() < deadline:
+            if process is not None and process.poll() is not None:
+                raise MPVIPCError(
+                    f"MPV exited with code {process.returncode} before its IPC socket was ready"
+                )
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             try:
-                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
                 self.socket.connect(self.socket_path)
-                logger.info(f"Connected to MPV IPC socket at {self.socket_path}")
-                self._start_reader_thread()
-                return
             except (ConnectionRefusedError, FileNotFoundError, OSError):
-                time.sleep(0.2)
+                self.socket.close()
+                self.socket = None
+                time.sleep(delay)
+                delay = min(delay * 2, IPC_PROBE_MAX_DELAY)
+                continue
+            logger.info(f"Connected to MPV IPC socket at {self.socket_path}")
+            self._start_reader_thread()
+            return
         raise MPVIPCError(f"Failed to connect to MPV IPC socket at {self.socket_path}")
 
     def disconnect(self) -> None:
@@ -267,12 +293,22 @@ class MpvIPCPlayer(BaseIPCPlayer):
     media_item: Optional[MediaItem] = None
 
     registry: Optional[MediaRegistryService] = None
+    skip_times: Optional[SkipTimesService] = None
 
-    def __init__(self, stream_config: StreamConfig):
+    def __init__(self, stream_config: StreamConfig, pool: Optional[MpvPool] = None):
         super().__init__(stream_config)
+        self.pool = pool
         self.socket_path: Optional[str] = None
+        self._initial_subtitles: List[str] = []
+        self._file_loaded = False
+        self._playback_finished = False
         self._fetch_thread: Optional[threading.Thread] = None
         self._fetch_result_queue: Queue = Queue()
+        self._skip_intervals: List[SkipInterval] = []
+        self._skip_intervals_episode: Optional[str] = None
+        self._skipped_intervals: set[SkipInterval] = set()
+        # fetch generation of the last cache miss for the current episode
+        self._skip_times_missed_at: Optional[int] = None
 
     def play(
         self,
@@ -282,28 +318,36 @@ class MpvIPCPlayer(BaseIPCPlayer):
         anime: Optional[Anime] = None,
         registry: Optional[MediaRegistryService] = None,
         media_item: Optional[MediaItem] = None,
+        skip_times: Optional[SkipTimesService] = None,
     ) -> PlayerResult:
         self.provider = provider
         self.anime = anime
         self.media_item = media_item
         self.registry = registry
+        self.skip_times = skip_times
         self.player_state = PlayerState(
             self.stream_config,
             player_params.query,
             player_params.episode,
             media_item=media_item,
         )
+        self._prefetch_skip_times()
 
         return self._play_with_ipc(player, player_params)
 
     def _play_with_ipc(self, player: BasePlayer, params: PlayerParams) -> PlayerResult:
         """Play media using MPV IPC."""
         try:
-            self._start_mpv_process(player, params)
+            if self.pool:
+                self.mpv_process, self.socket_path = self.pool.acquire()
+            else:
+                self._start_mpv_process(player, params)
             self._connect_ipc()
             self._setup_event_handling()
             self._setup_key_bindings()
             self._setup_message_handlers()
+            if self.pool:
+                self._load_initial_stream(params)
             self._wait_for_playback()
 
             return PlayerResult(
@@ -332,13 +376,33 @@ class MpvIPCPlayer(BaseIPCPlayer):
         temp_dir = Path(tempfile.gettempdir())
         self.socket_path = str(temp_dir / f"mpv_ipc_{time.time()}.sock")
         self.mpv_process = player.play_with_ipc(params, self.socket_path)
-        time.sleep(1.0)
 
     def _connect_ipc(self):
         if not self.socket_path:
             raise MPVIPCError("Socket path not set")
         self.ipc_client = MPVIPCClient(self.socket_path)
-        self.ipc_client.connect()
+        self.ipc_client.connect(process=self.mpv_process)
+
+    def _load_initial_stream(self, params: PlayerParams):
+        """Load the first stream into the warm player with its per-file options."""
+        assert self.pool is not None
+        self._initial_subtitles = list(params.subtitles or [])
+        self._loadfile(params.url, self.pool.player.create_mpv_file_options(params))
+
+    def _loadfile(self, url: str, options: Dict[str, str]):
+        if not options:
+            self.ipc_client.send_command(["loadfile", url])
+            return
+        # %n% prefixes keep commas and quotes in values from being parsed
+        option_string = ",".join(
+            f"{key}=%{len(value.encode())}%{value}" for key, value in options.items()
+        )
+        # mpv 0.38 added a playlist index argument in front of the options
+        response = self.ipc_client.send_command(
+            ["loadfile", url, "replace", -1, option_string]
+        )
+        if response.get("error") != "success":
+            self.ipc_client.send_command(["loadfile", url, "replace", option_string])
 
     def _setup_event_handling(self):
         if not self.ipc_client:
@@ -348,6 +412,9 @@ class MpvIPCPlayer(BaseIPCPlayer):
         self.ipc_client.send_command(["observe_property", 2, "duration"])
         self.ipc_client.send_command(["observe_property", 3, "percent-pos"])
         self.ipc_client.send_command(["observe_property", 4, "filename"])
+        if self.pool:
+            # the warm player goes idle instead of exiting when playback ends
+            self.ipc_client.send_command(["observe_property", 5, "idle-active"])
 
     def _bind_key(self, key, command, description):
         if not self.ipc_client:
@@ -377,6 +444,9 @@ class MpvIPCPlayer(BaseIPCPlayer):
             ),
             "shift+r": ("script-message viu-reload-episode", "Reload Episode"),
         }
+        if self.pool:
+            # stop instead of quitting so the warm player survives
+            key_bindings["q"] = ("stop", "Stop")
         for key, (command, description) in key_bindings.items():
             self._bind_key(key, command, description)
 
@@ -407,6 +477,9 @@ class MpvIPCPlayer(BaseIPCPlayer):
                 if self.mpv_process and self.mpv_process.poll() is not None:
                     logger.info("MPV process has exited.")
                     break
+                if self._playback_finished:
+                    logger.info("MPV went idle, playback finished.")
+                    break
 
                 while True:
                     message = self.ipc_client.get_event(block=False)
@@ -439,8 +512,16 @@ class MpvIPCPlayer(BaseIPCPlayer):
         elif event == "client-message":
             self._handle_client_message(message)
         elif event == "file-loaded":
+            self._file_loaded = True
             time.sleep(0.1)
             self._configure_player()
+            # never skip with the previous episode's intervals
+            self._skip_intervals = []
+            self._skip_intervals_episode = None
+            self._skipped_intervals.clear()
+            self._skip_times_missed_at = None
+            self._prefetch_skip_times()
+            self._load_skip_intervals()
         elif event:
             logger.debug(f"MPV event: {event}")
 
@@ -449,8 +530,13 @@ class MpvIPCPlayer(BaseIPCPlayer):
         data = message.get("data")
         if name == "time-pos" and isinstance(data, (int, float)):
             self.player_state.stop_time_secs = data
+            self._auto_skip(data)
         elif name == "duration" and isinstance(data, (int, float)):
             self.player_state.total_time_secs = data
+        elif name == "idle-active" and data is True:
+            # the initial value arrives before anything was loaded
+            if self._file_loaded and not self.player_fetching:
+                self._playback_finished = True
         elif name == "percent-pos" and isinstance(data, (int, float)):
             if (
                 self.stream_config.auto_next
@@ -472,6 +558,16 @@ class MpvIPCPlayer(BaseIPCPlayer):
                     logger.error(f"Error in message handler for '{handler_name}': {e}")
 
     def _cleanup(self):
+        if self.pool:
+            # keep the warm player, just stop whatever it is still playing
+            if self.ipc_client and self.mpv_process.poll() is None:
+                try:
+                    self.ipc_client.send_command(["stop"], timeout=1.0)
+                except MPVIPCError as e:
+                    logger.debug(f"Failed to stop the warm player: {e}")
+            if self.ipc_client:
+                self.ipc_client.disconnect()
+            return
         if self.ipc_client:
             self.ipc_client.disconnect()
         if self.mpv_process:
@@ -634,7 +730,16 @@ class MpvIPCPlayer(BaseIPCPlayer):
 
     def _load_current_stream(self):
         if self.ipc_client and self.player_state and self.player_state.stream_url:
-            self.ipc_client.send_command(["loadfile", self.player_state.stream_url])
+            if self.pool and self.player_state.stream_headers:
+                # per-file options of the previous stream no longer apply
+                headers = ",".join(
+                    f"{k}:{v}" for k, v in self.player_state.stream_headers.items()
+                )
+                self._loadfile(
+                    self.player_state.stream_url, {"http-header-fields": headers}
+                )
+            else:
+                self.ipc_client.send_command(["loadfile", self.player_state.stream_url])
 
     def _show_text(self, text: str, duration: int = 2000):
         if self.ipc_client:
@@ -643,6 +748,9 @@ class MpvIPCPlayer(BaseIPCPlayer):
     def _configure_player(self):
         if not self.ipc_client or self.player_first_run:
             self.player_first_run = False
+            if self.ipc_client and self._initial_subtitles:
+                # the warm player did not get them on its command line
+                self._add_subtitles(self._initial_subtitles)
             return
 
         self.ipc_client.send_command(["seek", 0, "absolute"])
@@ -656,10 +764,91 @@ class MpvIPCPlayer(BaseIPCPlayer):
             return
 
         time.sleep(0.5)
-        for i, sub_url in enumerate(self.player_state.stream_subtitles):
+        self._add_subtitles(self.player_state.stream_subtitles)
+
+    def _add_subtitles(self, subtitles: List[str]):
+        for i, sub_url in enumerate(subtitles):
             flag = "select" if i == 0 else "auto"
             self.ipc_client.send_command(["sub-add", sub_url, flag])
 
+    def _prefetch_skip_times(self):
+        """Queue skip times for the current and next few episodes in the background."""
+        if not self.skip_times or not self.media_item or not self.media_item.id_mal:
+            return
+
+        episodes = [self.player_state.episode]
+        if self.anime:
+            available_episodes = getattr(
+                self.anime.episodes, self.stream_config.translation_type
+            )
+            if self.player_state.episode in available_episodes:
+                index = available_episodes.index(self.player_state.episode)
+                episodes = available_episodes[
+                    index : index + 1 + SKIP_TIMES_PREFETCH_AHEAD
+                ]
+        self.skip_times.prefetch(self.media_item.id_mal, episodes)
+
+    def _load_skip_intervals(self):
+        """Pick up cached skip times for the current episode and expose them as chapters."""
+        if not self.skip_times or not self.media_item or not self.media_item.id_mal:
+            return
+        if self._skip_intervals_episode == self.player_state.episode:
+            return
+        # read before the lookup, so a fetch finishing in between is not missed
+        generation = self.skip_times.fetch_generation
+        if self._skip_times_missed_at == generation:
+            return
+
+        intervals = self.skip_times.get_cached(
+            self.media_item.id_mal, self.player_state.episode
+        )
+        if intervals is None:
+            # still being fetched; retried once a fetch has finished
+            self._skip_times_missed_at = generation
+            return
+
+        self._skip_intervals = intervals
+        self._skip_intervals_episode = self.player_state.episode
+        self._skipped_intervals.clear()
+        if intervals:
+            self._set_skip_chapters(intervals)
+
+    def _set_skip_chapters(self, intervals: List[SkipInterval]):
+        chapters: List[Dict[str, Any]] = []
+        if intervals[0].start_time > 0:
+            chapters.append({"title": "Episode", "time": 0})
+        for interval in intervals:
+            chapters.append({"title": interval.title, "time": interval.start_time})
+            chapters.append({"title": "Episode", "time": interval.end_time})
+        try:
+            response = self.ipc_client.send_command(
+                ["set_property", "chapter-list", chapters]
+            )
+            if response.get("error") != "success":
+                logger.debug(f"mpv rejected skip chapters: {response.get('error')}")
+        except MPVIPCError as e:
+            logger.debug(f"Failed to set skip chapters: {e}")
+
+    def _auto_skip(self, position: float):
+        if not self.skip_times or not self.stream_config.auto_skip:
+            return
+        self._load_skip_intervals()
+        for interval in self._skip_intervals:
+            if interval in self._skipped_intervals:
+                continue
+            # leave a small margin so a seek landing right on the boundary doesn't loop
+            if interval.start_time <= position < interval.end_time - 0.5:
+                self._skipped_intervals.add(interval)
+                try:
+                    self.ipc_client.send_command(
+                        ["seek", interval.end_time, "absolute"]
+                    )
+                except MPVIPCError as e:
+                    logger.warning(f"Failed to skip {interval.title}: {e}")
+                    break
+                self._show_text(f"Skipped {interval.title}")
+                break
+
     def _toggle_auto_next(self):
         self.stream_config.auto_next = not self.stream_config.auto_next
         self._show_text(
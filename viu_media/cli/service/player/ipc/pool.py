@@ -0,0 +1,84 @@
+"""
+A warm mpv kept alive across episodes and menu round-trips.
+
+Starting mpv, creating its window and waiting for its IPC socket costs a
+noticeable amount of time on every play. With ``stream.reuse_player`` one idle
+mpv (``--idle=yes``) is started on first use and kept for the rest of the
+process; every play connects to its socket and loads the stream with
+``loadfile``. If the user closes the window, the next play starts a new one.
+"""
+
+import atexit
+import logging
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .....core.patterns import TORRENT_REGEX
+from .....core.utils import detect
+from .....libs.player.mpv.player import MpvPlayer
+from .....libs.player.params import PlayerParams
+
+logger = logging.getLogger(__name__)
+
+
+class MpvPool:
+    """Owns the warm mpv process and its IPC socket."""
+
+    def __init__(self, player: MpvPlayer):
+        self.player = player
+        self.process: Optional[subprocess.Popen] = None
+        self.socket_path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def can_play(self, params: PlayerParams) -> bool:
+        """Whether the stream can be loaded into the warm player."""
+        return not (
+            params.syncplay
+            or TORRENT_REGEX.search(params.url)
+            or detect.is_running_in_termux()
+        )
+
+    def acquire(self) -> tuple[subprocess.Popen, str]:
+        """The running mpv and its socket, starting a new one if needed."""
+        with self._lock:
+            if self.process is None or self.process.poll() is not None:
+                self._discard()
+                temp_dir = Path(tempfile.gettempdir())
+                self.socket_path = str(temp_dir / f"mpv_pool_{time.time()}.sock")
+                self.process = self.player.start_idle(self.socket_path)
+            assert self.socket_path is not None
+            return self.process, self.socket_path
+
+    def close(self) -> None:
+        with self._lock:
+            if self.process and self.process.poll() is None:
+                try:
+                    self.process.terminate()
+                    self.process.wait(timeout=3)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+            self._discard()
+
+    def _discard(self) -> None:
+        if self.socket_path:
+            Path(self.socket_path).unlink(missing_ok=True)
+        self.process = None
+        self.socket_path = None
+
+
+_pool: Optional[MpvPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(player: MpvPlayer) -> MpvPool:
+    """The process-wide warm player pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MpvPool(player)
+            atexit.register(_pool.close)
+        return _pool
@@ -1,5 +1,7 @@
+import dataclasses
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from ....core.config import AppConfig
 from ....core.exceptions import ViuError
@@ -11,6 +13,12 @@ from ....libs.player.types import PlayerResult
 from ....libs.provider.anime.base import BaseAnimeProvider
 from ....libs.provider.anime.types import Anime
 from ..registry import MediaRegistryService
+from ..registry.models import DownloadStatus
+from ..skip import SkipTimesService
+
+if TYPE_CHECKING:
+    from ..stream_cache import StreamCacheService
+    from .ipc.pool import MpvPool
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +28,9 @@ class PlayerService:
     provider: BaseAnimeProvider
     player: BasePlayer
     registry: Optional[MediaRegistryService] = None
+    skip_times: Optional[SkipTimesService] = None
     local: bool = False
+    stream_cache: Optional["StreamCacheService"] = None
 
     def __init__(
         self,
@@ -32,6 +42,21 @@ class PlayerService:
         self.provider = provider
         self.registry = registry
         self.player = create_player(app_config)
+        if app_config.stream.auto_skip:
+            self.skip_times = SkipTimesService()
+
+    def _get_pool(self, params: PlayerParams) -> Optional["MpvPool"]:
+        """The warm player to load the stream into, if player reuse is enabled."""
+        stream_config = self.app_config.stream
+        if not (stream_config.reuse_player and stream_config.player == "mpv"):
+            return None
+        from ....libs.player.mpv.player import MpvPlayer
+        from .ipc.pool import get_pool
+
+        if not isinstance(self.player, MpvPlayer):
+            return None
+        pool = get_pool(self.player)
+        return pool if pool.can_play(params) else None
 
     def play(
         self,
@@ -41,8 +66,16 @@ class PlayerService:
         local: bool = False,
     ) -> PlayerResult:
         self.local = local
+        if (
+            self.app_config.stream.cache_streams
+            and media_item
+            and self.registry
+            and not local
+        ):
+            params = self._cache_stream(params, media_item)
         if self.app_config.stream.use_ipc:
-            if anime or self.registry:
+            # the warm player is only reachable over ipc
+            if anime or self.registry or self._get_pool(params):
                 return self._play_with_ipc(params, anime, media_item)
             else:
                 logger.warning(
@@ -50,6 +83,42 @@ class PlayerService:
                 )
         return self.player.play(params)
 
+    def _cache_stream(
+        self, params: PlayerParams, media_item: MediaItem
+    ) -> PlayerParams:
+        """Route the stream through the caching proxy so it ends up downloaded."""
+        if self.stream_cache is None:
+            from ..stream_cache import StreamCacheService
+
+            self.stream_cache = StreamCacheService(
+                self.app_config.downloads.downloads_dir
+            )
+        registry = self.registry
+        assert registry is not None
+
+        def register_download(file_path: Path, file_size: int) -> None:
+            registry.get_or_create_record(media_item)
+            registry.update_episode_download_status(
+                media_id=media_item.id,
+                episode_number=params.episode,
+                status=DownloadStatus.COMPLETED,
+                file_path=file_path,
+                file_size=file_size,
+                provider_name=self.app_config.general.provider.value,
+            )
+
+        url = self.stream_cache.proxy_url(
+            params.url,
+            params.headers,
+            media_item.title.english or media_item.title.romaji or params.query,
+            params.title,
+            on_complete=register_download,
+        )
+        if url == params.url:
+            return params
+        # the proxy sends the provider headers itself
+        return dataclasses.replace(params, url=url, headers=None)
+
     def _play_with_ipc(
         self,
         params: PlayerParams,
@@ -60,8 +129,14 @@ class PlayerService:
             from .ipc.mpv import MpvIPCPlayer
 
             registry = self.registry if self.local else None
-            return MpvIPCPlayer(self.app_config.stream).play(
-                self.player, params, self.provider, anime, registry, media_item
+            return MpvIPCPlayer(self.app_config.stream, self._get_pool(params)).play(
+                self.player,
+                params,
+                self.provider,
+                anime,
+                registry,
+                media_item,
+                self.skip_times,
             )
         else:
             raise ViuError("Not implemented")
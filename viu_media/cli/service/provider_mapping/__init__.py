@@ -0,0 +1,3 @@
+from .service import PinnedMappingUnavailable, ProviderMappingService
+
+__all__ = ["PinnedMappingUnavailable", "ProviderMappingService"]
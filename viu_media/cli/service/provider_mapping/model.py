@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+PROVIDER_MAPPINGS_VERSION = "1.0"
+
+
+class ProviderMapping(BaseModel):
+    provider_anime_id: str
+    provider_title: str = ""
+    # pinned mappings were chosen by the user and are never replaced by auto-matches
+    pinned: bool = False
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+
+class ProviderMappingStore(BaseModel):
+    version: str = Field(default=PROVIDER_MAPPINGS_VERSION)
+    # "{media_api}_{media_id}" -> "{provider}:{translation_type}" -> mapping
+    mappings: Dict[str, Dict[str, ProviderMapping]] = Field(default_factory=dict)
@@ -0,0 +1,204 @@
+import inspect
+import logging
+from typing import TYPE_CHECKING, Optional
+
+import httpx
+
+from ....core.config.model import MediaRegistryConfig
+from ....core.exceptions import ViuError
+from ....core.utils import json_codec
+from ....core.utils.file import FileLock, check_file_modified
+from ....libs.provider.anime.params import AnimeParams
+from ....libs.provider.anime.types import Anime, ProviderName
+from .model import ProviderMapping, ProviderMappingStore
+
+if TYPE_CHECKING:
+    from ....libs.provider.anime.base import BaseAnimeProvider
+
+logger = logging.getLogger(__name__)
+
+# statuses meaning the provider no longer knows the id, unlike timeouts or 5xx
+NOT_FOUND_STATUSES = (404, 410)
+
+
+class PinnedMappingUnavailable(ViuError):
+    """A provider anime the user picked by hand could not be fetched."""
+
+    def __init__(
+        self, provider_name: ProviderName, mapping: ProviderMapping, reason: str
+    ):
+        self.mapping = mapping
+        super().__init__(
+            f"Your chosen {provider_name.value} match "
+            f"'{mapping.provider_title or mapping.provider_anime_id}' {reason}"
+        )
+
+
+class ProviderMappingService:
+    """
+    Remembers which provider anime a media api entry resolved to.
+
+    Mappings are keyed by (media api id, provider, translation type) and let
+    callers skip the provider search and fuzzy title matching on repeat visits.
+    """
+
+    def __init__(self, media_api: str, config: MediaRegistryConfig):
+        self._media_api = media_api
+        self.config = config
+        self.config.index_dir.mkdir(parents=True, exist_ok=True)
+        self._store: Optional[ProviderMappingStore] = None
+        self._store_file = self.config.index_dir / "provider_mappings.json"
+        self._store_file_modified_time = 0
+        self._lock = FileLock(self.config.index_dir / "provider_mappings.lock")
+
+    def get(
+        self, media_id: int, provider: ProviderName, translation_type: str
+    ) -> Optional[ProviderMapping]:
+        entries = self._load_store().mappings.get(self._media_key(media_id), {})
+        return entries.get(self._provider_key(provider, translation_type))
+
+    def save(
+        self,
+        media_id: int,
+        provider: ProviderName,
+        translation_type: str,
+        provider_anime_id: str,
+        provider_title: str = "",
+        pinned: bool = False,
+    ) -> None:
+        """Record a resolved mapping. Automatic matches never replace a pinned one."""
+        with self._lock:
+            store = self._load_store(force=True)
+            entries = store.mappings.setdefault(self._media_key(media_id), {})
+            key = self._provider_key(provider, translation_type)
+            existing = entries.get(key)
+            if existing and existing.pinned and not pinned:
+                return
+            if (
+                existing
+                and existing.provider_anime_id == provider_anime_id
+                and existing.pinned == pinned
+            ):
+                return
+            entries[key] = ProviderMapping(
+                provider_anime_id=provider_anime_id,
+                provider_title=provider_title,
+                pinned=pinned,
+            )
+            self._save_store(store)
+        logger.debug(
+            f"Mapped {self._media_key(media_id)} to {key}={provider_anime_id} (pinned={pinned})"
+        )
+
+    def invalidate(
+        self,
+        media_id: int,
+        provider: ProviderName,
+        translation_type: str,
+        force: bool = False,
+    ) -> bool:
+        """Forget a mapping. Pinned mappings are only removed when forced."""
+        with self._lock:
+            store = self._load_store(force=True)
+            entries = store.mappings.get(self._media_key(media_id), {})
+            key = self._provider_key(provider, translation_type)
+            existing = entries.get(key)
+            if not existing or (existing.pinned and not force):
+                return False
+            del entries[key]
+            if not entries:
+                store.mappings.pop(self._media_key(media_id), None)
+            self._save_store(store)
+        logger.info(f"Invalidated provider mapping {key} for {media_id}")
+        return True
+
+    def get_mapped_anime(
+        self,
+        provider: "BaseAnimeProvider",
+        provider_name: ProviderName,
+        media_id: int,
+        translation_type: str,
+        query: str,
+    ) -> Optional[Anime]:
+        """
+        Fetch the provider anime for a mapped entry without searching.
+
+        Returns None when there is no usable mapping. Only a provider that no
+        longer knows the mapped id, or has no episodes for the translation
+        type, invalidates an automatic mapping; timeouts and server errors
+        keep it for the next visit. Raises PinnedMappingUnavailable instead of
+        returning None when the mapping was picked by the user, so callers can
+        tell them before falling back to a search.
+        """
+        mapping = self.get(media_id, provider_name, translation_type)
+        if not mapping:
+            return None
+
+        try:
+            anime = self._fetch_anime(
+                provider, AnimeParams(id=mapping.provider_anime_id, query=query)
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not fetch mapped {provider_name.value} id {mapping.provider_anime_id} for {media_id}: {e}"
+            )
+            if mapping.pinned:
+                raise PinnedMappingUnavailable(
+                    provider_name, mapping, "could not be fetched right now"
+                ) from e
+            return None
+
+        if anime and getattr(anime.episodes, translation_type, None):
+            return anime
+
+        if mapping.pinned:
+            raise PinnedMappingUnavailable(
+                provider_name, mapping, f"is no longer available in {translation_type}"
+            )
+        self.invalidate(media_id, provider_name, translation_type)
+        return None
+
+    @staticmethod
+    def _fetch_anime(
+        provider: "BaseAnimeProvider", params: AnimeParams
+    ) -> Optional[Anime]:
+        """
+        Call the provider's get without @debug_provider, which turns every
+        error into None, so a timeout does not look like an unknown id.
+        """
+        get = inspect.unwrap(type(provider).get)
+        try:
+            return get(provider, params)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in NOT_FOUND_STATUSES:
+                return None
+            raise
+
+    def _media_key(self, media_id: int) -> str:
+        return f"{self._media_api}_{media_id}"
+
+    def _provider_key(self, provider: ProviderName, translation_type: str) -> str:
+        return f"{provider.value}:{translation_type}"
+
+    def _load_store(self, force: bool = False) -> ProviderMappingStore:
+        self._store_file_modified_time, is_modified = check_file_modified(
+            self._store_file, self._store_file_modified_time
+        )
+        if not force and not is_modified and self._store is not None:
+            return self._store
+        if self._store_file.exists():
+            try:
+                self._store = json_codec.read_model(
+                    self._store_file, ProviderMappingStore
+                )
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable provider mappings: {e}")
+                self._store = ProviderMappingStore()
+        else:
+            self._store = ProviderMappingStore()
+        return self._store
+
+    def _save_store(self, store: ProviderMappingStore) -> None:
+        json_codec.write_model(self._store_file, store)
+        self._store = store
+        self._store_file_modified_time, _ = check_file_modified(self._store_file, 0)
@@ -1,12 +1,14 @@
-import json
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Generator, List, Optional, TypedDict
 
 from ....core.config.model import MediaRegistryConfig
 from ....core.exceptions import ViuError
-from ....core.utils.file import AtomicWriter, FileLock, check_file_modified
+from ....core.utils import json_codec
+from ....core.utils.file import ReadWriteFileLock, check_file_modified
+from ....core.utils.profiling import timed
 from ....libs.media_api.params import MediaSearchParams
 from ....libs.media_api.types import (
     MediaItem,
@@ -21,6 +23,7 @@ from .models import (
     MediaRegistryIndex,
     MediaRegistryIndexEntry,
 )
+from .title_index import TitleIndex
 
 
 class StatBreakdown(TypedDict):
@@ -42,7 +45,14 @@ class MediaRegistryService:
         self._index_file = self.config.index_dir / "registry.json"
         self._index_file_modified_time = 0
         _lock_file = self.config.media_dir / "registry.lock"
-        self._lock = FileLock(_lock_file)
+        # shared while reading registry files, exclusive while writing them
+        self._lock = ReadWriteFileLock(_lock_file)
+        # serializes read-modify-write of records between threads, e.g.
+        # concurrent downloads of episodes of the same anime
+        self._records_lock = threading.RLock()
+        self._title_index = TitleIndex(
+            self.config.index_dir / f"{media_api}_title_index.json"
+        )
 
     def _ensure_directories(self) -> None:
         """Ensure registry directories exist."""
@@ -52,6 +62,7 @@ class MediaRegistryService:
         except Exception as e:
             logger.error(f"Failed to create registry directories: {e}")
 
+    @timed("registry.load_index", "registry")
     def _load_index(self) -> MediaRegistryIndex:
         """Load or create the registry index."""
         self._index_file_modified_time, is_modified = check_file_modified(
@@ -60,9 +71,10 @@ class MediaRegistryService:
         if not is_modified and self._index is not None:
             return self._index
         if self._index_file.exists():
-            with self._index_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            self._index = MediaRegistryIndex.model_validate(data)
+            with self._lock.read():
+                self._index = json_codec.read_model(
+                    self._index_file, MediaRegistryIndex
+                )
         else:
             self._index = MediaRegistryIndex()
             self._save_index(self._index)
@@ -76,12 +88,12 @@ class MediaRegistryService:
         logger.debug(f"Loaded registry index with {self._index.media_count} entries")
         return self._index
 
+    @timed("registry.save_index", "registry")
     def _save_index(self, index: MediaRegistryIndex):
         """Save the registry index."""
-        with self._lock:
+        with self._lock.write():
             index.last_updated = datetime.now()
-            with AtomicWriter(self._index_file) as f:
-                json.dump(index.model_dump(mode="json"), f, indent=2)
+            json_codec.write_model(self._index_file, index)
 
             logger.debug("saved registry index")
 
@@ -96,18 +108,22 @@ class MediaRegistryService:
         index = self._load_index()
         return index.media_index.get(f"{self._media_api}_{media_id}")
 
+    def get_media_ids(self) -> List[int]:
+        """Ids of every media in the registry index, without reading any record."""
+        return [entry.media_id for entry in self._load_index().media_index.values()]
+
     def _get_media_file_path(self, media_id: int) -> Path:
         """Get file path for media record."""
         return self.media_registry_dir / f"{media_id}.json"
 
+    @timed("registry.load_record", "registry")
     def get_media_record(self, media_id: int) -> Optional[MediaRecord]:
         record_file = self._get_media_file_path(media_id)
         if not record_file.exists():
             return None
 
-        data = json.load(record_file.open(mode="r", encoding="utf-8"))
-
-        record = MediaRecord.model_validate(data)
+        with self._lock.read():
+            record = json_codec.read_model(record_file, MediaRecord)
 
         # logger.debug(f"Loaded media record for {media_id}")
         return record
@@ -133,27 +149,30 @@ class MediaRegistryService:
         logger.debug(f"Saved media record for {index_entry.media_id}")
         return True
 
+    @timed("registry.save_record", "registry")
     def save_media_record(self, record: MediaRecord) -> bool:
         self.get_or_create_index_entry(record.media_item.id)
-        with self._lock:
+        with self._lock.write():
             media_id = record.media_item.id
 
             record_file = self._get_media_file_path(media_id)
 
-            with AtomicWriter(record_file) as f:
-                json.dump(record.model_dump(mode="json"), f, indent=2, default=str)
+            json_codec.write_model(record_file, record)
+
+            self._title_index.update(record.media_item)
 
             logger.debug(f"Saved media record for {media_id}")
             return True
 
     def get_or_create_record(self, media_item: MediaItem) -> MediaRecord:
-        record = self.get_media_record(media_item.id)
-        if record is None:
-            record = MediaRecord(media_item=media_item)
-            self.save_media_record(record)
-        else:
-            record.media_item = media_item
-            self.save_media_record(record)
+        with self._records_lock:
+            record = self.get_media_record(media_item.id)
+            if record is None:
+                record = MediaRecord(media_item=media_item)
+                self.save_media_record(record)
+            else:
+                record.media_item = media_item
+                self.save_media_record(record)
 
         return record
 
@@ -232,6 +251,17 @@ class MediaRegistryService:
         )
         return MediaSearchResult(page_info=page_info, media=recent_media)
 
+    def search_titles(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[tuple[int, float]]:
+        """Rank registry media ids by typo-tolerant similarity to the query."""
+        if self._title_index.needs_rebuild:
+            with self._lock.write():
+                self._title_index.rebuild(
+                    record.media_item for record in self.get_all_media_records()
+                )
+        return self._title_index.search(query, limit)
+
     def search_for_media(self, params: MediaSearchParams) -> MediaSearchResult:
         """Search for media in the local registry based on search parameters."""
         from ....libs.media_api.types import MediaSearchResult, PageInfo
@@ -239,9 +269,25 @@ class MediaRegistryService:
         index = self._load_index()
         all_media: List[MediaItem] = []
 
+        if params.query:
+            # only records whose titles match are loaded, best matches first
+            media_ids = [
+                media_id
+                for media_id, _ in self.search_titles(params.query)
+                if f"{self._media_api}_{media_id}" in index.media_index
+            ]
+        elif params.id_in:
+            media_ids = [
+                media_id
+                for media_id in params.id_in
+                if f"{self._media_api}_{media_id}" in index.media_index
+            ]
+        else:
+            media_ids = [entry.media_id for entry in index.media_index.values()]
+
         # Get all media records and attach user status
-        for entry in index.media_index.values():
-            record = self.get_media_record(entry.media_id)
+        for media_id in media_ids:
+            record = self.get_media_record(media_id)
             if record:
                 # Create UserListItem from index entry
                 all_media.append(record.media_item)
@@ -275,29 +321,7 @@ class MediaRegistryService:
         """Apply search filters to media list."""
         filtered = media_list.copy()
 
-        # Query filter (search in title)
-        if params.query:
-            query_lower = params.query.lower()
-            filtered = [
-                media
-                for media in filtered
-                if (
-                    query_lower in media.title.english.lower()
-                    if media.title.english
-                    else False
-                )
-                or (
-                    query_lower in media.title.romaji.lower()
-                    if media.title.romaji
-                    else False
-                )
-                or (
-                    query_lower in media.title.native.lower()
-                    if media.title.native
-                    else False
-                )
-                or any(query_lower in synonym.lower() for synonym in media.synonymns)
-            ]
+        # The query filter is applied through the title index in search_for_media
 
         # Status filters
         if params.status:
@@ -408,7 +432,10 @@ class MediaRegistryService:
 
         # Apply sorting based on MediaSort enum
         try:
-            if sort.value == "POPULARITY_DESC":
+            if sort.value == "SEARCH_MATCH" and params.query:
+                # already ranked by the title index, best match first
+                return media_list
+            elif sort.value == "POPULARITY_DESC":
                 return sorted(media_list, key=lambda x: x.popularity or 0, reverse=True)
             elif sort.value == "SCORE_DESC":
                 return sorted(
@@ -511,7 +538,7 @@ class MediaRegistryService:
         return records
 
     def remove_media_record(self, media_id: int):
-        with self._lock:
+        with self._lock.write():
             record_file = self._get_media_file_path(media_id)
             if record_file.exists():
                 record_file.unlink()
@@ -527,6 +554,8 @@ class MediaRegistryService:
             self._save_index(index)
 
             logger.debug(f"Removed media record {media_id}")
+        with self._lock.write():
+            self._title_index.remove(media_id)
 
     def update_episode_download_status(
         self,
@@ -543,64 +572,65 @@ class MediaRegistryService:
         download_date: Optional[datetime] = None,
     ) -> bool:
         """Update the download status and metadata for a specific episode."""
-        try:
-            from .models import DownloadStatus, MediaEpisode
+        with self._records_lock:
+            try:
+                from .models import DownloadStatus, MediaEpisode
 
-            record = self.get_media_record(media_id)
-            if not record:
-                logger.error(f"No media record found for ID {media_id}")
-                return False
+                record = self.get_media_record(media_id)
+                if not record:
+                    logger.error(f"No media record found for ID {media_id}")
+                    return False
 
-            # Find existing episode or create new one
-            episode_record = None
-            for episode in record.media_episodes:
-                if episode.episode_number == episode_number:
-                    episode_record = episode
-                    break
-
-            if not episode_record:
-                # Allow creation without file_path for queued/in-progress states.
-                # Only require file_path once the episode is marked COMPLETED.
-                episode_record = MediaEpisode(
-                    episode_number=episode_number,
-                    download_status=status,
-                    file_path=file_path,
-                )
-                record.media_episodes.append(episode_record)
-
-            # Update episode metadata
-            episode_record.download_status = status
-            if file_path:
-                episode_record.file_path = file_path
-            elif status.name == "COMPLETED" and not episode_record.file_path:
-                logger.warning(
-                    "Completed status set without file_path for media %s episode %s",
-                    media_id,
-                    episode_number,
-                )
-            if file_size is not None:
-                episode_record.file_size = file_size
-            if quality:
-                episode_record.quality = quality
-            if provider_name:
-                episode_record.provider_name = provider_name
-            if server_name:
-                episode_record.server_name = server_name
-            if subtitle_paths:
-                episode_record.subtitle_paths = subtitle_paths
-            if error_message:
-                episode_record.last_error = error_message
-
-            # Increment download attempts if this is a failure
-            if status == DownloadStatus.FAILED:
-                episode_record.download_attempts += 1
-
-            # Save the updated record
-            return self.save_media_record(record)
+                # Find existing episode or create new one
+                episode_record = None
+                for episode in record.media_episodes:
+                    if episode.episode_number == episode_number:
+                        episode_record = episode
+                        break
+
+                if not episode_record:
+                    # Allow creation without file_path for queued/in-progress states.
+                    # Only require file_path once the episode is marked COMPLETED.
+                    episode_record = MediaEpisode(
+                        episode_number=episode_number,
+                        download_status=status,
+                        file_path=file_path,
+                    )
+                    record.media_episodes.append(episode_record)
 
-        except Exception as e:
-            logger.error(f"Failed to update episode download status: {e}")
-            return False
+                # Update episode metadata
+                episode_record.download_status = status
+                if file_path:
+                    episode_record.file_path = file_path
+                elif status.name == "COMPLETED" and not episode_record.file_path:
+                    logger.warning(
+                        "Completed status set without file_path for media %s episode %s",
+                        media_id,
+                        episode_number,
+                    )
+                if file_size is not None:
+                    episode_record.file_size = file_size
+                if quality:
+                    episode_record.quality = quality
+                if provider_name:
+                    episode_record.provider_name = provider_name
+                if server_name:
+                    episode_record.server_name = server_name
+                if subtitle_paths:
+                    episode_record.subtitle_paths = subtitle_paths
+                if error_message:
+                    episode_record.last_error = error_message
+
+                # Increment download attempts if this is a failure
+                if status == DownloadStatus.FAILED:
+                    episode_record.download_attempts += 1
+
+                # Save the updated record
+                return self.save_media_record(record)
+
+            except Exception as e:
+                logger.error(f"Failed to update episode download status: {e}")
+                return False
 
     def get_episodes_by_download_status(
         self, status: "DownloadStatus"
@@ -0,0 +1,251 @@
+import json
+import logging
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ....core.utils import json_codec
+from ....core.utils.file import check_file_modified
+from ....libs.media_api.types import MediaItem
+
+logger = logging.getLogger(__name__)
+
+TITLE_INDEX_VERSION = "1.0"
+
+# candidates scoring below this are dropped unless the query is a substring
+MIN_SIMILARITY = 0.3
+
+# the journal is folded into the index file once it has this many entries, or
+# as many as the index, so saving n records costs O(n) writes overall
+JOURNAL_COMPACT_MIN = 200
+
+_NON_ALNUM = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_index_title(title: str) -> str:
+    return _NON_ALNUM.sub(" ", title.casefold()).strip()
+
+
+def title_trigrams(title: str) -> Set[str]:
+    """Trigrams of every word, padded so short words and word starts still match."""
+    trigrams: Set[str] = set()
+    for word in title.split():
+        padded = f"  {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class TitleIndex:
+    """
+    Persistent trigram index over the titles and synonyms of registry records.
+
+    Postings map each trigram to the media ids whose titles contain it. A
+    query is answered by counting shared trigrams through the postings and
+    ranking the candidates by Dice similarity, so it tolerates typos and never
+    has to read the media records themselves.
+
+    Changes are appended to a journal next to the index file and replayed on
+    load, so saving a record is a small write; the journal is folded back into
+    the index file once it grows as large as the index. Writers are expected
+    to hold the registry write lock.
+    """
+
+    def __init__(self, index_file: Path):
+        self.index_file = index_file
+        self.journal_file = index_file.with_suffix(".deltas.jsonl")
+        self._titles: Dict[int, List[str]] = {}
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._journal_entries = 0
+        self._loaded = False
+        self._valid = False
+        self._index_file_modified_time = 0.0
+        self._journal_file_modified_time = 0.0
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """True when the index file is missing, unreadable or from another version."""
+        self._load()
+        return not self._valid
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._titles)
+
+    def update(self, media_item: MediaItem) -> bool:
+        """Index the titles of a media item. Returns True if anything changed."""
+        self._load()
+        if not self._valid:
+            # a partial index would hide records; the next search rebuilds it
+            return False
+        titles = self._collect_titles(media_item)
+        if self._titles.get(media_item.id) == titles:
+            return False
+
+        self._set_titles(media_item.id, titles)
+        self._append_journal(media_item.id, titles)
+        return True
+
+    def remove(self, media_id: int) -> bool:
+        self._load()
+        if not self._valid or media_id not in self._titles:
+            return False
+        self._set_titles(media_id, None)
+        self._append_journal(media_id, None)
+        return True
+
+    def rebuild(self, media_items: Iterable[MediaItem]) -> None:
+        """Replace the whole index, e.g. when it is missing or outdated."""
+        self._titles = {}
+        self._postings = defaultdict(set)
+        for media_item in media_items:
+            self._set_titles(media_item.id, self._collect_titles(media_item))
+        self._loaded = True
+        self._valid = True
+        self._save()
+        logger.info(f"Rebuilt registry title index with {len(self._titles)} entries")
+
+    def search(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """Return (media_id, score) pairs ranked by similarity to the query."""
+        self._load()
+        normalized_query = normalize_index_title(query)
+        query_trigrams = title_trigrams(normalized_query)
+        if not query_trigrams:
+            return []
+
+        shared: Dict[int, int] = defaultdict(int)
+        for trigram in query_trigrams:
+            for media_id in self._postings.get(trigram, ()):
+                shared[media_id] += 1
+
+        results: List[Tuple[int, float]] = []
+        for media_id in shared:
+            score = 0.0
+            for title in self._titles[media_id]:
+                if normalized_query in title:
+                    # substring hits always rank, longer coverage ranks higher
+                    score = max(score, 1.0 + len(normalized_query) / len(title))
+                    continue
+                trigrams = title_trigrams(title)
+                common = len(query_trigrams & trigrams)
+                score = max(score, 2 * common / (len(query_trigrams) + len(trigrams)))
+            if score >= MIN_SIMILARITY:
+                results.append((media_id, score))
+
+        results.sort(key=lambda result: result[1], reverse=True)
+        return results[:limit] if limit else results
+
+    def _collect_titles(self, media_item: MediaItem) -> List[str]:
+        raw_titles = [
+            media_item.title.english,
+            media_item.title.romaji,
+            media_item.title.native,
+            *media_item.synonymns,
+        ]
+        titles = []
+        for raw_title in raw_titles:
+            if raw_title and (title := normalize_index_title(raw_title)):
+                if title not in titles:
+                    titles.append(title)
+        return titles
+
+    def _item_trigrams(self, titles: List[str]) -> Set[str]:
+        trigrams: Set[str] = set()
+        for title in titles:
+            trigrams |= title_trigrams(title)
+        return trigrams
+
+    def _set_titles(self, media_id: int, titles: Optional[List[str]]) -> None:
+        """Replace the titles of a media id in memory; None removes it."""
+        self._remove_postings(media_id)
+        if titles is None:
+            self._titles.pop(media_id, None)
+            return
+        self._titles[media_id] = titles
+        for trigram in self._item_trigrams(titles):
+            self._postings[trigram].add(media_id)
+
+    def _remove_postings(self, media_id: int) -> None:
+        for trigram in self._item_trigrams(self._titles.get(media_id, [])):
+            ids = self._postings.get(trigram)
+            if ids is not None:
+                ids.discard(media_id)
+                if not ids:
+                    del self._postings[trigram]
+
+    def _load(self) -> None:
+        self._index_file_modified_time, is_modified = check_file_modified(
+            self.index_file, self._index_file_modified_time
+        )
+        self._journal_file_modified_time, is_journal_modified = check_file_modified(
+            self.journal_file, self._journal_file_modified_time
+        )
+        if self._loaded and not is_modified and not is_journal_modified:
+            return
+        self._loaded = True
+        self._valid = False
+        self._journal_entries = 0
+        if not self.index_file.exists():
+            return
+        try:
+            data = json_codec.read(self.index_file)
+            if data.get("version") != TITLE_INDEX_VERSION:
+                logger.info("Registry title index version changed; ignoring it")
+                return
+            self._titles = {
+                int(media_id): titles for media_id, titles in data["titles"].items()
+            }
+            self._postings = defaultdict(
+                set,
+                {trigram: set(ids) for trigram, ids in data["postings"].items()},
+            )
+            self._valid = True
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to load registry title index: {e}")
+            return
+        if self.journal_file.exists():
+            self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        try:
+            with self.journal_file.open("r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        self._set_titles(int(entry["id"]), entry["titles"])
+                        self._journal_entries += 1
+                    except (ValueError, KeyError, TypeError) as e:
+                        # a torn line from an interrupted write shouldn't lose the rest
+                        logger.warning(
+                            f"Skipping bad title index entry on line {line_no}: {e}"
+                        )
+        except OSError as e:
+            logger.warning(f"Failed to replay registry title index journal: {e}")
+
+    def _append_journal(self, media_id: int, titles: Optional[List[str]]) -> None:
+        self._journal_entries += 1
+        if self._journal_entries >= max(JOURNAL_COMPACT_MIN, len(self._titles)):
+            self._save()
+            return
+        with self.journal_file.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"id": media_id, "titles": titles}) + "\n")
+        self._journal_file_modified_time, _ = check_file_modified(self.journal_file, 0)
+
+    def _save(self) -> None:
+        data = {
+            "version": TITLE_INDEX_VERSION,
+            "titles": self._titles,
+            "postings": {
+                trigram: sorted(ids) for trigram, ids in self._postings.items()
+            },
+        }
+        json_codec.write(self.index_file, data)
+        # everything journaled so far is in the index file now
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_entries = 0
+        self._index_file_modified_time, _ = check_file_modified(self.index_file, 0)
+        self._journal_file_modified_time = 0.0
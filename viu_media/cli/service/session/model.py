@@ -1,13 +1,60 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, computed_field
 
-from ...interactive.state import State
+from ....libs.media_api.params import MediaSearchParams, UserMediaListSearchParams
+from ....libs.media_api.types import MediaItem, PageInfo
+from ...interactive.state import MediaApiState, MenuName, ProviderState, State
+
+
+class MediaApiSnapshot(BaseModel):
+    """A MediaApiState with its search results reduced to their ids."""
+
+    media_ids: Optional[List[int]] = None
+    search_params: Optional[Union[MediaSearchParams, UserMediaListSearchParams]] = None
+    page_info: Optional[PageInfo] = None
+    media_id: Optional[int] = None
+
+    @classmethod
+    def from_state(cls, state: MediaApiState) -> "MediaApiSnapshot":
+        return cls(
+            media_ids=None
+            if state.search_result_ is None
+            else list(state.search_result_),
+            search_params=state.search_params_,
+            page_info=state.page_info_,
+            media_id=state.media_id_,
+        )
+
+
+class StateSnapshot(BaseModel):
+    """
+    A history entry below the top of the stack.
+
+    Media items are stored once per session and referenced by id; provider
+    search results, only needed while picking a provider match, are dropped.
+    """
+
+    menu_name: MenuName
+    media_api: MediaApiSnapshot = Field(default_factory=MediaApiSnapshot)
+    provider: ProviderState = Field(default_factory=ProviderState)
+
+    @classmethod
+    def from_state(cls, state: State) -> "StateSnapshot":
+        return cls(
+            menu_name=state.menu_name,
+            media_api=MediaApiSnapshot.from_state(state.media_api),
+            provider=state.provider.model_copy(update={"search_results_": None}),
+        )
 
 
 class Session(BaseModel):
-    history: List[State]
+    # full states; only written by older versions, still read on resume
+    history: List[State] = Field(default_factory=list)
+    snapshots: List[StateSnapshot] = Field(default_factory=list)
+    # payloads for the top of the stack and the selected media of every state
+    media: Dict[int, MediaItem] = Field(default_factory=dict)
 
     created_at: datetime = Field(default_factory=datetime.now)
     name: str = Field(
@@ -19,4 +66,4 @@ class Session(BaseModel):
     @computed_field
     @property
     def state_count(self) -> int:
-        return len(self.history)
+        return len(self.snapshots) or len(self.history)
@@ -1,44 +1,70 @@
-import json
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from ....core.config.model import SessionsConfig
-from ....core.utils.file import AtomicWriter
-from ...interactive.state import State
-from .model import Session
+from ....core.utils import json_codec
+from ....libs.media_api.params import MediaSearchParams
+from ....libs.media_api.types import MediaItem
+from ...interactive.state import MediaApiState, State
+from .model import Session, StateSnapshot
+
+if TYPE_CHECKING:
+    from ....libs.media_api.base import BaseApiClient
+    from ..registry import MediaRegistryService
 
 logger = logging.getLogger(__name__)
 
+# AniList returns at most 50 media per page
+REHYDRATE_BATCH_SIZE = 50
+
+# entries of a resumed history stay snapshots until they are navigated back to
+SessionHistory = List[Union[State, StateSnapshot]]
+
 
 class SessionsService:
     def __init__(self, config: SessionsConfig):
         self.dir = config.dir
         self._ensure_sessions_directory()
+        # media payloads of the loaded session, consulted first on rehydration
+        self._media: Dict[int, MediaItem] = {}
 
     def save_session(
-        self, history: List[State], name: Optional[str] = None, default=True
+        self, history: SessionHistory, name: Optional[str] = None, default=True
     ):
         if default:
             name = "default"
-            session = Session(history=history, name=name)
+            session = self._compact(history, name=name)
         else:
-            session = Session(history=history)
+            session = self._compact(history)
         self._save_session(session)
 
-    def create_crash_backup(self, history: List[State], default=True):
+    def create_crash_backup(self, history: SessionHistory, default=True):
         if default:
-            self._save_session(
-                Session(history=history, name="crash", is_from_crash=True)
-            )
+            self._save_session(self._compact(history, name="crash", is_from_crash=True))
         else:
-            self._save_session(Session(history=history, is_from_crash=True))
+            self._save_session(self._compact(history, is_from_crash=True))
 
-    def get_session_history(self, session_name: str) -> Optional[List[State]]:
-        if session := self._load_session(session_name):
-            return session.history
+    def get_session_history(self, session_name: str) -> Optional[SessionHistory]:
+        """
+        The saved history, with only its top-of-stack state rehydrated.
+
+        The other entries are returned as snapshots; pass them to `rehydrate`
+        when they become the current state again.
+        """
+        session = self._load_session(session_name)
+        if not session:
+            return None
+        if session.history:
+            return list(session.history)
+        if not session.snapshots:
+            return None
+        self._media = dict(session.media)
+        history: SessionHistory = list(session.snapshots)
+        history[-1] = self._restore(session.snapshots[-1], self._media)
+        return history
 
-    def get_default_session_history(self) -> Optional[List[State]]:
+    def get_default_session_history(self) -> Optional[SessionHistory]:
         if history := self.get_session_history("default"):
             return history
 
@@ -62,10 +88,106 @@ class SessionsService:
         if session_name:
             return self.get_session_history(session_name)
 
+    def rehydrate(
+        self,
+        snapshot: StateSnapshot,
+        registry: "MediaRegistryService",
+        media_api: "BaseApiClient",
+    ) -> State:
+        """
+        Rebuild a full state from a snapshot.
+
+        Media items come from the loaded session, then from the registry, and
+        whatever is still missing is fetched by id, one search per page. Items
+        that cannot be found anywhere are left out of the search results.
+        """
+        wanted = list(snapshot.media_api.media_ids or [])
+        if snapshot.media_api.media_id is not None:
+            wanted.append(snapshot.media_api.media_id)
+
+        for media_id in wanted:
+            if media_id not in self._media:
+                if record := registry.get_media_record(media_id):
+                    self._media[media_id] = record.media_item
+
+        missing = [media_id for media_id in wanted if media_id not in self._media]
+        for start in range(0, len(missing), REHYDRATE_BATCH_SIZE):
+            batch = missing[start : start + REHYDRATE_BATCH_SIZE]
+            try:
+                result = media_api.search_media(
+                    MediaSearchParams(id_in=batch, per_page=len(batch))
+                )
+            except Exception as e:
+                logger.warning(f"Failed to fetch media for session state: {e}")
+                result = None
+            for media_item in result.media if result else []:
+                self._media[media_item.id] = media_item
+
+        logger.debug(
+            f"Rehydrated {snapshot.menu_name.value} state "
+            f"({len(missing)} of {len(wanted)} media items fetched)"
+        )
+        return self._restore(snapshot, self._media)
+
+    def _restore(self, snapshot: StateSnapshot, media: Dict[int, MediaItem]) -> State:
+        media_api = snapshot.media_api
+        search_result = None
+        if media_api.media_ids is not None:
+            search_result = {
+                media_id: media[media_id]
+                for media_id in media_api.media_ids
+                if media_id in media
+            }
+        if (
+            media_api.media_id is not None
+            and media_api.media_id in media
+            and (search_result is None or media_api.media_id not in search_result)
+        ):
+            search_result = {
+                **(search_result or {}),
+                media_api.media_id: media[media_api.media_id],
+            }
+        return State(
+            menu_name=snapshot.menu_name,
+            media_api=MediaApiState(
+                search_result=search_result,
+                search_params=media_api.search_params,
+                page_info=media_api.page_info,
+                media_id=media_api.media_id,
+            ),
+            provider=snapshot.provider,
+        )
+
+    def _compact(self, history: SessionHistory, **kwargs) -> Session:
+        """
+        A session storing each media item once.
+
+        Full payloads are kept for the search results of the top-of-stack
+        state and for the selected media of every state; other search results
+        are stored as ids and rehydrated when navigated back to.
+        """
+        snapshots = [
+            entry
+            if isinstance(entry, StateSnapshot)
+            else StateSnapshot.from_state(entry)
+            for entry in history
+        ]
+        media: Dict[int, MediaItem] = {}
+        if history and isinstance(top := history[-1], State):
+            media.update(top.media_api.search_result_ or {})
+        for entry in history:
+            if isinstance(entry, State):
+                media_id = entry.media_api.media_id_
+                search_result = entry.media_api.search_result_ or {}
+                if media_id in search_result:
+                    media[media_id] = search_result[media_id]
+            elif (media_id := entry.media_api.media_id) in self._media:
+                media[media_id] = self._media[media_id]
+        return Session(snapshots=snapshots, media=media, **kwargs)
+
     def _save_session(self, session: Session):
         path = self.dir / f"{session.name}.json"
-        with AtomicWriter(path) as f:
-            json.dump(session.model_dump(mode="json", by_alias=True), f)
+        json_codec.write_model(path, session, by_alias=True)
 
     def _load_session(self, session_name: str) -> Optional[Session]:
         path = self.dir / f"{session_name}.json"
@@ -73,9 +195,7 @@ class SessionsService:
             logger.warning(f"Session file not found: {path}")
             return None
 
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            session = Session.model_validate(data)
+        session = json_codec.read_model(path, Session)
 
         logger.info(f"Session loaded from {path} with {session.state_count} states")
         return session
@@ -0,0 +1,3 @@
+from .service import SkipTimesService
+
+__all__ = ["SkipTimesService"]
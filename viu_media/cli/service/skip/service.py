@@ -0,0 +1,173 @@
+import logging
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ....core.constants import APP_CACHE_DIR
+from ....core.utils import json_codec
+from ....core.utils.concurrency import (
+    BackgroundWorker,
+    ManagedBackgroundWorker,
+    thread_manager,
+)
+from ....libs.aniskip import AniSkip, SkipInterval
+
+logger = logging.getLogger(__name__)
+
+SKIP_TIMES_CACHE_DIR = APP_CACHE_DIR / "aniskip"
+SKIP_TIMES_WORKER = "skip_times_worker"
+
+# intervals rarely change once submitted, but missing episodes get new submissions
+FOUND_TTL = 7 * 24 * 60 * 60
+NOT_FOUND_TTL = 24 * 60 * 60
+
+_CacheKey = Tuple[int, str]
+
+
+class SkipTimesService:
+    """
+    Fetches AniSkip intervals ahead of playback and keeps them in a local cache.
+
+    Entries are stored per show in ``<cache>/aniskip/<mal_id>.json`` keyed by
+    episode number, so lookups at playback time never touch the network.
+    """
+
+    def __init__(self, cache_dir: Path = SKIP_TIMES_CACHE_DIR, max_workers: int = 2):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._client = AniSkip()
+        self._memory: Dict[_CacheKey, Tuple[float, List[SkipInterval]]] = {}
+        self._loaded_shows: set[int] = set()
+        self._pending: set[_CacheKey] = set()
+        self._fetch_generation = 0
+        self._lock = threading.RLock()
+
+        self._worker = self._get_worker(max_workers)
+
+    @staticmethod
+    def _get_worker(max_workers: int) -> BackgroundWorker:
+        """Share one registered worker between every instance of the service."""
+        worker = thread_manager.get_worker(SKIP_TIMES_WORKER)
+        if worker and worker.is_running():
+            return worker
+        if worker:
+            thread_manager.shutdown_worker(SKIP_TIMES_WORKER, wait=False)
+
+        worker = ManagedBackgroundWorker(
+            max_workers=max_workers, name="SkipTimesWorker"
+        )
+        worker.start()
+        thread_manager.register_worker(SKIP_TIMES_WORKER, worker)
+        return worker
+
+    def prefetch(self, mal_id: int, episodes: Iterable[str]) -> None:
+        """Queue a background fetch for every episode without a fresh cache entry."""
+        with self._lock:
+            self._load_show(mal_id)
+            missing = [
+                episode
+                for episode in dict.fromkeys(episodes)
+                if not self._is_fresh((mal_id, episode))
+                and (mal_id, episode) not in self._pending
+            ]
+            self._pending.update((mal_id, episode) for episode in missing)
+
+        if not missing:
+            return
+        logger.debug(f"Prefetching skip times for {mal_id}: {missing}")
+        try:
+            self._worker.submit_function(self._fetch_batch, mal_id, missing)
+        except RuntimeError as e:
+            logger.warning(f"Could not queue skip times prefetch: {e}")
+            with self._lock:
+                self._pending.difference_update((mal_id, ep) for ep in missing)
+
+    @property
+    def fetch_generation(self) -> int:
+        """
+        Bumped whenever a fetch finishes.
+
+        A cache miss is only worth looking up again once this has changed.
+        """
+        return self._fetch_generation
+
+    def get_cached(self, mal_id: int, episode: str) -> Optional[List[SkipInterval]]:
+        """
+        Return the cached intervals for an episode without any network access.
+
+        None means nothing is known yet; an empty list means AniSkip has no data.
+        """
+        with self._lock:
+            self._load_show(mal_id)
+            entry = self._memory.get((mal_id, episode))
+        return entry[1] if entry else None
+
+    def get_skip_times(self, mal_id: int, episode: str) -> List[SkipInterval]:
+        """Return the intervals for an episode, fetching them if not cached."""
+        cached = self.get_cached(mal_id, episode)
+        if cached is not None and self._is_fresh((mal_id, episode)):
+            return cached
+        self._fetch_batch(mal_id, [episode])
+        return self.get_cached(mal_id, episode) or []
+
+    def _fetch_batch(self, mal_id: int, episodes: List[str]) -> None:
+        fetched: Dict[str, List[SkipInterval]] = {}
+        try:
+            for episode in episodes:
+                intervals = self._client.get_skip_times(mal_id, episode)
+                if intervals is not None:
+                    fetched[episode] = intervals
+        finally:
+            with self._lock:
+                self._pending.difference_update((mal_id, ep) for ep in episodes)
+                now = time.time()
+                for episode, intervals in fetched.items():
+                    self._memory[(mal_id, episode)] = (now, intervals)
+                if fetched:
+                    self._save_show(mal_id)
+                self._fetch_generation += 1
+
+    def _is_fresh(self, key: _CacheKey) -> bool:
+        entry = self._memory.get(key)
+        if not entry:
+            return False
+        fetched_at, intervals = entry
+        ttl = FOUND_TTL if intervals else NOT_FOUND_TTL
+        return time.time() - fetched_at < ttl
+
+    def _show_cache_file(self, mal_id: int) -> Path:
+        return self.cache_dir / f"{mal_id}.json"
+
+    def _load_show(self, mal_id: int) -> None:
+        if mal_id in self._loaded_shows:
+            return
+        self._loaded_shows.add(mal_id)
+
+        cache_file = self._show_cache_file(mal_id)
+        if not cache_file.exists():
+            return
+        try:
+            data = json_codec.read(cache_file)
+            for episode, entry in data.items():
+                intervals = [SkipInterval(**i) for i in entry.get("intervals", [])]
+                self._memory.setdefault(
+                    (mal_id, episode), (float(entry.get("fetched_at", 0)), intervals)
+                )
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring corrupt skip times cache {cache_file}: {e}")
+
+    def _save_show(self, mal_id: int) -> None:
+        data = {
+            episode: {
+                "fetched_at": fetched_at,
+                "intervals": [asdict(i) for i in intervals],
+            }
+            for (show_id, episode), (fetched_at, intervals) in self._memory.items()
+            if show_id == mal_id
+        }
+        try:
+            json_codec.write(self._show_cache_file(mal_id), data)
+        except OSError as e:
+            logger.warning(f"Failed to write skip times cache for {mal_id}: {e}")
@@ -0,0 +1,3 @@
+from .service import StreamCacheService
+
+__all__ = ["StreamCacheService"]
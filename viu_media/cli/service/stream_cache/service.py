@@ -0,0 +1,391 @@
+"""
+A local HTTP proxy that caches what the player streams into the downloads dir.
+
+The player is pointed at ``http://127.0.0.1:<port>/stream/<token>`` instead of
+the provider. The proxy forwards the provider headers upstream and writes
+every byte it relays into a sparse, hidden part file at its offset, keeping
+track of the cached byte ranges in a sidecar file. Requests (including the
+range requests a seek produces) are answered from disk where the bytes are
+already cached and from upstream for the gaps in between. Once every byte of
+the file is cached it is renamed to the name a download would have and the
+episode is registered as a completed download.
+
+Only plain video files are cached; HLS playlists and upstreams that do not
+report a size are played directly.
+"""
+
+import json
+import logging
+import os
+import re
+import secrets
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from ....core.downloader.postprocess import temp_output_path
+from ....core.utils.file import AtomicWriter, sanitize_filename
+from ....core.utils.http_client import create_client
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+# persist the cached ranges at least this often while streaming
+RANGES_SAVE_INTERVAL = 16 * 1024 * 1024
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".webm", ".avi", ".mov", ".m4v"})
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)")
+_CONTENT_RANGE_PATTERN = re.compile(r"bytes \d+-\d+/(\d+)")
+
+OnComplete = Callable[[Path, int], None]
+
+
+class RangeSet:
+    """Sorted, non-overlapping ``[start, end)`` byte ranges."""
+
+    def __init__(self, ranges: Optional[List[Tuple[int, int]]] = None):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        for start, end in sorted(ranges or []):
+            self.add(start, end)
+
+    def add(self, start: int, end: int) -> None:
+        if start >= end:
+            return
+        # merge with every range that overlaps or touches [start, end)
+        i = bisect_right(self._ends, start - 1)
+        j = i
+        while j < len(self._starts) and self._starts[j] <= end:
+            start = min(start, self._starts[j])
+            end = max(end, self._ends[j])
+            j += 1
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    def cached_until(self, pos: int) -> Optional[int]:
+        """End of the cached range containing ``pos``, if it is cached."""
+        i = bisect_right(self._starts, pos) - 1
+        if i >= 0 and pos < self._ends[i]:
+            return self._ends[i]
+        return None
+
+    def next_start(self, pos: int) -> Optional[int]:
+        """Start of the first cached range after ``pos``."""
+        i = bisect_right(self._starts, pos)
+        return self._starts[i] if i < len(self._starts) else None
+
+    def covers(self, start: int, end: int) -> bool:
+        until = self.cached_until(start)
+        return until is not None and until >= end
+
+    def to_list(self) -> List[Tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+
+@dataclass
+class CachedStream:
+    """A proxied upstream file and its partially cached copy."""
+
+    url: str
+    headers: Dict[str, str]
+    final_path: Path
+    total_size: int
+    content_type: str
+    on_complete: Optional[OnComplete] = None
+    ranges: RangeSet = field(default_factory=RangeSet)
+    completed: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    _fd: Optional[int] = None
+    _unsaved_bytes: int = 0
+
+    @property
+    def part_path(self) -> Path:
+        return temp_output_path(self.final_path)
+
+    @property
+    def ranges_path(self) -> Path:
+        return self.part_path.with_name(f"{self.part_path.name}.ranges")
+
+    def open(self) -> None:
+        self.final_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.final_path.exists():
+            # already downloaded: everything is served from disk
+            self._fd = os.open(self.final_path, os.O_RDONLY)
+            self.ranges.add(0, self.total_size)
+            self.completed = True
+            return
+        if self.part_path.exists() and self.ranges_path.exists():
+            try:
+                saved = json.loads(self.ranges_path.read_text(encoding="utf-8"))
+                for start, end in saved:
+                    self.ranges.add(start, end)
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable cache ranges: {e}")
+        self._fd = os.open(self.part_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def cached_until(self, pos: int) -> Optional[int]:
+        with self.lock:
+            return self.ranges.cached_until(pos)
+
+    def next_cached(self, pos: int) -> Optional[int]:
+        with self.lock:
+            return self.ranges.next_start(pos)
+
+    def read(self, pos: int, size: int) -> bytes:
+        assert self._fd is not None
+        return os.pread(self._fd, size, pos)
+
+    def write(self, pos: int, data: bytes) -> None:
+        if self.completed:
+            return
+        assert self._fd is not None
+        os.pwrite(self._fd, data, pos)
+        with self.lock:
+            self.ranges.add(pos, pos + len(data))
+            self._unsaved_bytes += len(data)
+            if self._unsaved_bytes >= RANGES_SAVE_INTERVAL:
+                self._save_ranges()
+            if self.ranges.covers(0, self.total_size):
+                self._finalize()
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.completed and self._unsaved_bytes:
+                self._save_ranges()
+
+    def close(self) -> None:
+        self.save()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _save_ranges(self) -> None:
+        with AtomicWriter(self.ranges_path) as f:
+            json.dump(self.ranges.to_list(), f)
+        self._unsaved_bytes = 0
+
+    def _finalize(self) -> None:
+        self.completed = True
+        # the open descriptor keeps serving reads after the rename
+        os.replace(self.part_path, self.final_path)
+        self.ranges_path.unlink(missing_ok=True)
+        logger.info(f"Stream fully cached to {self.final_path}")
+        if self.on_complete:
+            try:
+                self.on_complete(self.final_path, self.total_size)
+            except Exception as e:
+                logger.error(f"Failed to register cached stream: {e}")
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    server: "_ProxyServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.server.service._handle(self, send_body=False)
+
+    def do_GET(self):
+        self.server.service._handle(self, send_body=True)
+
+    def log_message(self, format, *args):
+        logger.debug(f"Stream proxy: {format % args}")
+
+
+class _ProxyServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, service: "StreamCacheService"):
+        super().__init__(("127.0.0.1", 0), _ProxyHandler)
+        self.service = service
+
+
+class StreamCacheService:
+    """
+    Serves streams to the player through a caching local proxy.
+
+    The server starts on the first proxied stream and runs in a daemon thread
+    for the rest of the process.
+    """
+
+    def __init__(self, downloads_dir: Path):
+        self.downloads_dir = downloads_dir
+        self._client = create_client("download", follow_redirects=True)
+        self._streams: Dict[str, CachedStream] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_ProxyServer] = None
+
+    def proxy_url(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        anime_title: str,
+        episode_title: str,
+        on_complete: Optional[OnComplete] = None,
+    ) -> str:
+        """
+        The url the player should open to stream ``url`` through the cache.
+
+        Returns ``url`` itself when the stream cannot be cached.
+        """
+        extension = Path(urlparse(url).path).suffix.lower()
+        if not url.startswith(("http://", "https://")) or extension == ".m3u8":
+            return url
+        try:
+            total_size, content_type = self._probe(url, headers or {})
+        except httpx.HTTPError as e:
+            logger.warning(f"Not caching stream, probing {url} failed: {e}")
+            return url
+        if total_size is None or "mpegurl" in content_type.lower():
+            logger.debug(f"Not caching {url}: not a ranged video file")
+            return url
+
+        if extension not in VIDEO_EXTENSIONS:
+            extension = ".mp4"
+        final_path = (
+            self.downloads_dir
+            / sanitize_filename(anime_title)
+            / f"{sanitize_filename(episode_title)}{extension}"
+        )
+        stream = CachedStream(
+            url=url,
+            headers=dict(headers or {}),
+            final_path=final_path,
+            total_size=total_size,
+            content_type=content_type,
+            on_complete=on_complete,
+        )
+        try:
+            stream.open()
+        except OSError as e:
+            logger.warning(f"Not caching stream, cannot write {final_path}: {e}")
+            return url
+
+        token = secrets.token_urlsafe(12)
+        with self._lock:
+            self._streams[token] = stream
+            server = self._ensure_server()
+        host, port = server.server_address[:2]
+        logger.info(f"Streaming {url} through the cache into {final_path}")
+        return f"http://{host}:{port}/stream/{token}{extension}"
+
+    def shutdown(self) -> None:
+        with self._lock:
+            server, self._server = self._server, None
+            streams = list(self._streams.values())
+        if server:
+            server.shutdown()
+            server.server_close()
+        for stream in streams:
+            stream.close()
+
+    def _ensure_server(self) -> _ProxyServer:
+        if self._server is None:
+            self._server = _ProxyServer(self)
+            threading.Thread(
+                target=self._server.serve_forever, name="StreamProxy", daemon=True
+            ).start()
+        return self._server
+
+    def _probe(self, url: str, headers: Dict[str, str]) -> Tuple[Optional[int], str]:
+        """Size and content type of a file whose server supports ranges."""
+        with self._client.stream(
+            "GET", url, headers={**headers, "Range": "bytes=0-0"}
+        ) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "")
+            if response.status_code != 206:
+                return None, content_type
+            match = _CONTENT_RANGE_PATTERN.match(
+                response.headers.get("Content-Range", "")
+            )
+            return (int(match.group(1)) if match else None), content_type
+
+    def _handle(self, handler: _ProxyHandler, send_body: bool) -> None:
+        token = Path(urlparse(handler.path).path).stem
+        with self._lock:
+            stream = self._streams.get(token)
+        if stream is None:
+            handler.send_error(404)
+            return
+
+        start, end = 0, stream.total_size - 1
+        range_header = handler.headers.get("Range")
+        match = _RANGE_PATTERN.fullmatch(range_header or "")
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                if match.group(2):
+                    end = min(int(match.group(2)), end)
+            else:
+                # suffix range: the last n bytes
+                start = max(stream.total_size - int(match.group(2)), 0)
+            if start > end:
+                handler.send_response(416)
+                handler.send_header("Content-Range", f"bytes */{stream.total_size}")
+                handler.send_header("Content-Length", "0")
+                handler.end_headers()
+                return
+            handler.send_response(206)
+            handler.send_header(
+                "Content-Range", f"bytes {start}-{end}/{stream.total_size}"
+            )
+        else:
+            handler.send_response(200)
+        handler.send_header("Accept-Ranges", "bytes")
+        handler.send_header("Content-Type", stream.content_type or "video/mp4")
+        handler.send_header("Content-Length", str(end - start + 1))
+        handler.end_headers()
+        if not send_body:
+            return
+
+        try:
+            self._send_range(handler, stream, start, end + 1)
+        except (BrokenPipeError, ConnectionResetError):
+            # the player closes the connection on every seek
+            pass
+        except httpx.HTTPError as e:
+            logger.warning(f"Upstream failed while streaming {stream.url}: {e}")
+            handler.close_connection = True
+        finally:
+            stream.save()
+
+    def _send_range(
+        self, handler: _ProxyHandler, stream: CachedStream, pos: int, end: int
+    ) -> None:
+        while pos < end:
+            cached_until = stream.cached_until(pos)
+            if cached_until is not None:
+                stop = min(cached_until, end)
+                while pos < stop:
+                    data = stream.read(pos, min(CHUNK_SIZE, stop - pos))
+                    if not data:
+                        raise ConnectionResetError("cache file is truncated")
+                    handler.wfile.write(data)
+                    pos += len(data)
+                continue
+
+            # fetch the gap up to the next cached range from upstream
+            next_cached = stream.next_cached(pos)
+            stop = min(next_cached, end) if next_cached is not None else end
+            headers = {**stream.headers, "Range": f"bytes={pos}-{stop - 1}"}
+            with self._client.stream("GET", stream.url, headers=headers) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise httpx.HTTPError(
+                        f"upstream ignored the range request ({response.status_code})"
+                    )
+                for data in response.iter_bytes(CHUNK_SIZE):
+                    data = data[: stop - pos]
+                    stream.write(pos, data)
+                    handler.wfile.write(data)
+                    pos += len(data)
+                    if pos >= stop:
+                        break
+            if pos < stop:
+                raise httpx.HTTPError("upstream closed the connection early")
@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 from ....core.config.model import AppConfig
 from ....libs.media_api.base import BaseApiClient
@@ -10,6 +11,9 @@ from ..registry import MediaRegistryService
 
 logger = logging.getLogger(__name__)
 
+# seconds between local saves of the position while the player runs
+PROGRESS_SAVE_INTERVAL = 10
+
 
 class WatchHistoryService:
     def __init__(
@@ -73,6 +77,35 @@ class WatchHistoryService:
         else:
             logger.warning("Not logged in")
 
+    def progress_hook(self, media_item: MediaItem) -> Callable[[PlayerResult], None]:
+        """
+        A ``PlayerParams.progress_hook`` that saves the position while playing.
+
+        Only the local index is written, at most every PROGRESS_SAVE_INTERVAL
+        seconds, so a crash or a killed player still resumes close to where it
+        stopped. The remote list is left to ``track`` once playback ends.
+        """
+        last_saved = 0.0
+
+        def hook(player_result: PlayerResult) -> None:
+            nonlocal last_saved
+            now = time.monotonic()
+            if now - last_saved < PROGRESS_SAVE_INTERVAL:
+                return
+            last_saved = now
+            try:
+                self.media_registry.update_media_index_entry(
+                    media_id=media_item.id,
+                    media_item=media_item,
+                    last_watch_position=player_result.stop_time,
+                    total_duration=player_result.total_time,
+                    progress=player_result.episode,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to save watch progress: {e}")
+
+        return hook
+
     def get_episode(self, media_item: MediaItem):
         index_entry = self.media_registry.get_media_index_entry(media_item.id)
         current_remote_episode = None
@@ -0,0 +1,264 @@
+"""
+Local control socket of the background worker.
+
+While ``viu worker`` runs it listens on a Unix socket in the app data
+directory. Other viu processes reach it through `WorkerClient`. They can hand
+it new downloads, which start at once instead of at the worker's next
+registry poll. They can also query, pause, resume and cancel its downloads
+without building a download service of their own.
+
+Every request and response is one line of JSON:
+``{"method": "enqueue", "params": {...}}`` is answered with
+``{"ok": true, "result": ...}`` or ``{"ok": false, "error": "..."}``.
+"""
+
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from ....core.constants import APP_DATA_DIR
+from ....core.exceptions import ViuError
+from ....core.utils import json_codec
+from ....libs.media_api.types import MediaItem
+
+if TYPE_CHECKING:
+    from ..download.service import DownloadService
+
+logger = logging.getLogger(__name__)
+
+WORKER_SOCKET_PATH = APP_DATA_DIR / "worker.sock"
+# an enqueue of a few hundred media items stays far below this
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class WorkerUnavailable(ViuError):
+    """The worker's control socket could not be reached or dropped a request."""
+
+
+def _read_message(sock_file) -> Any:
+    line = sock_file.readline(MAX_MESSAGE_BYTES + 1)
+    if not line:
+        raise ConnectionError("Connection closed before a message was received")
+    if len(line) > MAX_MESSAGE_BYTES:
+        raise ValueError("Message too large")
+    return json_codec.loads(line)
+
+
+def _write_message(sock_file, message: Any) -> None:
+    sock_file.write(json_codec.dumps(message) + b"\n")
+    sock_file.flush()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_ControlSocketServer"
+
+    def handle(self):
+        try:
+            request = _read_message(self.rfile)
+            method = request["method"]
+            params = request.get("params") or {}
+        except Exception as e:
+            _write_message(self.wfile, {"ok": False, "error": f"Bad request: {e}"})
+            return
+        try:
+            result = self.server.control.dispatch(method, params)
+        except (TypeError, ValueError) as e:
+            # unknown method or bad parameters
+            logger.warning(f"Rejected worker control request '{method}': {e}")
+            _write_message(self.wfile, {"ok": False, "error": str(e)})
+        except Exception as e:
+            logger.exception(f"Worker control request '{method}' failed")
+            _write_message(self.wfile, {"ok": False, "error": str(e)})
+        else:
+            _write_message(self.wfile, {"ok": True, "result": result})
+
+
+class _ControlSocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    control: "WorkerControlServer"
+
+
+class WorkerControlServer:
+    """Serves control requests for the worker's download service."""
+
+    def __init__(
+        self,
+        download_service: "DownloadService",
+        socket_path: Path = WORKER_SOCKET_PATH,
+    ):
+        self.download_service = download_service
+        self.socket_path = socket_path
+        self.started_at = time.time()
+        self._server: Optional[_ControlSocketServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "ping": self._ping,
+            "enqueue": self._enqueue,
+            "status": self._status,
+            "pause": self._pause,
+            "resume": self._resume,
+            "cancel": self._cancel,
+            "stats": self._stats,
+        }
+
+    def start(self) -> bool:
+        """
+        Start listening in a background thread.
+
+        Returns:
+            False if control sockets are not supported on this platform.
+
+        Raises:
+            ViuError: If another worker is already listening on the socket.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            logger.info("Unix sockets are unavailable; worker control disabled")
+            return False
+        if self.socket_path.exists():
+            if WorkerClient.connect(self.socket_path):
+                raise ViuError(f"A worker is already running ({self.socket_path})")
+            # left behind by a worker that did not shut down cleanly
+            self.socket_path.unlink(missing_ok=True)
+
+        self._server = _ControlSocketServer(str(self.socket_path), _RequestHandler)
+        self._server.control = self
+        os.chmod(self.socket_path, 0o600)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="WorkerControl", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Worker control socket listening on {self.socket_path}")
+        return True
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self.socket_path.unlink(missing_ok=True)
+
+    def dispatch(self, method: str, params: Dict[str, Any]) -> Any:
+        handler = self._methods.get(method)
+        if handler is None:
+            raise ValueError(f"Unknown method '{method}'")
+        return handler(**params)
+
+    def _ping(self) -> Dict[str, Any]:
+        return {"pid": os.getpid(), "started_at": self.started_at}
+
+    def _enqueue(self, media_item: Dict[str, Any], episodes: List[str]) -> int:
+        item = MediaItem.model_validate(media_item)
+        return sum(
+            1 for episode in episodes if self.download_service.submit(item, episode)
+        )
+
+    def _status(self) -> Dict[str, Any]:
+        return {
+            **self._ping(),
+            "paused": self.download_service.paused,
+            "jobs": self.download_service.status(),
+        }
+
+    def _pause(self) -> None:
+        self.download_service.pause()
+
+    def _resume(self) -> None:
+        self.download_service.resume()
+        self.download_service.resume_unfinished_downloads()
+
+    def _cancel(
+        self,
+        media_id: Optional[int] = None,
+        episodes: Optional[List[str]] = None,
+        include_running: bool = True,
+    ) -> int:
+        return self.download_service.cancel(media_id, episodes, include_running)
+
+    def _stats(self) -> Dict[str, Any]:
+        return self.download_service.registry.get_download_statistics()
+
+
+class WorkerClient:
+    """Talks to a running ``viu worker`` over its control socket."""
+
+    def __init__(self, socket_path: Path = WORKER_SOCKET_PATH, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    @classmethod
+    def connect(
+        cls, socket_path: Path = WORKER_SOCKET_PATH
+    ) -> Optional["WorkerClient"]:
+        """A client for the running worker, or None if no worker is listening."""
+        if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+            return None
+        client = cls(socket_path, timeout=2.0)
+        try:
+            client.call("ping")
+        except ViuError:
+            return None
+        client.timeout = 30.0
+        return client
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Run a method on the worker.
+
+        Raises:
+            WorkerUnavailable: If the worker cannot be reached or stops
+                responding, e.g. because it exited.
+            ViuError: If the worker failed to handle the request.
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                with sock.makefile("rwb") as sock_file:
+                    _write_message(sock_file, {"method": method, "params": params})
+                    response = _read_message(sock_file)
+        except OSError as e:
+            raise WorkerUnavailable(f"No background worker is running: {e}") from e
+        except ValueError as e:
+            raise ViuError(f"Invalid response from worker: {e}") from e
+        if not response.get("ok"):
+            raise ViuError(response.get("error") or "Worker request failed")
+        return response.get("result")
+
+    def enqueue(self, media_item: MediaItem, episodes: List[str]) -> int:
+        """Queue episodes and start them at once; returns how many were new."""
+        return self.call(
+            "enqueue",
+            media_item=media_item.model_dump(mode="json"),
+            episodes=list(episodes),
+        )
+
+    def status(self) -> Dict[str, Any]:
+        return self.call("status")
+
+    def pause(self) -> None:
+        self.call("pause")
+
+    def resume(self) -> None:
+        self.call("resume")
+
+    def cancel(
+        self,
+        media_id: Optional[int] = None,
+        episodes: Optional[List[str]] = None,
+        include_running: bool = True,
+    ) -> int:
+        return self.call(
+            "cancel",
+            media_id=media_id,
+            episodes=episodes,
+            include_running=include_running,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return self.call("stats")
@@ -5,7 +5,9 @@ import time
 from typing import Optional
 
 from viu_media.cli.service.download.service import DownloadService
+from viu_media.cli.service.notification.schedule import AiringScheduler
 from viu_media.cli.service.notification.service import NotificationService
+from viu_media.cli.service.worker.control import WorkerControlServer
 from viu_media.core.config.model import WorkerConfig
 
 logger = logging.getLogger(__name__)
@@ -23,6 +25,15 @@ class BackgroundWorkerService:
         self.download_service = download_service
         self._stop_event = threading.Event()
         self._signals_installed = False
+        self.control_server = WorkerControlServer(download_service)
+        self.airing_scheduler: Optional[AiringScheduler] = None
+        if config.airing_schedule_notifications:
+            self.airing_scheduler = AiringScheduler(
+                notification_service.registry,
+                notification_service.media_api,
+                delay=config.notification_airing_delay * 60,
+                fallback_interval=config.notification_fallback_interval * 60,
+            )
 
     def _install_signal_handlers(self):
         """Install SIGINT/SIGTERM handlers to allow graceful shutdown when run in foreground."""
@@ -49,8 +60,12 @@ class BackgroundWorkerService:
         """Run the background loop until stopped.
 
         Responsibilities:
-        - Periodically check AniList notifications (if authenticated & plyer available)
+        - Check AniList notifications shortly after tracked episodes air, or
+          periodically if airing schedule notifications are disabled
+          (if authenticated & plyer available)
+        - Start auto-downloads of newly aired episodes right away
         - Periodically resume/process unfinished downloads
+        - Serve control requests (enqueue, status, pause, ...) from other viu processes
         - Keep CPU usage low using an event-based wait
         - Gracefully terminate on KeyboardInterrupt/SIGTERM
         """
@@ -65,6 +80,9 @@ class BackgroundWorkerService:
             60, self.config.download_check_failed_interval * 60
         )
 
+        # Take the control socket first so a second worker exits right away
+        self.control_server.start()
+
         # Start download worker and attempt resuming pending jobs once at startup
         self.download_service.start()
 
@@ -82,13 +100,25 @@ class BackgroundWorkerService:
 
                 # Check for notifications
                 if next_notification_ts is not None and now >= next_notification_ts:
+                    notified = []
                     try:
                         logger.info("Checking for notifications...")
-                        self.notification_service.check_and_display_notifications()
+                        notified = (
+                            self.notification_service.check_and_display_notifications()
+                        )
+                        if notified and self.config.auto_download_new_episode:
+                            # the new episodes are already queued in the registry
+                            self.download_service.resume_unfinished_downloads()
                     except Exception:
                         logger.exception("Error during notification check")
                     finally:
-                        next_notification_ts = now + notification_interval_sec
+                        if self.airing_scheduler:
+                            self.airing_scheduler.record_check(
+                                now, [n.media.id for n in notified]
+                            )
+                            next_notification_ts = self.airing_scheduler.next_check()
+                        else:
+                            next_notification_ts = now + notification_interval_sec
 
                 # Process download queue
                 if next_download_ts is not None and now >= next_download_ts:
@@ -131,6 +161,7 @@ class BackgroundWorkerService:
             logger.info("Background worker interrupted by user. Stopping...")
             self.stop()
         finally:
+            self.control_server.stop()
             # Ensure we always stop the download worker
             try:
                 self.download_service.stop()
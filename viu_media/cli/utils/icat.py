@@ -1,15 +1,20 @@
+import logging
 import shutil
 import subprocess
 import sys
 import termios
 import tty
 from sys import exit
+from typing import Optional
 
 from rich.align import Align
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+from .manga_cache import MangaPageCache
+
+logger = logging.getLogger(__name__)
 console = Console()
 
 
@@ -36,7 +41,11 @@ def draw_banner_at(msg: str, row: int):
     console.print(panel)
 
 
-def icat_manga_viewer(image_links: list[str], window_title: str):
+def icat_manga_viewer(
+    image_links: list[str],
+    window_title: str,
+    page_cache: Optional[MangaPageCache] = None,
+):
     ICAT = shutil.which("kitty")
     if not ICAT:
         console.print("[bold red]kitty (for icat) not found[/]")
@@ -45,6 +54,9 @@ def icat_manga_viewer(image_links: list[str], window_title: str):
     idx, total = 0, len(image_links)
     title = f"{window_title}  ({total} images)"
     show_banner = True
+    # pages are shown from the local cache while the next ones download
+    owns_cache = page_cache is None
+    cache = page_cache or MangaPageCache()
 
     try:
         while True:
@@ -60,6 +72,13 @@ def icat_manga_viewer(image_links: list[str], window_title: str):
             else:
                 image_height = term_height
 
+            try:
+                page = str(cache.get(image_links[idx]))
+            except Exception as e:
+                logger.warning(f"Failed to cache page {image_links[idx]}: {e}")
+                page = image_links[idx]
+            cache.prefetch_around(image_links, idx)
+
             subprocess.run(
                 [
                     ICAT,
@@ -71,7 +90,7 @@ def icat_manga_viewer(image_links: list[str], window_title: str):
                     f"{term_width}x{image_height}@0x0",
                     "--z-index",
                     "-1",
-                    image_links[idx],
+                    page,
                 ],
                 check=False,
             )
@@ -99,5 +118,7 @@ def icat_manga_viewer(image_links: list[str], window_title: str):
     except KeyboardInterrupt:
         pass
     finally:
+        if owns_cache:
+            cache.close()
         console.clear()
         console.print("Exited viewer.", style="bold")
@@ -0,0 +1,145 @@
+"""
+On-disk cache of manga pages with read-ahead.
+
+Pages are stored under a hash of their url in a bounded directory that is
+evicted least-recently-used first (by mtime, which a cache hit refreshes).
+While one page is displayed the viewer asks for the next few to be prefetched
+on a small thread pool, so flipping forward or back rarely waits on the
+network.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from ...core.constants import APP_CACHE_DIR
+from ...core.utils.file import AtomicWriter
+from ...core.utils.http_client import create_client
+
+logger = logging.getLogger(__name__)
+
+MANGA_PAGES_CACHE_DIR = APP_CACHE_DIR / "manga_pages"
+# pages prefetched ahead of the one being displayed
+READ_AHEAD = 4
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+
+class MangaPageCache:
+    """Bounded LRU directory of manga pages filled by a prefetching pool."""
+
+    def __init__(
+        self,
+        cache_dir: Path = MANGA_PAGES_CACHE_DIR,
+        max_bytes: int = MAX_CACHE_BYTES,
+        read_ahead: int = READ_AHEAD,
+        client: Optional[httpx.Client] = None,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.read_ahead = read_ahead
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._client = client or create_client("download", follow_redirects=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(read_ahead, 1), thread_name_prefix="MangaPrefetch"
+        )
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._sizes: Dict[Path, int] = {
+            path: path.stat().st_size
+            for path in self.cache_dir.iterdir()
+            if path.is_file() and not path.name.startswith(".")
+        }
+        self._total_bytes = sum(self._sizes.values())
+
+    def path_for(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return self.cache_dir / f"{digest}{Path(urlparse(url).path).suffix}"
+
+    def get(self, url: str) -> Path:
+        """
+        The local copy of a page, downloading it if it is not cached.
+
+        Waits for an in-flight prefetch of the same page instead of starting
+        a second download.
+
+        Raises:
+            httpx.HTTPError: If the page could not be downloaded.
+        """
+        path = self.path_for(url)
+        if path.exists():
+            self._touch(path)
+            return path
+        return self._submit(url).result()
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """Download the given pages in the background if they are not cached."""
+        for url in urls:
+            if not self.path_for(url).exists():
+                self._submit(url)
+
+    def prefetch_around(self, urls: list[str], index: int) -> None:
+        """Prefetch the pages following ``index``, and the one before it."""
+        ahead = [urls[(index + i) % len(urls)] for i in range(1, self.read_ahead + 1)]
+        self.prefetch([*ahead, urls[index - 1]])
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._client.close()
+
+    def _submit(self, url: str) -> Future:
+        with self._lock:
+            future = self._pending.get(url)
+            if future is None:
+                future = self._executor.submit(self._download, url)
+                self._pending[url] = future
+                future.add_done_callback(lambda _: self._forget(url))
+            return future
+
+    def _forget(self, url: str) -> None:
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def _download(self, url: str) -> Path:
+        path = self.path_for(url)
+        if path.exists():
+            return path
+        response = self._client.get(url)
+        response.raise_for_status()
+        with AtomicWriter(path, mode="wb", encoding=None) as f:
+            f.write(response.content)
+        logger.debug(f"Cached manga page {url} ({len(response.content)} bytes)")
+        with self._lock:
+            self._total_bytes += len(response.content) - self._sizes.get(path, 0)
+            self._sizes[path] = len(response.content)
+        self._evict(keep=path)
+        return path
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _evict(self, keep: Path) -> None:
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            by_age = sorted(
+                self._sizes,
+                key=lambda p: p.stat().st_mtime if p.exists() else 0,
+            )
+            for path in by_age:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                self._total_bytes -= self._sizes.pop(path)
+            logger.debug(f"Evicted manga pages down to {self._total_bytes} bytes")
@@ -1,13 +1,14 @@
 import logging
 import os
 import re
+from functools import lru_cache
 from hashlib import sha256
 from typing import Dict, List, Optional
 
 import httpx
 
 from ...core.config import AppConfig
-from ...core.constants import APP_CACHE_DIR, PLATFORM, SCRIPTS_DIR
+from ...core.constants import APP_CACHE_DIR, PLATFORM
 from ...core.utils.file import AtomicWriter
 from ...libs.media_api.types import (
     AiringScheduleResult,
@@ -17,6 +18,7 @@ from ...libs.media_api.types import (
 )
 from . import ansi
 from .preview_workers import PreviewWorkerManager
+from .template import load_template
 
 
 def get_rofi_preview(
@@ -126,22 +128,11 @@ REVIEWS_CACHE_DIR = PREVIEWS_CACHE_DIR / "reviews"
 CHARACTERS_CACHE_DIR = PREVIEWS_CACHE_DIR / "characters"
 AIRING_SCHEDULE_CACHE_DIR = PREVIEWS_CACHE_DIR / "airing_schedule"
 
-FZF_SCRIPTS_DIR = SCRIPTS_DIR / "fzf"
-TEMPLATE_PREVIEW_SCRIPT = (FZF_SCRIPTS_DIR / "preview.template.sh").read_text(
-    encoding="utf-8"
-)
-TEMPLATE_REVIEW_PREVIEW_SCRIPT = (
-    FZF_SCRIPTS_DIR / "review-preview.template.sh"
-).read_text(encoding="utf-8")
-TEMPLATE_CHARACTER_PREVIEW_SCRIPT = (
-    FZF_SCRIPTS_DIR / "character-preview.template.sh"
-).read_text(encoding="utf-8")
-TEMPLATE_AIRING_SCHEDULE_PREVIEW_SCRIPT = (
-    FZF_SCRIPTS_DIR / "airing-schedule-preview.template.sh"
-).read_text(encoding="utf-8")
-DYNAMIC_PREVIEW_SCRIPT = (FZF_SCRIPTS_DIR / "dynamic-preview.template.sh").read_text(
-    encoding="utf-8"
-)
+TEMPLATE_PREVIEW_SCRIPT = "fzf/preview.template.sh"
+TEMPLATE_REVIEW_PREVIEW_SCRIPT = "fzf/review-preview.template.sh"
+TEMPLATE_CHARACTER_PREVIEW_SCRIPT = "fzf/character-preview.template.sh"
+TEMPLATE_AIRING_SCHEDULE_PREVIEW_SCRIPT = "fzf/airing-schedule-preview.template.sh"
+DYNAMIC_PREVIEW_SCRIPT = "fzf/dynamic-preview.template.sh"
 
 EPISODE_PATTERN = re.compile(r"^Episode\s+(\d+)\s-\s.*")
 
@@ -288,8 +279,6 @@ def get_anime_preview(
     HEADER_COLOR = config.fzf.preview_header_color.split(",")
     SEPARATOR_COLOR = config.fzf.preview_separator_color.split(",")
 
-    preview_script = TEMPLATE_PREVIEW_SCRIPT
-
     # Start the managed background caching
     try:
         preview_manager = _get_preview_manager()
@@ -320,10 +309,7 @@ def get_anime_preview(
         "SCALE_UP": " --scale-up" if config.general.preview_scale_up else "",
     }
 
-    for key, value in replacements.items():
-        preview_script = preview_script.replace(f"{{{key}}}", value)
-
-    return preview_script
+    return _render_script(TEMPLATE_PREVIEW_SCRIPT, replacements)
 
 
 def get_episode_preview(
@@ -348,8 +334,6 @@ def get_episode_preview(
     HEADER_COLOR = config.fzf.preview_header_color.split(",")
     SEPARATOR_COLOR = config.fzf.preview_separator_color.split(",")
 
-    preview_script = TEMPLATE_PREVIEW_SCRIPT
-
     # Start managed background caching for episodes
     try:
         preview_manager = _get_preview_manager()
@@ -380,10 +364,7 @@ def get_episode_preview(
         "SCALE_UP": " --scale-up" if config.general.preview_scale_up else "",
     }
 
-    for key, value in replacements.items():
-        preview_script = preview_script.replace(f"{{{key}}}", value)
-
-    return preview_script
+    return _render_script(TEMPLATE_PREVIEW_SCRIPT, replacements)
 
 
 def get_dynamic_anime_preview(config: AppConfig) -> str:
@@ -408,9 +389,6 @@ def get_dynamic_anime_preview(config: AppConfig) -> str:
     HEADER_COLOR = config.fzf.preview_header_color.split(",")
     SEPARATOR_COLOR = config.fzf.preview_separator_color.split(",")
 
-    # Use the dynamic preview script template
-    preview_script = DYNAMIC_PREVIEW_SCRIPT
-
     search_cache_dir = APP_CACHE_DIR / "search"
     search_results_file = search_cache_dir / "current_search_results.json"
 
@@ -434,10 +412,25 @@ def get_dynamic_anime_preview(config: AppConfig) -> str:
         "SCALE_UP": " --scale-up" if config.general.preview_scale_up else "",
     }
 
-    for key, value in replacements.items():
-        preview_script = preview_script.replace(f"{{{key}}}", value)
+    return _render_script(DYNAMIC_PREVIEW_SCRIPT, replacements)
 
-    return preview_script
+
+def _render_script(template_name: str, replacements: Dict[str, str]) -> str:
+    """
+    Render a preview script template.
+
+    The replacements are derived from the config (plus the title prefix for
+    episodes), so the rendered script is memoized on them and rebuilt only
+    when the config changes.
+    """
+    return _render_script_cached(template_name, tuple(replacements.items()))
+
+
+@lru_cache(maxsize=32)
+def _render_script_cached(
+    template_name: str, replacements: tuple[tuple[str, str], ...]
+) -> str:
+    return load_template(template_name).render(dict(replacements))
 
 
 def _get_preview_manager() -> PreviewWorkerManager:
@@ -484,7 +477,6 @@ def get_review_preview(choice_map: Dict[str, MediaReview], config: AppConfig) ->
     logger.debug("Started background caching for review previews")
 
     # Use the generic loader script
-    preview_script = TEMPLATE_REVIEW_PREVIEW_SCRIPT
     path_sep = "\\" if PLATFORM == "win32" else "/"
 
     # Inject the correct cache path and color codes
@@ -501,10 +493,7 @@ def get_review_preview(choice_map: Dict[str, MediaReview], config: AppConfig) ->
         "RESET": ansi.RESET,
     }
 
-    for key, value in replacements.items():
-        preview_script = preview_script.replace(f"{{{key}}}", value)
-
-    return preview_script
+    return _render_script(TEMPLATE_REVIEW_PREVIEW_SCRIPT, replacements)
 
 
 def get_character_preview(choice_map: Dict[str, Character], config: AppConfig) -> str:
@@ -519,7 +508,6 @@ def get_character_preview(choice_map: Dict[str, Character], config: AppConfig) -
     logger.debug("Started background caching for character previews")
 
     # Use the generic loader script
-    preview_script = TEMPLATE_CHARACTER_PREVIEW_SCRIPT
     path_sep = "\\" if PLATFORM == "win32" else "/"
 
     # Inject the correct cache path and color codes
@@ -537,10 +525,7 @@ def get_character_preview(choice_map: Dict[str, Character], config: AppConfig) -
         "RESET": ansi.RESET,
     }
 
-    for key, value in replacements.items():
-        preview_script = preview_script.replace(f"{{{key}}}", value)
-
-    return preview_script
+    return _render_script(TEMPLATE_CHARACTER_PREVIEW_SCRIPT, replacements)
 
 
 def get_airing_schedule_preview(
@@ -557,7 +542,6 @@ def get_airing_schedule_preview(
     logger.debug("Started background caching for airing schedule previews")
 
     # Use the generic loader script
-    preview_script = TEMPLATE_AIRING_SCHEDULE_PREVIEW_SCRIPT
     path_sep = "\\" if PLATFORM == "win32" else "/"
 
     # Inject the correct cache path and color codes
@@ -574,7 +558,4 @@ def get_airing_schedule_preview(
         "RESET": ansi.RESET,
     }
 
-    for key, value in replacements.items():
-        preview_script = preview_script.replace(f"{{{key}}}", value)
-
-    return preview_script
+    return _render_script(TEMPLATE_AIRING_SCHEDULE_PREVIEW_SCRIPT, replacements)
@@ -11,8 +11,8 @@ from typing import Dict, List, Optional
 import httpx
 
 from ...core.config import AppConfig
-from ...core.constants import SCRIPTS_DIR
 from ...core.utils import formatter
+from ...core.utils.cassette import transport_from_env
 from ...core.utils.concurrency import (
     ManagedBackgroundWorker,
     WorkerTask,
@@ -26,26 +26,16 @@ from ...libs.media_api.types import (
     MediaReview,
 )
 from . import image
+from .template import load_template
 
 logger = logging.getLogger(__name__)
 
 
-FZF_SCRIPTS_DIR = SCRIPTS_DIR / "fzf"
-TEMPLATE_INFO_SCRIPT = (FZF_SCRIPTS_DIR / "info.template.sh").read_text(
-    encoding="utf-8"
-)
-TEMPLATE_EPISODE_INFO_SCRIPT = (FZF_SCRIPTS_DIR / "episode-info.template.sh").read_text(
-    encoding="utf-8"
-)
-TEMPLATE_REVIEW_INFO_SCRIPT = (FZF_SCRIPTS_DIR / "review-info.template.sh").read_text(
-    encoding="utf-8"
-)
-TEMPLATE_CHARACTER_INFO_SCRIPT = (
-    FZF_SCRIPTS_DIR / "character-info.template.sh"
-).read_text(encoding="utf-8")
-TEMPLATE_AIRING_SCHEDULE_INFO_SCRIPT = (
-    FZF_SCRIPTS_DIR / "airing-schedule-info.template.sh"
-).read_text(encoding="utf-8")
+TEMPLATE_INFO_SCRIPT = "fzf/info.template.sh"
+TEMPLATE_EPISODE_INFO_SCRIPT = "fzf/episode-info.template.sh"
+TEMPLATE_REVIEW_INFO_SCRIPT = "fzf/review-info.template.sh"
+TEMPLATE_CHARACTER_INFO_SCRIPT = "fzf/character-info.template.sh"
+TEMPLATE_AIRING_SCHEDULE_INFO_SCRIPT = "fzf/airing-schedule-info.template.sh"
 
 
 class PreviewCacheWorker(ManagedBackgroundWorker):
@@ -74,6 +64,7 @@ class PreviewCacheWorker(ManagedBackgroundWorker):
         """Start the worker and initialize HTTP client."""
         super().start()
         self._http_client = httpx.Client(
+            transport=transport_from_env(),
             timeout=20.0,
             follow_redirects=True,
             limits=httpx.Limits(max_connections=self.max_workers),
@@ -102,6 +93,7 @@ class PreviewCacheWorker(ManagedBackgroundWorker):
         if not self.is_running():
             raise RuntimeError("PreviewCacheWorker is not running")
 
+        info_tasks = []
         for media_item, title_str in zip(media_items, titles):
             hash_id = self._get_cache_hash(title_str)
 
@@ -115,10 +107,13 @@ class PreviewCacheWorker(ManagedBackgroundWorker):
                         hash_id,
                     )
 
-            # Submit info generation task if needed
             if config.general.preview in ("full", "text"):
-                info_text = self._generate_info_text(media_item, config)
-                self.submit_function(self._save_info_text, info_text, hash_id)
+                info_tasks.append((media_item, hash_id))
+
+        # Render all info texts in one task, in display order, so the menu
+        # thread neither renders them nor pays a submit per item
+        if info_tasks:
+            self.submit_function(self._cache_info_texts, info_tasks, config)
 
     def _download_and_save_image(self, url: str, hash_id: str) -> None:
         """Download an image and save it to cache."""
@@ -143,8 +138,6 @@ class PreviewCacheWorker(ManagedBackgroundWorker):
 
     def _generate_info_text(self, media_item: MediaItem, config: AppConfig) -> str:
         """Generate formatted info text for a media item."""
-        # Import here to avoid circular imports
-        info_script = TEMPLATE_INFO_SCRIPT
         description = formatter.clean_html(
             media_item.description or "No description available."
         )
@@ -211,10 +204,18 @@ class PreviewCacheWorker(ManagedBackgroundWorker):
             "SYNOPSIS": formatter.shell_safe(description),
         }
 
-        for key, value in replacements.items():
-            info_script = info_script.replace(f"{{{key}}}", value)
+        return load_template(TEMPLATE_INFO_SCRIPT).render(replacements)
 
-        return info_script
+    def _cache_info_texts(
+        self, info_tasks: List[tuple[MediaItem, str]], config: AppConfig
+    ) -> None:
+        """Render the info text of each media item and save it to cache."""
+        for media_item, hash_id in info_tasks:
+            try:
+                info_text = self._generate_info_text(media_item, config)
+                self._save_info_text(info_text, hash_id)
+            except Exception as e:
+                logger.error(f"Failed to cache info for {hash_id}: {e}")
 
     def _save_info_text(self, info_text: str, hash_id: str) -> None:
         """Save info text to cache."""
@@ -269,6 +270,7 @@ class EpisodeCacheWorker(ManagedBackgroundWorker):
         """Start the worker and initialize HTTP client."""
         super().start()
         self._http_client = httpx.Client(
+            transport=transport_from_env(),
             timeout=20.0,
             follow_redirects=True,
             limits=httpx.Limits(max_connections=self.max_workers),
@@ -299,6 +301,7 @@ class EpisodeCacheWorker(ManagedBackgroundWorker):
 
         streaming_episodes = media_item.streaming_episodes
 
+        info_tasks = []
         for episode_str in episodes:
             hash_id = self._get_cache_hash(
                 f"{media_item.title.english}_Episode_{episode_str}"
@@ -318,9 +321,13 @@ class EpisodeCacheWorker(ManagedBackgroundWorker):
             if thumbnail:
                 self.submit_function(self._download_and_save_image, thumbnail, hash_id)
 
-            # Submit episode info generation task
-            episode_info = self._generate_episode_info(config, title, media_item)
-            self.submit_function(self._save_info_text, episode_info, hash_id)
+            info_tasks.append((title, hash_id))
+
+        # Render all episode infos in one task, in display order
+        if info_tasks:
+            self.submit_function(
+                self._cache_episode_infos, info_tasks, media_item, config
+            )
 
     def _download_and_save_image(self, url: str, hash_id: str) -> None:
         """Download an image and save it to cache."""
@@ -347,8 +354,6 @@ class EpisodeCacheWorker(ManagedBackgroundWorker):
         self, config: AppConfig, title: str, media_item: MediaItem
     ) -> str:
         """Generate formatted episode info text."""
-        episode_info_script = TEMPLATE_EPISODE_INFO_SCRIPT
-
         replacements = {
             "TITLE": formatter.shell_safe(title),
             "NEXT_EPISODE": formatter.shell_safe(
@@ -377,10 +382,21 @@ class EpisodeCacheWorker(ManagedBackgroundWorker):
             ),
         }
 
-        for key, value in replacements.items():
-            episode_info_script = episode_info_script.replace(f"{{{key}}}", value)
+        return load_template(TEMPLATE_EPISODE_INFO_SCRIPT).render(replacements)
 
-        return episode_info_script
+    def _cache_episode_infos(
+        self,
+        info_tasks: List[tuple[str, str]],
+        media_item: MediaItem,
+        config: AppConfig,
+    ) -> None:
+        """Render the info text of each episode and save it to cache."""
+        for title, hash_id in info_tasks:
+            try:
+                episode_info = self._generate_episode_info(config, title, media_item)
+                self._save_info_text(episode_info, hash_id)
+            except Exception as e:
+                logger.error(f"Failed to cache episode info for {hash_id}: {e}")
 
     def _save_info_text(self, info_text: str, hash_id: str) -> None:
         """Save episode info text to cache."""
@@ -434,8 +450,7 @@ class ReviewCacheWorker(ManagedBackgroundWorker):
         for choice_str, review in choice_map.items():
             hash_id = self._get_cache_hash(choice_str)
 
-            preview_content = self._generate_review_preview_content(review, config)
-            self.submit_function(self._save_preview_content, preview_content, hash_id)
+            self.submit_function(self._cache_review_preview, review, config, hash_id)
 
     def _generate_review_preview_content(
         self, review: MediaReview, config: AppConfig
@@ -450,16 +465,19 @@ class ReviewCacheWorker(ManagedBackgroundWorker):
         body = review.body
 
         # Inject data into the presentation template
-        template = TEMPLATE_REVIEW_INFO_SCRIPT
         replacements = {
             "REVIEWER_NAME": formatter.shell_safe(reviewer),
             "REVIEW_SUMMARY": formatter.shell_safe(summary),
             "REVIEW_BODY": formatter.shell_safe(body),
         }
-        for key, value in replacements.items():
-            template = template.replace(f"{{{key}}}", value)
+        return load_template(TEMPLATE_REVIEW_INFO_SCRIPT).render(replacements)
 
-        return template
+    def _cache_review_preview(
+        self, review: MediaReview, config: AppConfig, hash_id: str
+    ) -> None:
+        self._save_preview_content(
+            self._generate_review_preview_content(review, config), hash_id
+        )
 
     def _save_preview_content(self, content: str, hash_id: str) -> None:
         """Saves the final preview content to the cache."""
@@ -499,6 +517,7 @@ class CharacterCacheWorker(ManagedBackgroundWorker):
         """Start the worker and initialize HTTP client."""
         super().start()
         self._http_client = httpx.Client(
+            transport=transport_from_env(),
             timeout=20.0,
             follow_redirects=True,
             limits=httpx.Limits(max_connections=self.max_workers),
@@ -521,9 +540,6 @@ class CharacterCacheWorker(ManagedBackgroundWorker):
         for choice_str, character in choice_map.items():
             hash_id = self._get_cache_hash(choice_str)
 
-            preview_content = self._generate_character_preview_content(
-                character, config
-            )
             #  NOTE: Disabled due to issue of the text overlapping with the image
             if (
                 character.image
@@ -532,7 +548,9 @@ class CharacterCacheWorker(ManagedBackgroundWorker):
             ):
                 image_url = character.image.medium or character.image.large
                 self.submit_function(self._download_and_save_image, image_url, hash_id)
-            self.submit_function(self._save_preview_content, preview_content, hash_id)
+            self.submit_function(
+                self._cache_character_preview, character, config, hash_id
+            )
 
     def _generate_character_preview_content(
         self, character: Character, config: AppConfig
@@ -560,7 +578,6 @@ class CharacterCacheWorker(ManagedBackgroundWorker):
             description = formatter.clean_html(description)
 
         # Inject data into the presentation template
-        template = TEMPLATE_CHARACTER_INFO_SCRIPT
         replacements = {
             "CHARACTER_NAME": formatter.shell_safe(character_name),
             "CHARACTER_NATIVE_NAME": formatter.shell_safe(native_name),
@@ -571,10 +588,14 @@ class CharacterCacheWorker(ManagedBackgroundWorker):
             "CHARACTER_FAVOURITES": formatter.shell_safe(favourites),
             "CHARACTER_DESCRIPTION": formatter.shell_safe(description),
         }
-        for key, value in replacements.items():
-            template = template.replace(f"{{{key}}}", value)
+        return load_template(TEMPLATE_CHARACTER_INFO_SCRIPT).render(replacements)
 
-        return template
+    def _cache_character_preview(
+        self, character: Character, config: AppConfig, hash_id: str
+    ) -> None:
+        self._save_preview_content(
+            self._generate_character_preview_content(character, config), hash_id
+        )
 
     def _download_and_save_image(self, url: str, hash_id: str) -> None:
         """Download an image and save it to cache."""
@@ -643,10 +664,13 @@ class AiringScheduleCacheWorker(ManagedBackgroundWorker):
 
         hash_id = self._get_cache_hash(anime_title)
 
-        preview_content = self._generate_airing_schedule_preview_content(
-            anime_title, schedule_result, config
+        self.submit_function(
+            self._cache_airing_schedule_preview,
+            anime_title,
+            schedule_result,
+            config,
+            hash_id,
         )
-        self.submit_function(self._save_preview_content, preview_content, hash_id)
 
     def _generate_airing_schedule_preview_content(
         self, anime_title: str, schedule_result: AiringScheduleResult, config: AppConfig
@@ -706,17 +730,27 @@ class AiringScheduleCacheWorker(ManagedBackgroundWorker):
         schedule_table = "\n".join(schedule_lines)
 
         # Inject data into the presentation template
-        template = TEMPLATE_AIRING_SCHEDULE_INFO_SCRIPT
         replacements = {
             "ANIME_TITLE": formatter.shell_safe(anime_title),
             "TOTAL_EPISODES": formatter.shell_safe(str(total_episodes)),
             "UPCOMING_EPISODES": formatter.shell_safe(str(upcoming_episodes)),
             "SCHEDULE_TABLE": formatter.shell_safe(schedule_table),
         }
-        for key, value in replacements.items():
-            template = template.replace(f"{{{key}}}", value)
-
-        return template
+        return load_template(TEMPLATE_AIRING_SCHEDULE_INFO_SCRIPT).render(replacements)
+
+    def _cache_airing_schedule_preview(
+        self,
+        anime_title: str,
+        schedule_result: AiringScheduleResult,
+        config: AppConfig,
+        hash_id: str,
+    ) -> None:
+        self._save_preview_content(
+            self._generate_airing_schedule_preview_content(
+                anime_title, schedule_result, config
+            ),
+            hash_id,
+        )
 
     def _save_preview_content(self, content: str, hash_id: str) -> None:
         """Saves the final preview content to the cache."""
@@ -21,16 +21,17 @@ def find_best_match_title(
     Returns:
         str: The best match title.
     """
-    return max(
-        provider_results_map.keys(),
-        key=lambda p_title: max(
-            fuzz.ratio(
-                normalize_title(p_title, provider.value).lower(),
-                (media_item.title.romaji or "").lower(),
-            ),
-            fuzz.ratio(
-                normalize_title(p_title, provider.value).lower(),
-                (media_item.title.english or "").lower(),
-            ),
-        ),
-    )
+    titles = list(provider_results_map.keys())
+    # normalize every candidate once instead of once per media title compared
+    normalized_titles = [
+        normalize_title(p_title, provider.value).lower() for p_title in titles
+    ]
+    media_titles = [
+        (media_item.title.romaji or "").lower(),
+        (media_item.title.english or "").lower(),
+    ]
+
+    best_match = fuzz.extract_best(media_titles, normalized_titles)
+    if best_match is None:
+        return titles[0]
+    return titles[best_match[2]]
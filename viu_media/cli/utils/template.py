@@ -0,0 +1,41 @@
+"""
+Single-pass rendering of the ``{PLACEHOLDER}`` script templates in assets.
+
+A template is split once into its literal text and placeholder names, so a
+render is one join over the pieces instead of a full-text ``str.replace``
+pass per placeholder. Placeholders without a value are left as they are,
+which keeps fzf's ``{q}`` and other braces in the scripts untouched.
+"""
+
+import re
+from functools import lru_cache
+from typing import Mapping
+
+from ...core.constants import SCRIPTS_DIR
+
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Z][A-Z0-9_]*)\}")
+
+
+class CompiledTemplate:
+    """A template pre-split into literal text and placeholder names."""
+
+    __slots__ = ("_literals", "_keys")
+
+    def __init__(self, source: str):
+        parts = PLACEHOLDER_PATTERN.split(source)
+        self._literals = parts[0::2]
+        self._keys = parts[1::2]
+
+    def render(self, values: Mapping[str, str]) -> str:
+        pieces = [self._literals[0]]
+        for key, literal in zip(self._keys, self._literals[1:]):
+            value = values.get(key)
+            pieces.append(f"{{{key}}}" if value is None else value)
+            pieces.append(literal)
+        return "".join(pieces)
+
+
+@lru_cache(maxsize=None)
+def load_template(name: str) -> CompiledTemplate:
+    """The template at ``assets/scripts/<name>``, read and compiled once."""
+    return CompiledTemplate((SCRIPTS_DIR / name).read_text(encoding="utf-8"))
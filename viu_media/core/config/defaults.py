@@ -59,6 +59,10 @@ def STREAM_USE_IPC():
     return True if PLATFORM != "win32" and not detect.is_running_in_termux() else False
 
 
+STREAM_REUSE_PLAYER = False
+STREAM_CACHE_STREAMS = False
+
+
 # WorkerConfig
 WORKER_ENABLED = True
 WORKER_NOTIFICATION_CHECK_INTERVAL = 15  # minutes
@@ -96,6 +100,9 @@ DOWNLOADS_DOWNLOADS_DIR = USER_VIDEOS_DIR
 DOWNLOADS_ENABLE_TRACKING = True
 DOWNLOADS_NO_CHECK_CERTIFICATE = True
 DOWNLOADS_MAX_CONCURRENT = 3
+DOWNLOADS_MAX_CONCURRENT_PER_PROVIDER = 2
+DOWNLOADS_MAX_CONCURRENT_PER_HOST = 2
+DOWNLOADS_MAX_CONCURRENT_POSTPROCESSING = 2
 DOWNLOADS_RETRY_ATTEMPTS = 2
 DOWNLOADS_RETRY_DELAY = 60
 DOWNLOADS_MERGE_SUBTITLES = True
@@ -105,6 +112,8 @@ DOWNLOADS_CLEANUP_AFTER_MERGE = True
 # RegistryConfig
 MEDIA_REGISTRY_DIR = USER_VIDEOS_DIR / ".registry"
 MEDIA_REGISTRY_INDEX_DIR = APP_DATA_DIR
+# None keeps libtorrent fast-resume data in <media_registry.media_dir>/torrents
+DOWNLOADS_TORRENT_RESUME_DIR = None
 
 # session config
 SESSIONS_DIR = APP_DATA_DIR / ".sessions"
@@ -62,6 +62,8 @@ STREAM_DEFAULT_MEDIA_LIST_TRACKING = (
 )
 STREAM_SUB_LANG = "Preferred language code for subtitles (e.g., 'en', 'es')."
 STREAM_USE_IPC = "Use IPC communication with the player for advanced features like episode navigation."
+STREAM_CACHE_STREAMS = "Play streams through a local caching proxy that saves them into the downloads directory; fully streamed episodes are registered as downloaded."
+STREAM_REUSE_PLAYER = "Keep one idle mpv running for the whole session and load each episode into it over IPC instead of starting a new player every time (requires use_ipc)."
 
 # WorkerConfig
 APP_WORKER = "Configuration for the background worker service."
@@ -103,6 +105,13 @@ DOWNLOADS_DOWNLOADER = "The downloader to use"
 DOWNLOADS_DOWNLOADS_DIR = "The default directory to save downloaded anime."
 DOWNLOADS_ENABLE_TRACKING = "Enable download tracking and management"
 DOWNLOADS_MAX_CONCURRENT = "Maximum number of concurrent downloads"
+DOWNLOADS_MAX_CONCURRENT_PER_PROVIDER = (
+    "Maximum number of downloads resolving streams on the same provider at once"
+)
+DOWNLOADS_MAX_CONCURRENT_PER_HOST = (
+    "Maximum number of concurrent downloads from the same stream host"
+)
+DOWNLOADS_MAX_CONCURRENT_POSTPROCESSING = "Maximum number of downloads merged and finalized at once, separately from the downloads themselves"
 DOWNLOADS_NO_CHECK_CERTIFICATE = "Whether or not to check certificates"
 DOWNLOADS_RETRY_ATTEMPTS = "Number of retry attempts for failed downloads"
 DOWNLOADS_RETRY_DELAY = "Delay between retry attempts in seconds"
@@ -112,6 +121,7 @@ DOWNLOADS_MERGE_SUBTITLES = (
 DOWNLOADS_CLEANUP_AFTER_MERGE = (
     "Delete the original video and subtitle files after a successful merge."
 )
+DOWNLOADS_TORRENT_RESUME_DIR = "Directory where resume data of torrent downloads is kept, so interrupted torrents continue instead of starting over. Defaults to a 'torrents' directory inside the media registry directory."
 
 
 # RegistryConfig
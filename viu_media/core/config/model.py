@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from ...libs.media_api.types import MediaSort, UserMediaListSort
 from ...libs.provider.anime.types import ProviderName, ProviderServer
@@ -279,6 +279,14 @@ class StreamConfig(BaseModel):
         default_factory=defaults.STREAM_USE_IPC,
         description=desc.STREAM_USE_IPC,
     )
+    reuse_player: bool = Field(
+        default=defaults.STREAM_REUSE_PLAYER,
+        description=desc.STREAM_REUSE_PLAYER,
+    )
+    cache_streams: bool = Field(
+        default=defaults.STREAM_CACHE_STREAMS,
+        description=desc.STREAM_CACHE_STREAMS,
+    )
 
 
 class OtherConfig(BaseModel):
@@ -295,7 +303,21 @@ class WorkerConfig(OtherConfig):
     notification_check_interval: int = Field(
         default=15,  # in minutes
         ge=1,
-        description="How often to check for new AniList notifications (in minutes).",
+        description="How often to check for new AniList notifications (in minutes), when checks do not follow the airing schedule.",
+    )
+    airing_schedule_notifications: bool = Field(
+        default=True,
+        description="Check for notifications shortly after episodes of tracked shows air, instead of every notification_check_interval.",
+    )
+    notification_airing_delay: int = Field(
+        default=5,  # in minutes
+        ge=1,
+        description="How long after an episode airs to check for its notification (in minutes).",
+    )
+    notification_fallback_interval: int = Field(
+        default=180,  # in minutes
+        ge=1,
+        description="How often to check for notifications between airings when checks follow the airing schedule (in minutes).",
     )
     download_check_interval: int = Field(
         default=5,  # in minutes
@@ -446,6 +468,21 @@ class DownloadsConfig(OtherConfig):
         ge=1,
         description=desc.DOWNLOADS_MAX_CONCURRENT,
     )
+    max_concurrent_per_provider: int = Field(
+        default=defaults.DOWNLOADS_MAX_CONCURRENT_PER_PROVIDER,
+        ge=1,
+        description=desc.DOWNLOADS_MAX_CONCURRENT_PER_PROVIDER,
+    )
+    max_concurrent_per_host: int = Field(
+        default=defaults.DOWNLOADS_MAX_CONCURRENT_PER_HOST,
+        ge=1,
+        description=desc.DOWNLOADS_MAX_CONCURRENT_PER_HOST,
+    )
+    max_concurrent_postprocessing: int = Field(
+        default=defaults.DOWNLOADS_MAX_CONCURRENT_POSTPROCESSING,
+        ge=1,
+        description=desc.DOWNLOADS_MAX_CONCURRENT_POSTPROCESSING,
+    )
     max_retry_attempts: int = Field(
         default=defaults.DOWNLOADS_RETRY_ATTEMPTS,
         ge=0,
@@ -464,6 +501,12 @@ class DownloadsConfig(OtherConfig):
         default=defaults.DOWNLOADS_CLEANUP_AFTER_MERGE,
         description=desc.DOWNLOADS_CLEANUP_AFTER_MERGE,
     )
+    torrent_resume_dir: Optional[Path] = Field(
+        default=defaults.DOWNLOADS_TORRENT_RESUME_DIR,
+        description=desc.DOWNLOADS_TORRENT_RESUME_DIR,
+    )
+    # set from media_registry.media_dir by AppConfig
+    _media_registry_dir: Path = PrivateAttr(default=defaults.MEDIA_REGISTRY_DIR)
 
     server: ProviderServer = Field(
         default=ProviderServer.TOP,
@@ -479,6 +522,11 @@ class DownloadsConfig(OtherConfig):
         description=desc.DOWNLOADS_NO_CHECK_CERTIFICATE,
     )
 
+    @property
+    def torrent_resume_path(self) -> Path:
+        """The configured torrent resume dir, else ``torrents`` in the registry dir."""
+        return self.torrent_resume_dir or self._media_registry_dir / "torrents"
+
 
 class MediaRegistryConfig(OtherConfig):
     """Configuration for registry related options"""
@@ -535,3 +583,9 @@ class AppConfig(BaseModel):
         default_factory=WorkerConfig,
         description="Configuration for the background worker service.",
     )
+
+    @model_validator(mode="after")
+    def _follow_media_registry_dir(self) -> "AppConfig":
+        # the torrent resume dir defaults to a directory inside the registry
+        self.downloads._media_registry_dir = self.media_registry.media_dir
+        return self
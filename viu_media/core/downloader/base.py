@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 import httpx
 
 from ..config.model import DownloadsConfig
+from ..utils.http_client import create_client
 from .model import DownloadResult
 from .params import DownloadParams
 
@@ -13,13 +14,9 @@ class BaseDownloader(ABC):
     def __init__(self, config: DownloadsConfig):
         self.config = config
 
-        # Increase timeouts and add retries for robustness
-        transport = httpx.HTTPTransport(retries=3)
-        self.client = httpx.Client(
-            transport=transport,
-            timeout=httpx.Timeout(15.0, connect=60.0),
-            follow_redirects=True,
-        )
+        # Downloaders share one keep-alive pool with long connect timeouts and
+        # retries, so creating one per episode does not reconnect every time
+        self.client = create_client("download", follow_redirects=True)
 
     @abstractmethod
     def download(self, params: DownloadParams) -> DownloadResult:
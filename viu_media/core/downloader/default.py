@@ -1,13 +1,10 @@
 """Default downloader implementation without yt-dlp dependency."""
 
-import itertools
 import logging
 import shutil
-import subprocess
-import tempfile
 import urllib.parse
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import httpx
 from rich import print
@@ -22,19 +19,59 @@ from rich.progress import (
 from rich.prompt import Confirm
 from ..utils.file import sanitize_filename
 
-from ..exceptions import ViuError
+from ..exceptions import DownloaderError, DownloadCancelled, ViuError
 from ..patterns import TORRENT_REGEX
 from ..utils.networking import get_remote_filename
+from ..utils.profiling import timed
 from .base import BaseDownloader
 from .model import DownloadResult
 from .params import DownloadParams
+from .postprocess import merge_subtitles
+from .progress import ProgressAggregator
 
 logger = logging.getLogger(__name__)
 
+# bounds of the write buffer, which holds about WRITE_BUFFER_SECONDS of data
+MIN_WRITE_BUFFER = 256 * 1024
+MAX_WRITE_BUFFER = 4 * 1024 * 1024
+WRITE_BUFFER_SECONDS = 0.25
+
+
+class _CoalescingWriter:
+    """Collects small chunks in one reusable buffer and writes it out when full."""
+
+    def __init__(self, file: BinaryIO):
+        self._file = file
+        self._buffer = bytearray(MAX_WRITE_BUFFER)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+        self.limit = MIN_WRITE_BUFFER
+
+    def write(self, chunk: bytes) -> None:
+        size = len(chunk)
+        if self._used + size > self.limit:
+            self.flush()
+        if size >= self.limit:
+            self._file.write(chunk)
+            return
+        self._view[self._used : self._used + size] = chunk
+        self._used += size
+
+    def adapt(self, bytes_per_second: float) -> None:
+        """Size the buffer to the current throughput."""
+        target = int(bytes_per_second * WRITE_BUFFER_SECONDS)
+        self.limit = max(MIN_WRITE_BUFFER, min(MAX_WRITE_BUFFER, target))
+
+    def flush(self) -> None:
+        if self._used:
+            self._file.write(self._view[: self._used])
+            self._used = 0
+
 
 class DefaultDownloader(BaseDownloader):
     """Default downloader that uses httpx for downloads without yt-dlp dependency."""
 
+    @timed(category="download")
     def download(self, params: DownloadParams) -> DownloadResult:
         """Download video and optionally subtitles, returning detailed results."""
         try:
@@ -43,16 +80,17 @@ class DefaultDownloader(BaseDownloader):
             merged_path = None
 
             if TORRENT_REGEX.match(params.url):
-                from .torrents import download_torrent_with_webtorrent_cli
+                from .torrents import download_torrent
 
                 anime_title = sanitize_filename(params.anime_title)
-                episode_title = sanitize_filename(params.episode_title)
                 dest_dir = self.config.downloads_dir / anime_title
                 dest_dir.mkdir(parents=True, exist_ok=True)
 
-                video_path = dest_dir / episode_title
-                video_path = download_torrent_with_webtorrent_cli(
-                    video_path, params.url
+                video_path = download_torrent(
+                    params.url,
+                    dest_dir,
+                    resume_dir=self.config.torrent_resume_path,
+                    progress_hooks=params.progress_hooks,
                 )
             else:
                 video_path = self._download_video(params)
@@ -89,6 +127,7 @@ class DefaultDownloader(BaseDownloader):
                 episode_title=params.episode_title,
             )
 
+    @timed(category="download")
     def _download_video(self, params: DownloadParams) -> Path:
         """Download video using httpx with progress tracking."""
         anime_title = sanitize_filename(params.anime_title)
@@ -118,7 +157,12 @@ class DefaultDownloader(BaseDownloader):
 
         # Download with progress tracking
         self._download_with_progress(
-            params.url, video_path, params.headers, params.silent, params.progress_hooks
+            params.url,
+            video_path,
+            params.headers,
+            params.silent,
+            params.progress_hooks,
+            show_progress=params.show_progress,
         )
 
         # Handle unknown video extension normalization
@@ -171,25 +215,34 @@ class DefaultDownloader(BaseDownloader):
         headers: dict,
         silent: bool,
         progress_hooks: list | None = None,
+        show_progress: bool = True,
     ):
-        """Download file with rich progress bar and progress hooks."""
+        """
+        Download file with rich progress bar and progress hooks.
+
+        Chunks are taken as they arrive from the network and coalesced in a
+        reusable buffer that is flushed with one write per fill; the buffer
+        size follows the measured throughput. Progress is reported through a
+        ProgressAggregator, so the bar and hooks are updated at a fixed
+        sample rate rather than per chunk.
+        """
         progress_hooks = progress_hooks or []
 
-        # Always show download start message
-        print(f"[cyan]Starting download of {output_path.name}...[/]")
+        if show_progress:
+            print(f"[cyan]Starting download of {output_path.name}...[/]")
 
+        aggregator = ProgressAggregator(output_path.name, hooks=progress_hooks)
         try:
             with self.client.stream("GET", url, headers=headers) as response:
                 response.raise_for_status()
 
                 total_size = int(response.headers.get("content-length", 0))
-                downloaded = 0
+                aggregator.total_bytes = total_size
 
-                # Initialize progress display - always show progress
+                # Initialize progress display unless the caller renders it
                 progress = None
-                task_id = None
 
-                if total_size > 0:
+                if show_progress and total_size > 0:
                     progress = Progress(
                         TextColumn(
                             "[bold blue]{task.fields[filename]}", justify="right"
@@ -203,7 +256,7 @@ class DefaultDownloader(BaseDownloader):
                         "•",
                         TimeRemainingColumn(),
                     )
-                else:
+                elif show_progress:
                     # Progress without total size (indeterminate)
                     progress = Progress(
                         TextColumn(
@@ -214,77 +267,44 @@ class DefaultDownloader(BaseDownloader):
                         TransferSpeedColumn(),
                     )
 
-                progress.start()
-                task_id = progress.add_task(
-                    "download",
-                    filename=output_path.name,
-                    total=total_size if total_size > 0 else None,
-                )
+                if progress is not None:
+                    progress.start()
+                    aggregator.progress = progress
+                    aggregator.task_id = progress.add_task(
+                        "download",
+                        filename=output_path.name,
+                        total=total_size if total_size > 0 else None,
+                    )
 
                 try:
                     with open(output_path, "wb") as f:
-                        for chunk in response.iter_bytes(chunk_size=8192):
+                        writer = _CoalescingWriter(f)
+                        # no chunk_size: httpx would re-slice every network read
+                        for chunk in response.iter_bytes():
                             if chunk:
-                                f.write(chunk)
-                                chunk_size = len(chunk)
-                                downloaded += chunk_size
-
-                                # Always update progress bar
-                                if progress is not None and task_id is not None:
-                                    progress.update(task_id, advance=chunk_size)
-
-                                # Call progress hooks
-                                if progress_hooks:
-                                    progress_info = {
-                                        "downloaded_bytes": downloaded,
-                                        "total_bytes": total_size,
-                                        "filename": output_path.name,
-                                        "status": "downloading",
-                                    }
-                                    for hook in progress_hooks:
-                                        try:
-                                            hook(progress_info)
-                                        except Exception as e:
-                                            logger.warning(f"Progress hook failed: {e}")
-
+                                writer.write(chunk)
+                                aggregator.advance(len(chunk))
+                                writer.adapt(aggregator.rate)
+                        writer.flush()
+
+                except DownloadCancelled:
+                    # a partial file would pass for a finished download
+                    output_path.unlink(missing_ok=True)
+                    raise
                 finally:
                     if progress:
                         progress.stop()
 
-                # Always show completion message
-                print(f"[green]✓ Download completed: {output_path.name}[/]")
-
-                # Call completion hooks
-                if progress_hooks:
-                    completion_info = {
-                        "downloaded_bytes": downloaded,
-                        "total_bytes": total_size or downloaded,
-                        "filename": output_path.name,
-                        "status": "finished",
-                    }
-                    for hook in progress_hooks:
-                        try:
-                            hook(completion_info)
-                        except Exception as e:
-                            logger.warning(f"Progress hook failed: {e}")
+                if show_progress:
+                    print(f"[green]✓ Download completed: {output_path.name}[/]")
+
+                aggregator.finish()
 
         except httpx.HTTPError as e:
-            # Call error hooks
-            if progress_hooks:
-                error_info = {
-                    "downloaded_bytes": 0,
-                    "total_bytes": 0,
-                    "filename": output_path.name,
-                    "status": "error",
-                    "error": str(e),
-                }
-                for hook in progress_hooks:
-                    try:
-                        hook(error_info)
-                    except Exception as hook_error:
-                        logger.warning(f"Progress hook failed: {hook_error}")
+            aggregator.fail(e)
             raise ViuError(f"Failed to download video: {e}")
 
+    @timed(category="download")
     def _download_subs(self, params: DownloadParams) -> list[Path]:
         """Download subtitles from provided URLs."""
         anime_title = sanitize_filename(params.anime_title)
@@ -321,98 +341,32 @@ class DefaultDownloader(BaseDownloader):
 
         return downloaded_subs
 
+    @timed(category="download")
     def _merge_subtitles(
         self, params: DownloadParams, video_path: Path, sub_paths: list[Path]
     ) -> Optional[Path]:
         """Merge subtitles with video using ffmpeg and return the path to the merged file."""
-        ffmpeg_executable = shutil.which("ffmpeg")
-        if not ffmpeg_executable:
-            raise ViuError("Please install ffmpeg in order to merge subtitles")
-
-        merged_filename = video_path.stem + ".mkv"
-
-        # Prepare subtitle input arguments
-        subs_input_args = list(
-            itertools.chain.from_iterable(
-                [["-i", str(sub_path)] for sub_path in sub_paths]
+        print(f"[cyan]Starting subtitle merge for {video_path.name}...[/]")
+        try:
+            merged_path = merge_subtitles(
+                video_path,
+                sub_paths,
+                silent=params.silent,
+                clean=params.clean,
+                overwrite=lambda path: (
+                    not params.prompt
+                    or Confirm.ask(f"File exists ({path}). Overwrite?", default=True)
+                ),
             )
-        )
-
-        with tempfile.TemporaryDirectory() as temp_dir_str:
-            temp_dir = Path(temp_dir_str)
-            temp_output_path = temp_dir / merged_filename
-
-            # Construct ffmpeg command
-            args = [
-                ffmpeg_executable,
-                "-hide_banner",
-                "-i",
-                str(video_path),  # Main video input
-                *subs_input_args,  # All subtitle inputs
-                "-c",
-                "copy",  # Copy streams without re-encoding
-                "-map",
-                "0:v",  # Map video from first input
-                "-map",
-                "0:a",  # Map audio from first input
-            ]
-
-            # Map subtitle streams from each subtitle input
-            for i in range(len(sub_paths)):
-                args.extend(["-map", f"{i + 1}:s"])
-
-            args.append(str(temp_output_path))
-
-            print(f"[cyan]Starting subtitle merge for {video_path.name}...[/]")
-
-            try:
-                # Run ffmpeg - use silent flag to control ffmpeg output, not progress
-                subprocess.run(
-                    args,
-                    capture_output=params.silent,  # Only suppress ffmpeg output if silent
-                    text=True,
-                    check=True,
-                )
-
-                final_output_path = video_path.parent / merged_filename
-
-                # Handle existing file
-                if final_output_path.exists():
-                    if not params.prompt or Confirm.ask(
-                        f"File exists ({final_output_path}). Overwrite?",
-                        default=True,
-                    ):
-                        print(
-                            f"[yellow]Overwriting existing file: {final_output_path}[/]"
-                        )
-                        final_output_path.unlink()
-                        shutil.move(str(temp_output_path), str(final_output_path))
-                    else:
-                        print("[yellow]Merge cancelled: File not overwritten.[/]")
-                        return None
-                else:
-                    shutil.move(str(temp_output_path), str(final_output_path))
-
-                # Clean up original files if requested
-                if params.clean:
-                    print("[cyan]Cleaning original files...[/]")
-                    video_path.unlink()
-                    for sub_path in sub_paths:
-                        sub_path.unlink()
-
-                print(
-                    f"[green bold]Subtitles merged successfully.[/] Output: {final_output_path}"
-                )
-
-                return final_output_path
-
-            except subprocess.CalledProcessError as e:
-                error_msg = f"FFmpeg failed: {e.stderr if e.stderr else str(e)}"
-                logger.error(error_msg)
-                print(f"[red bold]Merge failed:[/] {error_msg}")
-                return None
-            except Exception as e:
-                error_msg = f"Unexpected error during merge: {e}"
-                logger.error(error_msg)
-                print(f"[red bold]Unexpected error:[/] {error_msg}")
-                return None
+        except DownloaderError as e:
+            logger.error(str(e))
+            print(f"[red bold]Merge failed:[/] {e}")
+            return None
+
+        if merged_path:
+            print(
+                f"[green bold]Subtitles merged successfully.[/] Output: {merged_path}"
+            )
+        else:
+            print("[yellow]Merge cancelled: File not overwritten.[/]")
+        return merged_path
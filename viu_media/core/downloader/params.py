@@ -8,6 +8,8 @@ class DownloadParams:
     anime_title: str
     episode_title: str
     silent: bool
+    # False when the caller renders progress itself through progress_hooks
+    show_progress: bool = True
     progress_hooks: list[Callable] = field(default_factory=list)
     vid_format: str = "best"
     force_unknown_ext: bool = False
@@ -0,0 +1,104 @@
+"""
+Post-processing steps that run after the bytes of a download are on disk.
+
+Steps write their output to a hidden temporary file in the destination
+directory and finish with an atomic rename, so a partial result is never
+visible under the final name and nothing is copied across filesystems.
+"""
+
+import itertools
+import logging
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+from ..exceptions import DownloaderError, ViuError
+from ..utils.profiling import timed
+
+logger = logging.getLogger(__name__)
+
+
+def temp_output_path(final_path: Path) -> Path:
+    """A hidden sibling of ``final_path`` to write to before renaming."""
+    return final_path.with_name(f".{final_path.stem}.part{final_path.suffix}")
+
+
+@timed(category="postprocess")
+def merge_subtitles(
+    video_path: Path,
+    sub_paths: List[Path],
+    silent: bool = True,
+    clean: bool = False,
+    overwrite: Union[bool, Callable[[Path], bool]] = True,
+) -> Optional[Path]:
+    """
+    Mux subtitle files into an mkv next to the video, copying all streams.
+
+    Args:
+        video_path: The downloaded video.
+        sub_paths: Subtitle files to add as subtitle streams.
+        silent: Hide ffmpeg's output.
+        clean: Delete the video and subtitle files after a successful merge.
+        overwrite: Whether an existing merged file may be replaced, or a
+            callback deciding it for the existing path.
+
+    Returns:
+        The merged file, or None when an existing file was kept.
+
+    Raises:
+        ViuError: If ffmpeg is not installed.
+        DownloaderError: If ffmpeg fails.
+    """
+    ffmpeg_executable = shutil.which("ffmpeg")
+    if not ffmpeg_executable:
+        raise ViuError("Please install ffmpeg in order to merge subtitles")
+
+    final_output_path = video_path.with_suffix(".mkv")
+    # an mkv input is replaced by its merged version, which is always wanted
+    if final_output_path != video_path and final_output_path.exists():
+        allowed = overwrite(final_output_path) if callable(overwrite) else overwrite
+        if not allowed:
+            return None
+
+    subs_input_args = list(
+        itertools.chain.from_iterable([["-i", str(sub_path)] for sub_path in sub_paths])
+    )
+    temp_path = temp_output_path(final_output_path)
+    args = [
+        ffmpeg_executable,
+        "-hide_banner",
+        "-y",
+        "-i",
+        str(video_path),  # Main video input
+        *subs_input_args,  # All subtitle inputs
+        "-c",
+        "copy",  # Copy streams without re-encoding
+        "-map",
+        "0:v",  # Map video from first input
+        "-map",
+        "0:a",  # Map audio from first input
+    ]
+    # Map subtitle streams from each subtitle input
+    for i in range(len(sub_paths)):
+        args.extend(["-map", f"{i + 1}:s"])
+    args.append(str(temp_path))
+
+    try:
+        subprocess.run(args, capture_output=silent, text=True, check=True)
+        os.replace(temp_path, final_output_path)
+    except subprocess.CalledProcessError as e:
+        raise DownloaderError(
+            f"FFmpeg failed: {e.stderr if e.stderr else str(e)}"
+        ) from e
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+    if clean:
+        for path in [video_path, *sub_paths]:
+            if path != final_output_path:
+                path.unlink(missing_ok=True)
+
+    logger.info(f"Merged {len(sub_paths)} subtitles into {final_output_path}")
+    return final_output_path
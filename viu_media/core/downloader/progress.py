@@ -0,0 +1,108 @@
+"""Sampled progress reporting for downloads."""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.progress import Progress, TaskID
+
+from ..exceptions import DownloadCancelled
+
+logger = logging.getLogger(__name__)
+
+# progress consumers are refreshed at most this often (10 Hz)
+SAMPLE_INTERVAL = 0.1
+
+
+class ProgressAggregator:
+    """
+    Counts transferred bytes and reports them to a rich progress bar and to
+    progress hooks at a fixed sample rate instead of once per chunk.
+
+    ``advance`` is cheap enough to call for every chunk: it only bumps a
+    counter and compares the clock against the next sample time. Exceptions
+    raised by hooks are logged, except ``DownloadCancelled`` which propagates
+    to stop the transfer.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        total_bytes: int = 0,
+        hooks: Optional[List[Callable[[Dict[str, Any]], Any]]] = None,
+        progress: Optional[Progress] = None,
+        task_id: Optional[TaskID] = None,
+        interval: float = SAMPLE_INTERVAL,
+    ):
+        self.filename = filename
+        self.total_bytes = total_bytes
+        self.downloaded_bytes = 0
+        self.hooks = hooks or []
+        self.progress = progress
+        self.task_id = task_id
+        self.interval = interval
+        self._started_at = time.monotonic()
+        self._next_sample = self._started_at + interval
+        self._last_sample_at = self._started_at
+        self._last_sample_bytes = 0
+        # bytes per second over the last sample period
+        self.rate = 0.0
+
+    def advance(self, size: int) -> None:
+        self.downloaded_bytes += size
+        now = time.monotonic()
+        if now >= self._next_sample:
+            self._sample(now)
+
+    def finish(self) -> None:
+        """Report the final byte count with status "finished"."""
+        self._sample(time.monotonic())
+        self._call_hooks(
+            {
+                "downloaded_bytes": self.downloaded_bytes,
+                "total_bytes": self.total_bytes or self.downloaded_bytes,
+                "filename": self.filename,
+                "status": "finished",
+            }
+        )
+
+    def fail(self, error: Exception) -> None:
+        self._call_hooks(
+            {
+                "downloaded_bytes": self.downloaded_bytes,
+                "total_bytes": self.total_bytes,
+                "filename": self.filename,
+                "status": "error",
+                "error": str(error),
+            }
+        )
+
+    def _sample(self, now: float) -> None:
+        elapsed = now - self._last_sample_at
+        if elapsed > 0:
+            self.rate = (self.downloaded_bytes - self._last_sample_bytes) / elapsed
+        self._last_sample_at = now
+        self._last_sample_bytes = self.downloaded_bytes
+        self._next_sample = now + self.interval
+
+        if self.progress is not None and self.task_id is not None:
+            self.progress.update(self.task_id, completed=self.downloaded_bytes)
+        self._call_hooks(
+            {
+                "downloaded_bytes": self.downloaded_bytes,
+                "total_bytes": self.total_bytes,
+                "filename": self.filename,
+                "status": "downloading",
+                "speed": self.rate,
+                "elapsed": now - self._started_at,
+            }
+        )
+
+    def _call_hooks(self, info: Dict[str, Any]) -> None:
+        for hook in self.hooks:
+            try:
+                hook(info)
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                logger.warning(f"Progress hook failed: {e}")
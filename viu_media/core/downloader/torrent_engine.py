@@ -0,0 +1,728 @@
+"""
+A long-lived libtorrent session shared by every torrent viu downloads or streams.
+
+One session per process holds all torrents, so several can download at once
+over one DHT node and one set of peer connections. A single thread consumes
+libtorrent's alerts and wakes the threads waiting on a torrent as soon as its
+state changes; nothing polls ``handle.status()``.
+
+Fast-resume data is written next to the registry whenever a torrent finishes,
+is released, or periodically while it downloads. Adding the same torrent again
+later, even after a restart, continues from that data instead of rechecking
+or downloading from scratch.
+
+Streams are served over a local HTTP server with range support. A read waits
+for the pieces it covers, and those pieces and a read-ahead window get piece
+deadlines, so playback can start long before the torrent completes.
+"""
+
+import atexit
+import logging
+import mimetypes
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+from ..config import defaults
+from ..constants import APP_CACHE_DIR
+from ..utils.file import AtomicWriter
+from .torrents import LIBTORRENT_AVAILABLE, TorrentDownloadError, lt
+
+logger = logging.getLogger(__name__)
+
+TORRENT_STREAM_DIR = APP_CACHE_DIR / "torrent-streams"
+# the alert thread wakes at least this often to request status updates
+STATUS_UPDATE_INTERVAL = 0.5
+RESUME_SAVE_INTERVAL = 60.0
+METADATA_TIMEOUT = 120.0
+TORRENT_FILE_TIMEOUT = 30.0
+# how far ahead of a stream's read position pieces get deadlines
+STREAM_READAHEAD_BYTES = 16 * 1024 * 1024
+MIN_READAHEAD_PIECES = 4
+# deadline of the n-th piece ahead of the read position is n * this
+PIECE_DEADLINE_STEP_MS = 200
+STREAM_PIECE_TIMEOUT = 120.0
+STREAM_CHUNK_SIZE = 256 * 1024
+VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".webm", ".m4v", ".mov", ".ts"}
+
+_RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def _hash_key(info_hashes: Any) -> str:
+    """A stable key for a torrent, the same for its magnet and its metadata."""
+    if hasattr(info_hashes, "has_v1"):
+        # libtorrent 2: prefer the v1 hash, which magnet links of hybrid
+        # torrents carry as well
+        return str(info_hashes.v1 if info_hashes.has_v1() else info_hashes.v2)
+    return str(info_hashes)
+
+
+def _handle_key(handle: Any) -> str:
+    if hasattr(handle, "info_hashes"):
+        return _hash_key(handle.info_hashes())
+    return _hash_key(handle.info_hash())
+
+
+def _params_key(params: Any) -> str:
+    if params.ti is not None:
+        ti = params.ti
+        return _hash_key(
+            ti.info_hashes() if hasattr(ti, "info_hashes") else ti.info_hash()
+        )
+    if hasattr(params, "info_hashes"):
+        return _hash_key(params.info_hashes)
+    return _hash_key(params.info_hash)
+
+
+class TorrentJob:
+    """A torrent in the engine's session, shared by everyone who added it."""
+
+    def __init__(self, engine: "TorrentEngine", key: str, handle: Any, save_path: Path):
+        self.engine = engine
+        self.key = key
+        self.handle = handle
+        self.save_path = save_path
+        self.refs = 1
+        self.progress: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self._cond = threading.Condition()
+        self._version = 0
+        self._finished = False
+        self._has_metadata = handle.torrent_file() is not None
+        self._pieces: Set[int] = set()
+        self._releasing = False
+        # set once a download joins; streams then leave the file priorities alone
+        self.wants_all_files = False
+
+    @property
+    def name(self) -> str:
+        return self.handle.name()
+
+    @property
+    def content_path(self) -> Path:
+        return self.save_path / self.name
+
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Path:
+        """
+        Block until the torrent has finished downloading.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely.
+            on_progress: Called in the waiting thread on every status update.
+                Exceptions it raises propagate, e.g. to cancel the download.
+
+        Returns:
+            The path of the downloaded content.
+
+        Raises:
+            TorrentDownloadError: If the torrent fails or the timeout passes.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        seen = 0
+        while True:
+            with self._cond:
+                while not (self._finished or self.error) and self._version == seen:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TorrentDownloadError(
+                            f"Download timeout after {timeout} seconds"
+                        )
+                    self._cond.wait(remaining)
+                if self.error:
+                    raise TorrentDownloadError(f"Torrent error: {self.error}")
+                seen = self._version
+                progress = dict(self.progress)
+                finished = self._finished
+            if on_progress and progress:
+                on_progress(progress)
+            if finished:
+                return self.content_path
+
+    def wait_for_metadata(self, timeout: float = METADATA_TIMEOUT) -> Any:
+        """The torrent's info, waiting for it if it was added from a magnet link."""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._has_metadata or self.error, timeout
+            ):
+                raise TorrentDownloadError(
+                    f"No metadata received for {self.key} within {timeout} seconds"
+                )
+            if self.error:
+                raise TorrentDownloadError(f"Torrent error: {self.error}")
+        return self.handle.torrent_file()
+
+    def wait_for_piece(self, piece: int, timeout: float = STREAM_PIECE_TIMEOUT):
+        """
+        Block until a piece has been downloaded and verified.
+
+        The piece gets a deadline of zero, which is renewed while waiting in
+        case a seek elsewhere in the stream cleared it.
+        """
+        if piece in self._pieces or self.handle.have_piece(piece):
+            return
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while piece not in self._pieces:
+                if self.error:
+                    raise TorrentDownloadError(f"Torrent error: {self.error}")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TorrentDownloadError(
+                        f"Piece {piece} of {self.name} did not arrive within {timeout} seconds"
+                    )
+                self.handle.set_piece_deadline(piece, 0)
+                self._cond.wait(min(remaining, 1.0))
+
+    def prioritize(self, first_piece: int, last_piece: int, count: int):
+        """Give the next ``count`` missing pieces from ``first_piece`` on deadlines."""
+        step = 0
+        for piece in range(first_piece, min(first_piece + count, last_piece + 1)):
+            if piece in self._pieces:
+                continue
+            self.handle.set_piece_deadline(piece, step * PIECE_DEADLINE_STEP_MS)
+            step += 1
+
+    def _notify(self, **changes: Any):
+        with self._cond:
+            for name, value in changes.items():
+                setattr(self, name, value)
+            self._version += 1
+            self._cond.notify_all()
+
+    def _piece_finished(self, piece: int):
+        with self._cond:
+            self._pieces.add(piece)
+            self._cond.notify_all()
+
+
+@dataclass
+class TorrentFileStream:
+    """One file of a torrent, served to a player as it downloads."""
+
+    job: TorrentJob
+    file_index: int
+    # relative to the job's save path, which moves if a download joins
+    file_path: str
+    size: int
+    # offset of the file within the torrent's concatenated content
+    offset: int
+    piece_length: int
+    last_piece: int
+
+    @property
+    def path(self) -> Path:
+        return self.job.save_path / self.file_path
+
+    @property
+    def url_path(self) -> str:
+        return f"/{self.job.key}/{self.file_index}"
+
+    def piece_at(self, position: int) -> int:
+        return (self.offset + position) // self.piece_length
+
+    def read(self, start: int, stop: int) -> Iterator[bytes]:
+        """Yield bytes ``start`` to ``stop`` of the file as their pieces arrive."""
+        readahead = max(
+            MIN_READAHEAD_PIECES, STREAM_READAHEAD_BYTES // self.piece_length
+        )
+        # a new read is usually a seek; drop the deadlines of the old position
+        self.job.handle.clear_piece_deadlines()
+        position = start
+        file = None
+        try:
+            while position < stop:
+                piece = self.piece_at(position)
+                self.job.prioritize(piece, self.last_piece, readahead)
+                self.job.wait_for_piece(piece)
+                piece_end = (piece + 1) * self.piece_length - self.offset
+                size = min(stop, piece_end) - position
+                if file is None:
+                    # unbuffered: read-ahead would cache pieces not yet written
+                    file = self.path.open("rb", buffering=0)
+                file.seek(position)
+                while size > 0:
+                    chunk = file.read(min(size, STREAM_CHUNK_SIZE))
+                    if not chunk:
+                        raise TorrentDownloadError(
+                            f"{self.path} is shorter than its downloaded pieces"
+                        )
+                    size -= len(chunk)
+                    position += len(chunk)
+                    yield chunk
+        finally:
+            if file is not None:
+                file.close()
+
+
+class _StreamRequestHandler(BaseHTTPRequestHandler):
+    server: "_StreamServer"
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def log_message(self, format: str, *args: Any):
+        logger.debug(f"Torrent stream: {format % args}")
+
+    def _serve(self, send_body: bool):
+        stream = self.server.streams.get(self.path)
+        if stream is None:
+            self.send_error(404)
+            return
+
+        start, stop = 0, stream.size
+        partial = False
+        if match := _RANGE_PATTERN.match(self.headers.get("Range", "")):
+            first, last = match.groups()
+            if first:
+                start = int(first)
+                if last:
+                    stop = min(int(last) + 1, stream.size)
+            elif last:
+                start = max(0, stream.size - int(last))
+            partial = True
+            if start >= stream.size or start >= stop:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{stream.size}")
+                self.end_headers()
+                return
+
+        self.send_response(206 if partial else 200)
+        content_type = mimetypes.guess_type(stream.path.name)[0]
+        self.send_header("Content-Type", content_type or "application/octet-stream")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(stop - start))
+        if partial:
+            self.send_header("Content-Range", f"bytes {start}-{stop - 1}/{stream.size}")
+        self.end_headers()
+        if not send_body:
+            return
+        try:
+            for chunk in stream.read(start, stop):
+                self.wfile.write(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the player seeked or closed
+        except TorrentDownloadError as e:
+            logger.warning(f"Torrent stream of {stream.path.name} stopped: {e}")
+
+
+class _StreamServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StreamRequestHandler)
+        self.streams: Dict[str, TorrentFileStream] = {}
+
+    def url(self, stream: TorrentFileStream) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{stream.url_path}"
+
+
+class TorrentEngine:
+    """One libtorrent session and the thread that consumes its alerts."""
+
+    def __init__(self, resume_dir: Path, settings: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            resume_dir: Directory of the fast-resume files.
+            settings: libtorrent settings applied on top of viu's defaults.
+        """
+        if not LIBTORRENT_AVAILABLE or lt is None:
+            raise TorrentDownloadError("libtorrent is not available")
+        self.resume_dir = resume_dir
+        self.resume_dir.mkdir(parents=True, exist_ok=True)
+        self._session = lt.session(
+            {
+                "user_agent": "Viu/1.0",
+                "listen_interfaces": "0.0.0.0:6881",
+                "enable_outgoing_utp": True,
+                "enable_incoming_utp": True,
+                "enable_outgoing_tcp": True,
+                "enable_incoming_tcp": True,
+                "dht_bootstrap_nodes": "dht.transmissionbt.com:6881,router.bittorrent.com:6881,router.utorrent.com:6881",
+                "alert_mask": (
+                    lt.alert.category_t.status_notification
+                    | lt.alert.category_t.error_notification
+                    | lt.alert.category_t.storage_notification
+                    | lt.alert.category_t.piece_progress_notification
+                ),
+                **(settings or {}),
+            }
+        )
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, TorrentJob] = {}
+        self._pending_resume_saves = 0
+        self._resume_saved = threading.Condition(self._lock)
+        self._stream_server: Optional[_StreamServer] = None
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="TorrentEngine", daemon=True
+        )
+        self._thread.start()
+        logger.info("Torrent engine started")
+
+    def add(
+        self,
+        source: str,
+        save_path: Path,
+        sequential: bool = False,
+        streaming: bool = False,
+    ) -> TorrentJob:
+        """
+        Add a torrent, or join it if it is already in the session.
+
+        Every `add` must be paired with a `release`.
+
+        Args:
+            source: Magnet link, torrent file URL, or local torrent file path.
+            save_path: Directory to download the content to.
+            sequential: Download pieces in order.
+            streaming: Only one file is wanted, see `stream`. A download
+                joining a streamed torrent moves it to its own save path and
+                wants every file again.
+        """
+        params = self._add_torrent_params(source)
+        key = _params_key(params)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                job.refs += 1
+                job._releasing = False
+                if sequential:
+                    job.handle.set_flags(lt.torrent_flags.sequential_download)
+                if not streaming and not job.wants_all_files:
+                    self._want_all_files(job, save_path)
+                return job
+
+            resume_file = self._resume_file(key)
+            if resume_file.exists():
+                try:
+                    resumed = lt.read_resume_data(resume_file.read_bytes())
+                    if resumed.ti is None:
+                        resumed.ti = params.ti
+                    params = resumed
+                    logger.info(f"Resuming torrent {key} from {resume_file}")
+                except Exception as e:
+                    logger.warning(
+                        f"Ignoring unreadable resume data {resume_file}: {e}"
+                    )
+            save_path.mkdir(parents=True, exist_ok=True)
+            params.save_path = str(save_path)
+            if sequential:
+                params.flags |= lt.torrent_flags.sequential_download
+            handle = self._session.add_torrent(params)
+            job = TorrentJob(self, key, handle, save_path)
+            job.wants_all_files = not streaming
+            self._jobs[key] = job
+        logger.info(f"Added torrent {key} to the session")
+        return job
+
+    def release(self, job: TorrentJob):
+        """
+        Drop one reference to a torrent.
+
+        When the last one goes, its resume data is saved and it leaves the
+        session; its files stay on disk.
+        """
+        with self._lock:
+            job.refs -= 1
+            if job.refs > 0:
+                return
+            job._releasing = True
+            self._save_resume_data(job)
+
+    @contextmanager
+    def stream(
+        self, source: str, save_path: Path = TORRENT_STREAM_DIR
+    ) -> Iterator[str]:
+        """
+        Serve the main video file of a torrent over local HTTP while it downloads.
+
+        Yields:
+            The URL to hand to the player.
+        """
+        job = self.add(source, save_path, sequential=True, streaming=True)
+        try:
+            file_stream = self._open_stream(job)
+            server = self._get_stream_server()
+            server.streams[file_stream.url_path] = file_stream
+            try:
+                yield server.url(file_stream)
+            finally:
+                server.streams.pop(file_stream.url_path, None)
+        finally:
+            self.release(job)
+
+    def close(self, timeout: float = 10.0):
+        """Save the resume data of every torrent and stop the session."""
+        if self._stopping.is_set():
+            return
+        with self._lock:
+            for job in self._jobs.values():
+                self._save_resume_data(job)
+            self._resume_saved.wait_for(
+                lambda: self._pending_resume_saves == 0, timeout
+            )
+        self._stopping.set()
+        self._thread.join(timeout)
+        if self._stream_server is not None:
+            self._stream_server.shutdown()
+            self._stream_server.server_close()
+        self._session.pause()
+        logger.info("Torrent engine stopped")
+
+    def _open_stream(self, job: TorrentJob) -> TorrentFileStream:
+        ti = job.wait_for_metadata()
+        files = ti.files()
+        indexes = range(files.num_files())
+        videos = [
+            i
+            for i in indexes
+            if Path(files.file_path(i)).suffix.lower() in VIDEO_EXTENSIONS
+        ]
+        file_index = max(videos or indexes, key=files.file_size)
+        with self._lock:
+            if not job.wants_all_files:
+                job.handle.prioritize_files(
+                    [4 if i == file_index else 0 for i in indexes]
+                )
+        file_stream = TorrentFileStream(
+            job=job,
+            file_index=file_index,
+            file_path=files.file_path(file_index),
+            size=files.file_size(file_index),
+            offset=files.file_offset(file_index),
+            piece_length=ti.piece_length(),
+            last_piece=0,
+        )
+        file_stream.last_piece = file_stream.piece_at(max(0, file_stream.size - 1))
+        # players read the head and then the container index at the end first
+        readahead = max(
+            MIN_READAHEAD_PIECES, STREAM_READAHEAD_BYTES // ti.piece_length()
+        )
+        job.prioritize(file_stream.piece_at(0), file_stream.last_piece, readahead)
+        job.handle.set_piece_deadline(file_stream.last_piece, 0)
+        logger.info(f"Streaming {files.file_path(file_index)} of {job.name}")
+        return file_stream
+
+    def _want_all_files(self, job: TorrentJob, save_path: Path):
+        """
+        Undo what streaming did to a torrent a download joins.
+
+        The content moves from the stream cache to the download's save path
+        and the files the stream skipped get their priority back. Called with
+        the lock held.
+        """
+        job.wants_all_files = True
+        if job.save_path != save_path:
+            save_path.mkdir(parents=True, exist_ok=True)
+            job.handle.move_storage(str(save_path))
+            job.save_path = save_path
+            logger.info(f"Moving torrent {job.key} to {save_path}")
+
+        ti = job.handle.torrent_file()
+        if ti is None:
+            # streams only skip files once the metadata has arrived
+            return
+        files = ti.files()
+        skipped = [
+            i
+            for i, priority in enumerate(job.handle.get_file_priorities())
+            if not priority
+        ]
+        if not skipped:
+            return
+        job.handle.prioritize_files([4] * files.num_files())
+        file_progress = job.handle.file_progress()
+        if any(file_progress[i] < files.file_size(i) for i in skipped):
+            # finishing the streamed file alone finished the torrent
+            job._notify(_finished=False)
+
+    def _get_stream_server(self) -> _StreamServer:
+        with self._lock:
+            if self._stream_server is None:
+                self._stream_server = _StreamServer()
+                threading.Thread(
+                    target=self._stream_server.serve_forever,
+                    name="TorrentStreamServer",
+                    daemon=True,
+                ).start()
+            return self._stream_server
+
+    def _add_torrent_params(self, source: str) -> Any:
+        if source.startswith("magnet:"):
+            return lt.parse_magnet_uri(source)
+
+        params = lt.add_torrent_params()
+        if source.startswith(("http://", "https://")):
+            params.ti = lt.torrent_info(lt.bdecode(self._fetch_torrent_file(source)))
+        else:
+            torrent_path = Path(source)
+            if not torrent_path.exists():
+                raise TorrentDownloadError(f"Torrent file not found: {source}")
+            params.ti = lt.torrent_info(str(torrent_path))
+        return params
+
+    @staticmethod
+    def _fetch_torrent_file(url: str) -> bytes:
+        import httpx
+
+        from ..utils.http_client import create_client
+
+        try:
+            with create_client("download", follow_redirects=True) as client:
+                response = client.get(url, timeout=TORRENT_FILE_TIMEOUT)
+                response.raise_for_status()
+                return response.content
+        except httpx.HTTPError as e:
+            raise TorrentDownloadError(
+                f"Failed to fetch torrent file {url}: {e}"
+            ) from e
+
+    def _resume_file(self, key: str) -> Path:
+        return self.resume_dir / f"{key}.fastresume"
+
+    def _save_resume_data(self, job: TorrentJob, only_if_modified: bool = False):
+        # called with self._lock held
+        flags = lt.save_resume_flags_t.save_info_dict
+        if only_if_modified and hasattr(lt.save_resume_flags_t, "only_if_modified"):
+            flags |= lt.save_resume_flags_t.only_if_modified
+        self._pending_resume_saves += 1
+        job.handle.save_resume_data(flags)
+
+    def _run(self):
+        next_status_update = 0.0
+        next_resume_save = time.monotonic() + RESUME_SAVE_INTERVAL
+        while not self._stopping.is_set():
+            now = time.monotonic()
+            if now >= next_status_update:
+                self._session.post_torrent_updates()
+                next_status_update = now + STATUS_UPDATE_INTERVAL
+            if now >= next_resume_save:
+                with self._lock:
+                    for job in self._jobs.values():
+                        if not job._finished:
+                            self._save_resume_data(job, only_if_modified=True)
+                next_resume_save = now + RESUME_SAVE_INTERVAL
+
+            wait_ms = max(1, int((next_status_update - time.monotonic()) * 1000))
+            self._session.wait_for_alert(wait_ms)
+            for alert in self._session.pop_alerts():
+                try:
+                    self._handle_alert(alert)
+                except Exception:
+                    logger.exception(f"Failed to handle torrent alert {alert.what()}")
+
+    def _handle_alert(self, alert: Any):
+        if isinstance(alert, lt.state_update_alert):
+            for status in alert.status:
+                job = self._jobs.get(_handle_key(status.handle))
+                if job is not None:
+                    self._update_progress(job, status)
+            return
+
+        if isinstance(
+            alert, (lt.save_resume_data_alert, lt.save_resume_data_failed_alert)
+        ):
+            self._resume_data_saved(alert)
+            return
+
+        handle = getattr(alert, "handle", None)
+        job = None
+        if handle is not None and handle.is_valid():
+            job = self._jobs.get(_handle_key(handle))
+        if job is None:
+            if isinstance(alert, lt.listen_failed_alert):
+                logger.warning(f"Torrent engine: {alert.message()}")
+            return
+
+        if isinstance(alert, lt.piece_finished_alert):
+            job._piece_finished(int(alert.piece_index))
+        elif isinstance(alert, lt.metadata_received_alert):
+            job._notify(_has_metadata=True)
+        elif isinstance(alert, lt.torrent_finished_alert):
+            self._finished(job)
+        elif isinstance(alert, lt.torrent_error_alert):
+            logger.error(f"Torrent {job.key} failed: {alert.message()}")
+            job._notify(error=alert.message())
+
+    def _update_progress(self, job: TorrentJob, status: Any):
+        progress = {
+            "name": status.name,
+            "progress": status.progress * 100,
+            "download_rate": status.download_rate / 1024,  # KB/s
+            "upload_rate": status.upload_rate / 1024,  # KB/s
+            "num_peers": status.num_peers,
+            "total_size": status.total_wanted,
+            "downloaded": status.total_wanted_done,
+            "state": str(status.state),
+        }
+        job._notify(progress=progress)
+        if status.is_finished and not job._finished:
+            self._finished(job)
+
+    def _finished(self, job: TorrentJob):
+        if job._finished:
+            return
+        logger.info(f"Torrent download completed: {job.content_path}")
+        job._notify(_finished=True)
+        with self._lock:
+            self._save_resume_data(job)
+
+    def _resume_data_saved(self, alert: Any):
+        key = _handle_key(alert.handle)
+        if isinstance(alert, lt.save_resume_data_alert):
+            if hasattr(lt, "write_resume_data_buf"):
+                data = lt.write_resume_data_buf(alert.params)
+            else:
+                data = lt.bencode(alert.resume_data)
+            with AtomicWriter(self._resume_file(key), mode="wb", encoding=None) as f:
+                f.write(data)
+        else:
+            logger.debug(f"No resume data saved for {key}: {alert.message()}")
+
+        with self._lock:
+            self._pending_resume_saves -= 1
+            self._resume_saved.notify_all()
+            job = self._jobs.get(key)
+            if job is not None and job._releasing and job.refs <= 0:
+                del self._jobs[key]
+                self._session.remove_torrent(job.handle)
+                logger.info(f"Removed torrent {key} from the session")
+
+
+_engine: Optional[TorrentEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_torrent_engine(
+    resume_dir: Optional[Path] = None, settings: Optional[Dict[str, Any]] = None
+) -> TorrentEngine:
+    """
+    The process-wide torrent engine, started on first use.
+
+    The arguments only take effect on the call that starts it.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = TorrentEngine(
+                resume_dir or defaults.MEDIA_REGISTRY_DIR / "torrents", settings
+            )
+            atexit.register(_engine.close)
+        return _engine
@@ -1,12 +1,11 @@
 import logging
 import shutil
 import subprocess
-import tempfile
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable
+from typing import Any, Callable, Dict, Optional
 
-from ..exceptions import ViuError, DependencyNotFoundError
+from ..exceptions import DependencyNotFoundError, DownloadCancelled, ViuError
 
 try:
     import libtorrent as lt
@@ -39,6 +38,7 @@ class TorrentDownloader:
         max_connections: int = 200,
         listen_port: int = 6881,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        resume_dir: Optional[Path] = None,
     ):
         """
         Initialize the torrent downloader.
@@ -50,6 +50,8 @@ class TorrentDownloader:
             max_connections: Maximum number of connections
             listen_port: Port to listen on for incoming connections
             progress_callback: Optional callback function for download progress updates
+            resume_dir: Directory of libtorrent's fast-resume data; only used by
+                the call that starts the shared torrent engine
         """
         self.download_path = Path(download_path)
         self.download_path.mkdir(parents=True, exist_ok=True)
@@ -58,75 +60,40 @@ class TorrentDownloader:
         self.max_connections = max_connections
         self.listen_port = listen_port
         self.progress_callback = progress_callback
-        self.session: Optional[Any] = None
-
-    def _setup_libtorrent_session(self) -> Any:
-        """Setup and configure libtorrent session."""
-        if not LIBTORRENT_AVAILABLE or lt is None:
-            raise DependencyNotFoundError("libtorrent is not available")
-
-        session = lt.session()  # type: ignore
-
-        # Configure session settings
-        settings = {
-            "user_agent": "Viu/1.0",
-            "listen_interfaces": f"0.0.0.0:{self.listen_port}",
-            "enable_outgoing_utp": True,
-            "enable_incoming_utp": True,
-            "enable_outgoing_tcp": True,
-            "enable_incoming_tcp": True,
-            "connections_limit": self.max_connections,
-            "dht_bootstrap_nodes": "dht.transmissionbt.com:6881",
-        }
-
-        if self.max_upload_rate > 0:
-            settings["upload_rate_limit"] = self.max_upload_rate * 1024
-        if self.max_download_rate > 0:
-            settings["download_rate_limit"] = self.max_download_rate * 1024
-
-        session.apply_settings(settings)
-
-        # Start DHT
-        session.start_dht()
-
-        # Add trackers
-        session.add_dht_router("router.bittorrent.com", 6881)
-        session.add_dht_router("router.utorrent.com", 6881)
-
-        logger.info("Libtorrent session configured successfully")
-        return session
-
-    def _get_torrent_info(self, torrent_source: str) -> Any:
-        """Get torrent info from magnet link or torrent file."""
-        if not LIBTORRENT_AVAILABLE or lt is None:
-            raise DependencyNotFoundError("libtorrent is not available")
-
-        if torrent_source.startswith("magnet:"):
-            # Parse magnet link
-            return lt.parse_magnet_uri(torrent_source)  # type: ignore
-        elif torrent_source.startswith(("http://", "https://")):
-            # Download torrent file
-            import urllib.request
-
-            with tempfile.NamedTemporaryFile(
-                suffix=".torrent", delete=False
-            ) as tmp_file:
-                urllib.request.urlretrieve(torrent_source, tmp_file.name)
-                torrent_info = lt.torrent_info(tmp_file.name)  # type: ignore
-                Path(tmp_file.name).unlink()  # Clean up temp file
-                return {"ti": torrent_info}
-        else:
-            # Local torrent file
-            torrent_path = Path(torrent_source)
-            if not torrent_path.exists():
-                raise TorrentDownloadError(f"Torrent file not found: {torrent_source}")
-            return {"ti": lt.torrent_info(str(torrent_path))}  # type: ignore
+        self.resume_dir = resume_dir
+        self._last_log_time = 0.0
+
+    def _session_settings(self) -> Dict[str, Any]:
+        return session_settings(
+            self.max_upload_rate,
+            self.max_download_rate,
+            self.max_connections,
+            self.listen_port,
+        )
+
+    def _report_progress(self, progress_info: Dict[str, Any]):
+        if self.progress_callback:
+            self.progress_callback(progress_info)
+
+        # Log progress periodically (every 10 seconds)
+        current_time = time.time()
+        if current_time - self._last_log_time >= 10:
+            logger.info(
+                f"Download progress: {progress_info['progress']:.1f}% "
+                f"({progress_info['download_rate']:.1f} KB/s) "
+                f"- {progress_info['num_peers']} peers"
+            )
+            self._last_log_time = current_time
 
     def download_with_libtorrent(
         self, torrent_source: str, timeout: int = 3600, sequential: bool = False
     ) -> Path:
         """
-        Download torrent using libtorrent.
+        Download torrent using the shared libtorrent engine.
+
+        The torrent leaves the engine's session once it completes, fails or
+        times out; its resume data is kept, so a later attempt continues
+        where this one stopped.
 
         Args:
             torrent_source: Magnet link, torrent file URL, or local torrent file path
@@ -145,87 +112,24 @@ class TorrentDownloader:
                 "libtorrent is not available. Please install python-libtorrent: "
                 "pip install python-libtorrent"
             )
+        from .torrent_engine import get_torrent_engine
 
         try:
-            self.session = self._setup_libtorrent_session()
-            torrent_params = self._get_torrent_info(torrent_source)
-
-            # Set save path
-            torrent_params["save_path"] = str(self.download_path)
-
-            if sequential and lt is not None:
-                torrent_params["flags"] = lt.torrent_flags.sequential_download  # type: ignore
-
-            # Add torrent to session
-            if self.session is None:
-                raise TorrentDownloadError("Session is not initialized")
-            handle = self.session.add_torrent(torrent_params)
-
-            logger.info(f"Starting torrent download: {handle.name()}")
-
-            # Monitor download progress
-            start_time = time.time()
-            last_log_time = start_time
-            while not handle.is_seed():
-                current_time = time.time()
-
-                # Check timeout
-                if current_time - start_time > timeout:
-                    raise TorrentDownloadError(
-                        f"Download timeout after {timeout} seconds"
-                    )
-
-                status = handle.status()
-
-                # Prepare progress info
-                progress_info = {
-                    "name": handle.name(),
-                    "progress": status.progress * 100,
-                    "download_rate": status.download_rate / 1024,  # KB/s
-                    "upload_rate": status.upload_rate / 1024,  # KB/s
-                    "num_peers": status.num_peers,
-                    "total_size": status.total_wanted,
-                    "downloaded": status.total_wanted_done,
-                    "state": str(status.state),
-                }
-
-                # Call progress callback if provided
-                if self.progress_callback:
-                    self.progress_callback(progress_info)
-
-                # Log progress periodically (every 10 seconds)
-                if current_time - last_log_time >= 10:
-                    logger.info(
-                        f"Download progress: {progress_info['progress']:.1f}% "
-                        f"({progress_info['download_rate']:.1f} KB/s) "
-                        f"- {progress_info['num_peers']} peers"
-                    )
-                    last_log_time = current_time
-
-                # Check for errors
-                if status.error:
-                    raise TorrentDownloadError(f"Torrent error: {status.error}")
-
-                time.sleep(1)
-
-            # Download completed
-            download_path = self.download_path / handle.name()
-            logger.info(f"Torrent download completed: {download_path}")
-
-            # Remove torrent from session
-            if self.session is not None:
-                self.session.remove_torrent(handle)
-
-            return download_path
-
+            engine = get_torrent_engine(self.resume_dir, self._session_settings())
+            job = engine.add(torrent_source, self.download_path, sequential)
+        except TorrentDownloadError:
+            raise
         except Exception as e:
-            if isinstance(e, (TorrentDownloadError, DependencyNotFoundError)):
-                raise
             raise TorrentDownloadError(f"Failed to download torrent: {str(e)}") from e
+
+        logger.info(f"Starting torrent download: {job.key}")
+        self._last_log_time = time.time()
+        try:
+            download_path = job.wait(timeout, on_progress=self._report_progress)
         finally:
-            if self.session:
-                # Clean up session
-                self.session = None
+            engine.release(job)
+        logger.info(f"Torrent download completed: {download_path}")
+        return download_path
 
     def download_with_webtorrent_cli(self, torrent_source: str) -> Path:
         """
@@ -349,6 +253,8 @@ class TorrentDownloader:
                     return method_func(torrent_source, **kwargs)
                 else:
                     return method_func(torrent_source)
+            except DownloadCancelled:
+                raise
             except DependencyNotFoundError as e:
                 logger.warning(f"{method_name} not available: {e}")
                 last_exception = e
@@ -364,6 +270,60 @@ class TorrentDownloader:
         ) from last_exception
 
 
+def session_settings(
+    max_upload_rate: int = -1,
+    max_download_rate: int = -1,
+    max_connections: int = 200,
+    listen_port: int = 6881,
+) -> Dict[str, Any]:
+    """
+    libtorrent settings for the shared torrent engine.
+
+    The defaults match TorrentDownloader's, so streaming and downloading start
+    the engine the same way. Rates are in KB/s, -1 meaning unlimited.
+    """
+    settings: Dict[str, Any] = {
+        "listen_interfaces": f"0.0.0.0:{listen_port}",
+        "connections_limit": max_connections,
+    }
+    if max_upload_rate > 0:
+        settings["upload_rate_limit"] = max_upload_rate * 1024
+    if max_download_rate > 0:
+        settings["download_rate_limit"] = max_download_rate * 1024
+    return settings
+
+
+def download_torrent(
+    url: str,
+    dest_dir: Path,
+    resume_dir: Optional[Path] = None,
+    progress_hooks: Optional[list[Callable[[Dict[str, Any]], Any]]] = None,
+) -> Path:
+    """
+    Download a torrent with libtorrent if available, else with webtorrent CLI.
+
+    Progress is reported to the hooks in the same form as other downloads.
+    """
+    hooks = progress_hooks or []
+
+    def report(progress_info: Dict[str, Any]):
+        for hook in hooks:
+            hook(
+                {
+                    "downloaded_bytes": progress_info["downloaded"],
+                    "total_bytes": progress_info["total_size"],
+                    "filename": progress_info["name"],
+                    "status": "downloading",
+                    "speed": progress_info["download_rate"] * 1024,
+                }
+            )
+
+    downloader = TorrentDownloader(
+        download_path=dest_dir, progress_callback=report, resume_dir=resume_dir
+    )
+    return downloader.download(url)
+
+
 def download_torrent_with_webtorrent_cli(path: Path, url: str) -> Path:
     """
     Legacy function for backward compatibility.
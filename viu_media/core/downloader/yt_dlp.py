@@ -1,8 +1,5 @@
-import itertools
 import logging
 import shutil
-import subprocess
-import tempfile
 from pathlib import Path
 
 import httpx
@@ -12,17 +9,20 @@ from rich.prompt import Confirm
 import yt_dlp
 from yt_dlp.utils import sanitize_filename
 
-from ..exceptions import ViuError
+from ..exceptions import DownloaderError, ViuError
 from ..patterns import TORRENT_REGEX
 from ..utils.networking import get_remote_filename
+from ..utils.profiling import timed
 from .base import BaseDownloader
 from .model import DownloadResult
 from .params import DownloadParams
+from .postprocess import merge_subtitles
 
 logger = logging.getLogger(__name__)
 
 
 class YtDLPDownloader(BaseDownloader):
+    @timed(category="download")
     def download(self, params: DownloadParams) -> DownloadResult:
         """Download video and optionally subtitles, returning detailed results."""
         try:
@@ -31,16 +31,17 @@ class YtDLPDownloader(BaseDownloader):
             merged_path = None
 
             if TORRENT_REGEX.match(params.url):
-                from .torrents import download_torrent_with_webtorrent_cli
+                from .torrents import download_torrent
 
                 anime_title = sanitize_filename(params.anime_title)
-                episode_title = sanitize_filename(params.episode_title)
                 dest_dir = self.config.downloads_dir / anime_title
                 dest_dir.mkdir(parents=True, exist_ok=True)
 
-                video_path = dest_dir / episode_title
-                video_path = download_torrent_with_webtorrent_cli(
-                    video_path, params.url
+                video_path = download_torrent(
+                    params.url,
+                    dest_dir,
+                    resume_dir=self.config.torrent_resume_path,
+                    progress_hooks=params.progress_hooks,
                 )
             else:
                 video_path = self._download_video(params)
@@ -77,6 +78,7 @@ class YtDLPDownloader(BaseDownloader):
                 episode_title=params.episode_title,
             )
 
+    @timed(category="download")
     def _download_video(self, params: DownloadParams) -> Path:
         anime_title = sanitize_filename(params.anime_title)
         episode_title = sanitize_filename(params.episode_title)
@@ -90,6 +92,9 @@ class YtDLPDownloader(BaseDownloader):
             if params.force_unknown_ext
             else tuple(),
             "progress_hooks": params.progress_hooks,
+            # the caller renders progress through the hooks
+            "noprogress": not params.show_progress,
+            "quiet": not params.show_progress,
             "nocheckcertificate": params.no_check_certificate,
         }
         opts = opts
@@ -146,6 +151,7 @@ class YtDLPDownloader(BaseDownloader):
                 video_path = dest_dir / episode_title
                 return video_path
 
+    @timed(category="download")
     def _download_subs(self, params: DownloadParams) -> list[Path]:
         anime_title = sanitize_filename(params.anime_title)
         episode_title = sanitize_filename(params.episode_title)
@@ -171,85 +177,34 @@ class YtDLPDownloader(BaseDownloader):
             downloaded_subs.append(sub_path)
         return downloaded_subs
 
+    @timed(category="download")
     def _merge_subtitles(
         self, params, video_path: Path, sub_paths: list[Path]
     ) -> Path | None:
         """Merge subtitles with video and return the path to the merged file."""
-        self.FFMPEG_EXECUTABLE = shutil.which("ffmpeg")
-        if not self.FFMPEG_EXECUTABLE:
-            raise ViuError("Please install ffmpeg in order to merge subs")
-        merged_filename = video_path.stem + ".mkv"
-
-        subs_input_args = list(
-            itertools.chain.from_iterable(
-                [["-i", str(sub_path)] for sub_path in sub_paths]
-            )
-        )
-
-        with tempfile.TemporaryDirectory() as temp_dir_str:
-            temp_dir = Path(temp_dir_str)
-            temp_output_path = temp_dir / merged_filename
-
-            # Construct the ffmpeg command arguments
-            args = [
-                self.FFMPEG_EXECUTABLE,
-                "-hide_banner",
-                "-i",
-                str(video_path),  # Main video input
-                *subs_input_args,  # All subtitle inputs
-                "-c",
-                "copy",  # Copy streams without re-encoding
-                # Map all video and audio streams from the first input (video_path)
-                "-map",
-                "0:v",
-                "-map",
-                "0:a",
-            ]
-
-            # Dynamically map subtitle streams from each subtitle input
-            # Input indices for subtitle files start from 1 (0 is the video)
-            for i in range(len(sub_paths)):
-                args.extend(
-                    ["-map", f"{i + 1}:s"]
-                )  # Map all subtitle streams from input i+1
-
-            args.append(str(temp_output_path))
-
-            print(f"[cyan]Starting subtitle merge for {video_path.name}...[/]")
-
-            # Run the ffmpeg command
-            try:
-                subprocess.run(args)
-                final_output_path = video_path.parent / merged_filename
-
-                if final_output_path.exists():
-                    if not params.prompt or Confirm.ask(
-                        f"File exists({final_output_path}) would you like to overwrite it",
+        print(f"[cyan]Starting subtitle merge for {video_path.name}...[/]")
+        try:
+            merged_path = merge_subtitles(
+                video_path,
+                sub_paths,
+                silent=params.silent,
+                clean=params.clean,
+                overwrite=lambda path: (
+                    not params.prompt
+                    or Confirm.ask(
+                        f"File exists({path}) would you like to overwrite it",
                         default=True,
-                    ):
-                        print(
-                            f"[yellow]Overwriting existing file: {final_output_path}[/]"
-                        )
-                        final_output_path.unlink()
-                        shutil.move(str(temp_output_path), str(final_output_path))
-                    else:
-                        print("[yellow]Merge cancelled: File not overwritten.[/]")
-                        return None
-                else:
-                    shutil.move(str(temp_output_path), str(final_output_path))
-
-                # Clean up original files if requested
-                if params.clean:
-                    print("[cyan]Cleaning original files...[/]")
-                    video_path.unlink()
-                    for sub_path in sub_paths:
-                        sub_path.unlink()
-
-                print(
-                    f"[green bold]Subtitles merged successfully.[/] Output file: {final_output_path}"
-                )
-                return final_output_path
+                    )
+                ),
+            )
+        except DownloaderError as e:
+            print(f"[red bold]An unexpected error[/] occurred: {e}")
+            return None
 
-            except Exception as e:
-                print(f"[red bold]An unexpected error[/] occurred: {e}")
-                return None
+        if merged_path:
+            print(
+                f"[green bold]Subtitles merged successfully.[/] Output file: {merged_path}"
+            )
+        else:
+            print("[yellow]Merge cancelled: File not overwritten.[/]")
+        return merged_path
@@ -106,6 +106,16 @@ class DownloaderError(ViuError):
     pass
 
 
+class DownloadCancelled(DownloaderError):
+    """
+    A download was cancelled while in progress, e.g. by Ctrl-C.
+
+    Raised from progress hooks to stop the transfer at the next update.
+    """
+
+    pass
+
+
 class InvalidEpisodeRangeError(ViuError, ValueError):
     """
     The user-provided episode range string is malformed or invalid.
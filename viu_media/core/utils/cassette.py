@@ -0,0 +1,230 @@
+"""
+Record and replay HTTP exchanges through httpx transports.
+
+A cassette is a JSON file of request/response pairs. ``RecordingTransport``
+forwards requests to the network and appends every exchange to a cassette;
+``ReplayTransport`` answers requests from a cassette without touching the
+network, optionally sleeping to simulate latency. This makes the network heavy
+paths (providers, media apis, preview caching) measurable offline and
+deterministically.
+
+Set ``VIU_HTTP_RECORD=<cassette>`` or ``VIU_HTTP_REPLAY=<cassette>`` to make the
+client factories use these transports, and ``VIU_HTTP_REPLAY_LATENCY=<ms>`` to
+inject latency during replay.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from .file import AtomicWriter
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = "1.0"
+
+RECORD_ENV = "VIU_HTTP_RECORD"
+REPLAY_ENV = "VIU_HTTP_REPLAY"
+REPLAY_LATENCY_ENV = "VIU_HTTP_REPLAY_LATENCY"
+
+# the stored content is already decoded, so these no longer describe it
+_DROPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+_InteractionKey = Tuple[str, str, str]
+
+
+class CassetteMiss(httpx.TransportError):
+    """Raised during replay when a request was never recorded."""
+
+
+def _request_key(request: httpx.Request) -> _InteractionKey:
+    body = request.read()
+    body_hash = hashlib.sha1(body).hexdigest() if body else ""
+    return request.method, str(request.url), body_hash
+
+
+class Cassette:
+    """A set of recorded exchanges, stored as JSON."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._interactions: Dict[_InteractionKey, List[dict]] = {}
+        self._replay_positions: Dict[_InteractionKey, int] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._interactions.values())
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> None:
+        entry = {
+            "status_code": response.status_code,
+            "headers": [
+                [name, value]
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _DROPPED_RESPONSE_HEADERS
+            ],
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            self._interactions.setdefault(_request_key(request), []).append(entry)
+            self._save()
+
+    def play(self, request: httpx.Request) -> httpx.Response:
+        """
+        Return the next recorded response for an identical request.
+
+        Repeated identical requests get the recorded responses in order; once
+        they run out the last one is repeated, so benchmarks can loop.
+        """
+        key = _request_key(request)
+        with self._lock:
+            responses = self._interactions.get(key)
+            if not responses:
+                raise CassetteMiss(
+                    f"No recorded response for {request.method} {request.url}",
+                    request=request,
+                )
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            entry = responses[min(position, len(responses) - 1)]
+
+        return httpx.Response(
+            status_code=entry["status_code"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["content"]),
+            request=request,
+        )
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._replay_positions.clear()
+
+    def _load(self) -> None:
+        with self.path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(
+                f"Unsupported cassette version {data.get('version')} in {self.path}"
+            )
+        for interaction in data["interactions"]:
+            request = interaction["request"]
+            key = (request["method"], request["url"], request["body_sha1"])
+            self._interactions[key] = interaction["responses"]
+
+    def _save(self) -> None:
+        data = {
+            "version": CASSETTE_VERSION,
+            "interactions": [
+                {
+                    "request": {"method": method, "url": url, "body_sha1": body_hash},
+                    "responses": responses,
+                }
+                for (method, url, body_hash), responses in self._interactions.items()
+            ],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with AtomicWriter(self.path) as f:
+            json.dump(data, f, indent=1)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Forwards requests to the network and records every exchange."""
+
+    def __init__(
+        self, cassette: Cassette, transport: Optional[httpx.BaseTransport] = None
+    ):
+        self.cassette = cassette
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        self.cassette.record(request, response)
+        logger.debug(f"Recorded {request.method} {request.url}")
+        # rebuilt so the client does not decode the already decoded content again
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=[
+                (name, value)
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _DROPPED_RESPONSE_HEADERS
+            ],
+            content=response.content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """
+    Answers requests from a cassette, never touching the network.
+
+    Args:
+        cassette: The recorded exchanges.
+        latency: Seconds to sleep before every response.
+        jitter: Extra random sleep of up to this many seconds.
+        seed: Seed for the jitter so runs stay reproducible.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: Optional[int] = 0,
+    ):
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+        return self.cassette.play(request)
+
+
+_cassettes: Dict[Path, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def _get_cassette(path: str) -> Cassette:
+    resolved = Path(path).expanduser().resolve()
+    with _cassettes_lock:
+        if resolved not in _cassettes:
+            _cassettes[resolved] = Cassette(resolved)
+        return _cassettes[resolved]
+
+
+def transport_from_env() -> Optional[httpx.BaseTransport]:
+    """
+    The record or replay transport selected through the environment, if any.
+
+    Every client created in the process shares one cassette per path.
+    """
+    if replay_path := os.environ.get(REPLAY_ENV):
+        latency_ms = float(os.environ.get(REPLAY_LATENCY_ENV) or 0)
+        return ReplayTransport(_get_cassette(replay_path), latency=latency_ms / 1000)
+    if record_path := os.environ.get(RECORD_ENV):
+        return RecordingTransport(_get_cassette(record_path))
+    return None
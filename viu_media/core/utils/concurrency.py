@@ -9,6 +9,7 @@ import logging
 import threading
 from abc import ABC, abstractmethod
 from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from typing import Any, Callable, Dict, List, Optional, Protocol, TypeVar
 from weakref import WeakSet
 
@@ -217,15 +218,17 @@ class BackgroundWorker(ABC):
                 self.cancel_all_tasks()
                 self._executor.shutdown(wait=False, cancel_futures=True)
             else:
-                # Wait for tasks to complete with timeout
-                try:
-                    self._executor.shutdown(wait=True, timeout=timeout)
-                except TimeoutError:
+                # Wait for tasks to complete with timeout; the executor's own
+                # shutdown cannot time out, so wait on the futures first
+                _, not_done = wait_futures(list(self._futures), timeout=timeout)
+                if not_done:
                     logger.warning(
                         f"Worker {self.name} shutdown timed out, forcing cancellation"
                     )
                     self.cancel_all_tasks()
                     self._executor.shutdown(wait=False, cancel_futures=True)
+                else:
+                    self._executor.shutdown(wait=True)
 
             self._executor = None
             logger.debug(f"Worker {self.name} shutdown complete")
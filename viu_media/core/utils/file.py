@@ -1,9 +1,19 @@
 import logging
 import os
+import threading
 import time
 import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import IO, Any, Union
+from typing import IO, Any, Iterator, Optional, Union
+
+from .profiling import span
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -256,6 +266,22 @@ class AtomicWriter:
         return False
 
 
+def _is_pid_alive(pid: int) -> Optional[bool]:
+    """Whether a process with this PID is running, or None if that can't be checked."""
+    if os.name == "nt":
+        # os.kill terminates the process on Windows instead of probing it
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # running, but owned by another user
+    except OSError:
+        return None
+    return True
+
+
 class FileLock:
     def __init__(
         self, lock_file_path: Path, timeout: float = 300, stale_timeout: float = 300
@@ -268,7 +294,8 @@ class FileLock:
             timeout: How long (in seconds) to wait to acquire the lock.
                      Set to 0 for non-blocking attempt. Set to -1 for indefinite wait.
             stale_timeout: If the lock file is older than this (in seconds),
-                           it's considered stale and will be broken.
+                           it's considered stale and will be broken. Only used
+                           when the liveness of the holder's PID can't be checked.
         """
         self.lock_file_path = lock_file_path
         self.timeout = timeout
@@ -297,8 +324,8 @@ class FileLock:
 
     def _is_stale(self) -> bool:
         """
-        Checks if the existing lock file is stale based on its modification time
-        or the PID inside it.
+        Checks if the existing lock file is stale based on the PID inside it,
+        or on its timestamp if the PID can't be checked.
         """
         if not self.lock_file_path.exists():
             return False  # Not stale if it doesn't exist
@@ -308,9 +335,19 @@ class FileLock:
             with self.lock_file_path.open("r") as f:
                 lines = f.readlines()
                 if len(lines) >= 2:
+                    holder_pid = int(lines[0].strip())
                     locked_timestamp = float(lines[1].strip())
+                    holder_alive = _is_pid_alive(holder_pid)
+                    if holder_alive is False:
+                        logger.warning(
+                            f"Lock file {self.lock_file_path} is held by PID {holder_pid}, which is no longer running. Considering it stale."
+                        )
+                        return True
                     current_time = time.time()
-                    if current_time - locked_timestamp > self.stale_timeout:
+                    if (
+                        holder_alive is None
+                        and current_time - locked_timestamp > self.stale_timeout
+                    ):
                         logger.warning(
                             f"Lock file {self.lock_file_path} is older than {self.stale_timeout} seconds. Considering it stale."
                         )
@@ -327,6 +364,10 @@ class FileLock:
         """
         Attempts to acquire the lock. Blocks until acquired or timeout occurs.
         """
+        with span("filelock.acquire", "lock", path=self.lock_file_path.name):
+            self._acquire()
+
+    def _acquire(self):
         start_time = time.time()
         while True:
             if self._acquire_atomic():
@@ -399,3 +440,192 @@ class FileLock:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.release()
+
+
+def _flock_within(fd: int, operation: int, timeout: float) -> bool:
+    """
+    Block on ``flock`` for at most ``timeout`` seconds.
+
+    A blocking ``flock`` can't be interrupted from another thread, so the wait
+    runs in a helper thread. If it times out, the helper closes ``fd`` as soon
+    as it does get the lock and the caller must not use ``fd`` again.
+
+    Returns:
+        True if the lock was acquired in time.
+    """
+    state_lock = threading.Lock()
+    finished = threading.Event()
+    abandoned = False
+    errors: list[OSError] = []
+
+    def wait():
+        try:
+            fcntl.flock(fd, operation)  # type: ignore[union-attr]
+        except OSError as e:
+            errors.append(e)
+        with state_lock:
+            if abandoned:
+                os.close(fd)
+            finished.set()
+
+    threading.Thread(target=wait, name="FlockWait", daemon=True).start()
+    finished.wait(timeout)
+    with state_lock:
+        if not finished.is_set():
+            abandoned = True
+            return False
+    if errors:
+        os.close(fd)
+        raise errors[0]
+    return True
+
+
+@dataclass
+class _HeldLock:
+    # an flock'ed file descriptor, or the FileLock used as a fallback
+    handle: Union[int, FileLock]
+    shared: bool
+    depth: int = 1
+
+
+class ReadWriteFileLock:
+    """
+    A reader/writer lock shared between processes and threads.
+
+    Where ``fcntl`` is available the lock is an ``flock`` on the lock file. Any
+    number of readers can hold it at once, a writer holds it alone, and
+    waiting blocks in the kernel instead of polling. The kernel drops the lock
+    when its holder exits, so it never goes stale. Elsewhere every acquisition,
+    read or write, falls back to an exclusive `FileLock`.
+
+    The lock is reentrant within a thread. Taking the write lock while holding
+    only the read lock is not supported.
+
+    Usage:
+        lock = ReadWriteFileLock(Path("registry.lock"))
+        with lock.read():
+            ...  # other readers may run alongside
+        with lock.write():  # or simply `with lock:`
+            ...
+    """
+
+    def __init__(
+        self, lock_file_path: Path, timeout: float = 300, stale_timeout: float = 300
+    ):
+        """
+        Initializes a reader/writer lock.
+
+        Args:
+            lock_file_path: The Path object for the lock file. It is left in place
+                            after release; deleting it would race with waiters.
+            timeout: How long (in seconds) to wait to acquire the lock.
+                     Set to 0 for non-blocking attempt. Set to -1 for indefinite wait.
+            stale_timeout: Passed on to the `FileLock` fallback.
+        """
+        self.lock_file_path = lock_file_path
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+        self._local = threading.local()
+
+    @contextmanager
+    def read(self) -> Iterator["ReadWriteFileLock"]:
+        """Hold the lock in shared mode."""
+        self.acquire(shared=True)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    @contextmanager
+    def write(self) -> Iterator["ReadWriteFileLock"]:
+        """Hold the lock in exclusive mode."""
+        self.acquire(shared=False)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def acquire(self, shared: bool = False):
+        """
+        Acquires the lock. Blocks until acquired or timeout occurs.
+
+        Raises:
+            TimeoutError: If the lock wasn't acquired within the timeout.
+            BlockingIOError: If the timeout is 0 and the lock is taken.
+        """
+        held: Optional[_HeldLock] = getattr(self._local, "held", None)
+        if held is not None:
+            if held.shared and not shared:
+                raise RuntimeError(
+                    f"Cannot take the write lock {self.lock_file_path} while holding its read lock."
+                )
+            held.depth += 1
+            return
+
+        mode = "read" if shared else "write"
+        with span("filelock.acquire", "lock", path=self.lock_file_path.name, mode=mode):
+            if fcntl is None:
+                handle: Union[int, FileLock] = FileLock(
+                    self.lock_file_path, self.timeout, self.stale_timeout
+                )
+                handle._acquire()
+            else:
+                handle = self._flock(shared)
+        self._local.held = _HeldLock(handle, shared)
+        logger.debug(f"{mode.capitalize()} lock {self.lock_file_path} acquired.")
+
+    def _flock(self, shared: bool) -> int:
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX  # type: ignore[union-attr]
+        fd = os.open(self.lock_file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)  # type: ignore[union-attr]
+            return fd
+        except BlockingIOError:
+            pass
+        except BaseException:
+            os.close(fd)
+            raise
+
+        if self.timeout == 0:
+            os.close(fd)
+            raise BlockingIOError(
+                f"Lock {self.lock_file_path} is currently held by another process (non-blocking)."
+            )
+        logger.debug(f"Waiting for lock {self.lock_file_path}...")
+        if self.timeout < 0:
+            try:
+                fcntl.flock(fd, operation)  # type: ignore[union-attr]
+            except BaseException:
+                os.close(fd)
+                raise
+            return fd
+        if not _flock_within(fd, operation, self.timeout):
+            raise TimeoutError(
+                f"Failed to acquire lock {self.lock_file_path} within {self.timeout} seconds."
+            )
+        return fd
+
+    def release(self):
+        """Releases one level of the lock held by this thread."""
+        held: Optional[_HeldLock] = getattr(self._local, "held", None)
+        if held is None:
+            logger.warning(
+                f"Attempted to release lock {self.lock_file_path} that this thread doesn't hold."
+            )
+            return
+        held.depth -= 1
+        if held.depth:
+            return
+        self._local.held = None
+        if isinstance(held.handle, FileLock):
+            held.handle.release()
+        else:
+            # closing the descriptor drops the flock
+            os.close(held.handle)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
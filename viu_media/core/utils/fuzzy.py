@@ -27,9 +27,16 @@ Usage:
     >>> from viu_media.core.utils.fuzzy import ratio, partial_ratio
     >>> ratio("test", "best")
     75
+
+    Scoring one query against many choices in a single call:
+
+    >>> from viu_media.core.utils.fuzzy import extract_best
+    >>> extract_best("one piece", ["naruto", "one piece film red", "one piece"])
+    ('one piece', 100, 2)
 """
 
 import logging
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +51,17 @@ except ImportError:
     THEFUZZ_AVAILABLE = False
     logger.debug("thefuzz not available, using fallback implementation")
 
+# rapidfuzz provides C implementations of the one-vs-many helpers (thefuzz depends on it)
+try:
+    from rapidfuzz import fuzz as _rapidfuzz_fuzz
+    from rapidfuzz import process as _rapidfuzz_process
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    _rapidfuzz_fuzz = None
+    _rapidfuzz_process = None
+    RAPIDFUZZ_AVAILABLE = False
+
 
 class _PurePythonFuzz:
     """
@@ -53,6 +71,62 @@ class _PurePythonFuzz:
     of the core algorithms.
     """
 
+    @staticmethod
+    def _pattern_masks(pattern: str) -> Dict[str, int]:
+        """
+        Build the per-character match bitmasks used by the bit-parallel algorithms.
+
+        Bit i of ``masks[c]`` is set when ``pattern[i] == c``. Computing this once
+        lets a single pattern be compared against many texts cheaply.
+        """
+        masks: Dict[str, int] = {}
+        for i, char in enumerate(pattern):
+            masks[char] = masks.get(char, 0) | (1 << i)
+        return masks
+
+    @staticmethod
+    def _myers_distance(masks: Dict[str, int], pattern_length: int, text: str) -> int:
+        """
+        Levenshtein distance using Myers' bit-parallel algorithm (Hyyrö's variant).
+
+        Each character of ``text`` updates the whole DP column at once through
+        integer bit operations, so the cost is O(len(text)) big-int operations
+        instead of O(len(pattern) * len(text)) interpreted steps.
+        """
+        if not pattern_length:
+            return len(text)
+
+        full = (1 << pattern_length) - 1
+        last = 1 << (pattern_length - 1)
+        positive_vertical = full
+        negative_vertical = 0
+        distance = pattern_length
+
+        for char in text:
+            match = masks.get(char, 0)
+            x_vertical = match | negative_vertical
+            x_horizontal = (
+                ((match & positive_vertical) + positive_vertical) ^ positive_vertical
+            ) | match
+            positive_horizontal = negative_vertical | (
+                ~(x_horizontal | positive_vertical) & full
+            )
+            negative_horizontal = positive_vertical & x_horizontal
+
+            if positive_horizontal & last:
+                distance += 1
+            elif negative_horizontal & last:
+                distance -= 1
+
+            positive_horizontal = ((positive_horizontal << 1) | 1) & full
+            negative_horizontal = (negative_horizontal << 1) & full
+            positive_vertical = negative_horizontal | (
+                ~(x_vertical | positive_horizontal) & full
+            )
+            negative_vertical = positive_horizontal & x_vertical
+
+        return distance
+
     @staticmethod
     def _levenshtein_distance(s1: str, s2: str) -> int:
         """
@@ -66,29 +140,24 @@ class _PurePythonFuzz:
             The Levenshtein distance as an integer
         """
         if len(s1) < len(s2):
-            return _PurePythonFuzz._levenshtein_distance(s2, s1)
+            s1, s2 = s2, s1
 
         if len(s2) == 0:
             return len(s1)
 
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                # Cost of insertions, deletions and substitutions
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        # the shorter string is the pattern so the bit vectors stay small
+        return _PurePythonFuzz._myers_distance(
+            _PurePythonFuzz._pattern_masks(s2), len(s2), s1
+        )
 
     @staticmethod
     def _longest_common_subsequence(s1: str, s2: str) -> int:
         """
         Calculate the length of the longest common subsequence.
 
+        Uses the bit-vector formulation of the LCS recurrence, so only one
+        integer per row of the DP table is kept.
+
         Args:
             s1: First string
             s2: Second string
@@ -96,17 +165,18 @@ class _PurePythonFuzz:
         Returns:
             Length of the longest common subsequence
         """
-        m, n = len(s1), len(s2)
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
+        if not s1 or not s2:
+            return 0
 
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if s1[i - 1] == s2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+        masks = _PurePythonFuzz._pattern_masks(s1)
+        full = (1 << len(s1)) - 1
+        row = full
+        for char in s2:
+            match = masks.get(char, 0)
+            unmatched = row & match
+            row = ((row + unmatched) | (row - unmatched)) & full
 
-        return dp[m][n]
+        return len(s1) - bin(row).count("1")
 
     @staticmethod
     def _normalize_string(s: str) -> str:
@@ -455,6 +525,121 @@ class FuzzyMatcher:
         ]
         return max(ratios)
 
+    def extract_best(
+        self,
+        query: str | Sequence[str],
+        choices: Sequence[str],
+        scorer: str = "ratio",
+        processor: Optional[Callable[[str], str]] = None,
+        score_cutoff: int = 0,
+    ) -> Optional[Tuple[str, int, int]]:
+        """
+        Find the choice that best matches the query in a single batched call.
+
+        Uses rapidfuzz's C implementation when available. Otherwise choices are
+        preprocessed once and, for the default ``ratio`` scorer, compared with a
+        bit-parallel Levenshtein whose query masks are built only once.
+
+        Args:
+            query: The string to match, or several strings; a choice then scores
+                its best result against any of them
+            choices: Candidate strings
+            scorer: Name of the scoring method, e.g. "ratio" or "token_set_ratio"
+            processor: Optional function applied to the query and every choice
+            score_cutoff: Minimum score a choice needs to be returned
+
+        Returns:
+            A (choice, score, index) tuple, or None if no choice reaches the cutoff
+        """
+        queries = [query] if isinstance(query, str) else list(query)
+        if not queries or not choices:
+            return None
+
+        try:
+            if RAPIDFUZZ_AVAILABLE and _rapidfuzz_process is not None:
+                return self._extract_best_rapidfuzz(
+                    queries, choices, scorer, processor, score_cutoff
+                )
+            return self._extract_best_python(
+                queries, choices, scorer, processor, score_cutoff
+            )
+        except Exception as e:
+            logger.warning(f"Error in extract_best calculation: {e}")
+            return None
+
+    def _extract_best_rapidfuzz(
+        self,
+        queries: list[str],
+        choices: Sequence[str],
+        scorer: str,
+        processor: Optional[Callable[[str], str]],
+        score_cutoff: int,
+    ) -> Optional[Tuple[str, int, int]]:
+        scorer_func = getattr(_rapidfuzz_fuzz, scorer)
+        best: Optional[Tuple[str, int, int]] = None
+        for query in queries:
+            match = _rapidfuzz_process.extractOne(  # type: ignore
+                query,
+                choices,
+                scorer=scorer_func,
+                processor=processor,
+                score_cutoff=score_cutoff,
+            )
+            if match and (best is None or round(match[1]) > best[1]):
+                best = (match[0], round(match[1]), match[2])
+        return best
+
+    def _extract_best_python(
+        self,
+        queries: list[str],
+        choices: Sequence[str],
+        scorer: str,
+        processor: Optional[Callable[[str], str]],
+        score_cutoff: int,
+    ) -> Optional[Tuple[str, int, int]]:
+        if processor:
+            queries = [processor(query) for query in queries]
+            processed_choices = [processor(choice) for choice in choices]
+        else:
+            processed_choices = list(choices)
+
+        if scorer == "ratio" and self._impl is _PurePythonFuzz:
+            scores = self._batch_ratio(queries, processed_choices)
+        else:
+            scorer_func = getattr(self._impl, scorer)
+            scores = [
+                max(scorer_func(query, choice) for query in queries)
+                for choice in processed_choices
+            ]
+
+        best_index = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best_index] < score_cutoff:
+            return None
+        return choices[best_index], scores[best_index], best_index
+
+    @staticmethod
+    def _batch_ratio(queries: list[str], choices: list[str]) -> list[int]:
+        """Levenshtein ratios of every choice against its best query."""
+        prepared = [
+            (query, _PurePythonFuzz._pattern_masks(query), len(query))
+            for query in queries
+        ]
+        scores = []
+        for choice in choices:
+            best = 0
+            for query, masks, length in prepared:
+                if not query and not choice:
+                    score = 100
+                elif not query or not choice:
+                    score = 0
+                else:
+                    max_len = max(length, len(choice))
+                    distance = _PurePythonFuzz._myers_distance(masks, length, choice)
+                    score = int((max_len - distance) / max_len * 100)
+                best = max(best, score)
+            scores.append(best)
+        return scores
+
 
 # Create a default instance for convenience
 fuzz = FuzzyMatcher()
@@ -466,6 +651,7 @@ token_sort_ratio = fuzz.token_sort_ratio
 token_set_ratio = fuzz.token_set_ratio
 partial_token_sort_ratio = fuzz.partial_token_sort_ratio
 partial_token_set_ratio = fuzz.partial_token_set_ratio
+extract_best = fuzz.extract_best
 
 __all__ = [
     "FuzzyMatcher",
@@ -476,5 +662,7 @@ __all__ = [
     "token_set_ratio",
     "partial_token_sort_ratio",
     "partial_token_set_ratio",
+    "extract_best",
     "THEFUZZ_AVAILABLE",
+    "RAPIDFUZZ_AVAILABLE",
 ]
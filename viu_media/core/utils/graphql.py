@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from httpx import Client, Response
 
 from .networking import TIMEOUT
+from .profiling import span
 
 if TYPE_CHECKING:
     from httpx import Client
@@ -35,7 +36,8 @@ def execute_graphql_query_with_get_request(
 ) -> Response:
     query = load_graphql_from_file(graphql_file)
     params = {"query": query, "variables": json.dumps(variables)}
-    response = httpx_client.get(url, params=params, timeout=TIMEOUT)
+    with span("graphql", "http", operation=graphql_file.stem):
+        response = httpx_client.get(url, params=params, timeout=TIMEOUT)
     return response
 
 
@@ -44,5 +46,6 @@ def execute_graphql(
 ) -> Response:
     query = load_graphql_from_file(graphql_file)
     json_body = {"query": query, "variables": variables}
-    response = httpx_client.post(url, json=json_body, timeout=TIMEOUT)
+    with span("graphql", "http", operation=graphql_file.stem):
+        response = httpx_client.post(url, json=json_body, timeout=TIMEOUT)
     return response
@@ -0,0 +1,260 @@
+"""
+Long-lived, tuned httpx clients shared per host family.
+
+Every client created through ``create_client`` for the same family shares one
+pooled transport, so connections (and HTTP/2 sessions when the ``h2`` package
+is installed) are kept alive across provider instances, downloaders and
+episodes instead of being re-established for every request. Clients keep their
+own headers and cookies; closing one does not close the shared pool.
+
+The pooled transport retries connection failures, and 429/5xx responses of
+idempotent requests, with jittered exponential backoff.
+"""
+
+import atexit
+import importlib.util
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from .cassette import transport_from_env
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# never wait longer than this between attempts, whatever Retry-After says
+MAX_BACKOFF = 30.0
+
+
+@dataclass(frozen=True)
+class ClientProfile:
+    """Pool, timeout and retry settings of one host family."""
+
+    connect_timeout: float
+    read_timeout: float
+    write_timeout: float
+    pool_timeout: float
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    retries: int
+    backoff_factor: float
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+# json apis: small responses, fail fast
+API_PROFILE = ClientProfile(
+    connect_timeout=10.0,
+    read_timeout=20.0,
+    write_timeout=10.0,
+    pool_timeout=10.0,
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0,
+    retries=3,
+    backoff_factor=0.5,
+)
+# anime providers: scraped html and embed pages behind slow cdns
+PROVIDER_PROFILE = ClientProfile(
+    connect_timeout=15.0,
+    read_timeout=30.0,
+    write_timeout=15.0,
+    pool_timeout=15.0,
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0,
+    retries=3,
+    backoff_factor=0.5,
+)
+# media files: slow to connect to, long lived streams
+DOWNLOAD_PROFILE = ClientProfile(
+    connect_timeout=60.0,
+    read_timeout=30.0,
+    write_timeout=30.0,
+    pool_timeout=60.0,
+    max_connections=32,
+    max_keepalive_connections=16,
+    keepalive_expiry=120.0,
+    retries=3,
+    backoff_factor=1.0,
+)
+
+PROFILES: Dict[str, ClientProfile] = {
+    "api": API_PROFILE,
+    "provider": PROVIDER_PROFILE,
+    "download": DOWNLOAD_PROFILE,
+}
+
+
+def backoff_delay(
+    attempt: int, backoff_factor: float, retry_after: Optional[str] = None
+) -> float:
+    """
+    Seconds to wait before retry number ``attempt`` (starting at 0).
+
+    Uses "full jitter": a random delay up to the exponential backoff, so
+    clients that failed together do not retry in lockstep. A numeric
+    Retry-After header takes precedence.
+    """
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_BACKOFF)
+        except ValueError:
+            pass
+    return random.uniform(0, min(MAX_BACKOFF, backoff_factor * 2**attempt))
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    Retries failed requests with jittered exponential backoff.
+
+    Connection errors are retried for every method, since the request never
+    reached the server. Read timeouts and retryable status codes are only
+    retried for idempotent methods.
+    """
+
+    def __init__(
+        self, transport: httpx.BaseTransport, retries: int, backoff_factor: float
+    ):
+        self._transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                if attempt >= self.retries:
+                    raise
+                delay = backoff_delay(attempt, self.backoff_factor)
+            except httpx.ReadTimeout:
+                if not idempotent or attempt >= self.retries:
+                    raise
+                delay = backoff_delay(attempt, self.backoff_factor)
+            else:
+                if (
+                    not idempotent
+                    or response.status_code not in RETRY_STATUS_CODES
+                    or attempt >= self.retries
+                ):
+                    return response
+                delay = backoff_delay(
+                    attempt, self.backoff_factor, response.headers.get("Retry-After")
+                )
+                response.close()
+
+            attempt += 1
+            logger.debug(
+                f"Retrying {request.method} {request.url} in {delay:.2f}s (attempt {attempt}/{self.retries})"
+            )
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Hands requests to a pooled transport that outlives the client using it."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        # the pool belongs to the factory and is closed by close_all()
+        pass
+
+
+_transports: Dict[str, httpx.BaseTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def _profile_for(family: str) -> ClientProfile:
+    return PROFILES.get(family.split(":", 1)[0], API_PROFILE)
+
+
+def _get_transport(family: str) -> httpx.BaseTransport:
+    with _transports_lock:
+        transport = _transports.get(family)
+        if transport is None:
+            # the record/replay transport takes over the network in benchmarks
+            transport = transport_from_env()
+            if transport is None:
+                profile = _profile_for(family)
+                transport = RetryTransport(
+                    httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=profile.limits),
+                    retries=profile.retries,
+                    backoff_factor=profile.backoff_factor,
+                )
+            _transports[family] = transport
+            logger.debug(
+                f"Created connection pool for {family} (http2={HTTP2_AVAILABLE})"
+            )
+        return transport
+
+
+def create_client(
+    family: str,
+    headers: Optional[Dict[str, str]] = None,
+    follow_redirects: bool = False,
+) -> httpx.Client:
+    """
+    Create a client backed by the shared connection pool of a host family.
+
+    Args:
+        family: ``"api"``, ``"download"`` or ``"provider"``; a suffix such as
+            ``"provider:allanime"`` gives the family its own pool while keeping
+            the base family's settings.
+        headers: Default headers of this client.
+        follow_redirects: Whether the client follows redirects.
+    """
+    return httpx.Client(
+        headers=headers,
+        timeout=_profile_for(family).timeout,
+        follow_redirects=follow_redirects,
+        transport=_SharedTransport(_get_transport(family)),
+    )
+
+
+def close_all() -> None:
+    """Close every pooled connection."""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        try:
+            transport.close()
+        except Exception as e:
+            logger.debug(f"Failed to close transport: {e}")
+
+
+atexit.register(close_all)
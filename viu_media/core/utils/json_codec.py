@@ -0,0 +1,73 @@
+"""
+JSON encoding and decoding for persisted state and API responses.
+
+Plain values go through orjson when it is installed and through the standard
+library otherwise; both produce compact output. Pydantic models are read and
+written by pydantic-core straight from and to bytes (``model_validate_json``
+and ``model_dump_json``), skipping the intermediate dict of python objects
+that ``json.load`` plus ``model_validate`` builds.
+
+Output is always valid JSON that either backend can read back, so switching
+backends never invalidates existing files.
+"""
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .file import AtomicWriter
+
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Compact, utf-8 encoded JSON; non-ascii characters are kept as is."""
+    if orjson is not None:
+        # like the standard library, accept int keys and write them as strings
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        obj, default=default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def response_json(response: "httpx.Response") -> Any:
+    """The decoded body of an http response, parsed from its raw bytes."""
+    return loads(response.content)
+
+
+def read(path: Path) -> Any:
+    return loads(path.read_bytes())
+
+
+def write(path: Path, obj: Any, default: Optional[Callable[[Any], Any]] = None):
+    """Atomically replace ``path`` with ``obj`` encoded as JSON."""
+    with AtomicWriter(path, mode="wb", encoding=None) as f:
+        f.write(dumps(obj, default=default))
+
+
+def read_model(path: Path, model_type: Type[M]) -> M:
+    return model_type.model_validate_json(path.read_bytes())
+
+
+def write_model(path: Path, model: BaseModel, by_alias: bool = False):
+    """Atomically replace ``path`` with the JSON of a pydantic model."""
+    with AtomicWriter(path, mode="wb", encoding=None) as f:
+        f.write(model.model_dump_json(by_alias=by_alias).encode("utf-8"))
@@ -1,71 +1,162 @@
 import json
 import logging
+import threading
 from typing import Dict, Optional
 
 from ..constants import APP_DATA_DIR, ASSETS_DIR
 
 logger = logging.getLogger(__name__)
 
-# Cache for the normalizer data to avoid repeated file reads
-_normalizer_cache: Optional[Dict[str, Dict[str, str]]] = None
-
 USER_NORMALIZER_JSON = APP_DATA_DIR / "normalizer.json"
+# mappings picked interactively are appended here, one json object per line
+USER_NORMALIZER_DELTAS = APP_DATA_DIR / "normalizer.deltas.jsonl"
 
 DEFAULT_NORMALIZER_JSON = ASSETS_DIR / "normalizer.json"
 
 
-# will load one in the config dir if available and merge them
-def _load_normalizer_data() -> Dict[str, Dict[str, str]]:
+class TitleNormalizer:
     """
-    Load the normalizer.json file and cache it.
+    Bidirectional title mapping between providers and the media API.
 
-    Returns:
-        Dictionary containing provider mappings from normalizer.json
+    Forward (provider -> media API) and reverse (media API -> provider) indexes
+    are keyed by case-folded titles and built once, then kept in sync as
+    mappings are added.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, str]] = {}
+        self._forward: Dict[str, Dict[str, str]] = {}
+        self._reverse: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls) -> "TitleNormalizer":
+        """Build the indexes from the bundled, user and delta mapping files."""
+        normalizer = cls()
+        with open(DEFAULT_NORMALIZER_JSON, "r", encoding="utf-8") as f:
+            normalizer._add_all(json.load(f))
+        if USER_NORMALIZER_JSON.exists():
+            with open(USER_NORMALIZER_JSON, "r", encoding="utf-8") as f:
+                normalizer._add_all(json.load(f))
+        if USER_NORMALIZER_DELTAS.exists():
+            normalizer._replay_deltas()
+        return normalizer
+
+    @property
+    def data(self) -> Dict[str, Dict[str, str]]:
+        return self._data
+
+    def add(self, provider_name: str, provider_title: str, media_api_title: str):
+        with self._lock:
+            forward = self._forward.setdefault(provider_name, {})
+            reverse = self._reverse.setdefault(provider_name, {})
+            old_title = forward.get(provider_title.casefold())
+            # remapping a provider title must not leave the old media api title
+            # pointing at it, unless another mapping has claimed it since
+            if old_title is not None:
+                old_key = old_title.casefold()
+                if reverse.get(old_key, "").casefold() == provider_title.casefold():
+                    del reverse[old_key]
+            self._data.setdefault(provider_name, {})[provider_title] = media_api_title
+            forward[provider_title.casefold()] = media_api_title
+            reverse[media_api_title.casefold()] = provider_title
+
+    def to_media_api_title(self, provider_title: str, provider_name: str) -> str:
+        forward = self._forward.get(provider_name)
+        if forward is None:
+            logger.debug("Provider '%s' not found in normalizer data", provider_name)
+            return provider_title
+        return forward.get(provider_title.casefold(), provider_title)
+
+    def to_provider_title(self, media_api_title: str, provider_name: str) -> str:
+        reverse = self._reverse.get(provider_name)
+        if reverse is None:
+            logger.debug("Provider '%s' not found in normalizer data", provider_name)
+            return media_api_title
+        return reverse.get(media_api_title.casefold(), media_api_title)
+
+    def has_mapping(self, title: str, provider_name: str, reverse: bool = False):
+        index = self._reverse if reverse else self._forward
+        return title.casefold() in index.get(provider_name, {})
+
+    def _add_all(self, mappings: Dict[str, Dict[str, str]]):
+        for provider_name, provider_mappings in mappings.items():
+            for provider_title, media_api_title in provider_mappings.items():
+                self.add(provider_name, provider_title, media_api_title)
+
+    def _replay_deltas(self):
+        with open(USER_NORMALIZER_DELTAS, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    delta = json.loads(line)
+                    self.add(
+                        delta["provider"],
+                        delta["provider_title"],
+                        delta["media_api_title"],
+                    )
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    # a torn final line from an interrupted write shouldn't lose the rest
+                    logger.warning(
+                        "Skipping bad normalizer delta on line %s: %s", line_no, e
+                    )
+
+
+_normalizer: Optional[TitleNormalizer] = None
+_normalizer_lock = threading.Lock()
+
+
+def _get_normalizer() -> TitleNormalizer:
+    """
+    Load the normalizer indexes once and cache them.
 
     Raises:
         FileNotFoundError: If normalizer.json is not found
         json.JSONDecodeError: If normalizer.json is malformed
     """
-    global _normalizer_cache
+    global _normalizer
 
-    if _normalizer_cache is not None:
-        return _normalizer_cache
+    if _normalizer is not None:
+        return _normalizer
+    with _normalizer_lock:
+        if _normalizer is None:
+            _normalizer = TitleNormalizer.load()
+    return _normalizer
 
-    default_normalizer = {}
-    user_normalizer = {}
-    with open(DEFAULT_NORMALIZER_JSON, "r", encoding="utf-8") as f:
-        default_normalizer: dict = json.load(f)
-    if USER_NORMALIZER_JSON.exists():
-        with open(USER_NORMALIZER_JSON, "r", encoding="utf-8") as f:
-            user_normalizer: dict = json.load(f)
 
-    _normalizer_cache = default_normalizer
-    for key in default_normalizer:
-        if key in user_normalizer:
-            _normalizer_cache[key].update(user_normalizer[key])
+def _load_normalizer_data() -> Dict[str, Dict[str, str]]:
+    """
+    Load the merged normalizer mappings.
 
-    return _normalizer_cache
+    Returns:
+        Dictionary containing provider mappings from normalizer.json
+    """
+    return _get_normalizer().data
 
 
 def update_user_normalizer_json(
     provider_title: str, media_api_title: str, provider_name: str
 ):
-    import time
-
-    from .file import AtomicWriter
+    """
+    Persist a user-confirmed mapping and apply it immediately.
 
-    print(
-        "UPDATING USER NORMALIZER JSON. PLEASE CONTRIBUTE TO THE PROJECT BY OPENING A PR ON GITHUB TO MERGE YOUR NORMALIZER JSON TO MAIN. MAEMOTTE KANSHA SHIMASU :)"
+    The mapping is appended to the user's delta file instead of rewriting the
+    merged mappings, so saving is a single small write.
+    """
+    _get_normalizer().add(provider_name, provider_title, media_api_title.lower())
+
+    delta = {
+        "provider": provider_name,
+        "provider_title": provider_title,
+        "media_api_title": media_api_title.lower(),
+    }
+    with open(USER_NORMALIZER_DELTAS, "a", encoding="utf-8") as f:
+        f.write(json.dumps(delta, ensure_ascii=False) + "\n")
+    logger.info(
+        "Saved normalizer mapping to %s. Please consider contributing it upstream by opening a PR on GitHub.",
+        USER_NORMALIZER_DELTAS,
     )
-    print(f"NORMALIZER JSON PATH IS: {USER_NORMALIZER_JSON}")
-    time.sleep(5)
-    if not _normalizer_cache:
-        raise RuntimeError(
-            "Fatal _normalizer_cache missing this should not be the case : (. Please report"
-        )
-    _normalizer_cache[provider_name][provider_title] = media_api_title.lower()
-    with AtomicWriter(USER_NORMALIZER_JSON) as f:
-        json.dump(_normalizer_cache, f, indent=2)
 
 
 def provider_title_to_media_api_title(provider_title: str, provider_name: str) -> str:
@@ -91,17 +182,9 @@ def provider_title_to_media_api_title(provider_title: str, provider_name: str) -
         "Unknown Title"
     """
     try:
-        normalizer_data = _load_normalizer_data()
-
-        # Check if the provider exists in the normalizer data
-        if provider_name not in normalizer_data:
-            logger.debug("Provider '%s' not found in normalizer data", provider_name)
-            return provider_title
-
-        provider_mappings = normalizer_data[provider_name]
-
-        # Return the mapped title if it exists, otherwise return the original
-        normalized_title = provider_mappings.get(provider_title, provider_title)
+        normalized_title = _get_normalizer().to_media_api_title(
+            provider_title, provider_name
+        )
 
         if normalized_title != provider_title:
             logger.debug(
@@ -142,20 +225,9 @@ def media_api_title_to_provider_title(media_api_title: str, provider_name: str)
         "Unknown Title"
     """
     try:
-        normalizer_data = _load_normalizer_data()
-
-        # Check if the provider exists in the normalizer data
-        if provider_name not in normalizer_data:
-            logger.debug("Provider '%s' not found in normalizer data", provider_name)
-            return media_api_title
-
-        provider_mappings = normalizer_data[provider_name]
-
-        # Create a reverse mapping (media_api_title -> provider_title)
-        reverse_mappings = {v: k for k, v in provider_mappings.items()}
-
-        # Return the mapped title if it exists, otherwise return the original
-        provider_title = reverse_mappings.get(media_api_title, media_api_title)
+        provider_title = _get_normalizer().to_provider_title(
+            media_api_title, provider_name
+        )
 
         if provider_title != media_api_title:
             logger.debug(
@@ -228,8 +300,8 @@ def clear_cache() -> None:
     This is useful for testing or when the normalizer.json file has been updated
     and you want to reload the data.
     """
-    global _normalizer_cache
-    _normalizer_cache = None
+    global _normalizer
+    _normalizer = None
     logger.debug("Cleared normalizer cache")
 
 
@@ -278,20 +350,7 @@ def has_mapping(title: str, provider_name: str, reverse: bool = False) -> bool:
         False
     """
     try:
-        normalizer_data = _load_normalizer_data()
-
-        if provider_name not in normalizer_data:
-            return False
-
-        provider_mappings = normalizer_data[provider_name]
-
-        if reverse:
-            # Check if title exists as a value (media API title)
-            return title in provider_mappings.values()
-        else:
-            # Check if title exists as a key (provider title)
-            return title in provider_mappings
-
+        return _get_normalizer().has_mapping(title, provider_name, reverse)
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logger.warning("Failed to load normalizer data: %s", e)
         return False
@@ -321,14 +380,7 @@ def add_runtime_mapping(
         "Normalized Title"
     """
     try:
-        normalizer_data = _load_normalizer_data()
-
-        # Initialize provider if it doesn't exist
-        if provider_name not in normalizer_data:
-            normalizer_data[provider_name] = {}
-
-        # Add the mapping
-        normalizer_data[provider_name][provider_title] = media_api_title
+        _get_normalizer().add(provider_name, provider_title, media_api_title)
 
         logger.info(
             "Added runtime mapping: '%s' -> '%s' (provider: %s)",
@@ -0,0 +1,253 @@
+"""
+Lightweight span and timer instrumentation for the hot paths.
+
+Spans are only recorded after ``enable()`` is called (the global ``--profile``
+flag). While disabled, ``span()`` returns a shared no-op context manager and
+``timed`` functions go straight to the wrapped function, so instrumentation can
+stay in place permanently.
+
+Recorded spans can be summarised per name or exported in the Chrome trace
+event format, which opens in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+_enabled = False
+_spans: List["SpanRecord"] = []
+_spans_lock = threading.Lock()
+_origin_ns = time.perf_counter_ns()
+
+_NULL_SPAN = nullcontext()
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SpanSummary:
+    name: str
+    category: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class _Span:
+    __slots__ = ("name", "category", "args", "_start_ns")
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        duration_ns = time.perf_counter_ns() - self._start_ns
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _record(
+            SpanRecord(
+                self.name,
+                self.category,
+                self._start_ns,
+                duration_ns,
+                threading.get_native_id(),
+                self.args,
+            )
+        )
+        return False
+
+
+def enable() -> None:
+    global _enabled, _origin_ns
+    _origin_ns = time.perf_counter_ns()
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    with _spans_lock:
+        _spans.clear()
+
+
+def span(name: str, category: str = "app", **args: Any):
+    """
+    Time the enclosed block as a span.
+
+    Example:
+        with span("graphql", "http", operation="search"):
+            ...
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def timed(name: Optional[str] = None, category: str = "app") -> Callable[[F], F]:
+    """Decorator recording every call of the function as a span."""
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def timed_iter(
+    iterable: Iterable[T], name: str, category: str = "app", **args: Any
+) -> Iterator[T]:
+    """
+    Re-yield the items of ``iterable``, recording the time spent producing them.
+
+    Time the consumer spends between items is left out of the duration. The
+    span is recorded once the iteration ends, fails or is closed early.
+    """
+    if not _enabled:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    start_ns = time.perf_counter_ns()
+    busy_ns = 0
+    items = 0
+    try:
+        while True:
+            step_ns = time.perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            except Exception as e:
+                args["error"] = type(e).__name__
+                raise
+            finally:
+                busy_ns += time.perf_counter_ns() - step_ns
+            items += 1
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        _record(
+            SpanRecord(
+                name,
+                category,
+                start_ns,
+                busy_ns,
+                threading.get_native_id(),
+                {**args, "items": items},
+            )
+        )
+
+
+def _record(record: SpanRecord) -> None:
+    with _spans_lock:
+        _spans.append(record)
+
+
+def get_spans() -> List[SpanRecord]:
+    with _spans_lock:
+        return list(_spans)
+
+
+def summarize() -> List[SpanSummary]:
+    """Aggregate the recorded spans per name, slowest total first."""
+    summaries: Dict[str, SpanSummary] = {}
+    for record in get_spans():
+        duration_ms = record.duration_ns / 1e6
+        summary = summaries.get(record.name)
+        if summary is None:
+            summaries[record.name] = SpanSummary(
+                record.name, record.category, 1, duration_ms, duration_ms
+            )
+        else:
+            summary.count += 1
+            summary.total_ms += duration_ms
+            summary.max_ms = max(summary.max_ms, duration_ms)
+    return sorted(summaries.values(), key=lambda s: s.total_ms, reverse=True)
+
+
+def print_summary(title: str = "Profile") -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column("Span")
+    table.add_column("Category")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Mean ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    for summary in summarize():
+        table.add_row(
+            summary.name,
+            summary.category,
+            str(summary.count),
+            f"{summary.total_ms:.1f}",
+            f"{summary.mean_ms:.1f}",
+            f"{summary.max_ms:.1f}",
+        )
+    Console(stderr=True).print(table)
+
+
+def export_chrome_trace(path: Path) -> Path:
+    """Write the recorded spans as Chrome trace events ("X" complete events)."""
+    pid = os.getpid()
+    events = [
+        {
+            "name": record.name,
+            "cat": record.category,
+            "ph": "X",
+            "ts": (record.start_ns - _origin_ns) / 1000,
+            "dur": record.duration_ns / 1000,
+            "pid": pid,
+            "tid": record.thread_id,
+            "args": {key: str(value) for key, value in record.args.items()},
+        }
+        for record in get_spans()
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
@@ -0,0 +1,4 @@
+from .api import AniSkip
+from .types import SkipInterval
+
+__all__ = ["AniSkip", "SkipInterval"]
@@ -1,22 +1,76 @@
-from httpx import get
+import logging
+from typing import Iterable, List, Optional
+
+from httpx import Client, HTTPError
+
+from ...core.utils.networking import TIMEOUT
+from .types import SkipInterval, SkipType
+
+logger = logging.getLogger(__name__)
 
 ANISKIP_ENDPOINT = "https://api.aniskip.com/v1/skip-times"
 
 
-# TODO: Finish own implementation of aniskip script
 class AniSkip:
-    @classmethod
+    """Minimal client for the AniSkip skip-times API."""
+
+    def __init__(self, client: Optional[Client] = None):
+        self.http_client = client or Client(timeout=TIMEOUT)
+
     def get_skip_times(
-        cls, mal_id: int, episode_number: float | int, types=["op", "ed"]
-    ):
-        url = f"{ANISKIP_ENDPOINT}/{mal_id}/{episode_number}?types=op&types=ed"
-        response = get(url)
-        print(response.text)
-        return response.json()
+        self,
+        mal_id: int,
+        episode_number: float | int | str,
+        types: Iterable[SkipType] = ("op", "ed"),
+    ) -> Optional[List[SkipInterval]]:
+        """
+        Fetch the skip intervals of a single episode.
+
+        Returns an empty list when AniSkip has no data for the episode and None
+        when the request itself failed, so callers can tell a miss from an error.
+        """
+        episode = _format_episode_number(episode_number)
+        url = f"{ANISKIP_ENDPOINT}/{mal_id}/{episode}"
+        try:
+            response = self.http_client.get(
+                url, params=[("types", skip_type) for skip_type in types]
+            )
+            # aniskip answers unknown episodes with 404 and found=false
+            if response.status_code == 404:
+                return []
+            response.raise_for_status()
+            data = response.json()
+        except (HTTPError, ValueError) as e:
+            logger.warning(f"Failed to fetch skip times for {mal_id}/{episode}: {e}")
+            return None
+
+        if not data.get("found"):
+            return []
+
+        intervals = []
+        for result in data.get("results", []):
+            interval = result.get("interval") or {}
+            try:
+                intervals.append(
+                    SkipInterval(
+                        skip_type=result["skip_type"],
+                        start_time=float(interval["start_time"]),
+                        end_time=float(interval["end_time"]),
+                        episode_length=float(result.get("episode_length") or 0),
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping malformed aniskip result {result}: {e}")
+        return sorted(intervals, key=lambda i: i.start_time)
+
+
+def _format_episode_number(episode_number: float | int | str) -> str:
+    number = float(episode_number)
+    return str(int(number)) if number.is_integer() else str(number)
 
 
 if __name__ == "__main__":
     mal_id = input("Mal id: ")
     episode_number = input("episode_number: ")
-    skip_times = AniSkip.get_skip_times(int(mal_id), float(episode_number))
+    skip_times = AniSkip().get_skip_times(int(mal_id), episode_number)
     print(skip_times)
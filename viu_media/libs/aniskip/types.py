@@ -0,0 +1,30 @@
+"""
+Defines the SkipInterval dataclass, which describes a single skippable segment.
+"""
+
+from dataclasses import dataclass
+from typing import Literal
+
+SkipType = Literal["op", "ed"]
+
+
+@dataclass(frozen=True)
+class SkipInterval:
+    """
+    A skippable segment of an episode as reported by AniSkip.
+
+    Attributes:
+        skip_type: The kind of segment, either an opening ("op") or ending ("ed").
+        start_time: Segment start in seconds.
+        end_time: Segment end in seconds.
+        episode_length: Length of the episode the interval was submitted for.
+    """
+
+    skip_type: SkipType
+    start_time: float
+    end_time: float
+    episode_length: float = 0
+
+    @property
+    def title(self) -> str:
+        return "Opening" if self.skip_type == "op" else "Ending"
@@ -5,6 +5,7 @@ from typing import Any, List, Optional
 from httpx import Client
 
 from ....core.config import AnilistConfig
+from ....core.utils import json_codec
 from ....core.utils.graphql import (
     execute_graphql,
 )
@@ -102,7 +103,7 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.GET_LOGGED_IN_USER, {}
         )
-        return mapper.to_generic_user_profile(response.json())
+        return mapper.to_generic_user_profile(json_codec.response_json(response))
 
     def search_media(self, params: MediaSearchParams) -> Optional[MediaSearchResult]:
         variables = {
@@ -143,7 +144,11 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.SEARCH_MEDIA, variables
         )
-        return mapper.to_generic_search_result(response.json())
+        data = json_codec.response_json(response) if response else None
+        if data and "errors" not in data:
+            return mapper.to_generic_search_result(data)
+        # rate limited or rejected; callers may fall back to the local registry
+        return None
 
     def search_media_list(
         self, params: UserMediaListSearchParams
@@ -167,7 +172,11 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.SEARCH_USER_MEDIA_LIST, variables
         )
-        return mapper.to_generic_user_list_result(response.json()) if response else None
+        return (
+            mapper.to_generic_user_list_result(json_codec.response_json(response))
+            if response
+            else None
+        )
 
     def update_list_entry(self, params: UpdateUserMediaListEntryParams) -> bool:
         if not self.token:
@@ -183,7 +192,8 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.SAVE_MEDIA_LIST_ENTRY, variables
         )
-        return response.json() is not None and "errors" not in response.json()
+        data = json_codec.response_json(response)
+        return data is not None and "errors" not in data
 
     def delete_list_entry(self, media_id: int) -> bool:
         if not self.token:
@@ -194,7 +204,7 @@ class AniListApi(BaseApiClient):
             gql.GET_MEDIA_LIST_ITEM,
             {"mediaId": media_id},
         )
-        entry_data = response.json()
+        entry_data = json_codec.response_json(response)
 
         list_id = (
             entry_data.get("data", {}).get("MediaList", {}).get("id")
@@ -210,7 +220,7 @@ class AniListApi(BaseApiClient):
             {"id": list_id},
         )
         return (
-            response.json()
+            json_codec.response_json(response)
             .get("data", {})
             .get("DeleteMediaListEntry", {})
             .get("deleted", False)
@@ -229,7 +239,7 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.GET_MEDIA_RECOMMENDATIONS, variables
         )
-        return mapper.to_generic_recommendations(response.json())
+        return mapper.to_generic_recommendations(json_codec.response_json(response))
 
     def get_characters_of(
         self, params: MediaCharactersParams
@@ -238,8 +248,9 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.GET_MEDIA_CHARACTERS, variables
         )
-        if response and "errors" not in response.json():
-            return mapper.to_generic_characters_result(response.json())
+        data = json_codec.response_json(response) if response else None
+        if data and "errors" not in data:
+            return mapper.to_generic_characters_result(data)
         return None
 
     def get_related_anime_for(
@@ -249,7 +260,7 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.GET_MEDIA_RELATIONS, variables
         )
-        return mapper.to_generic_relations(response.json())
+        return mapper.to_generic_relations(json_codec.response_json(response))
 
     def get_airing_schedule_for(
         self, params: MediaAiringScheduleParams
@@ -258,8 +269,9 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.GET_AIRING_SCHEDULE, variables
         )
-        if response and "errors" not in response.json():
-            return mapper.to_generic_airing_schedule_result(response.json())
+        data = json_codec.response_json(response) if response else None
+        if data and "errors" not in data:
+            return mapper.to_generic_airing_schedule_result(data)
         return None
 
     def get_reviews_for(
@@ -273,8 +285,9 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.GET_REVIEWS, variables
         )
-        if response and "errors" not in response.json():
-            return mapper.to_generic_reviews_list(response.json())
+        data = json_codec.response_json(response) if response else None
+        if data and "errors" not in data:
+            return mapper.to_generic_reviews_list(data)
         return None
 
     def get_notifications(self) -> Optional[List[Notification]]:
@@ -286,8 +299,9 @@ class AniListApi(BaseApiClient):
         response = execute_graphql(
             ANILIST_ENDPOINT, self.http_client, gql.GET_NOTIFICATIONS, {}
         )
-        if response and "errors" not in response.json():
-            return mapper.to_generic_notifications(response.json())
+        data = json_codec.response_json(response) if response else None
+        if data and "errors" not in data:
+            return mapper.to_generic_notifications(data)
         logger.error(f"Failed to fetch notifications: {response.text}")
         return None
 
@@ -4,8 +4,7 @@ import importlib
 import logging
 from typing import TYPE_CHECKING
 
-from httpx import Client
-
+from ...core.utils.http_client import create_client
 from ...core.utils.networking import random_user_agent
 
 if TYPE_CHECKING:
@@ -38,8 +37,10 @@ def create_api_client(client_name: str, config: AppConfig) -> BaseApiClient:
     except (ImportError, AttributeError) as e:
         raise ImportError(f"Could not load API client '{client_name}': {e}") from e
 
-    # Create a shared httpx client for the API
-    http_client = Client(headers={"User-Agent": random_user_agent()})
+    # Create an httpx client on the api's shared connection pool
+    http_client = create_client(
+        f"api:{client_name}", headers={"User-Agent": random_user_agent()}
+    )
 
     # Retrieve the specific config section from the main AppConfig
     scoped_config = getattr(config, config_section_name)
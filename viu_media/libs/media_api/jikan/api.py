@@ -1,6 +1,7 @@
 import logging
 from typing import TYPE_CHECKING, List, Optional
 
+from ....core.utils import json_codec
 from ..base import BaseApiClient
 from ..params import (
     MediaAiringScheduleParams,
@@ -47,7 +48,7 @@ class JikanApi(BaseApiClient):
                 f"{JIKAN_ENDPOINT}{endpoint}", params=params, timeout=10
             )
             response.raise_for_status()
-            return response.json()
+            return json_codec.response_json(response)
         except Exception as e:
             logger.error(f"Jikan API request failed for endpoint '{endpoint}': {e}")
             return None
@@ -8,8 +8,11 @@ import logging
 import re
 import shutil
 import subprocess
+import threading
+from dataclasses import replace
+from typing import IO, Callable, Optional
 
-from ....core.config import MpvConfig
+from ....core.config import DownloadsConfig, MpvConfig
 from ....core.exceptions import ViuError
 from ....core.patterns import TORRENT_REGEX, YOUTUBE_REGEX
 from ....core.utils import detect
@@ -20,6 +23,59 @@ from ..types import PlayerResult
 logger = logging.getLogger(__name__)
 
 MPV_AV_TIME_PATTERN = re.compile(r"AV: ([0-9:]*) / ([0-9:]*) \(([0-9]*)%\)")
+# mpv redraws its status line with \r; a line longer than this is not a status line
+MAX_STATUS_LINE = 4096
+
+
+class MpvStatusReader:
+    """
+    Follows mpv's status output in a background thread, keeping only the
+    latest playback position instead of the whole output.
+    """
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        on_progress: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.stop_time: Optional[str] = None
+        self.total_time: Optional[str] = None
+        self._stream = stream
+        self._on_progress = on_progress
+        self._thread = threading.Thread(
+            target=self._read_loop, name="MpvStatusReader", daemon=True
+        )
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    def _read_loop(self) -> None:
+        pending = b""
+        try:
+            while chunk := self._stream.read1(MAX_STATUS_LINE):  # type: ignore[attr-defined]
+                lines = re.split(rb"[\r\n]", pending + chunk)
+                pending = lines.pop()[-MAX_STATUS_LINE:]
+                for line in reversed(lines):
+                    if self._parse(line):
+                        break
+            self._parse(pending)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Stopped reading mpv output: {e}")
+
+    def _parse(self, line: bytes) -> bool:
+        match = MPV_AV_TIME_PATTERN.search(line.decode("utf-8", "replace"))
+        if not match:
+            return False
+        stop_time, total_time = match.group(1), match.group(2)
+        if (stop_time, total_time) != (self.stop_time, self.total_time):
+            self.stop_time, self.total_time = stop_time, total_time
+            if self._on_progress:
+                try:
+                    self._on_progress(stop_time, total_time)
+                except Exception as e:
+                    logger.warning(f"Player progress hook failed: {e}")
+        return True
 
 
 class MpvPlayer(BasePlayer):
@@ -29,14 +85,17 @@ class MpvPlayer(BasePlayer):
     Provides playback functionality using the MPV media player, supporting desktop, mobile, torrents, and syncplay.
     """
 
-    def __init__(self, config: MpvConfig):
+    def __init__(self, config: MpvConfig, downloads: Optional[DownloadsConfig] = None):
         """
         Initialize the MpvPlayer with the given MPV configuration.
 
         Args:
             config: MpvConfig object containing MPV-specific settings.
+            downloads: Downloads configuration; torrent streaming starts the
+                torrent engine with its resume directory.
         """
         self.config = config
+        self.downloads = downloads or DownloadsConfig()
         self.executable = shutil.which("mpv")
 
     def play(self, params):
@@ -115,6 +174,10 @@ class MpvPlayer(BasePlayer):
             raise ViuError("MPV executable not found in PATH.")
 
         if TORRENT_REGEX.search(params.url):
+            from ....core.downloader.torrents import LIBTORRENT_AVAILABLE
+
+            if LIBTORRENT_AVAILABLE:
+                return self._stream_on_desktop_with_libtorrent(params)
             return self._stream_on_desktop_with_webtorrent_cli(params)
         elif params.syncplay:
             return self._stream_on_desktop_with_syncplay(params)
@@ -123,7 +186,10 @@ class MpvPlayer(BasePlayer):
 
     def _stream_on_desktop_with_subprocess(self, params: PlayerParams) -> PlayerResult:
         """
-        Stream media using MPV via subprocess, capturing playback times.
+        Stream media using MPV via subprocess, following its playback position.
+
+        The position is tracked while mpv runs, so it is still reported if mpv
+        is killed or viu is interrupted.
 
         Args:
             params: PlayerParams object containing playback parameters.
@@ -137,25 +203,39 @@ class MpvPlayer(BasePlayer):
 
         pre_args = self.config.pre_args.split(",") if self.config.pre_args else []
 
-        stop_time = None
-        total_time = None
+        on_progress = None
+        if hook := params.progress_hook:
 
-        proc = subprocess.run(
+            def on_progress(stop_time: str, total_time: str) -> None:
+                hook(
+                    PlayerResult(
+                        episode=params.episode,
+                        total_time=total_time,
+                        stop_time=stop_time,
+                    )
+                )
+
+        proc = subprocess.Popen(
             pre_args + mpv_args,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-        if proc.stdout:
-            for line in reversed(proc.stdout.split("\n")):
-                match = MPV_AV_TIME_PATTERN.search(line.strip())
-                if match:
-                    stop_time = match.group(1)
-                    total_time = match.group(2)
-                    break
+        assert proc.stdout is not None
+        reader = MpvStatusReader(proc.stdout, on_progress)
+        try:
+            proc.wait()
+        except KeyboardInterrupt:
+            # mpv got the same SIGINT; keep the position it reached
+            try:
+                proc.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        reader.join(timeout=1.0)
+        proc.stdout.close()
         return PlayerResult(
-            episode=params.episode, total_time=total_time, stop_time=stop_time
+            episode=params.episode,
+            total_time=reader.total_time,
+            stop_time=reader.stop_time,
         )
 
     def play_with_ipc(self, params: PlayerParams, socket_path: str) -> subprocess.Popen:
@@ -189,6 +269,83 @@ class MpvPlayer(BasePlayer):
 
         return process
 
+    def start_idle(self, socket_path: str) -> subprocess.Popen:
+        """
+        Start an idle MPV that waits for files to be loaded over IPC.
+
+        Only session-wide options are applied here; per-stream options are
+        passed with each ``loadfile`` (see ``create_mpv_file_options``).
+
+        Args:
+            socket_path: Path to the IPC socket for player control.
+
+        Returns:
+            subprocess.Popen: The running MPV process.
+        """
+        if not self.executable:
+            raise ViuError("MPV executable not found in PATH.")
+
+        mpv_args = [
+            self.executable,
+            f"--input-ipc-server={socket_path}",
+            "--idle=yes",
+            "--force-window=yes",
+        ]
+        if self.config.args:
+            mpv_args.extend(self.config.args.split(","))
+
+        pre_args = self.config.pre_args.split(",") if self.config.pre_args else []
+
+        logger.info(f"Starting idle MPV with IPC socket: {socket_path}")
+
+        return subprocess.Popen(pre_args + mpv_args)
+
+    def create_mpv_file_options(self, params: PlayerParams) -> dict[str, str]:
+        """
+        Per-file MPV options for loading a stream into a running player.
+
+        Subtitles are not included since they are added with ``sub-add`` once
+        the file is loaded.
+
+        Args:
+            params: PlayerParams object containing playback parameters.
+
+        Returns:
+            dict[str, str]: MPV option names mapped to their values.
+        """
+        options = {}
+        if params.headers:
+            options["http-header-fields"] = ",".join(
+                [f"{k}:{v}" for k, v in params.headers.items()]
+            )
+        if params.start_time:
+            options["start"] = str(params.start_time)
+        if params.title:
+            options["title"] = params.title
+        return options
+
+    def _stream_on_desktop_with_libtorrent(self, params: PlayerParams) -> PlayerResult:
+        """
+        Stream torrent media through viu's torrent engine and MPV.
+
+        The engine serves the torrent's video file over local HTTP while it
+        downloads, fetching the pieces MPV reads first.
+
+        Args:
+            params: PlayerParams object containing playback parameters.
+
+        Returns:
+            PlayerResult: Information about the playback session.
+        """
+        from ....core.downloader.torrent_engine import get_torrent_engine
+        from ....core.downloader.torrents import session_settings
+
+        engine = get_torrent_engine(
+            self.downloads.torrent_resume_path, session_settings()
+        )
+        with engine.stream(params.url) as url:
+            return self._play_on_desktop(replace(params, url=url))
+
     def _stream_on_desktop_with_webtorrent_cli(
         self, params: PlayerParams
     ) -> PlayerResult:
@@ -3,10 +3,10 @@ Defines the PlayerParams dataclass, which encapsulates all parameters required t
 """
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
-    pass
+    from .types import PlayerResult
 
 
 @dataclass(frozen=True)
@@ -23,6 +23,8 @@ class PlayerParams:
         subtitles: List of subtitle file paths or URLs.
         headers: HTTP headers to include in the request.
         start_time: The time offset to start playback from.
+        progress_hook: Called with the current position while the player
+            reports it (plain mpv playback only).
     """
 
     url: str
@@ -33,3 +35,4 @@ class PlayerParams:
     subtitles: list[str] | None = None
     headers: dict[str, str] | None = None
     start_time: str | None = None
+    progress_hook: "Callable[[PlayerResult], None] | None" = None
@@ -40,7 +40,7 @@ class PlayerFactory:
         if player_name == "mpv":
             from .mpv.player import MpvPlayer
 
-            return MpvPlayer(config.mpv)
+            return MpvPlayer(config.mpv, config.downloads)
         raise NotImplementedError(
             f"Configuration logic for player '{player_name}' not implemented in factory."
         )
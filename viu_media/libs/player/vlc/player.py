@@ -7,8 +7,10 @@ This module provides the VlcPlayer class, which implements the BasePlayer interf
 import logging
 import shutil
 import subprocess
+from dataclasses import replace
+from typing import Optional
 
-from ....core.config import VlcConfig
+from ....core.config import DownloadsConfig, VlcConfig
 from ....core.exceptions import ViuError
 from ....core.patterns import TORRENT_REGEX, YOUTUBE_REGEX
 from ....core.utils import detect
@@ -26,14 +28,17 @@ class VlcPlayer(BasePlayer):
     Provides playback functionality using the VLC media player, supporting desktop, mobile, and torrent scenarios.
     """
 
-    def __init__(self, config: VlcConfig):
+    def __init__(self, config: VlcConfig, downloads: Optional[DownloadsConfig] = None):
         """
         Initialize the VlcPlayer with the given VLC configuration.
 
         Args:
             config: VlcConfig object containing VLC-specific settings.
+            downloads: Downloads configuration; torrent streaming starts the
+                torrent engine with its resume directory.
         """
         self.config = config
+        self.downloads = downloads or DownloadsConfig()
         self.executable = shutil.which("vlc")
 
     def play(self, params: PlayerParams) -> PlayerResult:
@@ -117,6 +122,10 @@ class VlcPlayer(BasePlayer):
             PlayerResult: Information about the playback session.
         """
         if TORRENT_REGEX.search(params.url):
+            from ....core.downloader.torrents import LIBTORRENT_AVAILABLE
+
+            if LIBTORRENT_AVAILABLE:
+                return self._stream_on_desktop_with_libtorrent(params)
             return self._stream_on_desktop_with_webtorrent_cli(params)
 
         args = [self.executable, params.url]
@@ -133,6 +142,28 @@ class VlcPlayer(BasePlayer):
         subprocess.run(args, encoding="utf-8")
         return PlayerResult(episode=params.episode)
 
+    def _stream_on_desktop_with_libtorrent(self, params: PlayerParams) -> PlayerResult:
+        """
+        Stream torrent media through viu's torrent engine and VLC.
+
+        The engine serves the torrent's video file over local HTTP while it
+        downloads, fetching the pieces VLC reads first.
+
+        Args:
+            params: PlayerParams object containing playback parameters.
+
+        Returns:
+            PlayerResult: Information about the playback session.
+        """
+        from ....core.downloader.torrent_engine import get_torrent_engine
+        from ....core.downloader.torrents import session_settings
+
+        engine = get_torrent_engine(
+            self.downloads.torrent_resume_path, session_settings()
+        )
+        with engine.stream(params.url) as url:
+            return self._play_on_desktop(replace(params, url=url))
+
     def _stream_on_desktop_with_webtorrent_cli(
         self, params: PlayerParams
     ) -> PlayerResult:
@@ -4,6 +4,9 @@ import os
 import re
 from itertools import cycle
 
+from ....core.utils.profiling import is_enabled as profiling_enabled
+from ....core.utils.profiling import span
+
 logger = logging.getLogger(__name__)
 
 # Dictionary to map hex values to characters
@@ -41,17 +44,27 @@ hex_to_char = {
 
 
 def debug_extractor(extractor_function):
+    def _profiled(*args):
+        if not profiling_enabled():
+            return extractor_function(*args)
+        with span(
+            f"AllAnime.{extractor_function.__name__}",
+            "provider",
+            server=args[3].get("sourceName", "UNKNOWN"),
+        ):
+            return extractor_function(*args)
+
     @functools.wraps(extractor_function)
     def _provider_function_wrapper(*args):
         if not os.environ.get("VIU_DEBUG"):
             try:
-                return extractor_function(*args)
+                return _profiled(*args)
             except Exception as e:
                 logger.error(
                     f"[AllAnime@Server={args[3].get('sourceName', 'UNKNOWN')}]: {e}"
                 )
         else:
-            return extractor_function(*args)
+            return _profiled(*args)
 
     return _provider_function_wrapper
 
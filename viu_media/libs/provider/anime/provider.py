@@ -1,8 +1,6 @@
 import importlib
 import logging
 
-from httpx import Client
-
 from .base import BaseAnimeProvider
 from .types import ProviderName
 
@@ -39,6 +37,7 @@ class AnimeProviderFactory:
             ValueError: If the provider_name is not supported.
             ImportError: If the provider module or class cannot be found.
         """
+        from ....core.utils.http_client import create_client
         from ....core.utils.networking import random_user_agent
 
         # Correctly determine module and class name from the map
@@ -61,8 +60,10 @@ class AnimeProviderFactory:
             ) from e
 
         # Each provider class requires an httpx.Client, which we set up here.
-        client = Client(
-            headers={"User-Agent": random_user_agent(), **provider_class.HEADERS}
+        # Clients of the same provider share one keep-alive connection pool.
+        client = create_client(
+            f"provider:{provider_name.value.lower()}",
+            headers={"User-Agent": random_user_agent(), **provider_class.HEADERS},
         )
 
         return provider_class(client)
@@ -1,24 +1,41 @@
 import functools
+import inspect
 import logging
 import os
 from typing import Type
 
+from .....core.utils.profiling import is_enabled as profiling_enabled
+from .....core.utils.profiling import span, timed_iter
 from ..base import BaseAnimeProvider
 
 logger = logging.getLogger(__name__)
 
 
 def debug_provider(provider_function):
+    is_generator = inspect.isgeneratorfunction(provider_function)
+
+    def _profiled(self, *args, **kwargs):
+        if not profiling_enabled():
+            return provider_function(self, *args, **kwargs)
+        span_name = f"{self.__class__.__name__}.{provider_function.__name__}"
+        if is_generator:
+            # a span around the call would only time creating the generator
+            return timed_iter(
+                provider_function(self, *args, **kwargs), span_name, "provider"
+            )
+        with span(span_name, "provider"):
+            return provider_function(self, *args, **kwargs)
+
     @functools.wraps(provider_function)
     def _provider_function_wrapper(self, *args, **kwargs):
         provider_name = self.__class__.__name__.upper()
         if not os.environ.get("VIU_DEBUG"):
             try:
-                return provider_function(self, *args, **kwargs)
+                return _profiled(self, *args, **kwargs)
             except Exception as e:
                 logger.error(f"[{provider_name}@{provider_function.__name__}]: {e}")
         else:
-            return provider_function(self, *args, **kwargs)
+            return _profiled(self, *args, **kwargs)
 
     return _provider_function_wrapper
 
@@ -27,14 +44,16 @@ def test_anime_provider(AnimeProvider: Type[BaseAnimeProvider]):
     import shutil
     import subprocess
 
-    from httpx import Client
-
     from .....core.constants import APP_ASCII_ART
+    from .....core.utils.http_client import create_client
     from .....core.utils.networking import random_user_agent
     from ..params import AnimeParams, EpisodeStreamsParams, SearchParams
 
     anime_provider = AnimeProvider(
-        Client(headers={"User-Agent": random_user_agent(), **AnimeProvider.HEADERS})
+        create_client(
+            f"provider:{AnimeProvider.__name__.lower()}",
+            headers={"User-Agent": random_user_agent(), **AnimeProvider.HEADERS},
+        )
     )
     print(APP_ASCII_ART.read_text(encoding="utf-8"))
     query = input("What anime would you like to stream: ")
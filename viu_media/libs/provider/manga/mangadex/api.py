@@ -1,4 +1,7 @@
 import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
 from ...common.mini_anilist import search_for_manga_with_anilist
 from ..base_provider import MangaProvider
@@ -6,6 +9,11 @@ from ..common import fetch_manga_info_from_bal
 
 logger = logging.getLogger(__name__)
 
+# MangaDex@Home base urls are valid for 15 minutes; refresh a little early
+AT_HOME_TTL = 14 * 60
+_at_home_cache: Dict[str, Tuple[float, dict]] = {}
+_at_home_lock = threading.Lock()
+
 
 class MangaDexApi(MangaProvider):
     def search_for_manga(self, title: str, *args):
@@ -33,13 +41,9 @@ class MangaDexApi(MangaProvider):
         if not chapter_info_response.ok:
             return
         chapter_info = next(iter(chapter_info_response.json()["data"]))
-        chapters_thumbnails_url = (
-            f"https://api.mangadex.org/at-home/server/{chapter_info['id']}"
-        )
-        chapter_thumbnails_response = self.session.get(chapters_thumbnails_url)
-        if not chapter_thumbnails_response.ok:
+        chapter_thumbnails_info = self._get_at_home_server(chapter_info["id"])
+        if not chapter_thumbnails_info:
             return
-        chapter_thumbnails_info = chapter_thumbnails_response.json()
         base_url = chapter_thumbnails_info["baseUrl"]
         hash = chapter_thumbnails_info["chapter"]["hash"]
         return {
@@ -49,3 +53,21 @@ class MangaDexApi(MangaProvider):
             ],
             "title": chapter_info["attributes"]["title"],
         }
+
+    def _get_at_home_server(self, chapter_id: str) -> Optional[dict]:
+        """The at-home server of a chapter, memoized while its urls are valid."""
+        now = time.monotonic()
+        with _at_home_lock:
+            cached = _at_home_cache.get(chapter_id)
+        if cached and now - cached[0] < AT_HOME_TTL:
+            return cached[1]
+
+        response = self.session.get(
+            f"https://api.mangadex.org/at-home/server/{chapter_id}"
+        )
+        if not response.is_success:
+            return None
+        server_info = response.json()
+        with _at_home_lock:
+            _at_home_cache[chapter_id] = (now, server_info)
+        return server_info